@@ -2,7 +2,6 @@
 __init__.py file for scrapegraphai folder
 """
 
-from .utils.logging import get_logger, set_verbosity_info
+from .utils.logging import get_logger
 
 logger = get_logger(__name__)
-set_verbosity_info()
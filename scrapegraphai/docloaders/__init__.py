@@ -3,11 +3,33 @@ This module handles document loading functionalities for the ScrapeGraphAI appli
 """
 
 from .browser_base import browser_base_fetch
+from .browser_pool import BrowserPool, get_browser_pool
 from .chromium import ChromiumLoader
+from .document_size import get_document_size_limits, truncate_html
+from .http_cache import HttpCache, get_http_cache
+from .http_fetcher import HttpFetcher, get_http_fetcher
+from .politeness import PolitenessScheduler, get_politeness_scheduler
+from .resource_blocking import ResourceBlocker, get_resource_blocker
+from .robots_txt import RobotsCache, RobotsTxt, get_robots_cache
 from .scrape_do import scrape_do_fetch
 
 __all__ = [
     "browser_base_fetch",
+    "BrowserPool",
+    "get_browser_pool",
     "ChromiumLoader",
+    "get_document_size_limits",
+    "truncate_html",
+    "HttpCache",
+    "get_http_cache",
+    "HttpFetcher",
+    "get_http_fetcher",
+    "PolitenessScheduler",
+    "get_politeness_scheduler",
+    "ResourceBlocker",
+    "get_resource_blocker",
+    "RobotsCache",
+    "RobotsTxt",
+    "get_robots_cache",
     "scrape_do_fetch",
 ]
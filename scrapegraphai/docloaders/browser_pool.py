@@ -0,0 +1,309 @@
+"""
+Pool of warm Playwright browsers shared by the loaders of a process
+"""
+
+import asyncio
+import atexit
+import json
+import threading
+from contextlib import suppress
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from ..utils.logging import get_logger
+from .event_loop_thread import EventLoopThread
+
+logger = get_logger("browser-pool")
+
+DEFAULT_MAX_BROWSERS = 2
+DEFAULT_MAX_PAGES_PER_BROWSER = 100
+
+
+class _PooledBrowser:
+    """A browser of the pool with its usage counters."""
+
+    __slots__ = ("key", "browser", "active", "pages_served", "retired")
+
+    def __init__(self, key: str, browser):
+        self.key = key
+        self.browser = browser
+        self.active = 0
+        self.pages_served = 0
+        self.retired = False
+
+    @property
+    def healthy(self) -> bool:
+        with suppress(Exception):
+            return self.browser.is_connected()
+        return False
+
+
+class BrowserPool:
+    """
+    Keeps Playwright browsers running between fetches, so that a page costs a
+    new context instead of a browser launch.
+
+    Playwright objects are bound to the event loop that created them, so the
+    browsers live on the loop of an `EventLoopThread` and every fetch is
+    scheduled on it, whichever loop or thread it comes from.
+
+    Each fetch gets a fresh browser context, so cookies and storage states of
+    different loaders never mix. Browsers are keyed by their launch options
+    (browser name, headless mode, proxy, ...), health-checked before being
+    reused and recycled once they have served `max_pages_per_browser` pages.
+
+    Attributes:
+        max_browsers (int): Maximum number of browsers running at the same time.
+        max_pages_per_browser (int): Number of pages after which a browser is
+                                     closed and replaced by a new one.
+        launches (int): Number of browsers launched so far.
+
+    Example:
+        >>> with BrowserPool(max_browsers=4) as pool:
+        ...     loader = ChromiumLoader(urls, browser_pool=pool)
+        ...     docs = loader.load()
+    """
+
+    def __init__(
+        self,
+        max_browsers: int = DEFAULT_MAX_BROWSERS,
+        max_pages_per_browser: int = DEFAULT_MAX_PAGES_PER_BROWSER,
+    ):
+        if max_browsers < 1:
+            raise ValueError("max_browsers must be at least 1.")
+        if max_pages_per_browser < 1:
+            raise ValueError("max_pages_per_browser must be at least 1.")
+
+        self.max_browsers = max_browsers
+        self.max_pages_per_browser = max_pages_per_browser
+        self.launches = 0
+        self._browsers = []
+        self._launching = 0
+        self._playwright = None
+        self._condition = None
+        self._runner = EventLoopThread("browser-pool")
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    async def run(
+        self,
+        work: Callable[[Any], Awaitable[Any]],
+        *,
+        browser_name: str = "chromium",
+        launch_options: Optional[dict] = None,
+        context_options: Optional[dict] = None,
+        stealth: bool = False,
+    ) -> Any:
+        """
+        Runs `work` on a new page of a pooled browser and returns its result.
+
+        Args:
+            work (Callable): A coroutine function taking the Playwright page.
+            browser_name (str): Either "chromium" or "firefox".
+            launch_options (Optional[dict]): The kwargs of `BrowserType.launch`.
+            context_options (Optional[dict]): The kwargs of `Browser.new_context`.
+            stealth (bool): Whether to apply the undetected-playwright stealth
+                            scripts to the context.
+
+        Returns:
+            Any: The result of `work`.
+
+        Raises:
+            ValueError: When an invalid browser name is provided.
+        """
+        return await self._runner.run(
+            self._use_page(work, browser_name, launch_options, context_options, stealth)
+        )
+
+    def run_sync(
+        self,
+        work: Callable[[Any], Awaitable[Any]],
+        *,
+        browser_name: str = "chromium",
+        launch_options: Optional[dict] = None,
+        context_options: Optional[dict] = None,
+        stealth: bool = False,
+    ) -> Any:
+        """
+        Blocking version of `run`, for code running outside an event loop.
+        """
+        return self._runner.run_sync(
+            self._use_page(work, browser_name, launch_options, context_options, stealth)
+        )
+
+    def close(self, timeout: float = 30):
+        """
+        Closes the browsers and stops the thread of the pool. The pool can
+        still be used afterwards, it is started again on the next fetch.
+
+        Args:
+            timeout (float): Maximum time in seconds to wait for the browsers.
+        """
+        self._runner.stop(self._shutdown, timeout)
+
+    async def _use_page(
+        self,
+        work: Callable[[Any], Awaitable[Any]],
+        browser_name: str = "chromium",
+        launch_options: Optional[dict] = None,
+        context_options: Optional[dict] = None,
+        stealth: bool = False,
+    ) -> Any:
+        entry = await self._acquire(browser_name, launch_options or {})
+        context = None
+        try:
+            context = await entry.browser.new_context(**(context_options or {}))
+            if stealth:
+                from undetected_playwright import Malenia
+
+                await Malenia.apply_stealth(context)
+            page = await context.new_page()
+            return await work(page)
+        finally:
+            if context is not None:
+                with suppress(Exception):
+                    await context.close()
+            await self._release(entry)
+
+    async def _acquire(self, browser_name: str, launch_options: dict):
+        """
+        Returns a browser for the launch options, launching one if needed. The
+        slot of a new browser is reserved under the lock, but the browser is
+        launched outside of it, so that launches do not wait for each other.
+        """
+        if browser_name not in ("chromium", "firefox"):
+            raise ValueError(f"Invalid browser name: {browser_name}")
+
+        key = json.dumps([browser_name, launch_options], sort_keys=True, default=str)
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        async with self._condition:
+            while True:
+                await self._discard_unhealthy()
+                candidates = [
+                    entry
+                    for entry in self._browsers
+                    if entry.key == key and not entry.retired
+                ]
+                best = min(candidates, key=lambda entry: entry.active, default=None)
+                has_room = len(self._browsers) + self._launching < self.max_browsers
+
+                if best is not None and best.active == 0:
+                    return self._claim(best)
+                if has_room or await self._evict_idle():
+                    if self._playwright is None:
+                        from playwright.async_api import async_playwright
+
+                        self._playwright = await async_playwright().start()
+                    self._launching += 1
+                    break
+                if best is not None:
+                    # Every slot is busy, share the least loaded browser
+                    return self._claim(best)
+                await self._condition.wait()
+
+        entry = None
+        try:
+            entry = await self._launch(key, browser_name, launch_options)
+        finally:
+            async with self._condition:
+                self._launching -= 1
+                if entry is not None:
+                    self._browsers.append(entry)
+                    self._claim(entry)
+                self._condition.notify_all()
+        return entry
+
+    def _claim(self, entry: _PooledBrowser) -> _PooledBrowser:
+        entry.active += 1
+        entry.pages_served += 1
+        if entry.pages_served >= self.max_pages_per_browser:
+            entry.retired = True
+        return entry
+
+    async def _release(self, entry: _PooledBrowser):
+        async with self._condition:
+            entry.active -= 1
+            if entry.active == 0 and (entry.retired or not entry.healthy):
+                await self._remove(entry)
+            self._condition.notify_all()
+
+    async def _launch(
+        self, key: str, browser_name: str, launch_options: dict
+    ) -> _PooledBrowser:
+        browser_type = getattr(self._playwright, browser_name)
+        entry = _PooledBrowser(key, await browser_type.launch(**launch_options))
+        self.launches += 1
+        logger.info(f"Launched pooled {browser_name} browser ({self.launches} so far)")
+        return entry
+
+    async def _discard_unhealthy(self):
+        for entry in list(self._browsers):
+            if not entry.healthy:
+                entry.retired = True
+                if entry.active == 0:
+                    logger.warning("Discarding a disconnected pooled browser")
+                    await self._remove(entry)
+
+    async def _evict_idle(self) -> bool:
+        """Closes the least used idle browser, returns False if all are busy."""
+        idle = [entry for entry in self._browsers if entry.active == 0]
+        if not idle:
+            return False
+        await self._remove(min(idle, key=lambda entry: entry.pages_served))
+        return True
+
+    async def _remove(self, entry: _PooledBrowser):
+        if entry in self._browsers:
+            self._browsers.remove(entry)
+        with suppress(Exception):
+            await entry.browser.close()
+
+    async def _shutdown(self):
+        for entry in list(self._browsers):
+            await self._remove(entry)
+        if self._playwright is not None:
+            with suppress(Exception):
+                await self._playwright.stop()
+            self._playwright = None
+        self._condition = None
+
+
+_shared_pools: Dict[str, BrowserPool] = {}
+_shared_pool_lock = threading.Lock()
+
+
+def get_browser_pool(
+    option: Union[bool, dict, BrowserPool, None] = True,
+) -> Optional[BrowserPool]:
+    """
+    Resolves the `browser_pool` option of a loader.
+
+    Args:
+        option: False or None to launch a browser per fetch, a BrowserPool to
+                use it, True to use the pool shared by the whole process, or a
+                dict with the `max_browsers` and `max_pages_per_browser` of a
+                pool shared by the loaders passing the same settings.
+
+    Returns:
+        Optional[BrowserPool]: The pool, or None if pooling is disabled.
+    """
+    if not option:
+        return None
+    if isinstance(option, BrowserPool):
+        return option
+    if option is not True and not isinstance(option, dict):
+        raise ValueError(
+            "The browser_pool option must be a boolean, a dictionary or a BrowserPool."
+        )
+
+    settings = option if isinstance(option, dict) else {}
+    key = json.dumps(settings, sort_keys=True, default=str)
+    with _shared_pool_lock:
+        if key not in _shared_pools:
+            _shared_pools[key] = BrowserPool(**settings)
+            atexit.register(_shared_pools[key].close)
+        return _shared_pools[key]
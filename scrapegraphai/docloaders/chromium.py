@@ -1,15 +1,158 @@
 import asyncio
+import inspect
+import time
+import weakref
+from contextlib import asynccontextmanager, nullcontext
+from contextvars import ContextVar
 from typing import Any, AsyncIterator, Iterator, List, Optional, Union
+from urllib.parse import urlparse, urlsplit
 
 import aiohttp
 import async_timeout
+import httpx
 from langchain_community.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
 
-from ..utils import Proxy, dynamic_import, get_logger, parse_or_search_proxy
+from ..utils import (
+    Proxy,
+    ProxyPool,
+    dynamic_import,
+    get_logger,
+    get_proxy_pool,
+    parse_or_search_proxy,
+)
+from ..utils.tracing import span
+from .browser_pool import BrowserPool, get_browser_pool
+from .document_size import DOM_SIZE_GUARD_JS, get_document_size_limits, truncate_html
+from .http_cache import (
+    CACHE_HIT,
+    CACHE_MISS,
+    CACHE_REVALIDATED,
+    UNCACHED_HEADERS,
+    HttpCache,
+    get_http_cache,
+    record_cache_result,
+)
+from .http_fetcher import BROWSER_TIER, HTTP_TIER, get_http_fetcher, needs_browser
+from .politeness import PolitenessScheduler, get_politeness_scheduler
+from .resource_blocking import ResourceBlocker, get_resource_blocker
 
 logger = get_logger("web-loader")
 
+DEFAULT_INFINITE_SCROLL = {
+    "max_scrolls": 50,
+    "idle_timeout": 2.0,
+    "max_idle_scrolls": 2,
+    "timeout": 60.0,
+    "incremental": False,
+}
+
+# The proxy picked from the proxy pool for the fetch running in the current task
+_pool_proxy: ContextVar[Optional[dict]] = ContextVar("pool_proxy", default=None)
+
+# Quiet period after which a burst of DOM mutations is considered loaded, in ms
+SCROLL_SETTLE_TIME = 300
+
+# Counts the elements added to the page, keeping them when `track` is set
+_OBSERVE_MUTATIONS_JS = """(track) => {
+    if (window.__sgObserver) return;
+    window.__sgMutations = 0;
+    window.__sgAdded = [];
+    window.__sgObserver = new MutationObserver((records) => {
+        for (const record of records) {
+            for (const node of record.addedNodes) {
+                if (node.nodeType !== Node.ELEMENT_NODE) continue;
+                window.__sgMutations += 1;
+                if (track) window.__sgAdded.push(node);
+            }
+        }
+    });
+    window.__sgObserver.observe(document.documentElement, {
+        childList: true,
+        subtree: true,
+    });
+}"""
+
+# Scrolls to the bottom, waits for new elements and for the page to settle,
+# and returns the number of elements added
+_SCROLL_AND_WAIT_JS = """async ([idleTimeout, settleTime]) => {
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+    const start = window.__sgMutations;
+    const root = document.scrollingElement || document.documentElement;
+    window.scrollTo(0, root.scrollHeight);
+
+    let deadline = Date.now() + idleTimeout;
+    while (window.__sgMutations === start && Date.now() < deadline) {
+        await sleep(50);
+    }
+    deadline = Date.now() + idleTimeout;
+    let seen = window.__sgMutations;
+    while (seen !== start && Date.now() < deadline) {
+        await sleep(settleTime);
+        if (window.__sgMutations === seen) break;
+        seen = window.__sgMutations;
+    }
+    return window.__sgMutations - start;
+}"""
+
+# Returns the HTML of the elements added since the last call, outermost only
+_TAKE_ADDED_HTML_JS = """() => {
+    const added = new Set(window.__sgAdded.filter((node) => node.isConnected));
+    window.__sgAdded = [];
+    const skipped = new Set(["SCRIPT", "STYLE", "LINK", "META", "NOSCRIPT"]);
+    const roots = [];
+    for (const node of added) {
+        let parent = node.parentElement;
+        while (parent && !added.has(parent)) parent = parent.parentElement;
+        if (!parent && !skipped.has(node.tagName)) roots.push(node.outerHTML);
+    }
+    return roots.join("\\n");
+}"""
+
+
+def _same_document(request_url: str, url: str) -> bool:
+    """Tells whether a request URL is the given URL, as normalized by the browser."""
+
+    def normalize(value: str) -> tuple:
+        parts = urlsplit(value)
+        return parts.scheme, parts.netloc.lower(), parts.path or "/", parts.query
+
+    return normalize(request_url) == normalize(url)
+
+
+def _infinite_scroll_options(option: Union[bool, dict, None]) -> Optional[dict]:
+    """
+    Resolves the `infinite_scroll` option of the loader.
+
+    Raises:
+        ValueError: If the option has an unsupported type, key or value.
+    """
+    if not option:
+        return None
+    if option is True:
+        return dict(DEFAULT_INFINITE_SCROLL)
+    if not isinstance(option, dict):
+        raise ValueError(
+            "The infinite_scroll option must be a boolean or a dictionary."
+        )
+
+    unknown = set(option) - set(DEFAULT_INFINITE_SCROLL)
+    if unknown:
+        raise ValueError(f"Unknown infinite_scroll keys: {', '.join(sorted(unknown))}")
+    options = {**DEFAULT_INFINITE_SCROLL, **option}
+    if options["max_scrolls"] < 1 or options["max_idle_scrolls"] < 1:
+        raise ValueError("max_scrolls and max_idle_scrolls must be at least 1.")
+    if options["idle_timeout"] <= 0:
+        raise ValueError("idle_timeout must be greater than 0.")
+    return options
+
+
+def _record_cache_results(cache_results: list):
+    """Records the HTTP cache outcomes of a page load in the current scope."""
+    for result in cache_results:
+        record_cache_result(*result)
+    cache_results.clear()
+
 
 class ChromiumLoader(BaseLoader):
     """Scrapes HTML pages from URLs using a (headless) instance of the
@@ -22,6 +165,25 @@ class ChromiumLoader(BaseLoader):
         proxy: A dictionary containing proxy settings; None disables protection.
         urls: A list of URLs to scrape content from.
         requires_js_support: Flag to determine if JS rendering is required.
+        browser_pool: The pool of warm browsers used by the Playwright backend;
+            None launches a browser per fetch.
+        max_concurrency: Maximum number of URLs fetched at the same time.
+        max_concurrency_per_host: Maximum number of URLs of the same host
+            fetched at the same time.
+        http_first: Whether pages are first fetched over plain HTTP, falling
+            back to the browser when they need JavaScript.
+        http_cache: The on-disk HTTP cache of the fetched pages; None disables it.
+        resource_blocker: Aborts the requests of the resources not needed to read
+            the pages, such as images or trackers; None loads everything.
+        javascript_enabled: Whether the browser runs the scripts of the pages.
+        infinite_scroll: The options of the infinite scroll mode; None loads the
+            pages without scrolling.
+        politeness: Paces the requests sent to each host; None fetches them
+            as fast as the concurrency limits allow.
+        document_size: The size limits of the Documents and their truncation
+            strategy; None keeps the pages whole.
+        proxy_pool: The pool of health-checked proxies rotated on every URL;
+            None uses the fixed `proxy`, if any.
     """
 
     def __init__(
@@ -37,6 +199,17 @@ class ChromiumLoader(BaseLoader):
         browser_name: str = "chromium",  # default chromium
         retry_limit: int = 1,
         timeout: int = 60,
+        browser_pool: Union[bool, dict, BrowserPool, None] = None,
+        max_concurrency: int = 5,
+        max_concurrency_per_host: int = 3,
+        http_first: bool = False,
+        http_cache: Union[str, dict, HttpCache, None] = None,
+        block_resources: Union[bool, dict, ResourceBlocker, None] = None,
+        javascript_enabled: bool = True,
+        infinite_scroll: Union[bool, dict, None] = None,
+        politeness: Union[bool, dict, PolitenessScheduler, None] = None,
+        max_document_size: Union[int, dict, None] = None,
+        proxy_pool: Union[bool, dict, ProxyPool, None] = None,
         **kwargs: Any,
     ):
         """Initialize the loader with a list of URL paths.
@@ -49,10 +222,66 @@ class ChromiumLoader(BaseLoader):
             requires_js_support: Whether to use JS rendering for scraping.
             retry_limit: Maximum number of retry attempts for scraping. Defaults to 3.
             timeout: Maximum time in seconds to wait for scraping. Defaults to 10.
+            browser_pool: True to reuse the browsers of the pool shared by the process,
+                a dict with the `max_browsers` and `max_pages_per_browser` of a pool
+                shared by the loaders passing the same settings, or a BrowserPool
+                instance. Defaults to launching a browser per fetch.
+            max_concurrency: Maximum number of URLs fetched at the same time. Defaults to 5.
+            max_concurrency_per_host: Maximum number of URLs of the same host fetched
+                at the same time. Defaults to 3.
+            http_first: Whether to fetch pages over plain HTTP first and render them in
+                the browser only when they look client-side rendered. Defaults to False.
+            http_cache: The directory of an on-disk HTTP cache, a dict with its `path`
+                and `max_size` in bytes, or an HttpCache instance. Pages fetched over
+                HTTP and the main document loaded by the browser are served from it
+                while fresh and revalidated with conditional requests once stale.
+                Defaults to no cache.
+            block_resources: True to block images, media, fonts, stylesheets and
+                common advertising and analytics hosts, a dict with the
+                `resource_types`, `domains` and `url_patterns` to block, or a
+                ResourceBlocker instance. Defaults to loading every resource.
+            javascript_enabled: Whether the browser runs the scripts of the pages;
+                disabling it speeds up pages known to be server-rendered.
+                Defaults to True.
+            infinite_scroll: True or a dict of options to scroll the pages until no
+                more content loads, waiting for DOM mutations instead of fixed
+                sleeps: `max_scrolls` (50), `idle_timeout` in seconds to wait for
+                new elements after a scroll (2), `max_idle_scrolls` without new
+                elements before stopping (2), `timeout` of the whole scrolling in
+                seconds (60) and `incremental` (False) to yield the initial HTML
+                and then the HTML of the elements added by each scroll as separate
+                Documents. Requires the Playwright backend. Defaults to no scrolling.
+            politeness: True to pace the requests to each host with the scheduler
+                shared by the process, which enforces a per-host concurrency, a
+                token-bucket rate, the robots.txt `Crawl-delay` and a backoff on
+                429 and 503 responses, a dict with the settings of the shared
+                scheduler, or a PolitenessScheduler instance. Defaults to no pacing.
+            max_document_size: The maximum size of a Document in bytes, or a dict
+                with its `max_bytes`, the truncation `strategy` and the
+                `max_download_bytes` read from the server or the browser. Pages
+                fetched over HTTP are streamed and stop downloading past the
+                limit, and the browser DOM is measured before being serialized.
+                Oversized pages keep their beginning ("head", the default),
+                their main element ("main_content") or their text-bearing
+                markup ("byte_budget"), and their Documents are flagged with
+                `truncated` in their metadata. Defaults to no limit.
+            proxy_pool: True to rotate the proxies of the pool shared by the
+                process, a dict with the settings of a pool shared by the
+                loaders passing the same settings (`proxies`, broker
+                `criteria`, `probe_url`, eviction thresholds), or a ProxyPool
+                instance. Each URL is fetched through a proxy picked by success
+                rate and latency, and its outcome is reported to the pool, which
+                evicts failing proxies. Cannot be combined with `proxy`.
+                Defaults to no pool.
             kwargs: A dictionary containing additional browser kwargs.
 
         Raises:
             ImportError: If the required backend package is not installed.
+            ValueError: If a concurrency limit is lower than 1, the HTTP cache,
+                resource blocking, infinite scroll, politeness, document size or proxy
+                pool option is invalid, both `proxy` and `proxy_pool` are set, or
+                JavaScript support or scrolling is required while JavaScript is
+                disabled.
         """
         message = (
             f"{backend} is required for ChromiumLoader. "
@@ -72,6 +301,112 @@ class ChromiumLoader(BaseLoader):
         self.browser_name = kwargs.get("browser_name", browser_name)
         self.retry_limit = kwargs.get("retry_limit", retry_limit)
         self.timeout = kwargs.get("timeout", timeout)
+        self.browser_pool = get_browser_pool(browser_pool)
+
+        if max_concurrency < 1 or max_concurrency_per_host < 1:
+            raise ValueError("Concurrency limits must be at least 1.")
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.http_first = http_first
+        self.http_cache = get_http_cache(http_cache)
+        self.resource_blocker = get_resource_blocker(block_resources)
+        self.politeness = get_politeness_scheduler(politeness)
+        self.document_size = get_document_size_limits(max_document_size)
+        self.proxy_pool = get_proxy_pool(proxy_pool)
+        if self.proxy_pool is not None and self.proxy is not None:
+            raise ValueError("proxy and proxy_pool cannot be used together.")
+        # URLs whose content was cut while it was fetched
+        self._truncated = set()
+        # Global and per-host semaphores of each event loop, shared by all loads
+        self._limits = weakref.WeakKeyDictionary()
+
+        if requires_js_support and not javascript_enabled:
+            raise ValueError(
+                "JavaScript support cannot be required with JavaScript disabled."
+            )
+        self.javascript_enabled = javascript_enabled
+
+        self.infinite_scroll = _infinite_scroll_options(infinite_scroll)
+        if self.infinite_scroll is not None:
+            if self.backend != "playwright":
+                raise ValueError("infinite_scroll requires the playwright backend.")
+            if not javascript_enabled:
+                raise ValueError(
+                    "infinite_scroll cannot be used with JavaScript disabled."
+                )
+
+    def _launch_options(self) -> dict:
+        """Returns the kwargs used to launch the Playwright browser."""
+        return {"headless": self.headless, "proxy": self.proxy, **self.browser_config}
+
+    def _context_options(self, **options) -> dict:
+        """Returns the kwargs used to create a Playwright browser context."""
+        if not self.javascript_enabled:
+            options["java_script_enabled"] = False
+        # Pooled browsers are shared by every proxy, which is set per context
+        if _pool_proxy.get() is not None:
+            options["proxy"] = _pool_proxy.get()
+        return options
+
+    def _fetch_proxy(self) -> Optional[dict]:
+        """Returns the proxy of the current fetch, from the proxy pool if any."""
+        return _pool_proxy.get() or self.proxy
+
+    async def _prepare_page(self, page, url: str, cache_results: list):
+        """
+        Attaches the resource blocker and the HTTP cache to a page about to
+        load the URL.
+        """
+        if self.resource_blocker is not None:
+            await self.resource_blocker.attach(page)
+        # The last registered route runs first, so the cache sees the main document
+        if self.http_cache is not None:
+            await self._route_through_cache(page, url, cache_results)
+
+    def _report_response(self, url: str, response):
+        """
+        Hands the status of an HTTP or Playwright response to the politeness
+        scheduler, which slows down on the hosts throttling the requests.
+        """
+        if self.politeness is None or response is None:
+            return
+        status = getattr(response, "status_code", None) or response.status
+        self.politeness.report(url, status, response.headers.get("retry-after"))
+
+    async def _page_content(self, page, url: str) -> str:
+        """
+        Returns the HTML of a page, measuring the DOM first so that an oversized
+        page is cut in the browser instead of being serialized whole.
+        """
+        if self.document_size is None:
+            return await page.content()
+
+        content = await page.evaluate(
+            DOM_SIZE_GUARD_JS,
+            [
+                self.document_size["max_download_bytes"],
+                self.document_size["strategy"] == "main_content",
+            ],
+        )
+        if content is None:
+            return await page.content()
+        logger.info(f"Truncated the DOM of {url} in the browser")
+        self._truncated.add(url)
+        return content
+
+    def _document(self, url: str, content: str, **metadata) -> Document:
+        """
+        Builds the Document of a URL, fitting its content within the document
+        size limits and flagging it as `truncated` if it does not fit.
+        """
+        metadata = {"source": url, **metadata}
+        if self.document_size is not None:
+            partial = "chunk" not in metadata and url in self._truncated
+            self._truncated.discard(url)
+            content, truncated = truncate_html(content, self.document_size, partial)
+            if truncated:
+                metadata["truncated"] = True
+        return Document(page_content=content, metadata=metadata)
 
     async def scrape(self, url: str) -> str:
         if self.backend == "playwright":
@@ -84,6 +419,115 @@ class ChromiumLoader(BaseLoader):
         else:
             raise ValueError(f"Unsupported backend: {self.backend}")
 
+    async def ascrape_http(self, url: str) -> Optional[str]:
+        """
+        Asynchronously fetch the content of a given URL over plain HTTP, with the
+        pooled connections of the shared HTTP fetcher.
+
+        Args:
+            url (str): The URL to scrape.
+
+        Returns:
+            Optional[str]: The HTML content, or None if the page has to be rendered
+            by a browser: the request failed, the page looks client-side rendered or
+            the host previously needed a browser.
+        """
+        fetcher = get_http_fetcher()
+        if fetcher.preferred_tier(url) == BROWSER_TIER:
+            return None
+
+        max_bytes = (
+            self.document_size["max_download_bytes"]
+            if self.document_size is not None
+            else None
+        )
+        try:
+            with span("fetch", category="fetch", url=url, tier=HTTP_TIER):
+                response = await fetcher.afetch(
+                    url,
+                    timeout=self.timeout,
+                    proxy=self._fetch_proxy(),
+                    cache=self.http_cache,
+                    max_bytes=max_bytes,
+                )
+        except httpx.HTTPError as e:
+            logger.info(f"HTTP fetch of {url} failed, using the browser: {e!r}")
+            return None
+
+        self._report_response(url, response)
+        reason = needs_browser(response)
+        if reason is not None:
+            logger.info(f"Rendering {url} in the browser: {reason}")
+            # Throttling and server errors say nothing about the page itself
+            if response.status_code != 429 and response.status_code < 500:
+                fetcher.remember_tier(url, BROWSER_TIER)
+            return None
+
+        fetcher.remember_tier(url, HTTP_TIER)
+        if response.extensions.get("truncated"):
+            logger.info(f"Stopped downloading {url} at the document size limit")
+            self._truncated.add(url)
+        return response.text
+
+    async def _route_through_cache(self, page, url: str, cache_results: list):
+        """
+        Serves the main document of the page from the HTTP cache while it is
+        fresh, revalidates it with a conditional request once stale and stores
+        it otherwise. Subresources are left to the browser.
+
+        Args:
+            page: The Playwright page about to load the URL.
+            url (str): The URL of the main document.
+            cache_results (list): Receives the outcome of the lookup, recorded by
+                                  the caller once the page is loaded.
+        """
+        cache = self.http_cache
+
+        async def handle(route):
+            entry = await asyncio.to_thread(cache.lookup, url)
+            if entry is not None and entry.fresh:
+                await route.fulfill(
+                    status=entry.status, headers=entry.headers, body=entry.body
+                )
+                cache_results.append((CACHE_HIT, entry))
+                return
+
+            headers = dict(route.request.headers)
+            if entry is not None:
+                headers.update(entry.validators())
+
+            start = time.monotonic()
+            response = await route.fetch(headers=headers)
+            elapsed = time.monotonic() - start
+
+            if response.status == 304 and entry is not None:
+                refreshed = await asyncio.to_thread(
+                    cache.refresh, entry, response.headers
+                )
+                entry = refreshed or entry
+                await route.fulfill(
+                    status=entry.status, headers=entry.headers, body=entry.body
+                )
+                cache_results.append((CACHE_REVALIDATED, entry, elapsed))
+                return
+
+            body = await response.body()
+            await asyncio.to_thread(
+                cache.store, url, response.status, response.headers, body, elapsed
+            )
+            # The body is already decoded, its transfer headers no longer apply
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in UNCACHED_HEADERS or name.lower() == "set-cookie"
+            }
+            await route.fulfill(status=response.status, headers=headers, body=body)
+            cache_results.append((CACHE_MISS,))
+
+        await page.route(
+            lambda request_url: _same_document(request_url, url), handle, times=1
+        )
+
     async def ascrape_undetected_chromedriver(self, url: str) -> str:
         """
         Asynchronously scrape the content of a given URL using undetected chrome with Selenium.
@@ -221,8 +665,6 @@ class ChromiumLoader(BaseLoader):
                 "Scroll value for scrolling scraper must be greater than or equal to 5000."
             )
 
-        import time
-
         from playwright.async_api import async_playwright
         from undetected_playwright import Malenia
 
@@ -230,6 +672,7 @@ class ChromiumLoader(BaseLoader):
 
         results = ""
         attempt = 0
+        cache_results = []
 
         while attempt < self.retry_limit:
             try:
@@ -238,20 +681,21 @@ class ChromiumLoader(BaseLoader):
                     if browser_name == "chromium":
                         browser = await p.chromium.launch(
                             headless=self.headless,
-                            proxy=self.proxy,
+                            proxy=self._fetch_proxy(),
                             **self.browser_config,
                         )
                     elif browser_name == "firefox":
                         browser = await p.firefox.launch(
                             headless=self.headless,
-                            proxy=self.proxy,
+                            proxy=self._fetch_proxy(),
                             **self.browser_config,
                         )
                     else:
                         raise ValueError(f"Invalid browser name: {browser_name}")
-                    context = await browser.new_context()
+                    context = await browser.new_context(**self._context_options())
                     await Malenia.apply_stealth(context)
                     page = await context.new_page()
+                    await self._prepare_page(page, url, cache_results)
                     await page.goto(url, wait_until="domcontentloaded")
                     await page.wait_for_load_state(self.load_state)
 
@@ -285,9 +729,8 @@ class ChromiumLoader(BaseLoader):
                         logger.debug(
                             f"Scrolled {url} to current height {current_height}px..."
                         )
-                        time.sleep(
-                            sleep
-                        )  # Allow some time for any lazy-loaded content to load
+                        # Allow some time for any lazy-loaded content to load
+                        await asyncio.sleep(sleep)
 
                         current_time = time.time()
                         elapsed_time = current_time - start_time
@@ -306,6 +749,7 @@ class ChromiumLoader(BaseLoader):
                                 break
 
                     results = await page.content()
+                    _record_cache_results(cache_results)
                     break
 
             except (aiohttp.ClientError, asyncio.TimeoutError, Exception) as e:
@@ -320,6 +764,195 @@ class ChromiumLoader(BaseLoader):
 
         return results
 
+    @asynccontextmanager
+    async def _browser_page(self, browser_name: str = "chromium"):
+        """Launches a browser for a single fetch and yields a new page of it."""
+        from playwright.async_api import async_playwright
+        from undetected_playwright import Malenia
+
+        async with async_playwright() as p:
+            if browser_name not in ("chromium", "firefox"):
+                raise ValueError(f"Invalid browser name: {browser_name}")
+            browser = await getattr(p, browser_name).launch(**self._launch_options())
+            try:
+                context = await browser.new_context(
+                    **self._context_options(storage_state=self.storage_state)
+                )
+                await Malenia.apply_stealth(context)
+                yield await context.new_page()
+            finally:
+                await browser.close()
+
+    async def _scroll_page(
+        self, page, url: str, cache_results: list, incremental: bool
+    ) -> AsyncIterator[str]:
+        """
+        Loads the URL in the page and scrolls it to the bottom until no new
+        elements are added, a DOM mutation observer telling when new content
+        has loaded.
+
+        Args:
+            page: The Playwright page.
+            url (str): The URL to scrape.
+            cache_results (list): Receives the HTTP cache outcome of the page.
+            incremental (bool): Whether to yield the initial HTML and then the
+                                HTML of the elements added by each scroll, rather
+                                than the final HTML once scrolling is over.
+
+        Yields:
+            str: The HTML content, or its increments.
+        """
+        options = self.infinite_scroll
+        await self._prepare_page(page, url, cache_results)
+        response = await page.goto(url, wait_until="domcontentloaded")
+        self._report_response(url, response)
+        await page.wait_for_load_state(self.load_state)
+
+        await page.evaluate(_OBSERVE_MUTATIONS_JS, incremental)
+        if incremental:
+            yield await page.content()
+
+        deadline = time.monotonic() + options["timeout"]
+        idle_scrolls = 0
+        for scrolls in range(1, options["max_scrolls"] + 1):
+            added = await page.evaluate(
+                _SCROLL_AND_WAIT_JS,
+                [options["idle_timeout"] * 1000, SCROLL_SETTLE_TIME],
+            )
+            if added:
+                idle_scrolls = 0
+                if incremental:
+                    delta = await page.evaluate(_TAKE_ADDED_HTML_JS)
+                    if delta.strip():
+                        yield delta
+            else:
+                idle_scrolls += 1
+                if idle_scrolls >= options["max_idle_scrolls"]:
+                    logger.info(
+                        f"No more content loaded on {url} after {scrolls} scrolls"
+                    )
+                    break
+            if time.monotonic() >= deadline:
+                logger.info(
+                    f"Stopped scrolling {url} after {options['timeout']} seconds"
+                )
+                break
+
+        if not incremental:
+            yield await self._page_content(page, url)
+
+    async def _astream_scroll(
+        self, url: str, browser_name: str, incremental: bool
+    ) -> AsyncIterator[str]:
+        cache_results = []
+
+        if self.browser_pool is None:
+            async with self._browser_page(browser_name) as page:
+                async for chunk in self._scroll_page(
+                    page, url, cache_results, incremental
+                ):
+                    yield chunk
+            _record_cache_results(cache_results)
+            return
+
+        # The page lives on the loop of the pool, its chunks are handed over to this loop
+        loop = asyncio.get_running_loop()
+        chunks = asyncio.Queue()
+
+        async def scroll(page):
+            async for chunk in self._scroll_page(page, url, cache_results, incremental):
+                loop.call_soon_threadsafe(chunks.put_nowait, chunk)
+
+        run = asyncio.ensure_future(
+            self.browser_pool.run(
+                scroll,
+                browser_name=browser_name,
+                launch_options=self._launch_options(),
+                context_options=self._context_options(
+                    storage_state=self.storage_state, ignore_https_errors=True
+                ),
+                stealth=True,
+            )
+        )
+        run.add_done_callback(lambda _: chunks.put_nowait(None))
+        try:
+            while (chunk := await chunks.get()) is not None:
+                yield chunk
+            await run
+        finally:
+            run.cancel()
+        _record_cache_results(cache_results)
+
+    async def astream_infinite_scroll(
+        self, url: str, browser_name: str = "chromium"
+    ) -> AsyncIterator[str]:
+        """
+        Asynchronously scrape a page with infinite scrolling, yielding its
+        content as it loads: first the HTML of the page, then the HTML of the
+        elements added by each scroll, so that their processing can overlap
+        the scrolling.
+
+        Args:
+            url (str): The URL to scrape.
+            browser_name (str): The Playwright browser, "chromium" or "firefox".
+
+        Yields:
+            str: The initial HTML content, then the HTML of the new elements.
+
+        Raises:
+            ValueError: If the infinite scroll mode is not enabled or the browser
+                        name is invalid.
+        """
+        if self.infinite_scroll is None:
+            raise ValueError("The infinite_scroll option of the loader is not set.")
+
+        logger.info(f"Starting incremental scraping with infinite scroll for {url}...")
+        with span("fetch", category="fetch", url=url, mode="infinite_scroll"):
+            async for chunk in self._astream_scroll(url, browser_name, True):
+                yield chunk
+
+    async def ascrape_infinite_scroll(
+        self, url: str, browser_name: str = "chromium"
+    ) -> str:
+        """
+        Asynchronously scrape a page with infinite scrolling, scrolling until no
+        new elements load. Unlike `ascrape_playwright_scroll`, it waits for DOM
+        mutations rather than sleeping a fixed time after each scroll.
+
+        Args:
+            url (str): The URL to scrape.
+            browser_name (str): The Playwright browser, "chromium" or "firefox".
+
+        Returns:
+            str: The HTML content once scrolling is over.
+
+        Raises:
+            RuntimeError: When retry limit is reached without successful scraping
+            ValueError: If the infinite scroll mode is not enabled.
+        """
+        if self.infinite_scroll is None:
+            raise ValueError("The infinite_scroll option of the loader is not set.")
+
+        logger.info(f"Starting scraping with infinite scroll for {url}...")
+        attempt = 0
+        while True:
+            try:
+                with span("fetch", category="fetch", url=url, attempt=attempt + 1):
+                    chunks = [
+                        chunk
+                        async for chunk in self._astream_scroll(
+                            url, browser_name, False
+                        )
+                    ]
+                    return chunks[-1]
+            except (aiohttp.ClientError, asyncio.TimeoutError, Exception) as e:
+                attempt += 1
+                logger.error(f"Attempt {attempt} failed: {e}")
+                if attempt >= self.retry_limit:
+                    raise RuntimeError(
+                        f"Failed to scrape after {self.retry_limit} attempts: {str(e)}"
+                    )
+
     async def ascrape_playwright(self, url: str, browser_name: str = "chromium") -> str:
         """
         Asynchronously scrape the content of a given URL using Playwright's async API.
@@ -341,36 +974,66 @@ class ChromiumLoader(BaseLoader):
         results = ""
         attempt = 0
 
+        cache_results = []
+
+        async def load_page(page) -> str:
+            await self._prepare_page(page, url, cache_results)
+            response = await page.goto(url, wait_until="domcontentloaded")
+            self._report_response(url, response)
+            await page.wait_for_load_state(self.load_state)
+            return await self._page_content(page, url)
+
         while attempt < self.retry_limit:
             try:
-                async with async_playwright() as p, async_timeout.timeout(self.timeout):
-                    browser = None
-                    if browser_name == "chromium":
-                        browser = await p.chromium.launch(
-                            headless=self.headless,
-                            proxy=self.proxy,
-                            **self.browser_config,
-                        )
-                    elif browser_name == "firefox":
-                        browser = await p.firefox.launch(
-                            headless=self.headless,
-                            proxy=self.proxy,
-                            **self.browser_config,
+                with span("fetch", category="fetch", url=url, attempt=attempt + 1):
+                    if self.browser_pool is not None:
+                        async with async_timeout.timeout(self.timeout):
+                            results = await self.browser_pool.run(
+                                load_page,
+                                browser_name=browser_name,
+                                launch_options=self._launch_options(),
+                                context_options=self._context_options(
+                                    storage_state=self.storage_state,
+                                    ignore_https_errors=True,
+                                ),
+                                stealth=True,
+                            )
+                        logger.info("Content scraped")
+                        _record_cache_results(cache_results)
+                        return results
+
+                    async with (
+                        async_playwright() as p,
+                        async_timeout.timeout(self.timeout),
+                    ):
+                        browser = None
+                        if browser_name == "chromium":
+                            browser = await p.chromium.launch(
+                                headless=self.headless,
+                                proxy=self._fetch_proxy(),
+                                **self.browser_config,
+                            )
+                        elif browser_name == "firefox":
+                            browser = await p.firefox.launch(
+                                headless=self.headless,
+                                proxy=self._fetch_proxy(),
+                                **self.browser_config,
+                            )
+                        else:
+                            raise ValueError(f"Invalid browser name: {browser_name}")
+                        context = await browser.new_context(
+                            **self._context_options(
+                                storage_state=self.storage_state,
+                                ignore_https_errors=True,
+                            )
                         )
-                    else:
-                        raise ValueError(f"Invalid browser name: {browser_name}")
-                    context = await browser.new_context(
-                        storage_state=self.storage_state,
-                        ignore_https_errors=True,
-                    )
-                    await Malenia.apply_stealth(context)
-                    page = await context.new_page()
-                    await page.goto(url, wait_until="domcontentloaded")
-                    await page.wait_for_load_state(self.load_state)
-                    results = await page.content()
-                    logger.info("Content scraped")
-                    await browser.close()
-                    return results
+                        await Malenia.apply_stealth(context)
+                        page = await context.new_page()
+                        results = await load_page(page)
+                        logger.info("Content scraped")
+                        await browser.close()
+                        _record_cache_results(cache_results)
+                        return results
             except (aiohttp.ClientError, asyncio.TimeoutError, Exception) as e:
                 attempt += 1
                 logger.error(f"Attempt {attempt} failed: {e}")
@@ -400,31 +1063,53 @@ class ChromiumLoader(BaseLoader):
         logger.info(f"Starting scraping with JavaScript support for {url}...")
         attempt = 0
 
+        cache_results = []
+
+        async def render_page(page) -> str:
+            await self._prepare_page(page, url, cache_results)
+            response = await page.goto(url, wait_until="networkidle")
+            self._report_response(url, response)
+            return await self._page_content(page, url)
+
         while attempt < self.retry_limit:
+            browser = None
             try:
+                if self.browser_pool is not None:
+                    async with async_timeout.timeout(self.timeout):
+                        results = await self.browser_pool.run(
+                            render_page,
+                            browser_name=browser_name,
+                            launch_options=self._launch_options(),
+                            context_options=self._context_options(
+                                storage_state=self.storage_state
+                            ),
+                        )
+                    logger.info("Content scraped after JavaScript rendering")
+                    _record_cache_results(cache_results)
+                    return results
+
                 async with async_playwright() as p, async_timeout.timeout(self.timeout):
-                    browser = None
                     if browser_name == "chromium":
                         browser = await p.chromium.launch(
                             headless=self.headless,
-                            proxy=self.proxy,
+                            proxy=self._fetch_proxy(),
                             **self.browser_config,
                         )
                     elif browser_name == "firefox":
                         browser = await p.firefox.launch(
                             headless=self.headless,
-                            proxy=self.proxy,
+                            proxy=self._fetch_proxy(),
                             **self.browser_config,
                         )
                     else:
                         raise ValueError(f"Invalid browser name: {browser_name}")
                     context = await browser.new_context(
-                        storage_state=self.storage_state
+                        **self._context_options(storage_state=self.storage_state)
                     )
                     page = await context.new_page()
-                    await page.goto(url, wait_until="networkidle")
-                    results = await page.content()
+                    results = await render_page(page)
                     logger.info("Content scraped after JavaScript rendering")
+                    _record_cache_results(cache_results)
                     return results
             except (aiohttp.ClientError, asyncio.TimeoutError, Exception) as e:
                 attempt += 1
@@ -434,50 +1119,146 @@ class ChromiumLoader(BaseLoader):
                         f"Failed to scrape after {self.retry_limit} attempts: {str(e)}"
                     )
             finally:
-                await browser.close()
+                if browser is not None:
+                    await browser.close()
 
     def lazy_load(self) -> Iterator[Document]:
         """
         Lazily load text content from the provided URLs.
 
-        This method yields Documents one at a time as they're scraped,
-        instead of waiting to scrape all URLs before returning.
+        The URLs are fetched concurrently, within the limits of `max_concurrency`
+        and `max_concurrency_per_host`, on a single event loop for the whole
+        batch. Documents are yielded one at a time as soon as they're scraped,
+        in completion order.
 
         Yields:
             Document: The scraped content encapsulated within a Document object.
         """
-        scraping_fn = (
-            self.ascrape_with_js_support
-            if self.requires_js_support
-            else getattr(self, f"ascrape_{self.backend}")
-        )
-
-        for url in self.urls:
-            html_content = asyncio.run(scraping_fn(url))
-            metadata = {"source": url}
-            yield Document(page_content=html_content, metadata=metadata)
+        documents = self._aload(list(self.urls))
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(documents.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(documents.aclose())
+            loop.close()
 
     async def alazy_load(self) -> AsyncIterator[Document]:
         """
         Asynchronously load text content from the provided URLs.
 
-        This method leverages asyncio to initiate the scraping of all provided URLs
-        simultaneously. It improves performance by utilizing concurrent asynchronous
-        requests. Each Document is yielded as soon as its content is available,
-        encapsulating the scraped content.
+        With `http_first`, each URL is fetched over plain HTTP first and only
+        rendered by the browser if needed.
+
+        The URLs are fetched concurrently, at most `max_concurrency` at the same
+        time and at most `max_concurrency_per_host` for any single host, so that
+        a large batch neither starts a browser per URL nor hammers one site.
+        Each Document is yielded as soon as its content is available, in
+        completion order; if a fetch fails, the pending ones are cancelled.
 
         Yields:
             Document: A Document object containing the scraped content, along with its
             source URL as metadata.
         """
-        scraping_fn = (
-            self.ascrape_with_js_support
-            if self.requires_js_support
-            else getattr(self, f"ascrape_{self.backend}")
-        )
+        async for document in self._aload(self.urls):
+            yield document
+
+    async def aload_urls(self, urls: List[str]) -> List[Document]:
+        """
+        Asynchronously loads the given URLs with the settings of the loader, so
+        that a crawler can reuse a single loader for the pages it discovers.
+
+        Args:
+            urls (List[str]): The URLs to load, instead of `self.urls`.
+
+        Returns:
+            List[Document]: The scraped Documents, in completion order.
+        """
+        return [document async for document in self._aload(urls)]
 
-        tasks = [scraping_fn(url) for url in self.urls]
-        results = await asyncio.gather(*tasks)
-        for url, content in zip(self.urls, results):
-            metadata = {"source": url}
-            yield Document(page_content=content, metadata=metadata)
+    def _concurrency_limits(self) -> tuple:
+        """
+        Returns the global semaphore and the per-host semaphores of the running
+        event loop, so that concurrent loads of the loader, such as the pages a
+        crawler loads one `aload_urls` call at a time, share the same limits.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self._limits:
+            self._limits[loop] = (asyncio.Semaphore(self.max_concurrency), {})
+        return self._limits[loop]
+
+    async def _aload(self, urls) -> AsyncIterator[Document]:
+        if self.infinite_scroll is not None:
+            scraping_fn = self.ascrape_infinite_scroll
+        elif self.requires_js_support:
+            scraping_fn = self.ascrape_with_js_support
+        else:
+            scraping_fn = getattr(self, f"ascrape_{self.backend}")
+
+        global_limit, host_limits = self._concurrency_limits()
+        # Documents are handed over as they come, followed by the task that produced them
+        documents = asyncio.Queue()
+
+        async def fetch(url: str):
+            host = urlparse(url).netloc
+            if host not in host_limits:
+                host_limits[host] = asyncio.Semaphore(self.max_concurrency_per_host)
+
+            politeness = (
+                self.politeness.slot(url)
+                if self.politeness is not None
+                else nullcontext()
+            )
+            proxy_rotation = (
+                self.proxy_pool.arotate()
+                if self.proxy_pool is not None
+                else nullcontext()
+            )
+            # Waiting for the host slot first keeps the global slots free for other hosts
+            async with (
+                host_limits[host],
+                politeness,
+                global_limit,
+                proxy_rotation as proxy,
+            ):
+                # Each fetch runs in its own task, whose context holds its proxy
+                _pool_proxy.set(proxy)
+                if self.http_first:
+                    content = await self.ascrape_http(url)
+                    if content is not None:
+                        documents.put_nowait(self._document(url, content))
+                        return
+
+                if self.infinite_scroll and self.infinite_scroll["incremental"]:
+                    chunk = 0
+                    async for content in self.astream_infinite_scroll(url):
+                        documents.put_nowait(self._document(url, content, chunk=chunk))
+                        chunk += 1
+                    return
+
+                content = scraping_fn(url)
+                if not inspect.isawaitable(content):
+                    raise ValueError(f"a coroutine was expected, got {content!r}")
+                content = await content
+                documents.put_nowait(self._document(url, content))
+
+        tasks = [asyncio.ensure_future(fetch(url)) for url in urls]
+        for task in tasks:
+            task.add_done_callback(documents.put_nowait)
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await documents.get()
+                if isinstance(item, Document):
+                    yield item
+                else:
+                    remaining -= 1
+                    # Raises the error of a failed fetch
+                    item.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,159 @@
+"""
+Size limits of the fetched documents and their truncation strategies
+"""
+
+import re
+from typing import Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, Comment
+
+TRUNCATION_STRATEGIES = ("head", "main_content", "byte_budget")
+
+# Share of a page downloaded by the strategies that drop markup before cutting
+READ_FACTOR = 4
+
+# Elements that never hold readable content
+NOISE_TAGS = ("script", "style", "noscript", "svg", "template", "iframe")
+
+_NOISE_RE = re.compile(
+    r"<!--.*?-->|<(script|style|noscript|svg|template)\b.*?</\1\s*>",
+    re.DOTALL | re.IGNORECASE,
+)
+# Inline data URIs, such as base64 images, are the bulk of many oversized pages
+_DATA_URI_RE = re.compile(
+    r"""\s(?:src|srcset|href|poster)\s*=\s*(["'])data:.*?\1""",
+    re.DOTALL | re.IGNORECASE,
+)
+
+# Returns null when the DOM fits the limit, the HTML to keep otherwise
+DOM_SIZE_GUARD_JS = """([maxChars, mainContent]) => {
+    const root = document.documentElement;
+    const html = root.outerHTML;
+    if (html.length <= maxChars) return null;
+    if (!mainContent) return html.slice(0, maxChars);
+
+    const main = document.querySelector("main, [role=main], article")
+        || document.body || root;
+    const copy = main.cloneNode(true);
+    copy.querySelectorAll("script, style, noscript, svg, template, iframe")
+        .forEach((element) => element.remove());
+    return copy.outerHTML.slice(0, maxChars);
+}"""
+
+
+def get_document_size_limits(option: Union[int, dict, None]) -> Optional[dict]:
+    """
+    Resolves the `max_document_size` option of the loaders.
+
+    Args:
+        option: None for no limit, the maximum size of a document in bytes, or
+                a dict with its `max_bytes`, the truncation `strategy` ("head",
+                "main_content" or "byte_budget") and `max_download_bytes`, the
+                most that is downloaded or read from the browser.
+
+    Returns:
+        Optional[dict]: The `max_bytes`, `strategy` and `max_download_bytes`.
+
+    Raises:
+        ValueError: If the option has an unsupported type or value.
+    """
+    if option is None:
+        return None
+    if isinstance(option, bool) or not isinstance(option, (int, dict)):
+        raise ValueError("max_document_size must be a number of bytes or a dictionary.")
+    if isinstance(option, int):
+        option = {"max_bytes": option}
+
+    unknown = set(option) - {"max_bytes", "strategy", "max_download_bytes"}
+    if unknown:
+        raise ValueError(
+            f"Unknown max_document_size keys: {', '.join(sorted(unknown))}"
+        )
+    limits = {"strategy": "head", **option}
+    if limits["strategy"] not in TRUNCATION_STRATEGIES:
+        raise ValueError(
+            f"Unknown truncation strategy {limits['strategy']!r}, "
+            f"expected one of {', '.join(TRUNCATION_STRATEGIES)}."
+        )
+    if not isinstance(limits.get("max_bytes"), int) or limits["max_bytes"] < 1:
+        raise ValueError("max_document_size needs a positive max_bytes.")
+
+    if "max_download_bytes" not in limits:
+        factor = 1 if limits["strategy"] == "head" else READ_FACTOR
+        limits["max_download_bytes"] = factor * limits["max_bytes"]
+    elif limits["max_download_bytes"] < limits["max_bytes"]:
+        raise ValueError("max_download_bytes cannot be lower than max_bytes.")
+    return limits
+
+
+def _head(html: str, max_bytes: int) -> str:
+    """Keeps the first bytes of the HTML, without a trailing partial tag."""
+    html = html.encode("utf-8")[:max_bytes].decode("utf-8", "ignore")
+    start = html.rfind("<")
+    if start > html.rfind(">"):
+        html = html[:start]
+    return html
+
+
+def _main_content(html: str) -> str:
+    """Keeps the title and the main element of the page, without its noise."""
+    soup = BeautifulSoup(html, "html.parser")
+    for element in soup(NOISE_TAGS):
+        element.decompose()
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+
+    main = (
+        soup.find("main")
+        or soup.find(attrs={"role": "main"})
+        or soup.find("article")
+        or soup.body
+    )
+    if main is None:
+        return str(soup)
+    title = soup.title or ""
+    return f"<html><head>{title}</head><body>{main}</body></html>"
+
+
+def _strip_noise(html: str) -> str:
+    """Drops comments, scripts, styles, inline SVG and data URIs with regexes."""
+    return _DATA_URI_RE.sub("", _NOISE_RE.sub("", html))
+
+
+def truncate_html(html: str, limits: dict, partial: bool = False) -> Tuple[str, bool]:
+    """
+    Fits an HTML document into `max_bytes`, once encoded in UTF-8.
+
+    With the "head" strategy, the beginning of the document is kept. The
+    "main_content" strategy keeps the title and the main element of the page
+    (`<main>`, `role="main"`, `<article>` or `<body>`), and "byte_budget"
+    keeps the whole page but drops the markup that holds no content (scripts,
+    styles, inline SVG, comments, data URIs), so that the budget is spent on
+    text; the beginning of the result is then kept if it is still too large.
+    Documents within the limit are returned as is, unless they were already
+    cut while downloading them.
+
+    Args:
+        html (str): The HTML document.
+        limits (dict): The limits returned by `get_document_size_limits`.
+        partial (bool): Whether the download of the document stopped at
+                        `max_download_bytes`.
+
+    Returns:
+        Tuple[str, bool]: The document and whether it was truncated.
+    """
+    max_bytes = limits["max_bytes"]
+    if not partial and (
+        len(html) <= max_bytes // 4 or len(html.encode("utf-8")) <= max_bytes
+    ):
+        return html, False
+
+    if limits["strategy"] == "main_content":
+        html = _main_content(html)
+    elif limits["strategy"] == "byte_budget":
+        html = _strip_noise(html)
+
+    # A cut download may end in the middle of a tag, dropped by the head cut
+    if partial or len(html.encode("utf-8")) > max_bytes:
+        html = _head(html, max_bytes)
+    return html, True
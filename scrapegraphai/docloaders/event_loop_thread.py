@@ -0,0 +1,95 @@
+"""
+Event loop running in a daemon thread, for objects shared across event loops
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Callable, Coroutine, Optional
+
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class EventLoopThread:
+    """
+    Runs an event loop in a daemon thread, started on first use.
+
+    Playwright browsers and pooled HTTP clients are bound to the event loop
+    that created them, whereas the loaders run under `asyncio.run`, under the
+    loop of an async graph or in worker threads. Objects meant to be shared by
+    all of them live on this loop and every operation is scheduled on it.
+
+    Attributes:
+        name (str): The name of the thread.
+
+    Example:
+        >>> runner = EventLoopThread("browser-pool")
+        >>> content = runner.run_sync(fetch(url))
+        >>> runner.stop()
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, coroutine: Coroutine) -> concurrent.futures.Future:
+        """Schedules a coroutine on the loop, starting the thread if needed."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name=self.name, daemon=True
+                )
+                self._thread.start()
+            return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    async def run(self, coroutine: Coroutine) -> Any:
+        """Runs a coroutine on the loop and awaits its result from another loop."""
+        return await asyncio.wrap_future(self.submit(coroutine))
+
+    def run_sync(self, coroutine: Coroutine) -> Any:
+        """
+        Runs a coroutine on the loop and blocks until its result is available.
+
+        Raises:
+            RuntimeError: If called from the thread of the loop, which would deadlock.
+        """
+        if self._thread is threading.current_thread():
+            coroutine.close()
+            raise RuntimeError(f"run_sync cannot be called from the {self.name} loop.")
+        return self.submit(coroutine).result()
+
+    def stop(
+        self,
+        shutdown: Optional[Callable[[], Coroutine]] = None,
+        timeout: float = 30,
+    ):
+        """
+        Stops the loop and its thread. The thread is started again on the next
+        submitted coroutine.
+
+        Args:
+            shutdown (Optional[Callable]): A coroutine function run on the loop
+                                           before it stops, to release resources.
+            timeout (float): Maximum time in seconds to wait for the shutdown.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        try:
+            if shutdown is not None:
+                asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Could not shut down the {self.name} loop cleanly: {e}")
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
@@ -0,0 +1,425 @@
+"""
+On-disk HTTP cache of fetched pages, revalidated with conditional requests
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from typing import Iterator, Optional, Union
+
+from ..utils.logging import get_logger
+
+logger = get_logger("http-cache")
+
+HTTP_CACHE_DB = "http_cache.db"
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+CACHE_HIT = "hit"
+CACHE_REVALIDATED = "revalidated"
+CACHE_MISS = "miss"
+
+# Without explicit freshness, a page modified long ago is assumed to stay
+# unchanged for a tenth of its age (RFC 9111, section 4.2.2)
+HEURISTIC_FRACTION = 0.1
+MAX_HEURISTIC_LIFETIME = 24 * 3600
+
+# Headers describing the transfer rather than the page, or that must not be replayed
+UNCACHED_HEADERS = {
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "set-cookie",
+    "transfer-encoding",
+}
+
+
+def _cache_control(headers: dict) -> dict:
+    """Parses the Cache-Control directives of a response."""
+    directives = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    return directives
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    """Converts an HTTP date to a timestamp, None if it is missing or invalid."""
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def freshness_lifetime(headers: dict, now: Optional[float] = None) -> Optional[float]:
+    """
+    Computes how long a response can be served without revalidation.
+
+    Args:
+        headers (dict): The response headers, with lower-case names.
+        now (Optional[float]): The time the response was received.
+
+    Returns:
+        Optional[float]: The remaining freshness in seconds, 0 if the response
+        must be revalidated before every use, or None if it must not be stored.
+    """
+    now = time.time() if now is None else now
+    directives = _cache_control(headers)
+    if "no-store" in directives or headers.get("vary", "").strip() == "*":
+        return None
+    if "no-cache" in directives:
+        return 0.0
+
+    try:
+        age = max(0.0, float(headers.get("age", 0)))
+    except ValueError:
+        age = 0.0
+
+    if "max-age" in directives:
+        try:
+            return max(0.0, float(directives["max-age"]) - age)
+        except ValueError:
+            return 0.0
+
+    date = _http_date(headers.get("date")) or now
+    if "expires" in headers:
+        expires = _http_date(headers["expires"])
+        return max(0.0, expires - date - age) if expires is not None else 0.0
+
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified is not None:
+        lifetime = HEURISTIC_FRACTION * max(0.0, date - last_modified)
+        return max(0.0, min(lifetime, MAX_HEURISTIC_LIFETIME) - age)
+    return 0.0
+
+
+class CachedResponse:
+    """A response stored in the HTTP cache."""
+
+    __slots__ = ("url", "status", "headers", "body", "expires", "elapsed")
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: dict,
+        body: bytes,
+        expires: float,
+        elapsed: float,
+    ):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.expires = expires
+        self.elapsed = elapsed
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the response can be served without contacting the server."""
+        return time.time() < self.expires
+
+    def validators(self) -> dict:
+        """Returns the headers of a conditional request revalidating the response."""
+        validators = {}
+        if "etag" in self.headers:
+            validators["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            validators["If-Modified-Since"] = self.headers["last-modified"]
+        return validators
+
+
+class HttpCache:
+    """
+    Stores successful page responses in a local SQLite database, keyed by URL,
+    following the freshness rules of their `Cache-Control`, `Expires` and
+    `Last-Modified` headers. Stale responses carrying an `ETag` or a
+    `Last-Modified` date are revalidated with a conditional request, so that
+    an unchanged page costs a `304 Not Modified` instead of a full download.
+    The least recently used responses are evicted once the cache grows beyond
+    `max_size` bytes.
+
+    Attributes:
+        db_path (str): Path of the SQLite database file.
+        max_size (int): Maximum total size of the stored responses in bytes.
+
+    Args:
+        cache_path (str): Directory holding the cache database.
+        max_size (int, optional): Maximum total size of the stored responses in bytes.
+
+    Example:
+        >>> cache = HttpCache("./http_cache", max_size=64 * 1024 * 1024)
+        >>> loader = ChromiumLoader(urls, http_first=True, http_cache=cache)
+    """
+
+    def __init__(self, cache_path: str, max_size: int = DEFAULT_MAX_SIZE):
+        cache_path = os.fspath(cache_path)
+        os.makedirs(cache_path, exist_ok=True)
+        self.db_path = os.path.join(cache_path, HTTP_CACHE_DB)
+        self.max_size = max_size
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    status INTEGER,
+                    headers TEXT,
+                    body BLOB,
+                    expires REAL,
+                    elapsed REAL,
+                    size INTEGER,
+                    last_used REAL
+                )
+                """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """
+        Returns the stored response of a URL, fresh or not, or None on a miss.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            Optional[CachedResponse]: The stored response.
+        """
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT status, headers, body, expires, elapsed FROM responses "
+                "WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE responses SET last_used = ? WHERE url = ?", (time.time(), url)
+            )
+
+        status, headers, body, expires, elapsed = row
+        return CachedResponse(url, status, json.loads(headers), body, expires, elapsed)
+
+    def store(
+        self, url: str, status: int, headers: dict, body: bytes, elapsed: float = 0.0
+    ) -> Optional[CachedResponse]:
+        """
+        Stores the response of a URL if it is cacheable, and evicts the least
+        recently used responses if the cache exceeds its maximum size.
+
+        Args:
+            url (str): The requested URL.
+            status (int): The status code of the response.
+            headers (dict): The response headers.
+            body (bytes): The decoded response body.
+            elapsed (float): The time it took to download the response, in seconds.
+
+        Returns:
+            Optional[CachedResponse]: The stored response, or None if the
+            response cannot be cached.
+        """
+        if status != 200:
+            return None
+
+        headers = {
+            name.lower(): value
+            for name, value in headers.items()
+            if name.lower() not in UNCACHED_HEADERS
+        }
+        now = time.time()
+        lifetime = freshness_lifetime(headers, now)
+        if lifetime is None:
+            return None
+
+        entry = CachedResponse(url, status, headers, body, now + lifetime, elapsed)
+        # A response that is never fresh is only worth keeping if it can be revalidated
+        if not lifetime and not entry.validators():
+            return None
+
+        serialized = json.dumps(headers)
+        size = len(body) + len(serialized)
+        if size > self.max_size:
+            return None
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO responses
+                (url, status, headers, body, expires, elapsed, size, last_used)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (url, status, serialized, body, entry.expires, elapsed, size, now),
+            )
+            self._evict(conn)
+        return entry
+
+    def refresh(self, entry: CachedResponse, headers: dict) -> Optional[CachedResponse]:
+        """
+        Updates a stored response after the server confirmed it is unchanged
+        with a `304 Not Modified`.
+
+        Args:
+            entry (CachedResponse): The revalidated response.
+            headers (dict): The headers of the 304 response.
+
+        Returns:
+            Optional[CachedResponse]: The updated response, or None if the
+            server asked not to store it anymore.
+        """
+        merged = dict(entry.headers)
+        merged.update(
+            (name.lower(), value)
+            for name, value in headers.items()
+            if name.lower() not in UNCACHED_HEADERS
+        )
+
+        now = time.time()
+        lifetime = freshness_lifetime(merged, now)
+        with closing(self._connect()) as conn, conn:
+            if lifetime is None:
+                conn.execute("DELETE FROM responses WHERE url = ?", (entry.url,))
+                return None
+            conn.execute(
+                "UPDATE responses SET headers = ?, expires = ?, last_used = ? "
+                "WHERE url = ?",
+                (json.dumps(merged), now + lifetime, now, entry.url),
+            )
+
+        return CachedResponse(
+            entry.url, entry.status, merged, entry.body, now + lifetime, entry.elapsed
+        )
+
+    def _evict(self, conn: sqlite3.Connection):
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[
+            0
+        ]
+        if total <= self.max_size:
+            return
+
+        rows = conn.execute("SELECT url, size FROM responses ORDER BY last_used")
+        for url, size in rows.fetchall():
+            if total <= self.max_size:
+                break
+            conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            logger.debug(f"Evicted {url} from the HTTP cache")
+
+    def size(self) -> int:
+        """Returns the total size of the stored responses in bytes."""
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+
+    def clear(self):
+        """Removes every stored response."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM responses")
+
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+
+def get_http_cache(option: Union[str, dict, HttpCache, None]) -> Optional[HttpCache]:
+    """
+    Resolves the `http_cache` option of the loaders.
+
+    Args:
+        option: None or False to disable the cache, the directory of the cache,
+                a dict with its `path` and `max_size`, or an HttpCache instance.
+                Loaders given the same directory share one cache.
+
+    Returns:
+        Optional[HttpCache]: The cache to use, if any.
+
+    Raises:
+        ValueError: If the option has an unsupported type.
+    """
+    if not option:
+        return None
+    if isinstance(option, HttpCache):
+        return option
+    if isinstance(option, dict):
+        if "path" not in option:
+            raise ValueError("The http_cache option requires a 'path'.")
+        path, max_size = option["path"], option.get("max_size", DEFAULT_MAX_SIZE)
+    elif isinstance(option, (str, os.PathLike)):
+        path, max_size = option, DEFAULT_MAX_SIZE
+    else:
+        raise ValueError(
+            "The http_cache option must be a path, a dictionary or an HttpCache."
+        )
+
+    key = os.path.abspath(os.fspath(path))
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None or cache.max_size != max_size:
+            cache = _caches[key] = HttpCache(path, max_size=max_size)
+        return cache
+
+
+_cache_stats: ContextVar[Optional[dict]] = ContextVar("http_cache_stats", default=None)
+
+
+@contextmanager
+def http_cache_scope() -> Iterator[dict]:
+    """
+    Collects the HTTP cache results of the fetches made within the block,
+    including those of nested scopes.
+
+    Yields:
+        dict: The number of cached `requests`, of `hits` served without
+        contacting the server, of responses `revalidated` with a 304 and of
+        `misses`, along with the `bytes_saved` and the `time_saved` in seconds.
+    """
+    stats = {
+        "requests": 0,
+        "hits": 0,
+        "revalidated": 0,
+        "misses": 0,
+        "bytes_saved": 0,
+        "time_saved": 0.0,
+    }
+    parent = _cache_stats.get()
+    token = _cache_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _cache_stats.reset(token)
+        if parent is not None:
+            for key, value in stats.items():
+                parent[key] += value
+
+
+def record_cache_result(
+    status: str, entry: Optional[CachedResponse] = None, elapsed: float = 0.0
+):
+    """
+    Records the outcome of a cached fetch in the current `http_cache_scope`.
+
+    Args:
+        status (str): One of CACHE_HIT, CACHE_REVALIDATED or CACHE_MISS.
+        entry (Optional[CachedResponse]): The stored response that was served.
+        elapsed (float): The time spent contacting the server, in seconds.
+    """
+    stats = _cache_stats.get()
+    if stats is None:
+        return
+
+    stats["requests"] += 1
+    if status == CACHE_MISS or entry is None:
+        stats["misses"] += 1
+        return
+
+    stats["hits" if status == CACHE_HIT else "revalidated"] += 1
+    stats["bytes_saved"] += len(entry.body)
+    stats["time_saved"] += max(0.0, entry.elapsed - elapsed)
@@ -0,0 +1,365 @@
+"""
+HTTP tier of the fetch layer, tried before launching a browser
+"""
+
+import asyncio
+import atexit
+import importlib.util
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import urlparse, urlunparse
+
+import httpx
+
+from ..utils.logging import get_logger
+from .event_loop_thread import EventLoopThread
+from .http_cache import (
+    CACHE_HIT,
+    CACHE_MISS,
+    CACHE_REVALIDATED,
+    CachedResponse,
+    HttpCache,
+    record_cache_result,
+)
+
+logger = get_logger("http-fetcher")
+
+HTTP_TIER = "http"
+BROWSER_TIER = "browser"
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# A page is rendered client-side when its HTML has barely any visible text
+MIN_TEXT_CHARS = 200
+MIN_TEXT_RATIO = 0.005
+
+# Headers describing the encoded body, dropped from streamed responses
+_BODY_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+_INVISIBLE_RE = re.compile(
+    r"<(script|style|noscript|template|svg)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_NOSCRIPT_WALL_RE = re.compile(
+    r"<noscript\b[^>]*>(?:(?!</noscript).)*?"
+    r"(enable|turn on|activate|requires?)\b[^<]{0,40}javascript",
+    re.IGNORECASE | re.DOTALL,
+)
+_SPA_ROOT_RE = re.compile(
+    r"<(div|main|app-root)\b[^>]*\bid=[\"']?(root|app|__next|__nuxt|svelte|main)"
+    r"[\"']?[^>]*>\s*</\1>",
+    re.IGNORECASE,
+)
+
+
+def visible_text_length(html: str) -> int:
+    """Returns the approximate number of visible characters of an HTML page."""
+    text = _TAG_RE.sub(" ", _INVISIBLE_RE.sub(" ", html))
+    return len(" ".join(text.split()))
+
+
+def needs_browser(response: httpx.Response) -> Optional[str]:
+    """
+    Tells whether a page fetched over plain HTTP must be rendered by a browser.
+
+    Args:
+        response (httpx.Response): The response of the HTTP tier.
+
+    Returns:
+        Optional[str]: The reason to escalate to the browser, or None if the
+        HTTP response can be used as is.
+    """
+    if response.status_code >= 400:
+        return f"HTTP status {response.status_code}"
+
+    html = response.text
+    if not html.strip():
+        return "empty body"
+
+    text_length = visible_text_length(html)
+    if _NOSCRIPT_WALL_RE.search(html) and text_length < 10 * MIN_TEXT_CHARS:
+        return "JavaScript required by a <noscript> message"
+    if _SPA_ROOT_RE.search(html) and text_length < 10 * MIN_TEXT_CHARS:
+        return "empty single-page application root"
+    if text_length < MIN_TEXT_CHARS or text_length < MIN_TEXT_RATIO * len(html):
+        return f"little visible text ({text_length} characters)"
+    return None
+
+
+def proxy_url(proxy: Optional[dict]) -> Optional[str]:
+    """Converts Playwright proxy settings to a proxy URL with credentials."""
+    if not proxy or not proxy.get("server"):
+        return None
+
+    server = proxy["server"]
+    if "://" not in server:
+        server = f"http://{server}"
+    if not proxy.get("username"):
+        return server
+
+    parsed = urlparse(server)
+    credentials = proxy["username"]
+    if proxy.get("password"):
+        credentials += f":{proxy['password']}"
+    return urlunparse(parsed._replace(netloc=f"{credentials}@{parsed.netloc}"))
+
+
+class HttpFetcher:
+    """
+    Fetches pages over pooled keep-alive HTTP connections, with compression
+    and HTTP/2 when the `h2` package is installed.
+
+    The clients live on the loop of an `EventLoopThread`, so connections are
+    reused by every loader of the process, whichever event loop it runs in.
+    The fetcher also remembers, per host, which tier last produced a usable
+    page, so that hosts needing a browser are not fetched twice every time.
+
+    Attributes:
+        timeout (Optional[float]): Default timeout of a request in seconds.
+        http2 (bool): Whether HTTP/2 is negotiated.
+
+    Args:
+        timeout (Optional[float]): Default timeout of a request in seconds.
+        max_connections (int): Maximum number of open connections per proxy.
+        http2 (Optional[bool]): Whether to negotiate HTTP/2, by default when
+                                the `h2` package is installed.
+        max_remembered_hosts (int): Number of hosts whose tier is remembered.
+    """
+
+    def __init__(
+        self,
+        timeout: Optional[float] = 30,
+        max_connections: int = 100,
+        http2: Optional[bool] = None,
+        max_remembered_hosts: int = 10_000,
+    ):
+        self.timeout = timeout
+        self.http2 = (
+            importlib.util.find_spec("h2") is not None if http2 is None else http2
+        )
+        self.max_remembered_hosts = max_remembered_hosts
+        self._limits = httpx.Limits(
+            max_connections=max_connections, max_keepalive_connections=20
+        )
+        self._clients = {}
+        self._runner = EventLoopThread("http-fetcher")
+        self._tiers = OrderedDict()
+        self._tiers_lock = threading.Lock()
+
+    async def afetch(
+        self,
+        url: str,
+        *,
+        timeout=httpx.USE_CLIENT_DEFAULT,
+        proxy: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        cache: Optional[HttpCache] = None,
+        max_bytes: Optional[int] = None,
+    ) -> httpx.Response:
+        """
+        Fetches a URL, following redirects.
+
+        Args:
+            url (str): The URL to fetch.
+            timeout (Optional[float]): Timeout in seconds, None disables it.
+            proxy (Optional[dict]): Playwright style proxy settings.
+            headers (Optional[dict]): Additional request headers.
+            cache (Optional[HttpCache]): The HTTP cache serving and storing the
+                                         response, recorded in the current
+                                         `http_cache_scope`.
+            max_bytes (Optional[int]): Stops downloading the body past this
+                                       many bytes. A cut body is flagged by
+                                       `response.extensions["truncated"]`
+                                       and never stored in the cache.
+
+        Returns:
+            httpx.Response: The response, whose body has been read.
+
+        Raises:
+            httpx.HTTPError: If the request fails.
+        """
+        response, cache_result = await self._runner.run(
+            self._get(url, timeout, proxy, headers, cache, max_bytes)
+        )
+        if cache_result is not None:
+            record_cache_result(*cache_result)
+        return response
+
+    def fetch(
+        self,
+        url: str,
+        *,
+        timeout=httpx.USE_CLIENT_DEFAULT,
+        proxy: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        cache: Optional[HttpCache] = None,
+        max_bytes: Optional[int] = None,
+    ) -> httpx.Response:
+        """Blocking version of `afetch`."""
+        response, cache_result = self._runner.run_sync(
+            self._get(url, timeout, proxy, headers, cache, max_bytes)
+        )
+        if cache_result is not None:
+            record_cache_result(*cache_result)
+        return response
+
+    async def _get(self, url, timeout, proxy, headers, cache, max_bytes):
+        key = proxy_url(proxy)
+        if key not in self._clients:
+            self._clients[key] = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self._limits,
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers=DEFAULT_HEADERS,
+                proxy=key,
+            )
+        client = self._clients[key]
+        if cache is None:
+            return await _read(client, url, timeout, headers, max_bytes), None
+
+        # The cache runs blocking SQLite queries, kept off the shared loop
+        entry = await asyncio.to_thread(cache.lookup, url)
+        if entry is not None and entry.fresh:
+            return _cached_response(entry), (CACHE_HIT, entry)
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(entry.validators())
+
+        start = time.monotonic()
+        response = await _read(client, url, timeout, request_headers, max_bytes)
+        elapsed = time.monotonic() - start
+
+        if response.status_code == 304 and entry is not None:
+            refreshed = await asyncio.to_thread(cache.refresh, entry, response.headers)
+            return _cached_response(refreshed or entry), (
+                CACHE_REVALIDATED,
+                entry,
+                elapsed,
+            )
+        if response.extensions.get("truncated"):
+            return response, (CACHE_MISS,)
+
+        await asyncio.to_thread(
+            cache.store,
+            url,
+            response.status_code,
+            response.headers,
+            response.content,
+            elapsed,
+        )
+        return response, (CACHE_MISS,)
+
+    def preferred_tier(self, url: str) -> Optional[str]:
+        """Returns the tier that last worked for the host of the URL, if known."""
+        host = urlparse(url).netloc
+        with self._tiers_lock:
+            if host in self._tiers:
+                self._tiers.move_to_end(host)
+            return self._tiers.get(host)
+
+    def remember_tier(self, url: str, tier: str):
+        """Records the tier that produced a usable page for the host of the URL."""
+        host = urlparse(url).netloc
+        with self._tiers_lock:
+            self._tiers[host] = tier
+            self._tiers.move_to_end(host)
+            while len(self._tiers) > self.max_remembered_hosts:
+                self._tiers.popitem(last=False)
+
+    def release_proxy(self, proxy: Optional[dict]):
+        """
+        Closes, in the background, the pooled connections through a proxy that
+        is no longer used, such as a proxy evicted from a `ProxyPool`. A later
+        request through the proxy opens new connections.
+
+        Args:
+            proxy (Optional[dict]): Playwright style proxy settings.
+        """
+        key = proxy_url(proxy)
+        if key is not None and key in self._clients:
+            self._runner.submit(self._aclose_client(key))
+
+    def close(self, timeout: float = 30):
+        """Closes the pooled connections and stops the thread of the fetcher."""
+        self._runner.stop(self._aclose_clients, timeout)
+
+    async def _aclose_client(self, key: str):
+        client = self._clients.pop(key, None)
+        if client is not None:
+            await client.aclose()
+
+    async def _aclose_clients(self):
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+
+async def _read(client, url, timeout, headers, max_bytes) -> httpx.Response:
+    """
+    Sends a GET request, streaming the body so that at most `max_bytes` of it
+    are downloaded; the connection of a cut response is dropped.
+    """
+    if max_bytes is None:
+        return await client.get(url, timeout=timeout, headers=headers)
+
+    body, truncated = bytearray(), False
+    async with client.stream("GET", url, timeout=timeout, headers=headers) as response:
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) > max_bytes:
+                del body[max_bytes:]
+                truncated = True
+                break
+
+    # The body is decoded already, its encoding headers no longer apply
+    headers = [
+        (name, value)
+        for name, value in response.headers.multi_items()
+        if name.lower() not in _BODY_HEADERS
+    ]
+    read = httpx.Response(
+        response.status_code,
+        headers=headers,
+        content=bytes(body),
+        request=response.request,
+        extensions={"truncated": truncated},
+    )
+    read.history = response.history
+    return read
+
+
+def _cached_response(entry: CachedResponse) -> httpx.Response:
+    """Builds the response served from an HTTP cache entry."""
+    return httpx.Response(
+        entry.status,
+        headers=entry.headers,
+        content=entry.body,
+        request=httpx.Request("GET", entry.url),
+    )
+
+
+_shared_fetcher: Optional[HttpFetcher] = None
+_shared_fetcher_lock = threading.Lock()
+
+
+def get_http_fetcher() -> HttpFetcher:
+    """Returns the HTTP fetcher shared by the whole process."""
+    global _shared_fetcher
+
+    with _shared_fetcher_lock:
+        if _shared_fetcher is None:
+            _shared_fetcher = HttpFetcher()
+            atexit.register(_shared_fetcher.close)
+        return _shared_fetcher
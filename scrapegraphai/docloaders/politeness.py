@@ -0,0 +1,290 @@
+"""
+Per-host politeness scheduler shared by the fetches of a process
+"""
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Union
+from urllib.parse import urlsplit
+
+from ..utils.logging import get_logger
+from .robots_txt import get_robots_cache
+
+logger = get_logger("politeness")
+
+ROBOTS_USER_AGENT = "ScrapeGraphAI"
+THROTTLING_STATUSES = {429, 503}
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Converts a Retry-After header, in seconds or as an HTTP date, to seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class _HostState:
+    """The pacing state of a host."""
+
+    __slots__ = (
+        "active",
+        "waiters",
+        "tokens",
+        "updated",
+        "next_start",
+        "crawl_delay",
+        "backoff",
+        "backoff_until",
+    )
+
+    def __init__(self, burst: float):
+        self.active = 0
+        self.waiters = deque()
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.next_start = 0.0
+        self.crawl_delay = 0.0
+        self.backoff = 0.0
+        self.backoff_until = 0.0
+
+
+class PolitenessScheduler:
+    """
+    Paces the requests sent to each host, whichever loader, event loop or
+    thread they come from, so that large crawls are not throttled.
+
+    For every host, the scheduler enforces:
+
+    - at most `max_concurrency_per_host` requests in flight;
+    - a token bucket of `requests_per_second`, allowing bursts of `burst`;
+    - the `Crawl-delay` of its robots.txt, from the robots.txt cache shared by
+      the process;
+    - an adaptive backoff once the host answers 429 or 503: the delay between
+      requests doubles with every throttled response, honouring `Retry-After`,
+      and halves with every successful one.
+
+    Attributes:
+        max_concurrency_per_host (int): Maximum number of requests in flight per host.
+        requests_per_second (float): Sustained request rate per host.
+        burst (float): Number of requests that can be sent at once after a pause.
+        respect_crawl_delay (bool): Whether the robots.txt `Crawl-delay` is honoured.
+        max_crawl_delay (float): Upper bound of the honoured crawl delay in seconds.
+        max_backoff (float): Upper bound of the backoff delay in seconds.
+
+    Example:
+        >>> scheduler = PolitenessScheduler(requests_per_second=1)
+        >>> async with scheduler.slot(url):
+        ...     response = await fetch(url)
+        >>> scheduler.report(url, response.status_code)
+    """
+
+    def __init__(
+        self,
+        max_concurrency_per_host: int = 2,
+        requests_per_second: float = 2.0,
+        burst: float = 2.0,
+        respect_crawl_delay: bool = True,
+        max_crawl_delay: float = 30.0,
+        max_backoff: float = 60.0,
+        user_agent: str = ROBOTS_USER_AGENT,
+        max_hosts: int = 10_000,
+    ):
+        if max_concurrency_per_host < 1:
+            raise ValueError("max_concurrency_per_host must be at least 1.")
+        if requests_per_second <= 0 or burst < 1:
+            raise ValueError(
+                "requests_per_second must be positive and burst at least 1."
+            )
+
+        self.max_concurrency_per_host = max_concurrency_per_host
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.respect_crawl_delay = respect_crawl_delay
+        self.max_crawl_delay = max_crawl_delay
+        self.max_backoff = max_backoff
+        self.user_agent = user_agent
+        self.max_hosts = max_hosts
+        self._hosts = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> _HostState:
+        with self._lock:
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.burst)
+                self._prune()
+            self._hosts.move_to_end(host)
+            return state
+
+    def _prune(self):
+        """Forgets the least recently used idle hosts beyond `max_hosts`."""
+        for host in list(self._hosts):
+            if len(self._hosts) <= self.max_hosts:
+                break
+            state = self._hosts[host]
+            if not state.active and not state.waiters:
+                del self._hosts[host]
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        """
+        Waits until a request to the host of the URL may be sent and holds
+        one of its concurrency slots for the duration of the block.
+
+        Args:
+            url (str): The URL about to be fetched.
+        """
+        state = self._state(urlsplit(url).netloc.lower())
+        if self.respect_crawl_delay:
+            robots = await get_robots_cache().aget(url)
+            delay = robots.crawl_delay(self.user_agent)
+            state.crawl_delay = min(delay or 0.0, self.max_crawl_delay)
+
+        await self._acquire(state)
+        try:
+            delay = self._reserve(state)
+            if delay > 0:
+                logger.debug(f"Waiting {delay:.2f}s before fetching {url}")
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            self._release(state)
+
+    async def _acquire(self, state: _HostState):
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if state.active < self.max_concurrency_per_host:
+                    state.active += 1
+                    return
+                waiter = loop.create_future()
+                state.waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    woken = (loop, waiter) not in state.waiters
+                    if not woken:
+                        state.waiters.remove((loop, waiter))
+                # A wake-up received while being cancelled goes to the next waiter
+                if woken:
+                    self._wake_next(state)
+                raise
+
+    def _release(self, state: _HostState):
+        with self._lock:
+            state.active -= 1
+        self._wake_next(state)
+
+    def _wake_next(self, state: _HostState):
+        with self._lock:
+            while state.waiters:
+                loop, waiter = state.waiters.popleft()
+                if not loop.is_closed():
+                    loop.call_soon_threadsafe(_set_done, waiter)
+                    return
+
+    def _reserve(self, state: _HostState) -> float:
+        """Books the start time of the next request to a host and returns the wait."""
+        with self._lock:
+            now = time.monotonic()
+            state.tokens = min(
+                self.burst,
+                state.tokens + (now - state.updated) * self.requests_per_second,
+            )
+            state.updated = now
+            token_wait = max(0.0, (1 - state.tokens) / self.requests_per_second)
+            state.tokens -= 1
+
+            start = max(now + token_wait, state.next_start, state.backoff_until)
+            state.next_start = start + max(state.crawl_delay, state.backoff)
+            return start - now
+
+    def report(self, url: str, status_code: int, retry_after: Optional[str] = None):
+        """
+        Adapts the pacing of a host to the status of one of its responses.
+
+        Args:
+            url (str): The fetched URL.
+            status_code (int): The status code of the response.
+            retry_after (Optional[str]): The Retry-After header of the response.
+        """
+        state = self._state(urlsplit(url).netloc.lower())
+        with self._lock:
+            if status_code in THROTTLING_STATUSES:
+                state.backoff = min(
+                    self.max_backoff,
+                    max(2 * state.backoff, 1 / self.requests_per_second),
+                )
+                wait = _retry_after(retry_after)
+                wait = state.backoff if wait is None else min(wait, self.max_backoff)
+                state.backoff_until = max(state.backoff_until, time.monotonic() + wait)
+                logger.warning(
+                    f"{url} answered {status_code}, slowing down to one request "
+                    f"every {state.backoff:.2f}s"
+                )
+            elif status_code < 400 and state.backoff:
+                state.backoff /= 2
+                # A backoff below the token rate no longer slows anything down
+                if state.backoff < 1 / self.requests_per_second:
+                    state.backoff = 0.0
+
+    def backoff(self, url: str) -> float:
+        """Returns the current backoff delay of the host of a URL, in seconds."""
+        return self._state(urlsplit(url).netloc.lower()).backoff
+
+
+def _set_done(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+# Schedulers shared by the process, keyed by their settings
+_shared_schedulers: Dict[str, PolitenessScheduler] = {}
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_politeness_scheduler(
+    option: Union[bool, dict, PolitenessScheduler, None],
+) -> Optional[PolitenessScheduler]:
+    """
+    Resolves the `politeness` option of the loaders.
+
+    Args:
+        option: None or False to disable pacing, True to use the scheduler
+                shared by the process, a dict with the settings of a scheduler
+                shared by the loaders passing the same settings, or a
+                PolitenessScheduler.
+
+    Returns:
+        Optional[PolitenessScheduler]: The scheduler to use, if any.
+
+    Raises:
+        ValueError: If the option has an unsupported type.
+    """
+    if not option:
+        return None
+    if isinstance(option, PolitenessScheduler):
+        return option
+    if option is not True and not isinstance(option, dict):
+        raise ValueError(
+            "The politeness option must be a boolean, a dictionary or a PolitenessScheduler."
+        )
+
+    settings = option if isinstance(option, dict) else {}
+    key = json.dumps(settings, sort_keys=True, default=str)
+    with _shared_scheduler_lock:
+        if key not in _shared_schedulers:
+            _shared_schedulers[key] = PolitenessScheduler(**settings)
+        return _shared_schedulers[key]
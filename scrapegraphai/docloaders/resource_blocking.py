@@ -0,0 +1,155 @@
+"""
+Blocking of the page resources that are not needed to read its HTML
+"""
+
+from fnmatch import fnmatchcase
+from typing import Iterable, Optional, Union
+from urllib.parse import urlsplit
+
+# Resource types reported by Playwright for a request
+RESOURCE_TYPES = {
+    "document",
+    "stylesheet",
+    "image",
+    "media",
+    "font",
+    "script",
+    "texttrack",
+    "xhr",
+    "fetch",
+    "prefetch",
+    "eventsource",
+    "websocket",
+    "manifest",
+    "ping",
+    "other",
+}
+
+DEFAULT_BLOCKED_TYPES = ("image", "media", "font", "stylesheet")
+
+# Advertising and analytics hosts that never contribute to the content of a page
+DEFAULT_BLOCKED_DOMAINS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "facebook.net",
+    "hotjar.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "taboola.com",
+    "outbrain.com",
+    "criteo.com",
+    "adnxs.com",
+    "segment.io",
+    "mixpanel.com",
+)
+
+
+class ResourceBlocker:
+    """
+    Aborts the requests of a page that are not needed to read its HTML, such
+    as images, fonts or trackers, through Playwright route interception.
+    Navigations are never blocked, so the page itself always loads.
+
+    Attributes:
+        resource_types (frozenset): The blocked Playwright resource types.
+        domains (tuple): The blocked hosts, along with their subdomains.
+        url_patterns (tuple): Shell-style patterns of the blocked URLs.
+
+    Args:
+        resource_types (Iterable[str]): Resource types to block, among
+                                        "image", "media", "font", "stylesheet",
+                                        "script", "xhr", "fetch", ...
+        domains (Iterable[str]): Hosts to block, along with their subdomains.
+        url_patterns (Iterable[str]): Shell-style patterns matched against the
+                                      full URL, e.g. "*/ads/*" or "*.gif".
+
+    Raises:
+        ValueError: If a resource type is unknown.
+
+    Example:
+        >>> blocker = ResourceBlocker(resource_types=["image"], domains=["ads.com"])
+        >>> blocker.blocks("script", "https://cdn.ads.com/tag.js")
+        True
+    """
+
+    def __init__(
+        self,
+        resource_types: Iterable[str] = (),
+        domains: Iterable[str] = (),
+        url_patterns: Iterable[str] = (),
+    ):
+        resource_types = frozenset(resource_types)
+        unknown = resource_types - RESOURCE_TYPES
+        if unknown:
+            raise ValueError(f"Unknown resource types: {', '.join(sorted(unknown))}")
+
+        self.resource_types = resource_types
+        self.domains = tuple(domain.lower().lstrip(".") for domain in domains)
+        self.url_patterns = tuple(url_patterns)
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        """Tells whether a request of the given type and URL is blocked."""
+        if resource_type in self.resource_types:
+            return True
+
+        host = (urlsplit(url).hostname or "").lower()
+        if any(
+            host == domain or host.endswith(f".{domain}") for domain in self.domains
+        ):
+            return True
+        return any(fnmatchcase(url, pattern) for pattern in self.url_patterns)
+
+    async def attach(self, page):
+        """Intercepts the requests of a Playwright page to abort the blocked ones."""
+        await page.route("**/*", self._handle)
+
+    async def _handle(self, route):
+        request = route.request
+        if not request.is_navigation_request() and self.blocks(
+            request.resource_type, request.url
+        ):
+            await route.abort("blockedbyclient")
+        else:
+            await route.fallback()
+
+
+def get_resource_blocker(
+    option: Union[bool, dict, ResourceBlocker, None],
+) -> Optional[ResourceBlocker]:
+    """
+    Resolves the `block_resources` option of the loaders.
+
+    Args:
+        option: None or False to load every resource, True to block images,
+                media, fonts, stylesheets and common advertising and analytics
+                hosts, a dict with the `resource_types`, `domains` and
+                `url_patterns` to block, or a ResourceBlocker instance.
+
+    Returns:
+        Optional[ResourceBlocker]: The blocker to attach to the pages, if any.
+
+    Raises:
+        ValueError: If the option has an unsupported type or value.
+    """
+    if not option:
+        return None
+    if isinstance(option, ResourceBlocker):
+        return option
+    if option is True:
+        return ResourceBlocker(DEFAULT_BLOCKED_TYPES, DEFAULT_BLOCKED_DOMAINS)
+    if isinstance(option, dict):
+        unknown = set(option) - {"resource_types", "domains", "url_patterns"}
+        if unknown:
+            raise ValueError(
+                f"Unknown block_resources keys: {', '.join(sorted(unknown))}"
+            )
+        return ResourceBlocker(**option)
+    raise ValueError(
+        "The block_resources option must be a boolean, a dictionary or a ResourceBlocker."
+    )
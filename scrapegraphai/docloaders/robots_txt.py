@@ -0,0 +1,339 @@
+"""
+Deterministic robots.txt evaluation (RFC 9309) with a per-host cache
+"""
+
+import asyncio
+import concurrent.futures
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple, Union
+from urllib.parse import quote, urlsplit
+
+import httpx
+
+from ..utils.logging import get_logger
+
+logger = get_logger("robots")
+
+# Crawlers must parse at least the first 500 KiB of a robots.txt file
+MAX_ROBOTS_SIZE = 500 * 1024
+# Cached rules should not be used for more than a day
+DEFAULT_TTL = 24 * 3600
+# An unreachable robots.txt is tried again sooner
+ERROR_TTL = 300
+
+_LINE_RE = re.compile(r"^\s*([A-Za-z-]+)\s*:\s*([^#]*)")
+_ESCAPE_RE = re.compile(r"%[0-9a-fA-F]{2}")
+_PATH_SAFE = "/?=&;:@!$*+,~-._%"
+_FIELDS = {"user-agent", "allow", "disallow", "crawl-delay", "sitemap"}
+
+
+def _normalize(path: str) -> str:
+    """Percent-encodes the octets of a path that must be, with uppercase escapes."""
+    path = quote(path, safe=_PATH_SAFE)
+    return _ESCAPE_RE.sub(lambda match: match.group(0).upper(), path)
+
+
+def _compile(pattern: str) -> re.Pattern:
+    """Compiles a rule path, where `*` matches any sequence and `$` the end."""
+    anchored = pattern.endswith("$")
+    regex = ".*".join(re.escape(part) for part in pattern.rstrip("$").split("*"))
+    return re.compile(regex + ("$" if anchored else ""))
+
+
+def _product_token(user_agent: str) -> str:
+    """Returns the lowercased product token of a user agent, without its version."""
+    return (user_agent.split("/")[0].split() or [""])[0].lower()
+
+
+class RobotsTxt:
+    """
+    The rules of a robots.txt file, evaluated as specified by RFC 9309.
+
+    The rules applying to a crawler are those of the groups naming its product
+    token, or of the `*` groups if none does. Among them, the rule with the
+    longest path matching a URL wins, an `allow` rule winning a tie. Paths may
+    use the `*` and `$` wildcards.
+
+    Attributes:
+        status (str): "ok" for a parsed file, "unavailable" when the host has no
+            robots.txt, which allows everything, or "unreachable" when it could
+            not be fetched, which disallows everything.
+        has_rules (bool): Whether the file contains any robots.txt field.
+        unrecognized (Optional[str]): The content of a file without any robots.txt
+            field, such as an HTML error page served with a 200 status.
+
+    Args:
+        robots_txt (str): The content of the robots.txt file.
+        status (str): How the file was obtained, "ok" by default.
+
+    Example:
+        >>> robots = RobotsTxt("User-agent: *\\nDisallow: /private/")
+        >>> robots.allowed("https://example.com/private/page", "GPTBot")
+        False
+    """
+
+    def __init__(self, robots_txt: str = "", status: str = "ok"):
+        self.status = status
+        self.has_rules = False
+        self._groups: List[Tuple[List[str], list, Optional[float]]] = []
+        self._parse(robots_txt.encode("utf-8", "replace")[:MAX_ROBOTS_SIZE])
+        self.unrecognized = (
+            robots_txt[:MAX_ROBOTS_SIZE]
+            if not self.has_rules and robots_txt.strip()
+            else None
+        )
+
+    def _parse(self, content: bytes):
+        agents, rules, delay = [], [], None
+        in_rules = False
+        for line in content.decode("utf-8", "replace").splitlines():
+            match = _LINE_RE.match(line)
+            if not match:
+                continue
+            field, value = match.group(1).lower(), match.group(2).strip()
+            if field not in _FIELDS:
+                continue
+            self.has_rules = True
+
+            if field == "user-agent":
+                if in_rules:
+                    self._groups.append((agents, rules, delay))
+                    agents, rules, delay, in_rules = [], [], None, False
+                agents.append("*" if value == "*" else _product_token(value))
+            elif not agents:
+                # Rules outside of a group apply to no crawler
+                continue
+            elif field in ("allow", "disallow"):
+                in_rules = True
+                # An empty path matches nothing
+                if value:
+                    path = _normalize(value)
+                    rules.append((field == "allow", len(path), _compile(path)))
+            elif field == "crawl-delay":
+                in_rules = True
+                try:
+                    delay = float(value) if delay is None else delay
+                except ValueError:
+                    pass
+        if agents:
+            self._groups.append((agents, rules, delay))
+
+    def _matching_groups(self, user_agent: str) -> list:
+        token = _product_token(user_agent)
+        groups = [group for group in self._groups if token in group[0]]
+        return groups or [group for group in self._groups if "*" in group[0]]
+
+    def allowed(self, url: str, user_agents: Union[str, Iterable[str]] = "*") -> bool:
+        """
+        Tells whether crawlers may fetch a URL.
+
+        Args:
+            url (str): The URL, or its path.
+            user_agents (Union[str, Iterable[str]]): The product tokens of the
+                crawlers; the URL is allowed only if it is for all of them.
+
+        Returns:
+            bool: Whether the URL may be fetched.
+        """
+        parts = urlsplit(url)
+        path = _normalize(
+            (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        )
+        if path == "/robots.txt":
+            return True
+        if self.status == "unreachable":
+            return False
+
+        if isinstance(user_agents, str):
+            user_agents = [user_agents]
+        for user_agent in user_agents:
+            best = None
+            for _, rules, _ in self._matching_groups(user_agent):
+                for allow, length, regex in rules:
+                    if regex.match(path) and (
+                        best is None or (length, allow) > (best[0], best[1])
+                    ):
+                        best = (length, allow)
+            if best is not None and not best[1]:
+                return False
+        return True
+
+    def crawl_delay(self, user_agent: str = "*") -> Optional[float]:
+        """Returns the `Crawl-delay` in seconds applying to a crawler, if any."""
+        for _, _, delay in self._matching_groups(user_agent):
+            if delay is not None:
+                return delay
+        return None
+
+
+def robots_from_response(response: httpx.Response) -> RobotsTxt:
+    """
+    Builds the rules of a host from the response to its robots.txt request.
+
+    Args:
+        response (httpx.Response): The response, redirects followed.
+
+    Returns:
+        RobotsTxt: The parsed rules, allowing everything if the file is missing
+        and nothing if the server failed.
+    """
+    if 200 <= response.status_code < 300:
+        return RobotsTxt(response.text)
+    if 400 <= response.status_code < 500:
+        return RobotsTxt(status="unavailable")
+    return RobotsTxt(status="unreachable")
+
+
+class RobotsCache:
+    """
+    Caches the robots.txt rules of each host for `ttl` seconds, so that the
+    graphs and loaders of a process fetch a robots.txt once a day at most.
+    Concurrent lookups of the same host share a single request, and an
+    unreachable robots.txt keeps the previously cached rules in use.
+
+    Attributes:
+        ttl (float): Lifetime of the cached rules in seconds.
+        timeout (float): Timeout of the robots.txt requests in seconds.
+        max_hosts (int): Maximum number of hosts kept in the cache.
+
+    Example:
+        >>> cache = RobotsCache()
+        >>> cache.get("https://example.com/page").allowed("/page", "GPTBot")
+        True
+    """
+
+    def __init__(
+        self, ttl: float = DEFAULT_TTL, timeout: float = 10, max_hosts: int = 10_000
+    ):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.max_hosts = max_hosts
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _abandon(self, robots_url: str, future, error: BaseException):
+        """Drops the pending lookup of a host after an unexpected error."""
+        with self._lock:
+            host = robots_url[: -len("/robots.txt")]
+            if self._entries.get(host, (None, None))[1] is future:
+                del self._entries[host]
+        future.set_exception(error)
+
+    def _lookup(self, url: str):
+        """
+        Returns the future of the rules of the host of a URL, the robots.txt
+        URL and whether the caller has to fetch it.
+        """
+        parts = urlsplit(url)
+        host = f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry is not None and (entry[0] > now or not entry[1].done()):
+                self._entries.move_to_end(host)
+                return entry[1], None, None
+
+            future = concurrent.futures.Future()
+            previous = entry[1].result() if entry is not None else None
+            self._entries[host] = (now + self.ttl, future)
+            self._entries.move_to_end(host)
+            while len(self._entries) > self.max_hosts:
+                self._entries.popitem(last=False)
+            return future, f"{host}/robots.txt", previous
+
+    def _resolve(self, future, robots_url: str, previous, response):
+        if isinstance(response, Exception):
+            logger.info(f"Could not fetch {robots_url}: {response!r}")
+            robots = RobotsTxt(status="unreachable")
+        else:
+            robots = robots_from_response(response)
+
+        if robots.status == "unreachable":
+            if previous is not None and previous.status != "unreachable":
+                robots = previous
+            with self._lock:
+                host = robots_url[: -len("/robots.txt")]
+                if host in self._entries:
+                    self._entries[host] = (
+                        time.monotonic() + min(self.ttl, ERROR_TTL),
+                        future,
+                    )
+        future.set_result(robots)
+        return robots
+
+    def get(self, url: str) -> RobotsTxt:
+        """
+        Returns the robots.txt rules of the host of a URL, fetching them if needed.
+
+        Args:
+            url (str): Any URL of the host.
+
+        Returns:
+            RobotsTxt: The rules of the host.
+        """
+        future, robots_url, previous = self._lookup(url)
+        if robots_url is None:
+            return future.result()
+
+        from .http_fetcher import get_http_fetcher
+
+        try:
+            response = get_http_fetcher().fetch(
+                robots_url, timeout=self.timeout, max_bytes=MAX_ROBOTS_SIZE
+            )
+        except httpx.HTTPError as e:
+            response = e
+        except BaseException as e:
+            self._abandon(robots_url, future, e)
+            raise
+        return self._resolve(future, robots_url, previous, response)
+
+    async def aget(self, url: str) -> RobotsTxt:
+        """
+        Asynchronously returns the robots.txt rules of the host of a URL,
+        fetching them if needed.
+
+        Args:
+            url (str): Any URL of the host.
+
+        Returns:
+            RobotsTxt: The rules of the host.
+        """
+        future, robots_url, previous = self._lookup(url)
+        if robots_url is None:
+            return await asyncio.wrap_future(future)
+
+        from .http_fetcher import get_http_fetcher
+
+        try:
+            response = await get_http_fetcher().afetch(
+                robots_url, timeout=self.timeout, max_bytes=MAX_ROBOTS_SIZE
+            )
+        except httpx.HTTPError as e:
+            response = e
+        except BaseException as e:
+            self._abandon(robots_url, future, e)
+            raise
+        return self._resolve(future, robots_url, previous, response)
+
+    def clear(self):
+        """Forgets the cached rules of every host."""
+        with self._lock:
+            self._entries.clear()
+
+
+_shared_cache: Optional[RobotsCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_robots_cache() -> RobotsCache:
+    """Returns the robots.txt cache shared by the whole process."""
+    global _shared_cache
+
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = RobotsCache()
+        return _shared_cache
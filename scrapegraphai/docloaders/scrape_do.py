@@ -8,11 +8,18 @@ import urllib.parse
 import requests
 import urllib3
 
+from .http_fetcher import proxy_url
+
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
 def scrape_do_fetch(
-    token, target_url, use_proxy=False, geoCode=None, super_proxy=False
+    token,
+    target_url,
+    use_proxy=False,
+    geoCode=None,
+    super_proxy=False,
+    proxy_pool=None,
 ):
     """
     Fetches the IP address of the machine associated with the given URL using Scrape.do.
@@ -24,6 +31,10 @@ def scrape_do_fetch(
         geoCode (str, optional): Specify the country code for
         geolocation-based proxies. Default is None.
         super_proxy (bool): If True, use Residential & Mobile Proxy Networks. Default is False.
+        proxy_pool (ProxyPool, optional): The pool whose proxies the API requests
+        are rotated through, when the Scrape.do proxy mode is not used. These
+        requests use HTTPS, so that the proxies, anonymous ones by default, never
+        see the token. Default is None.
 
     Returns:
         str: The raw response from the target URL.
@@ -44,7 +55,14 @@ def scrape_do_fetch(
         )
     else:
         api_scrape_do_url = os.getenv("API_SCRAPE_DO_URL", "api.scrape.do")
-        url = f"http://{api_scrape_do_url}?token={token}&url={encoded_url}"
-        response = requests.get(url)
+        query = f"{api_scrape_do_url}?token={token}&url={encoded_url}"
+        if proxy_pool is None:
+            response = requests.get(f"http://{query}")
+        else:
+            with proxy_pool.rotate() as proxy:
+                server = proxy_url(proxy)
+                response = requests.get(
+                    f"https://{query}", proxies={"http": server, "https": server}
+                )
 
     return response.text
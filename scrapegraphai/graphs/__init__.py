@@ -1,32 +1,83 @@
 """
 This module defines the graph structures and related functionalities for the ScrapeGraphAI application.
+
+The graphs are imported lazily on first attribute access, so that importing
+the package does not pull in the dependencies of every graph.
 """
 
-from .abstract_graph import AbstractGraph
-from .base_graph import BaseGraph
-from .code_generator_graph import CodeGeneratorGraph
-from .csv_scraper_graph import CSVScraperGraph
-from .csv_scraper_multi_graph import CSVScraperMultiGraph
-from .depth_search_graph import DepthSearchGraph
-from .document_scraper_graph import DocumentScraperGraph
-from .document_scraper_multi_graph import DocumentScraperMultiGraph
-from .json_scraper_graph import JSONScraperGraph
-from .json_scraper_multi_graph import JSONScraperMultiGraph
-from .omni_scraper_graph import OmniScraperGraph
-from .omni_search_graph import OmniSearchGraph
-from .screenshot_scraper_graph import ScreenshotScraperGraph
-from .script_creator_graph import ScriptCreatorGraph
-from .script_creator_multi_graph import ScriptCreatorMultiGraph
-from .search_graph import SearchGraph
-from .search_link_graph import SearchLinkGraph
-from .smart_scraper_graph import SmartScraperGraph
-from .smart_scraper_lite_graph import SmartScraperLiteGraph
-from .smart_scraper_multi_concat_graph import SmartScraperMultiConcatGraph
-from .smart_scraper_multi_graph import SmartScraperMultiGraph
-from .smart_scraper_multi_lite_graph import SmartScraperMultiLiteGraph
-from .speech_graph import SpeechGraph
-from .xml_scraper_graph import XMLScraperGraph
-from .xml_scraper_multi_graph import XMLScraperMultiGraph
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .abstract_graph import AbstractGraph
+    from .base_graph import BaseGraph
+    from .code_generator_graph import CodeGeneratorGraph
+    from .csv_scraper_graph import CSVScraperGraph
+    from .csv_scraper_multi_graph import CSVScraperMultiGraph
+    from .depth_search_graph import DepthSearchGraph
+    from .document_scraper_graph import DocumentScraperGraph
+    from .document_scraper_multi_graph import DocumentScraperMultiGraph
+    from .json_scraper_graph import JSONScraperGraph
+    from .json_scraper_multi_graph import JSONScraperMultiGraph
+    from .omni_scraper_graph import OmniScraperGraph
+    from .omni_search_graph import OmniSearchGraph
+    from .screenshot_scraper_graph import ScreenshotScraperGraph
+    from .script_creator_graph import ScriptCreatorGraph
+    from .script_creator_multi_graph import ScriptCreatorMultiGraph
+    from .search_graph import SearchGraph
+    from .search_link_graph import SearchLinkGraph
+    from .smart_scraper_graph import SmartScraperGraph
+    from .smart_scraper_lite_graph import SmartScraperLiteGraph
+    from .smart_scraper_multi_concat_graph import SmartScraperMultiConcatGraph
+    from .smart_scraper_multi_graph import SmartScraperMultiGraph
+    from .smart_scraper_multi_lite_graph import SmartScraperMultiLiteGraph
+    from .speech_graph import SpeechGraph
+    from .xml_scraper_graph import XMLScraperGraph
+    from .xml_scraper_multi_graph import XMLScraperMultiGraph
+
+# Maps each public name to the submodule defining it
+_LAZY_IMPORTS = {
+    "AbstractGraph": ".abstract_graph",
+    "BaseGraph": ".base_graph",
+    "CodeGeneratorGraph": ".code_generator_graph",
+    "CSVScraperGraph": ".csv_scraper_graph",
+    "CSVScraperMultiGraph": ".csv_scraper_multi_graph",
+    "DepthSearchGraph": ".depth_search_graph",
+    "DocumentScraperGraph": ".document_scraper_graph",
+    "DocumentScraperMultiGraph": ".document_scraper_multi_graph",
+    "JSONScraperGraph": ".json_scraper_graph",
+    "JSONScraperMultiGraph": ".json_scraper_multi_graph",
+    "OmniScraperGraph": ".omni_scraper_graph",
+    "OmniSearchGraph": ".omni_search_graph",
+    "ScreenshotScraperGraph": ".screenshot_scraper_graph",
+    "ScriptCreatorGraph": ".script_creator_graph",
+    "ScriptCreatorMultiGraph": ".script_creator_multi_graph",
+    "SearchGraph": ".search_graph",
+    "SearchLinkGraph": ".search_link_graph",
+    "SmartScraperGraph": ".smart_scraper_graph",
+    "SmartScraperLiteGraph": ".smart_scraper_lite_graph",
+    "SmartScraperMultiConcatGraph": ".smart_scraper_multi_concat_graph",
+    "SmartScraperMultiGraph": ".smart_scraper_multi_graph",
+    "SmartScraperMultiLiteGraph": ".smart_scraper_multi_lite_graph",
+    "SpeechGraph": ".speech_graph",
+    "XMLScraperGraph": ".xml_scraper_graph",
+    "XMLScraperMultiGraph": ".xml_scraper_multi_graph",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Base graphs
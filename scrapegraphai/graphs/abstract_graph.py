@@ -3,18 +3,22 @@ AbstractGraph Module
 """
 
 import asyncio
+import copy
 import uuid
 import warnings
 from abc import ABC, abstractmethod
-from typing import Optional, Type
+from typing import AsyncIterator, Iterable, Iterator, List, Optional, Type, Union
 
 from langchain.chat_models import init_chat_model
 from langchain_core.rate_limiters import InMemoryRateLimiter
 from pydantic import BaseModel
 
 from ..helpers import models_tokens
-from ..models import XAI, CLoD, DeepSeek, Nvidia, OneApi
+from ..utils.checkpoint import CheckpointStore
 from ..utils.logging import get_logger, set_verbosity_info, set_verbosity_warning
+from ..utils.node_cache import DEFAULT_MAX_SIZE, NodeCache
+from ..utils.profiler import NodeProfiler
+from ..utils.tracing import TRACE_FORMATS
 
 logger = get_logger(__name__)
 
@@ -104,6 +108,34 @@ class AbstractGraph(ABC):
 
             self.graph.burr_config = self.burr_kwargs
 
+        if config.get("parallel", False):
+            self.graph.parallel = True
+            self.graph.max_workers = config.get("max_workers")
+
+        if self.cache_path:
+            self.graph.cache = NodeCache(
+                self.cache_path,
+                max_size=config.get("cache_max_size", DEFAULT_MAX_SIZE),
+                ttl=config.get("cache_ttl"),
+            )
+
+        checkpoint_path = config.get("checkpoint_path")
+        if checkpoint_path:
+            self.graph.checkpoint_store = CheckpointStore(checkpoint_path)
+
+        self.graph.profiler = NodeProfiler.from_config(config.get("profile", False))
+
+        trace_path = config.get("trace_path")
+        if trace_path:
+            trace_format = config.get("trace_format", "chrome")
+            if trace_format not in TRACE_FORMATS:
+                raise ValueError(
+                    f"trace_format must be one of {', '.join(TRACE_FORMATS)}, "
+                    f"got '{trace_format}'"
+                )
+            self.graph.trace_path = trace_path
+            self.graph.trace_format = trace_format
+
     def set_common_params(self, params: dict, overwrite=False):
         """
         Pass parameters to every node in the graph unless otherwise defined in the graph.
@@ -235,6 +267,8 @@ class AbstractGraph(ABC):
                     warnings.simplefilter("ignore")
                     return init_chat_model(**llm_params)
             else:
+                from ..models import XAI, CLoD, DeepSeek, Nvidia, OneApi
+
                 model_provider = llm_params.pop("model_provider")
 
                 if model_provider == "clod":
@@ -318,12 +352,248 @@ class AbstractGraph(ABC):
         """
         inputs = {"user_prompt": self.prompt, self.input_key: self.source}
         self.final_state, self.execution_info = self.graph.execute(inputs)
-        result = self.final_state.get("answer", "No answer found.")
-        return result
+        return self._result()
+
+    async def arun(self) -> str:
+        """
+        Asynchronously executes the graph on the running event loop and
+        returns the result. Graphs whose `run` uses different inputs or
+        outputs override this method accordingly.
+
+        Returns:
+            str: The answer to the prompt.
+        """
+
+        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
+        self.final_state, self.execution_info = await self.graph.aexecute(inputs)
+
+        return self._result()
+
+    def _result(self):
+        """
+        Returns the result of the graph from its final state, once `run`,
+        `arun` or a resume completes. Graphs returning something other than
+        the answer override this method.
+
+        Returns:
+            str: The answer to the prompt.
+        """
+
+        return self.final_state.get("answer", "No answer found.")
+
+    def _clone_for_item(self, prompt: str, source) -> "AbstractGraph":
+        """
+        Returns a shallow copy of the graph bound to another prompt and source.
+        The copy shares the LLM client and the compiled nodes and edges and
+        only owns its prompt, source, input key, results and run id.
+        """
+        graph = copy.copy(self)
+        graph.graph = copy.copy(self.graph)
+        graph.graph.run_id = None
+        graph.prompt = prompt
+        graph.source = source
+        if hasattr(self, "input_key") and isinstance(source, str):
+            if source.startswith("http"):
+                graph.input_key = "url"
+            elif self.input_key == "url":
+                graph.input_key = "local_dir"
+        graph.final_state = None
+        graph.execution_info = None
+
+        return graph
+
+    def _get_item(self, item: Union[str, tuple, dict]) -> tuple:
+        """Returns the (prompt, source) pair of a `run_many` item."""
+        if isinstance(item, dict):
+            return item.get("prompt", self.prompt), item.get("source", self.source)
+        if isinstance(item, tuple):
+            return item
+        return self.prompt, item
+
+    async def aiter_many(
+        self, items: Iterable[Union[str, tuple, dict]], concurrency: int = 4
+    ) -> AsyncIterator[dict]:
+        """
+        Runs the graph over many items, at most `concurrency` at a time, and
+        yields the result of each item as soon as it completes.
+
+        Each item is a source (run with the graph prompt), a (prompt, source)
+        tuple or a dict with "prompt" and/or "source" keys. All the runs share
+        the LLM client and the compiled graph of this instance.
+
+        Args:
+            items (Iterable): The items to run the graph on.
+            concurrency (int): The maximum number of items running at the same time.
+
+        Yields:
+            dict: The index, prompt, source, answer, exec_info, run_id and error
+            of an item; error is None unless the run of the item raised. With
+            `checkpoint_path` set, a failed item is resumed by passing its
+            run_id to `resume`.
+        """
+
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(index: int, prompt: str, source) -> dict:
+            graph = self._clone_for_item(prompt, source)
+            result = {
+                "index": index,
+                "prompt": prompt,
+                "source": source,
+                "answer": None,
+                "exec_info": None,
+                "run_id": None,
+                "error": None,
+            }
+            async with semaphore:
+                try:
+                    result["answer"] = await graph.arun()
+                except Exception as e:
+                    logger.error(f"Item {index} ({source}) failed: {e}")
+                    result["error"] = str(e)
+            result["exec_info"] = graph.get_execution_info()
+            result["run_id"] = graph.graph.run_id
+            return result
+
+        tasks = [
+            asyncio.ensure_future(_run(index, *self._get_item(item)))
+            for index, item in enumerate(items)
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def arun_many(
+        self, items: Iterable[Union[str, tuple, dict]], concurrency: int = 4
+    ) -> List[dict]:
+        """
+        Asynchronously runs the graph over many items with bounded concurrency,
+        see `aiter_many`.
+
+        Args:
+            items (Iterable): The items to run the graph on.
+            concurrency (int): The maximum number of items running at the same time.
+
+        Returns:
+            List[dict]: The result of each item, in the order of the items.
+        """
+
+        results = [result async for result in self.aiter_many(items, concurrency)]
+
+        return sorted(results, key=lambda result: result["index"])
+
+    def run_many(
+        self, items: Iterable[Union[str, tuple, dict]], concurrency: int = 4
+    ) -> List[dict]:
+        """
+        Runs the graph over many items with bounded concurrency on a new event
+        loop, see `aiter_many`. Use `arun_many` from a running event loop.
+
+        Args:
+            items (Iterable): The items to run the graph on.
+            concurrency (int): The maximum number of items running at the same time.
+
+        Returns:
+            List[dict]: The result of each item, in the order of the items.
+
+        Example:
+            >>> results = smart_scraper.run_many(
+            ...     ["https://example.com/a", ("List the prices", "https://example.com/b")],
+            ...     concurrency=8,
+            ... )
+            >>> [result["answer"] for result in results]
+        """
+
+        return asyncio.run(self.arun_many(items, concurrency))
+
+    def _get_inputs(self) -> dict:
+        """
+        Returns the initial state the graph is executed with by `stream`.
+
+        Returns:
+            dict: The inputs of the graph.
+        """
+
+        inputs = {"user_prompt": self.prompt}
+        if hasattr(self, "input_key"):
+            inputs[self.input_key] = self.source
+        return inputs
+
+    def stream(self) -> Iterator[dict]:
+        """
+        Executes the graph and yields an event per completed node and, for
+        multi graphs, per completed sub-graph, so that partial results can be
+        consumed before the whole graph has run. The last event has type
+        "end" and holds the final state, which is also stored in `final_state`.
+
+        Yields:
+            dict: The execution events, see `BaseGraph.stream`.
+        """
+
+        for event in self.graph.stream(self._get_inputs()):
+            if event["type"] == "end":
+                self.final_state = event["state"]
+                self.execution_info = event["exec_info"]
+            yield event
+
+    async def astream(self) -> AsyncIterator[dict]:
+        """
+        Asynchronously executes the graph and yields an event per completed
+        node and sub-graph, see `stream`.
+
+        Yields:
+            dict: The execution events, see `BaseGraph.stream`.
+        """
+
+        async for event in self.graph.astream(self._get_inputs()):
+            if event["type"] == "end":
+                self.final_state = event["state"]
+                self.execution_info = event["exec_info"]
+            yield event
+
+    def resume(self, run_id: Optional[str] = None) -> str:
+        """
+        Resumes a failed run from the node that failed, using the checkpoints
+        saved under the `checkpoint_path` of the graph config.
+
+        Args:
+            run_id (str, optional): The identifier of the run, defaults to the last
+                                    run of this graph.
+
+        Returns:
+            str: The result of the graph, as returned by `run`.
+        """
+
+        self.final_state, self.execution_info = self.graph.resume(run_id)
+
+        return self._result()
+
+    async def aresume(self, run_id: Optional[str] = None) -> str:
+        """
+        Asynchronously resumes a failed run from the node that failed.
+
+        Args:
+            run_id (str, optional): The identifier of the run, defaults to the last
+                                    run of this graph.
+
+        Returns:
+            str: The result of the graph, as returned by `arun`.
+        """
+
+        self.final_state, self.execution_info = await self.graph.aresume(run_id)
+
+        return self._result()
 
     async def run_safe_async(self) -> str:
         """
-        Executes the run process asynchronously safety.
+        Executes the run process asynchronously safety, running the synchronous
+        `run` in the default executor. Prefer `arun` for native async execution.
 
         Returns:
             str: The answer to the prompt.
@@ -2,19 +2,59 @@
 base_graph module
 """
 
+import asyncio
+import contextvars
+import queue
+import re
+import threading
 import time
+import uuid
 import warnings
-from typing import Tuple
-
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager, nullcontext
+from typing import (
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from ..docloaders.http_cache import http_cache_scope
+from ..nodes.base_node import node_event_scope
 from ..telemetry import log_graph_execution
-from ..utils import CustomLLMCallbackManager
+from ..utils.llm_callback_manager import CustomLLMCallbackManager
 from ..utils.logging import get_logger
+from ..utils.tracing import Tracer, get_tracer, span, use_tracer
 
 logger = get_logger(__name__)
 
+# Run executing the current node, under which the runs of nested graphs are keyed
+_current_run: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
+    "current_run", default=None
+)
+
+
+@contextmanager
+def _run_scope(run_id: Optional[str]):
+    """Keys the runs of the graphs nested in a node under the run executing it."""
+    token = _current_run.set(run_id)
+    try:
+        yield
+    finally:
+        _current_run.reset(token)
+
+
 # ANSI escape sequence for hyperlink
 CLICKABLE_URL = "\033]8;;https://scrapegraphai.com\033\\https://scrapegraphai.com\033]8;;\033\\"
 
+class StreamClosed(Exception):
+    """Stops a streamed execution whose consumer closed the stream."""
+
+
 class BaseGraph:
     """
     BaseGraph manages the execution flow of a graph composed of interconnected nodes.
@@ -30,6 +70,10 @@ class BaseGraph:
         edges (iterable): An iterable of tuples where each tuple represents a directed edge
                           in the graph, defined by a pair of nodes (from_node, to_node).
         entry_point (BaseNode): The node instance that represents the entry point of the graph.
+        parallel (bool, optional): If True, nodes are scheduled as a DAG derived from
+                          their `input`/`output` keys and independent nodes run concurrently.
+        max_workers (int, optional): Maximum number of nodes running at the same time
+                          when `parallel` is enabled.
 
     Raises:
         Warning: If the entry point node is not the first node in the list.
@@ -61,6 +105,8 @@ class BaseGraph:
         use_burr: bool = False,
         burr_config: dict = None,
         graph_name: str = "Custom",
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
     ):
         self.nodes = nodes
         self.raw_edges = edges
@@ -76,10 +122,22 @@ class BaseGraph:
             )
 
         self._set_conditional_node_edges()
+        self._compile()
 
         self.use_burr = use_burr
         self.burr_config = burr_config or {}
 
+        self.parallel = parallel
+        self.max_workers = max_workers
+
+        self.cache = None
+        self.profiler = None
+        self.trace_path = None
+        self.trace_format = "chrome"
+
+        self.checkpoint_store = None
+        self.run_id = None
+
     def _create_edges(self, edges: list) -> dict:
         """
         Helper method to create a dictionary of edges from the given iterable of tuples.
@@ -123,9 +181,51 @@ class BaseGraph:
                         f"Failed to set false_node_name for ConditionalNode '{node.node_name}'"
                     ) from e
 
+    def _compile(self):
+        """
+        Validates the graph once and prepares it for execution: builds the
+        name-to-node index, checks that edges and entry point reference nodes
+        of the graph and compiles every node's input expression.
+
+        Raises:
+            ValueError: If node names are duplicated, an edge or the entry point
+                        references an unknown node, or an input expression is invalid.
+        """
+        node_index = {}
+        for node in self.nodes:
+            if node.node_name in node_index:
+                raise ValueError(
+                    f"Node with name '{node.node_name}' already exists in the graph."
+                )
+            node_index[node.node_name] = node
+
+        for from_node, to_node in self.raw_edges:
+            for edge_node in (from_node, to_node):
+                if edge_node is not None and edge_node.node_name not in node_index:
+                    raise ValueError(
+                        f"Edge references node '{edge_node.node_name}' "
+                        "which is not part of the graph."
+                    )
+
+        if self.entry_point not in node_index:
+            raise ValueError(
+                f"Entry point '{self.entry_point}' is not part of the graph."
+            )
+
+        for node in self.nodes:
+            try:
+                node.compile_input_expression()
+            except ValueError as e:
+                raise ValueError(
+                    f"Invalid input expression for {node.node_name}: {e}"
+                ) from e
+
+        self._node_index = node_index
+        self._parallel_plan = None
+
     def _get_node_by_name(self, node_name: str):
         """Returns a node instance by its name."""
-        return next(node for node in self.nodes if node.node_name == node_name)
+        return self._node_index[node_name]
 
     def _update_source_info(self, current_node, state):
         """Updates source type and source information from FetchNode."""
@@ -195,35 +295,151 @@ class BaseGraph:
         except Exception:
             return None
 
-    def _execute_node(self, current_node, state, llm_model, llm_model_name):
+    def _execute_node(
+        self, current_node, state, llm_model, llm_model_name, run_id=None, on_event=None
+    ):
         """Executes a single node and returns execution information."""
-        curr_time = time.time()
-
-        with self.callback_manager.exclusive_get_callback(
-            llm_model, llm_model_name
-        ) as cb:
-            result = current_node.execute(state)
-            node_exec_time = time.time() - curr_time
-
-            cb_data = None
-            if cb is not None:
-                cb_data = {
-                    "node_name": current_node.node_name,
-                    "total_tokens": cb.total_tokens,
-                    "prompt_tokens": cb.prompt_tokens,
-                    "completion_tokens": cb.completion_tokens,
-                    "successful_requests": cb.successful_requests,
-                    "total_cost_USD": cb.total_cost,
-                    "exec_time": node_exec_time,
-                }
-
-        return result, node_exec_time, cb_data
+        with span(current_node.node_name, category="node"):
+            curr_time = time.time()
+
+            cache_key, cached = self._load_cached(current_node, state)
+            if cached is not None:
+                return self._apply_cached(current_node, state, cached, curr_time)
+            before = dict(state) if cache_key else None
+
+            with (
+                self._profile(current_node, state) as profile,
+                http_cache_scope() as http_cache,
+                _run_scope(run_id),
+                node_event_scope(on_event),
+            ):
+                with self.callback_manager.get_callback(
+                    llm_model, llm_model_name
+                ) as cb:
+                    result = current_node.execute(state)
+                    node_exec_time = time.time() - curr_time
+                    cb_data = self._get_cb_data(current_node, cb, node_exec_time)
+
+            if profile is not None:
+                cb_data["profile"] = profile
+            if http_cache["requests"]:
+                cb_data["http_cache"] = http_cache
+
+            if cache_key:
+                self.cache.store(cache_key, self._get_state_updates(before, result))
+
+            return result, node_exec_time, cb_data
+
+    async def _aexecute_node(
+        self, current_node, state, llm_model, llm_model_name, run_id=None, on_event=None
+    ):
+        """Asynchronously executes a single node and returns execution information."""
+        with span(current_node.node_name, category="node"):
+            curr_time = time.time()
+
+            cache_key, cached = self._load_cached(current_node, state)
+            if cached is not None:
+                return self._apply_cached(current_node, state, cached, curr_time)
+            before = dict(state) if cache_key else None
+
+            with (
+                self._profile(current_node, state, asynchronous=True) as profile,
+                http_cache_scope() as http_cache,
+                _run_scope(run_id),
+                node_event_scope(on_event),
+            ):
+                with self.callback_manager.get_callback(
+                    llm_model, llm_model_name
+                ) as cb:
+                    result = await current_node.aexecute(state)
+                    node_exec_time = time.time() - curr_time
+                    cb_data = self._get_cb_data(current_node, cb, node_exec_time)
+
+            if profile is not None:
+                cb_data["profile"] = profile
+            if http_cache["requests"]:
+                cb_data["http_cache"] = http_cache
+
+            if cache_key:
+                self.cache.store(cache_key, self._get_state_updates(before, result))
+
+            return result, node_exec_time, cb_data
+
+    @contextmanager
+    def _trace(self):
+        """
+        Records the execution of the graph as a span. A top-level run with
+        `trace_path` set collects the spans of its nodes and nested graphs and
+        exports them once it completes.
+        """
+        tracer = Tracer() if self.trace_path and get_tracer() is None else None
+        try:
+            with use_tracer(tracer), span(self.graph_name, category="graph"):
+                yield
+        finally:
+            if tracer is not None:
+                try:
+                    tracer.export(self.trace_path, self.trace_format)
+                except OSError as e:
+                    logger.warning(f"Could not write the trace to {self.trace_path}: {e}")
+
+    def _profile(self, current_node, state: dict, asynchronous: bool = False):
+        """Returns the context profiling a node execution, if profiling is enabled."""
+        if self.profiler is None:
+            return nullcontext()
+        if asynchronous:
+            return self.profiler.profile_async(current_node, state)
+        return self.profiler.profile(current_node, state)
+
+    def _load_cached(self, current_node, state) -> Tuple[Optional[str], Optional[dict]]:
+        """Returns the cache key of a node execution and its cached state updates."""
+        if self.cache is None:
+            return None, None
+
+        cache_key = self.cache.make_key(current_node, state)
+        if cache_key is None:
+            return None, None
+
+        return cache_key, self.cache.load(cache_key)
+
+    @staticmethod
+    def _apply_cached(current_node, state, cached: dict, curr_time: float):
+        """Applies cached state updates in place of executing a node."""
+        logger.info(f"--- Using cached result for {current_node.node_name} ---")
+        state.update(cached)
+        node_exec_time = time.time() - curr_time
+        cb_data = {
+            "node_name": current_node.node_name,
+            "total_tokens": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "successful_requests": 0,
+            "total_cost_USD": 0.0,
+            "exec_time": node_exec_time,
+        }
+
+        return state, node_exec_time, cb_data
+
+    @staticmethod
+    def _get_cb_data(current_node, cb, node_exec_time: float) -> Optional[dict]:
+        """Builds the execution info entry of a node from its LLM callback."""
+        if cb is None:
+            return None
+
+        return {
+            "node_name": current_node.node_name,
+            "total_tokens": cb.total_tokens,
+            "prompt_tokens": cb.prompt_tokens,
+            "completion_tokens": cb.completion_tokens,
+            "successful_requests": cb.successful_requests,
+            "total_cost_USD": cb.total_cost,
+            "exec_time": node_exec_time,
+        }
 
     def _get_next_node(self, current_node, result):
         """Determines the next node to execute based on current node type and result."""
         if current_node.node_type == "conditional_node":
-            node_names = {node.node_name for node in self.nodes}
-            if result in node_names:
+            if result in self._node_index:
                 return result
             elif result is None:
                 return None
@@ -233,104 +449,115 @@ class BaseGraph:
 
         return self.edges.get(current_node.node_name)
 
-    def _execute_standard(self, initial_state: dict) -> Tuple[dict, list]:
+    @staticmethod
+    def _new_run_id() -> str:
         """
-        Executes the graph by traversing nodes
-        starting from the entry point using the standard method.
+        Returns the identifier of a new run. The runs of graphs nested in a
+        node, such as the sub-graphs of GraphIteratorNode, are keyed under the
+        run executing the node, as "<parent run id>/<run id>".
         """
-        current_node_name = self.entry_point
-        state = initial_state
-
-        total_exec_time = 0.0
-        exec_info = []
-        cb_total = {
-            "total_tokens": 0,
-            "prompt_tokens": 0,
-            "completion_tokens": 0,
-            "successful_requests": 0,
-            "total_cost_USD": 0.0,
+        run_id = str(uuid.uuid4())
+        parent = _current_run.get()
+        return f"{parent}/{run_id}" if parent else run_id
+
+    def _start_run(self) -> dict:
+        """Returns the bookkeeping used to build exec_info and telemetry for a run."""
+        return {
+            "run_id": self._new_run_id(),
+            "start_time": time.time(),
+            "total_exec_time": 0.0,
+            "exec_info": [],
+            "cb_total": {
+                "total_tokens": 0,
+                "prompt_tokens": 0,
+                "completion_tokens": 0,
+                "successful_requests": 0,
+                "total_cost_USD": 0.0,
+            },
+            "source_type": None,
+            "source": [],
+            "prompt": None,
+            "llm_model": None,
+            "llm_model_name": None,
+            "embedder_model": None,
+            "schema": None,
+            "completed_nodes": None,
         }
 
-        start_time = time.time()
-        error_node = None
-        source_type = None
-        llm_model = None
-        llm_model_name = None
-        embedder_model = None
-        source = []
-        prompt = None
-        schema = None
-
-        while current_node_name:
-            current_node = self._get_node_by_name(current_node_name)
-
-            if source_type is None:
-                source_type, source, prompt = self._update_source_info(
-                    current_node, state
-                )
+    def _update_run_info(self, run: dict, current_node, state: dict):
+        """Collects source, model and schema information before a node runs."""
+        if run["source_type"] is None:
+            run["source_type"], run["source"], run["prompt"] = (
+                self._update_source_info(current_node, state)
+            )
 
-            if llm_model is None:
-                llm_model, llm_model_name, embedder_model = self._get_model_info(
-                    current_node
-                )
+        if run["llm_model"] is None:
+            run["llm_model"], run["llm_model_name"], run["embedder_model"] = (
+                self._get_model_info(current_node)
+            )
 
-            if schema is None:
-                schema = self._get_schema(current_node)
+        if run["schema"] is None:
+            run["schema"] = self._get_schema(current_node)
 
-            try:
-                result, node_exec_time, cb_data = self._execute_node(
-                    current_node, state, llm_model, llm_model_name
-                )
-                total_exec_time += node_exec_time
+    @staticmethod
+    def _record_node(run: dict, node_exec_time: float, cb_data: Optional[dict]):
+        """Adds the execution info of a completed node to the run totals."""
+        run["total_exec_time"] += node_exec_time
 
-                if cb_data:
-                    exec_info.append(cb_data)
-                    for key in cb_total:
-                        cb_total[key] += cb_data[key]
-
-                current_node_name = self._get_next_node(current_node, result)
+        if cb_data:
+            run["exec_info"].append(cb_data)
+            for key in run["cb_total"]:
+                run["cb_total"][key] += cb_data[key]
 
-            except Exception as e:
-                error_node = current_node.node_name
-                graph_execution_time = time.time() - start_time
-                log_graph_execution(
-                    graph_name=self.graph_name,
-                    source=source,
-                    prompt=prompt,
-                    schema=schema,
-                    llm_model=llm_model_name,
-                    embedder_model=embedder_model,
-                    source_type=source_type,
-                    execution_time=graph_execution_time,
-                    error_node=error_node,
-                    exception=str(e),
-                )
-                raise e
+    def _log_failure(self, run: dict, error_node: str, exception: Exception):
+        """Logs the telemetry event of a failed graph execution."""
+        if isinstance(exception, StreamClosed):
+            return
+        log_graph_execution(
+            graph_name=self.graph_name,
+            source=run["source"],
+            prompt=run["prompt"],
+            schema=run["schema"],
+            llm_model=run["llm_model_name"],
+            embedder_model=run["embedder_model"],
+            source_type=run["source_type"],
+            execution_time=time.time() - run["start_time"],
+            error_node=error_node,
+            exception=str(exception),
+        )
 
-        exec_info.append(
-            {
-                "node_name": "TOTAL RESULT",
-                "total_tokens": cb_total["total_tokens"],
-                "prompt_tokens": cb_total["prompt_tokens"],
-                "completion_tokens": cb_total["completion_tokens"],
-                "successful_requests": cb_total["successful_requests"],
-                "total_cost_USD": cb_total["total_cost_USD"],
-                "exec_time": total_exec_time,
+    def _finish_run(self, run: dict, state: dict) -> list:
+        """Appends the totals to exec_info and logs the successful graph execution."""
+        cb_total = run["cb_total"]
+        exec_info = run["exec_info"]
+        total = {
+            "node_name": "TOTAL RESULT",
+            "total_tokens": cb_total["total_tokens"],
+            "prompt_tokens": cb_total["prompt_tokens"],
+            "completion_tokens": cb_total["completion_tokens"],
+            "successful_requests": cb_total["successful_requests"],
+            "total_cost_USD": cb_total["total_cost_USD"],
+            "exec_time": run["total_exec_time"],
+        }
+        http_cache = [info["http_cache"] for info in exec_info if "http_cache" in info]
+        if http_cache:
+            total["http_cache"] = {
+                key: sum(stats[key] for stats in http_cache) for key in http_cache[0]
             }
-        )
+        exec_info.append(total)
 
-        graph_execution_time = time.time() - start_time
-        response = state.get("answer", None) if source_type == "url" else None
+        graph_execution_time = time.time() - run["start_time"]
+        response = state.get("answer", None) if run["source_type"] == "url" else None
         content = state.get("parsed_doc", None) if response is not None else None
 
         log_graph_execution(
             graph_name=self.graph_name,
-            source=source,
-            prompt=prompt,
-            schema=schema,
-            llm_model=llm_model_name,
-            embedder_model=embedder_model,
-            source_type=source_type,
+            source=run["source"],
+            prompt=run["prompt"],
+            schema=run["schema"],
+            llm_model=run["llm_model_name"],
+            embedder_model=run["embedder_model"],
+            source_type=run["source_type"],
             content=content,
             response=response,
             execution_time=graph_execution_time,
@@ -339,30 +566,443 @@ class BaseGraph:
             ),
         )
 
+        return exec_info
+
+    def _execute_standard(
+        self,
+        initial_state: dict,
+        start_node: Optional[str] = None,
+        run: Optional[dict] = None,
+        on_event: Optional[Callable[[dict], None]] = None,
+    ) -> Tuple[dict, list]:
+        """
+        Executes the graph by traversing nodes
+        starting from the entry point using the standard method.
+        """
+        current_node_name = start_node or self.entry_point
+        state = initial_state
+        run = run or self._start_run()
+        self.run_id = run["run_id"]
+        self._checkpoint(run, current_node_name, state)
+
+        while current_node_name:
+            current_node = self._get_node_by_name(current_node_name)
+            self._update_run_info(run, current_node, state)
+            before = dict(state) if on_event else None
+
+            try:
+                result, node_exec_time, cb_data = self._execute_node(
+                    current_node,
+                    state,
+                    run["llm_model"],
+                    run["llm_model_name"],
+                    run["run_id"],
+                    on_event,
+                )
+                self._record_node(run, node_exec_time, cb_data)
+                current_node_name = self._get_next_node(current_node, result)
+                if on_event:
+                    updates = self._get_state_updates(before, result)
+                    on_event(
+                        self._node_event(current_node, updates, node_exec_time, cb_data)
+                    )
+
+            except Exception as e:
+                self._checkpoint_failure(run, e)
+                self._log_failure(run, current_node.node_name, e)
+                raise e
+
+            self._checkpoint(run, current_node_name, state)
+
+        exec_info = self._finish_run(run, state)
+        self._checkpoint(run, None, state, status="completed")
+
         return state, exec_info
 
-    def execute(self, initial_state: dict) -> Tuple[dict, list]:
+    async def _aexecute_standard(
+        self,
+        initial_state: dict,
+        start_node: Optional[str] = None,
+        run: Optional[dict] = None,
+        on_event: Optional[Callable[[dict], None]] = None,
+    ) -> Tuple[dict, list]:
+        """
+        Asynchronously executes the graph by traversing nodes
+        starting from the entry point, awaiting each node's `aexecute`.
+        """
+        current_node_name = start_node or self.entry_point
+        state = initial_state
+        run = run or self._start_run()
+        self.run_id = run["run_id"]
+        self._checkpoint(run, current_node_name, state)
+
+        while current_node_name:
+            current_node = self._get_node_by_name(current_node_name)
+            self._update_run_info(run, current_node, state)
+            before = dict(state) if on_event else None
+
+            try:
+                result, node_exec_time, cb_data = await self._aexecute_node(
+                    current_node,
+                    state,
+                    run["llm_model"],
+                    run["llm_model_name"],
+                    run["run_id"],
+                    on_event,
+                )
+                self._record_node(run, node_exec_time, cb_data)
+                current_node_name = self._get_next_node(current_node, result)
+                if on_event:
+                    updates = self._get_state_updates(before, result)
+                    on_event(
+                        self._node_event(current_node, updates, node_exec_time, cb_data)
+                    )
+
+            except Exception as e:
+                self._checkpoint_failure(run, e)
+                self._log_failure(run, current_node.node_name, e)
+                raise e
+
+            self._checkpoint(run, current_node_name, state)
+
+        exec_info = self._finish_run(run, state)
+        self._checkpoint(run, None, state, status="completed")
+
+        return state, exec_info
+
+    def _checkpoint(
+        self,
+        run: dict,
+        next_node: Optional[str],
+        state: dict,
+        status: str = "running",
+    ):
+        """Saves the state of a run before `next_node` executes, if enabled."""
+        if self.checkpoint_store is None:
+            return
+
+        run_info = {
+            key: value
+            for key, value in run.items()
+            if key not in ("start_time", "llm_model")
+        }
+        self.checkpoint_store.save(
+            run["run_id"], self.graph_name, next_node, state, run_info, status
+        )
+
+    def _checkpoint_failure(self, run: dict, exception: Exception):
+        """Marks a run as failed, keeping the state saved before the failing node."""
+        if self.checkpoint_store is None:
+            return
+
+        self.checkpoint_store.set_status(run["run_id"], "failed", str(exception))
+
+    def _checkpoint_progress(self, run: dict, order: List, done: Set[str], state: dict):
+        """
+        Saves the state of a parallel run with the nodes it has completed, the
+        first node of the execution order left to run being its next node.
+        """
+        if self.checkpoint_store is None:
+            return
+
+        run["completed_nodes"] = sorted(done)
+        next_node = next(
+            (node.node_name for node in order if node.node_name not in done), None
+        )
+        self._checkpoint(run, next_node, state)
+
+    def _load_checkpoint(self, run_id: str) -> Tuple[dict, str, dict]:
+        """Returns the state, next node and run bookkeeping to resume a run from."""
+        if self.checkpoint_store is None:
+            raise ValueError(
+                "Checkpointing is not enabled, set 'checkpoint_path' in the graph config."
+            )
+
+        checkpoint = self.checkpoint_store.load(run_id)
+        if checkpoint is None:
+            raise ValueError(f"No checkpoint found for run '{run_id}'.")
+        if checkpoint["status"] == "completed" or checkpoint["next_node"] is None:
+            raise ValueError(f"Run '{run_id}' has already completed.")
+        if checkpoint["next_node"] not in self._node_index:
+            raise ValueError(
+                f"Node '{checkpoint['next_node']}' of run '{run_id}' is not part of the graph."
+            )
+
+        run = self._start_run()
+        run.update(checkpoint["run_info"])
+        logger.info(f"--- Resuming run {run_id} from {checkpoint['next_node']} ---")
+
+        return checkpoint["state"], checkpoint["next_node"], run
+
+    @staticmethod
+    def _expression_keys(expression: str) -> Set[str]:
+        """Returns the set of state keys referenced by an input expression."""
+        if not expression:
+            return set()
+        return set(re.findall(r"[^\s&|()]+", expression))
+
+    def _get_execution_order(self) -> List:
+        """Returns the nodes in the order the standard execution would visit them."""
+        order = []
+        visited = set()
+        current_node_name = self.entry_point
+        while current_node_name and current_node_name not in visited:
+            visited.add(current_node_name)
+            order.append(self._get_node_by_name(current_node_name))
+            current_node_name = self.edges.get(current_node_name)
+        return order
+
+    def _build_dependencies(self, order: List) -> Dict[str, Set[str]]:
         """
-        Executes the graph by either using BurrBridge or the standard method.
+        Derives the data dependencies between nodes from their `input` expressions
+        and `output` keys.
+
+        A node depends on every node preceding it in the execution order that
+        writes a key it reads (read-after-write), writes a key it also writes
+        (write-after-write) or reads a key it writes (write-after-read). This keeps
+        the final state identical to the one produced by the standard execution.
 
         Args:
-            initial_state (dict): The initial state to pass to the entry point node.
+            order (list): The nodes in sequential execution order.
 
         Returns:
-            Tuple[dict, list]: A tuple containing the final state and a list of execution info.
+            dict: A mapping from node name to the names of the nodes it depends on.
+        """
+        dependencies = {}
+        for i, node in enumerate(order):
+            reads = self._expression_keys(node.input)
+            writes = set(node.output or [])
+            deps = set()
+            for previous in order[:i]:
+                previous_reads = self._expression_keys(previous.input)
+                previous_writes = set(previous.output or [])
+                if (
+                    previous_writes & reads
+                    or previous_writes & writes
+                    or previous_reads & writes
+                ):
+                    deps.add(previous.node_name)
+            dependencies[node.node_name] = deps
+        return dependencies
+
+    def _get_parallel_plan(self):
         """
+        Returns the execution order and dependencies used by the parallel
+        executors, or None if the graph cannot be executed as a DAG.
+        The plan is computed once and reused across executions.
+        """
+        if any(node.node_type == "conditional_node" for node in self.nodes):
+            logger.warning(
+                "Parallel execution does not support conditional nodes, "
+                "falling back to standard execution."
+            )
+            return None
 
-        self.initial_state = initial_state
-        if self.use_burr:
-            from ..integrations import BurrBridge
+        if self._parallel_plan is None:
+            order = self._get_execution_order()
+            self._parallel_plan = (order, self._build_dependencies(order))
+        return self._parallel_plan
+
+    def _get_ready_nodes(self, order, dependencies, done, running, limit) -> List:
+        """Returns the nodes whose dependencies are all completed, up to `limit`."""
+        ready = []
+        for node in order:
+            if len(ready) >= limit:
+                break
+            if (
+                node.node_name not in done
+                and node.node_name not in running
+                and dependencies[node.node_name] <= done
+            ):
+                ready.append(node)
+        return ready
+
+    @staticmethod
+    def _get_state_updates(before: dict, result) -> dict:
+        """Returns the keys a node added or replaced compared to its input state."""
+        if not isinstance(result, dict):
+            return {}
+        return {
+            key: value
+            for key, value in result.items()
+            if key not in before or before[key] is not value
+        }
 
-            bridge = BurrBridge(self, self.burr_config)
-            result = bridge.execute(initial_state)
-            state, exec_info = (result["_state"], [])
-        else:
-            state, exec_info = self._execute_standard(initial_state)
+    def _execute_parallel(
+        self,
+        initial_state: dict,
+        run: Optional[dict] = None,
+        on_event: Optional[Callable[[dict], None]] = None,
+    ) -> Tuple[dict, list]:
+        """
+        Executes the graph as a DAG, running every node whose dependencies are
+        satisfied concurrently on a thread pool.
+
+        Each node receives a shallow copy of the state and the keys it adds or
+        replaces are merged back into the shared state once it completes.
+        Graphs containing conditional nodes fall back to the standard method.
+        A resumed run skips the nodes completed before its checkpoint.
+        """
+        plan = self._get_parallel_plan()
+        if plan is None:
+            return self._execute_standard(initial_state, run=run, on_event=on_event)
+
+        order, dependencies = plan
+        state = initial_state
+        run = run or self._start_run()
+        self.run_id = run["run_id"]
+        max_workers = self.max_workers or min(32, len(order))
+
+        def _run(node, snapshot):
+            before = dict(snapshot)
+            result, node_exec_time, cb_data = self._execute_node(
+                node,
+                snapshot,
+                run["llm_model"],
+                run["llm_model_name"],
+                run["run_id"],
+                on_event,
+            )
+            return self._get_state_updates(before, result), node_exec_time, cb_data
+
+        done = set(run["completed_nodes"] or ())
+        pending = {}
+        self._checkpoint_progress(run, order, done, state)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while len(done) < len(order):
+                running = {node.node_name for node in pending.values()}
+                for node in self._get_ready_nodes(
+                    order, dependencies, done, running, max_workers - len(pending)
+                ):
+                    self._update_run_info(run, node, state)
+                    # Run in a copy of the current context so that the LLM usage
+                    # of the node also counts towards any enclosing node
+                    future = executor.submit(
+                        contextvars.copy_context().run, _run, node, dict(state)
+                    )
+                    pending[future] = node
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    node = pending.pop(future)
+                    try:
+                        updates, node_exec_time, cb_data = future.result()
+                    except Exception as e:
+                        for other in pending:
+                            other.cancel()
+                        self._checkpoint_failure(run, e)
+                        self._log_failure(run, node.node_name, e)
+                        raise e
+
+                    state.update(updates)
+                    done.add(node.node_name)
+                    self._record_node(run, node_exec_time, cb_data)
+                    self._checkpoint_progress(run, order, done, state)
+                    if on_event:
+                        on_event(
+                            self._node_event(node, updates, node_exec_time, cb_data)
+                        )
+
+        exec_info = self._finish_run(run, state)
+        self._checkpoint(run, None, state, status="completed")
+
+        return state, exec_info
+
+    async def _aexecute_parallel(
+        self,
+        initial_state: dict,
+        run: Optional[dict] = None,
+        on_event: Optional[Callable[[dict], None]] = None,
+    ) -> Tuple[dict, list]:
+        """
+        Asynchronously executes the graph as a DAG, scheduling every node whose
+        dependencies are satisfied as a task on the running event loop.
+        """
+        plan = self._get_parallel_plan()
+        if plan is None:
+            return await self._aexecute_standard(
+                initial_state, run=run, on_event=on_event
+            )
+
+        order, dependencies = plan
+        state = initial_state
+        run = run or self._start_run()
+        self.run_id = run["run_id"]
+        max_workers = self.max_workers or len(order)
+
+        async def _run(node, snapshot):
+            before = dict(snapshot)
+            result, node_exec_time, cb_data = await self._aexecute_node(
+                node,
+                snapshot,
+                run["llm_model"],
+                run["llm_model_name"],
+                run["run_id"],
+                on_event,
+            )
+            return self._get_state_updates(before, result), node_exec_time, cb_data
+
+        done = set(run["completed_nodes"] or ())
+        pending = {}
+        self._checkpoint_progress(run, order, done, state)
+
+        while len(done) < len(order):
+            running = {node.node_name for node in pending.values()}
+            for node in self._get_ready_nodes(
+                order, dependencies, done, running, max_workers - len(pending)
+            ):
+                self._update_run_info(run, node, state)
+                pending[asyncio.ensure_future(_run(node, dict(state)))] = node
+
+            finished, _ = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                node = pending.pop(task)
+                try:
+                    updates, node_exec_time, cb_data = task.result()
+                except Exception as e:
+                    for other in pending:
+                        other.cancel()
+                    self._checkpoint_failure(run, e)
+                    self._log_failure(run, node.node_name, e)
+                    raise e
+
+                state.update(updates)
+                done.add(node.node_name)
+                self._record_node(run, node_exec_time, cb_data)
+                self._checkpoint_progress(run, order, done, state)
+                if on_event:
+                    on_event(
+                        self._node_event(node, updates, node_exec_time, cb_data)
+                    )
 
-        # Print the result first
+        exec_info = self._finish_run(run, state)
+        self._checkpoint(run, None, state, status="completed")
+
+        return state, exec_info
+
+    @staticmethod
+    def _node_event(
+        current_node, updates: dict, node_exec_time: float, cb_data: Optional[dict]
+    ) -> dict:
+        """Builds the streamed event of a completed node."""
+        cb_data = cb_data or {}
+        return {
+            "type": "node",
+            "node_name": current_node.node_name,
+            "changed_keys": list(updates),
+            "updates": updates,
+            "exec_time": node_exec_time,
+            "total_tokens": cb_data.get("total_tokens", 0),
+            "prompt_tokens": cb_data.get("prompt_tokens", 0),
+            "completion_tokens": cb_data.get("completion_tokens", 0),
+            "total_cost_USD": cb_data.get("total_cost_USD", 0.0),
+        }
+
+    def _print_result(self, state: dict):
+        """Prints the main result of the graph execution."""
         if "answer" in state:
             print(state["answer"])
         elif "parsed_doc" in state:
@@ -375,6 +1015,247 @@ class BaseGraph:
         # Then show the message ONLY ONCE
         print(f"✨ Try enhanced version of ScrapegraphAI at {CLICKABLE_URL} ✨")
 
+    def _execute(
+        self,
+        initial_state: dict,
+        on_event: Optional[Callable[[dict], None]] = None,
+    ) -> Tuple[dict, list]:
+        """
+        Executes the graph by either using BurrBridge, the parallel DAG executor
+        or the standard method. Burr runs the nodes itself, so only the events
+        they emit reach `on_event`, not one event per completed node.
+        """
+        if self.use_burr:
+            from ..integrations import BurrBridge
+
+            bridge = BurrBridge(self, self.burr_config)
+            with node_event_scope(on_event):
+                result = bridge.execute(initial_state)
+            return result["_state"], []
+        if self.parallel:
+            return self._execute_parallel(initial_state, on_event=on_event)
+        return self._execute_standard(initial_state, on_event=on_event)
+
+    async def _aexecute(
+        self,
+        initial_state: dict,
+        on_event: Optional[Callable[[dict], None]] = None,
+    ) -> Tuple[dict, list]:
+        """Asynchronous version of `_execute`."""
+        if self.use_burr:
+            from ..integrations import BurrBridge
+
+            bridge = BurrBridge(self, self.burr_config)
+            with node_event_scope(on_event):
+                result = await asyncio.to_thread(bridge.execute, initial_state)
+            return result["_state"], []
+        if self.parallel:
+            return await self._aexecute_parallel(initial_state, on_event=on_event)
+        return await self._aexecute_standard(initial_state, on_event=on_event)
+
+    def execute(self, initial_state: dict) -> Tuple[dict, list]:
+        """
+        Executes the graph by either using BurrBridge, the parallel DAG executor
+        or the standard method.
+
+        Args:
+            initial_state (dict): The initial state to pass to the entry point node.
+
+        Returns:
+            Tuple[dict, list]: A tuple containing the final state and a list of execution info.
+        """
+
+        self.initial_state = initial_state
+        with self._trace():
+            state, exec_info = self._execute(initial_state)
+
+        self._print_result(state)
+
+        return state, exec_info
+
+    async def aexecute(self, initial_state: dict) -> Tuple[dict, list]:
+        """
+        Asynchronously executes the graph on the running event loop, awaiting
+        each node's `aexecute` instead of blocking a thread per graph.
+
+        Args:
+            initial_state (dict): The initial state to pass to the entry point node.
+
+        Returns:
+            Tuple[dict, list]: A tuple containing the final state and a list of execution info.
+        """
+
+        self.initial_state = initial_state
+        with self._trace():
+            state, exec_info = await self._aexecute(initial_state)
+
+        self._print_result(state)
+
+        return state, exec_info
+
+    def stream(self, initial_state: dict) -> Iterator[dict]:
+        """
+        Executes the graph in a background thread and yields an event as soon
+        as each node completes, instead of returning once the whole graph has run.
+
+        Node events have the keys type ("node"), node_name, changed_keys,
+        updates, exec_time, total_tokens, prompt_tokens, completion_tokens and
+        total_cost_USD. Nodes running sub-graphs, such as GraphIteratorNode,
+        also emit a "subgraph" event per completed sub-graph. The last event
+        has type "end" and holds the final state and exec_info. With Burr, only
+        the events emitted by the nodes and the "end" event are yielded.
+
+        Closing the generator early stops the execution once the running node
+        completes.
+
+        Args:
+            initial_state (dict): The initial state to pass to the entry point node.
+
+        Yields:
+            dict: The execution events, in completion order.
+        """
+
+        self.initial_state = initial_state
+        events = queue.Queue()
+        finished = object()
+        closed = threading.Event()
+        outcome = {}
+
+        def _emit(event: dict):
+            if closed.is_set():
+                raise StreamClosed("The consumer of the stream stopped reading it.")
+            events.put(event)
+
+        def _run():
+            try:
+                with self._trace():
+                    outcome["result"] = self._execute(initial_state, on_event=_emit)
+            except StreamClosed:
+                pass
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                events.put(finished)
+
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(_run,), daemon=True).start()
+
+        try:
+            while (event := events.get()) is not finished:
+                yield event
+        finally:
+            closed.set()
+
+        if "error" in outcome:
+            raise outcome["error"]
+
+        state, exec_info = outcome["result"]
+        yield {"type": "end", "state": state, "exec_info": exec_info}
+
+    async def astream(self, initial_state: dict) -> AsyncIterator[dict]:
+        """
+        Asynchronously executes the graph on the running event loop and yields
+        an event as soon as each node completes. See `stream` for the events.
+        Closing the generator early cancels the execution.
+
+        Args:
+            initial_state (dict): The initial state to pass to the entry point node.
+
+        Yields:
+            dict: The execution events, in completion order.
+        """
+
+        self.initial_state = initial_state
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+
+        def _emit(event: dict):
+            # nodes running in worker threads emit events too
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        async def _run():
+            with self._trace():
+                return await self._aexecute(initial_state, on_event=_emit)
+
+        task = asyncio.ensure_future(_run())
+        getter = None
+
+        try:
+            while True:
+                getter = asyncio.ensure_future(events.get())
+                await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+                if not getter.done():
+                    break
+                yield getter.result()
+
+            while not events.empty():
+                yield events.get_nowait()
+        finally:
+            if getter is not None:
+                getter.cancel()
+            task.cancel()
+
+        state, exec_info = task.result()
+        yield {"type": "end", "state": state, "exec_info": exec_info}
+
+    def resume(self, run_id: Optional[str] = None) -> Tuple[dict, list]:
+        """
+        Resumes a checkpointed run from the node that failed, reusing the
+        state and execution info saved after the last successful node.
+        Parallel runs skip every node they completed before failing.
+
+        Args:
+            run_id (str, optional): The identifier of the run, defaults to the last
+                                    run of this graph.
+
+        Returns:
+            Tuple[dict, list]: A tuple containing the final state and a list of execution info.
+
+        Raises:
+            ValueError: If checkpointing is disabled, the run is unknown or already completed.
+        """
+
+        state, next_node, run = self._load_checkpoint(run_id or self.run_id)
+        self.initial_state = state
+        with self._trace():
+            if run["completed_nodes"] is not None:
+                state, exec_info = self._execute_parallel(state, run=run)
+            else:
+                state, exec_info = self._execute_standard(
+                    state, start_node=next_node, run=run
+                )
+
+        self._print_result(state)
+
+        return state, exec_info
+
+    async def aresume(self, run_id: Optional[str] = None) -> Tuple[dict, list]:
+        """
+        Asynchronously resumes a checkpointed run from the node that failed.
+
+        Args:
+            run_id (str, optional): The identifier of the run, defaults to the last
+                                    run of this graph.
+
+        Returns:
+            Tuple[dict, list]: A tuple containing the final state and a list of execution info.
+
+        Raises:
+            ValueError: If checkpointing is disabled, the run is unknown or already completed.
+        """
+
+        state, next_node, run = self._load_checkpoint(run_id or self.run_id)
+        self.initial_state = state
+        with self._trace():
+            if run["completed_nodes"] is not None:
+                state, exec_info = await self._aexecute_parallel(state, run=run)
+            else:
+                state, exec_info = await self._aexecute_standard(
+                    state, start_node=next_node, run=run
+                )
+
+        self._print_result(state)
+
         return state, exec_info
 
     def append_node(self, node):
@@ -386,13 +1267,17 @@ class BaseGraph:
         """
 
         # if node name already exists in the graph, raise an exception
-        if node.node_name in {n.node_name for n in self.nodes}:
+        if node.node_name in self._node_index:
             raise ValueError(
                 f"""Node with name '{node.node_name}' already exists in the graph.
                              You can change it by setting the 'node_name' attribute."""
             )
 
+        node.compile_input_expression()
+
         last_node = self.nodes[-1]
         self.raw_edges.append((last_node, node))
         self.nodes.append(node)
         self.edges = self._create_edges(set(self.raw_edges))
+        self._node_index[node.node_name] = node
+        self._parallel_plan = None
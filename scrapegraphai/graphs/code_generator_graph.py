@@ -178,6 +178,26 @@ class CodeGeneratorGraph(AbstractGraph):
         inputs = {"user_prompt": self.prompt, self.input_key: self.source}
         self.final_state, self.execution_info = self.graph.execute(inputs)
 
+        return self._result()
+
+    async def arun(self) -> str:
+        """
+        Asynchronously executes the scraping process and returns the generated code.
+
+        Returns:
+            str: The generated code.
+        """
+
+        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
+        self.final_state, self.execution_info = await self.graph.aexecute(inputs)
+
+        return self._result()
+
+    def _result(self) -> str:
+        """
+        Saves the generated code to the configured file and returns it.
+        """
+
         generated_code = self.final_state.get("generated_code", "No code created.")
 
         if self.config.get("filename") is None:
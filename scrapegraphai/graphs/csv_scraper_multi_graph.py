@@ -101,3 +101,26 @@ class CSVScraperMultiGraph(AbstractGraph):
         self.final_state, self.execution_info = self.graph.execute(inputs)
 
         return self.final_state.get("answer", "No answer found.")
+
+    async def arun(self) -> str:
+        """
+        Asynchronously executes the web scraping and searching process.
+
+        Returns:
+            str: The answer to the prompt.
+        """
+
+        inputs = {"user_prompt": self.prompt, "jsons": self.source}
+        self.final_state, self.execution_info = await self.graph.aexecute(inputs)
+
+        return self.final_state.get("answer", "No answer found.")
+
+    def _get_inputs(self) -> dict:
+        """
+        Returns the initial state of the graph, with the list of sources.
+
+        Returns:
+            dict: The inputs of the graph.
+        """
+
+        return {"user_prompt": self.prompt, "jsons": self.source}
@@ -13,6 +13,7 @@ from ..nodes import (
     ParseNodeDepthK,
     RAGNode,
 )
+from ..utils.crawl_store import CrawlStore
 from .abstract_graph import AbstractGraph
 from .base_graph import BaseGraph
 
@@ -71,10 +72,12 @@ class DepthSearchGraph(AbstractGraph):
         Returns:
             BaseGraph: A graph instance representing the web scraping workflow.
         """
+        crawl_store_path = self.config.get("crawl_store_path")
+        crawl_store = CrawlStore(crawl_store_path) if crawl_store_path else None
 
         fetch_node_k = FetchNodeLevelK(
             input="url| local_dir",
-            output=["docs"],
+            output=["docs", "crawl_complete"],
             node_config={
                 "loader_kwargs": self.config.get("loader_kwargs", {}),
                 "force": self.config.get("force", False),
@@ -83,6 +86,9 @@ class DepthSearchGraph(AbstractGraph):
                 "storage_state": self.config.get("storage_state"),
                 "depth": self.config.get("depth", 1),
                 "only_inside_links": self.config.get("only_inside_links", False),
+                "max_concurrency": self.config.get("max_concurrency", 5),
+                "max_pages": self.config.get("max_pages"),
+                "max_time": self.config.get("max_time"),
             },
         )
 
@@ -99,6 +105,7 @@ class DepthSearchGraph(AbstractGraph):
                 "llm_model": self.llm_model,
                 "verbose": self.config.get("verbose", False),
                 "cache_path": self.config.get("cache_path", False),
+                "crawl_store": crawl_store,
             },
         )
 
@@ -109,6 +116,7 @@ class DepthSearchGraph(AbstractGraph):
                 "llm_model": self.llm_model,
                 "embedder_model": self.config.get("embedder_model", False),
                 "verbose": self.config.get("verbose", False),
+                "crawl_store": crawl_store,
             },
         )
 
@@ -151,6 +159,24 @@ class DepthSearchGraph(AbstractGraph):
         inputs = {"user_prompt": self.prompt, self.input_key: self.source}
         self.final_state, self.execution_info = self.graph.execute(inputs)
 
-        docs = self.final_state.get("answer", "No answer")
+        return self._result()
+
+    async def arun(self) -> str:
+        """
+        Asynchronously executes the scraping process and returns the generated code.
+
+        Returns:
+            str: The generated code.
+        """
+
+        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
+        self.final_state, self.execution_info = await self.graph.aexecute(inputs)
+
+        return self._result()
+
+    def _result(self) -> str:
+        """
+        Returns the answer of the graph.
+        """
 
-        return docs
+        return self.final_state.get("answer", "No answer")
@@ -107,3 +107,16 @@ class OmniSearchGraph(AbstractGraph):
         self.final_state, self.execution_info = self.graph.execute(inputs)
 
         return self.final_state.get("answer", "No answer found.")
+
+    async def arun(self) -> str:
+        """
+        Asynchronously executes the web scraping and searching process.
+
+        Returns:
+            str: The answer to the prompt.
+        """
+
+        inputs = {"user_prompt": self.prompt}
+        self.final_state, self.execution_info = await self.graph.aexecute(inputs)
+
+        return self.final_state.get("answer", "No answer found.")
@@ -49,7 +49,12 @@ class ScreenshotScraperGraph(AbstractGraph):
             BaseGraph: A graph instance representing the web scraping workflow for images.
         """
         fetch_screen_node = FetchScreenNode(
-            input="url", output=["screenshots"], node_config={"link": self.source}
+            input="url",
+            output=["screenshots"],
+            node_config={
+                "link": self.source,
+                "loader_kwargs": self.config.get("loader_kwargs", {}),
+            },
         )
 
         generate_answer_from_image_node = GenerateAnswerFromImageNode(
@@ -76,7 +81,20 @@ class ScreenshotScraperGraph(AbstractGraph):
             str: The answer to the prompt.
         """
 
-        inputs = {"user_prompt": self.prompt}
+        inputs = {"user_prompt": self.prompt, "url": self.source}
         self.final_state, self.execution_info = self.graph.execute(inputs)
 
         return self.final_state.get("answer", "No answer found.")
+
+    async def arun(self) -> str:
+        """
+        Asynchronously executes the scraping process and returns the answer to the prompt.
+
+        Returns:
+            str: The answer to the prompt.
+        """
+
+        inputs = {"user_prompt": self.prompt, "url": self.source}
+        self.final_state, self.execution_info = await self.graph.aexecute(inputs)
+
+        return self.final_state.get("answer", "No answer found.")
@@ -86,7 +86,7 @@ class ScriptCreatorGraph(AbstractGraph):
         )
 
         generate_scraper_node = GenerateScraperNode(
-            input="user_prompt & (parsed_doc)",
+            input="user_prompt & (parsed_doc) & (url | local_dir)",
             output=["answer"],
             node_config={
                 "llm_model": self.llm_model,
@@ -122,4 +122,24 @@ class ScriptCreatorGraph(AbstractGraph):
         inputs = {"user_prompt": self.prompt, self.input_key: self.source}
         self.final_state, self.execution_info = self.graph.execute(inputs)
 
+        return self._result()
+
+    async def arun(self) -> str:
+        """
+        Asynchronously executes the web scraping process and returns the answer to the prompt.
+
+        Returns:
+            str: The answer to the prompt.
+        """
+
+        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
+        self.final_state, self.execution_info = await self.graph.aexecute(inputs)
+
+        return self._result()
+
+    def _result(self) -> str:
+        """
+        Returns the script generated by the graph.
+        """
+
         return self.final_state.get("answer", "No answer found ")
@@ -96,4 +96,32 @@ class ScriptCreatorMultiGraph(AbstractGraph):
 
         inputs = {"user_prompt": self.prompt, "urls": self.source}
         self.final_state, self.execution_info = self.graph.execute(inputs)
+        return self._result()
+
+    async def arun(self) -> str:
+        """
+        Asynchronously executes the web scraping and searching process.
+        Returns:
+            str: The answer to the prompt.
+        """
+
+        inputs = {"user_prompt": self.prompt, "urls": self.source}
+        self.final_state, self.execution_info = await self.graph.aexecute(inputs)
+        return self._result()
+
+    def _result(self) -> str:
+        """
+        Returns the merged script of the graph.
+        """
+
         return self.final_state.get("merged_script", "Failed to generate the script.")
+
+    def _get_inputs(self) -> dict:
+        """
+        Returns the initial state of the graph, with the list of sources.
+
+        Returns:
+            dict: The inputs of the graph.
+        """
+
+        return {"user_prompt": self.prompt, "urls": self.source}
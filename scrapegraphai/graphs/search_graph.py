@@ -111,6 +111,26 @@ class SearchGraph(AbstractGraph):
         inputs = {"user_prompt": self.prompt}
         self.final_state, self.execution_info = self.graph.execute(inputs)
 
+        return self._result()
+
+    async def arun(self) -> str:
+        """
+        Asynchronously executes the web scraping and searching process.
+
+        Returns:
+            str: The answer to the prompt.
+        """
+
+        inputs = {"user_prompt": self.prompt}
+        self.final_state, self.execution_info = await self.graph.aexecute(inputs)
+
+        return self._result()
+
+    def _result(self) -> str:
+        """
+        Stores the URLs considered by the search and returns the answer.
+        """
+
         # Store the URLs after execution
         if "urls" in self.final_state:
             self.considered_urls = self.final_state["urls"]
@@ -100,4 +100,24 @@ class SmartScraperLiteGraph(AbstractGraph):
         inputs = {"user_prompt": self.prompt, self.input_key: self.source}
         self.final_state, self.execution_info = self.graph.execute(inputs)
 
+        return self._result()
+
+    async def arun(self) -> str:
+        """
+        Asynchronously executes the scraping process and returns the scraping content.
+
+        Returns:
+            str: The scraping content.
+        """
+
+        inputs = {"user_prompt": self.prompt, self.input_key: self.source}
+        self.final_state, self.execution_info = await self.graph.aexecute(inputs)
+
+        return self._result()
+
+    def _result(self) -> str:
+        """
+        Returns the parsed document of the graph.
+        """
+
         return self.final_state.get("parsed_doc", "No document found.")
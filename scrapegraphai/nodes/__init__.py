@@ -1,38 +1,95 @@
 """
 __init__.py file for node folder module
+
+The nodes are imported lazily on first attribute access, so that importing
+the package does not pull in the dependencies of every node.
 """
 
-from .base_node import BaseNode
-from .concat_answers_node import ConcatAnswersNode
-from .conditional_node import ConditionalNode
-from .description_node import DescriptionNode
-from .fetch_node import FetchNode
-from .fetch_node_level_k import FetchNodeLevelK
-from .fetch_screen_node import FetchScreenNode
-from .generate_answer_csv_node import GenerateAnswerCSVNode
-from .generate_answer_from_image_node import GenerateAnswerFromImageNode
-from .generate_answer_node import GenerateAnswerNode
-from .generate_answer_node_k_level import GenerateAnswerNodeKLevel
-from .generate_answer_omni_node import GenerateAnswerOmniNode
-from .generate_code_node import GenerateCodeNode
-from .generate_scraper_node import GenerateScraperNode
-from .get_probable_tags_node import GetProbableTagsNode
-from .graph_iterator_node import GraphIteratorNode
-from .html_analyzer_node import HtmlAnalyzerNode
-from .image_to_text_node import ImageToTextNode
-from .markdownify_node import MarkdownifyNode
-from .merge_answers_node import MergeAnswersNode
-from .merge_generated_scripts_node import MergeGeneratedScriptsNode
-from .parse_node import ParseNode
-from .parse_node_depth_k_node import ParseNodeDepthK
-from .prompt_refiner_node import PromptRefinerNode
-from .rag_node import RAGNode
-from .reasoning_node import ReasoningNode
-from .robots_node import RobotsNode
-from .search_internet_node import SearchInternetNode
-from .search_link_node import SearchLinkNode
-from .search_node_with_context import SearchLinksWithContext
-from .text_to_speech_node import TextToSpeechNode
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base_node import BaseNode
+    from .concat_answers_node import ConcatAnswersNode
+    from .conditional_node import ConditionalNode
+    from .description_node import DescriptionNode
+    from .fetch_node import FetchNode
+    from .fetch_node_level_k import FetchNodeLevelK
+    from .fetch_screen_node import FetchScreenNode
+    from .generate_answer_csv_node import GenerateAnswerCSVNode
+    from .generate_answer_from_image_node import GenerateAnswerFromImageNode
+    from .generate_answer_node import GenerateAnswerNode
+    from .generate_answer_node_k_level import GenerateAnswerNodeKLevel
+    from .generate_answer_omni_node import GenerateAnswerOmniNode
+    from .generate_code_node import GenerateCodeNode
+    from .generate_scraper_node import GenerateScraperNode
+    from .get_probable_tags_node import GetProbableTagsNode
+    from .graph_iterator_node import GraphIteratorNode
+    from .html_analyzer_node import HtmlAnalyzerNode
+    from .image_to_text_node import ImageToTextNode
+    from .markdownify_node import MarkdownifyNode
+    from .merge_answers_node import MergeAnswersNode
+    from .merge_generated_scripts_node import MergeGeneratedScriptsNode
+    from .parse_node import ParseNode
+    from .parse_node_depth_k_node import ParseNodeDepthK
+    from .prompt_refiner_node import PromptRefinerNode
+    from .rag_node import RAGNode
+    from .reasoning_node import ReasoningNode
+    from .robots_node import RobotsNode
+    from .search_internet_node import SearchInternetNode
+    from .search_link_node import SearchLinkNode
+    from .search_node_with_context import SearchLinksWithContext
+    from .text_to_speech_node import TextToSpeechNode
+
+# Maps each public name to the submodule defining it
+_LAZY_IMPORTS = {
+    "BaseNode": ".base_node",
+    "ConcatAnswersNode": ".concat_answers_node",
+    "ConditionalNode": ".conditional_node",
+    "DescriptionNode": ".description_node",
+    "FetchNode": ".fetch_node",
+    "FetchNodeLevelK": ".fetch_node_level_k",
+    "FetchScreenNode": ".fetch_screen_node",
+    "GenerateAnswerCSVNode": ".generate_answer_csv_node",
+    "GenerateAnswerFromImageNode": ".generate_answer_from_image_node",
+    "GenerateAnswerNode": ".generate_answer_node",
+    "GenerateAnswerNodeKLevel": ".generate_answer_node_k_level",
+    "GenerateAnswerOmniNode": ".generate_answer_omni_node",
+    "GenerateCodeNode": ".generate_code_node",
+    "GenerateScraperNode": ".generate_scraper_node",
+    "GetProbableTagsNode": ".get_probable_tags_node",
+    "GraphIteratorNode": ".graph_iterator_node",
+    "HtmlAnalyzerNode": ".html_analyzer_node",
+    "ImageToTextNode": ".image_to_text_node",
+    "MarkdownifyNode": ".markdownify_node",
+    "MergeAnswersNode": ".merge_answers_node",
+    "MergeGeneratedScriptsNode": ".merge_generated_scripts_node",
+    "ParseNode": ".parse_node",
+    "ParseNodeDepthK": ".parse_node_depth_k_node",
+    "PromptRefinerNode": ".prompt_refiner_node",
+    "RAGNode": ".rag_node",
+    "ReasoningNode": ".reasoning_node",
+    "RobotsNode": ".robots_node",
+    "SearchInternetNode": ".search_internet_node",
+    "SearchLinkNode": ".search_link_node",
+    "SearchLinksWithContext": ".search_node_with_context",
+    "TextToSpeechNode": ".text_to_speech_node",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Base nodes
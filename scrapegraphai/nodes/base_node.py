@@ -2,11 +2,35 @@
 This module defines the base node class for the ScrapeGraphAI application.
 """
 
+import asyncio
 import re
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, List, Optional
 
 from ..utils import get_logger
+from ..utils.profiler import run_profiled
+
+# Receives the events emitted by the nodes of the graph being streamed
+_event_callback: ContextVar[Optional[Callable[[dict], None]]] = ContextVar(
+    "event_callback", default=None
+)
+
+
+@contextmanager
+def node_event_scope(callback: Optional[Callable[[dict], None]]):
+    """
+    Routes the events emitted by the nodes executed within the block to
+    `callback`, or drops them if it is None. The callback follows the context
+    of the execution, so that concurrent streams of a graph sharing its node
+    instances never receive each other's events.
+    """
+    token = _event_callback.set(callback)
+    try:
+        yield
+    finally:
+        _event_callback.reset(token)
 
 
 class BaseNode(ABC):
@@ -21,6 +45,8 @@ class BaseNode(ABC):
         min_input_len (int): Minimum required number of input keys.
         node_config (Optional[dict]): Additional configuration for the node.
         logger (logging.Logger): The centralized root logger
+        cacheable (bool): Whether the node is deterministic, so that its results
+                          can be reused by the graph's node cache.
 
     Args:
         node_name (str): Name for identifying the node.
@@ -45,6 +71,8 @@ class BaseNode(ABC):
         {'key': 'value'}
     """
 
+    cacheable = False
+
     def __init__(
         self,
         node_name: str,
@@ -81,6 +109,34 @@ class BaseNode(ABC):
 
         pass
 
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Asynchronously execute the node's logic. Nodes performing network or
+        LLM I/O override this with a native implementation; the default runs
+        `execute` in a worker thread so it does not block the event loop.
+
+        Args:
+            state (dict): The current state of the graph.
+
+        Returns:
+            dict: The updated state after executing the node's logic.
+        """
+
+        # The profile of the node, if any, is taken in the worker thread
+        return await asyncio.to_thread(run_profiled, self.execute, state)
+
+    def emit_event(self, event: dict):
+        """
+        Emits an intermediate event, such as the result of a sub-graph, to the
+        consumer of a streamed graph execution. Does nothing otherwise.
+
+        Args:
+            event (dict): The event to emit; the node name is added to it.
+        """
+        callback = _event_callback.get()
+        if callback is not None:
+            callback({**event, "node_name": self.node_name})
+
     def update_config(self, params: dict, overwrite: bool = False):
         """
         Updates the node_config dictionary as well as attributes with same key.
@@ -99,6 +155,10 @@ class BaseNode(ABC):
         """
         Determines the necessary state keys based on the input specification.
 
+        The input expression is compiled once (see `compile_input_expression`)
+        and the matched keys are memoised by which of the referenced keys are
+        present in the state, so repeated executions skip re-parsing.
+
         Args:
             state (dict): The current state of the graph used to parse input keys.
 
@@ -110,12 +170,75 @@ class BaseNode(ABC):
         """
 
         try:
-            input_keys = self._parse_input_keys(state, self.input)
+            input_keys = self._evaluate_input_keys(state)
             self._validate_input_keys(input_keys)
             return input_keys
         except ValueError as e:
             raise ValueError(f"Error parsing input keys for {self.node_name}") from e
 
+    def compile_input_expression(self):
+        """
+        Validates the input expression once and prepares the evaluator used by
+        `get_input_keys`. Called by BaseGraph at construction time and lazily
+        whenever the `input` attribute changes.
+
+        Raises:
+            ValueError: If the expression is empty or syntactically invalid.
+        """
+
+        expression = self.input
+
+        if not expression:
+            raise ValueError("Empty expression.")
+
+        if re.search(r"[^\s&|()]\s+[^\s&|()]", expression):
+            raise ValueError(
+                "Adjacent state keys found without an operator between them."
+            )
+
+        normalized = expression.replace(" ", "")
+        self._validate_expression(normalized)
+
+        keys = tuple(dict.fromkeys(re.findall(r"[^&|()]+", normalized)))
+        self._compiled_input = (expression, normalized, keys, {})
+
+    def _evaluate_input_keys(self, state: dict) -> List[str]:
+        """
+        Evaluates the compiled input expression against the keys present in the state.
+
+        Args:
+            state (dict): The current state of the graph.
+
+        Returns:
+            List[str]: A list of key names that match the input keys expression logic.
+
+        Raises:
+            ValueError: If the expression is invalid or if no state keys match the expression.
+        """
+
+        compiled = getattr(self, "_compiled_input", None)
+        if compiled is None or compiled[0] != self.input:
+            self.compile_input_expression()
+            compiled = self._compiled_input
+
+        _, normalized, keys, cache = compiled
+        presence = tuple(key in state for key in keys)
+
+        result = cache.get(presence)
+        if result is None:
+            present = {key for key, found in zip(keys, presence) if found}
+            result = tuple(self._evaluate_expression(normalized, present))
+            cache[presence] = result
+
+        if not result:
+            raise ValueError(
+                f"""No state keys matched the expression.
+                             Expression was {normalized}.
+                             State contains keys: {", ".join(state.keys())}"""
+            )
+
+        return list(result)
+
     def _validate_input_keys(self, input_keys):
         """
         Validates if the provided input keys meet the minimum length requirement.
@@ -166,6 +289,30 @@ class BaseNode(ABC):
             )
 
         expression = expression.replace(" ", "")
+        self._validate_expression(expression)
+
+        result = self._evaluate_expression(expression, state)
+
+        if not result:
+            raise ValueError(
+                f"""No state keys matched the expression.
+                             Expression was {expression}.
+                             State contains keys: {", ".join(state.keys())}"""
+            )
+
+        return result
+
+    @staticmethod
+    def _validate_expression(expression: str):
+        """
+        Checks operator usage and parentheses of an expression without spaces.
+
+        Args:
+            expression (str): The input keys expression with spaces removed.
+
+        Raises:
+            ValueError: If operators are misplaced or parentheses are unbalanced.
+        """
 
         if (
             expression[0] in "&|"
@@ -192,14 +339,27 @@ class BaseNode(ABC):
         if open_parentheses != close_parentheses:
             raise ValueError("Missing or unbalanced parentheses in expression.")
 
+    @staticmethod
+    def _evaluate_expression(expression: str, keys) -> List[str]:
+        """
+        Evaluates an expression without spaces against a collection of present keys.
+
+        Args:
+            expression (str): The input keys expression with spaces removed.
+            keys: The keys available in the state (any container supporting `in`).
+
+        Returns:
+            List[str]: The matched keys without duplicates, or an empty list.
+        """
+
         def evaluate_simple_expression(exp: str) -> List[str]:
             """Evaluate an expression without parentheses."""
 
             for or_segment in exp.split("|"):
                 and_segment = or_segment.split("&")
-                if all(elem.strip() in state for elem in and_segment):
+                if all(elem.strip() in keys for elem in and_segment):
                     return [
-                        elem.strip() for elem in and_segment if elem.strip() in state
+                        elem.strip() for elem in and_segment if elem.strip() in keys
                     ]
             return []
 
@@ -218,17 +378,8 @@ class BaseNode(ABC):
                 )
             return evaluate_simple_expression(expression)
 
-        result = evaluate_expression(expression)
-
-        if not result:
-            raise ValueError(
-                f"""No state keys matched the expression.
-                             Expression was {expression}.
-                             State contains keys: {", ".join(state.keys())}"""
-            )
-
         final_result = []
-        for key in result:
+        for key in evaluate_expression(expression):
             if key not in final_result:
                 final_result.append(key)
 
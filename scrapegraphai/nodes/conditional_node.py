@@ -4,7 +4,7 @@ Module for implementing the conditional node
 
 from typing import List, Optional
 
-from simpleeval import EvalWithCompoundTypes, simple_eval
+from simpleeval import EvalWithCompoundTypes, SimpleEval
 
 from .base_node import BaseNode
 
@@ -57,6 +57,15 @@ class ConditionalNode(BaseNode):
         self.condition = self.node_config.get("condition", None)
         self.eval_instance = EvalWithCompoundTypes()
         self.eval_instance.functions = {"len": len}
+        self.parsed_condition = None
+
+        if self.condition:
+            try:
+                self.parsed_condition = SimpleEval.parse(self.condition)
+            except SyntaxError as e:
+                raise ValueError(
+                    f"Invalid condition '{self.condition}' in {self.node_name}: {e}"
+                ) from e
 
     def execute(self, state: dict) -> dict:
         """
@@ -85,7 +94,8 @@ class ConditionalNode(BaseNode):
 
     def _evaluate_condition(self, state: dict, condition: str) -> bool:
         """
-        Parses and evaluates the condition expression against the state.
+        Evaluates the condition expression against the state, reusing the
+        expression parsed at construction time.
 
         Args:
             state (dict): The current state of the graph.
@@ -98,13 +108,17 @@ class ConditionalNode(BaseNode):
         eval_globals = self.eval_instance.functions.copy()
         eval_globals.update(state)
 
+        parsed_condition = (
+            self.parsed_condition if condition == self.condition else None
+        )
+
         try:
-            result = simple_eval(
-                condition,
-                names=eval_globals,
-                functions=self.eval_instance.functions,
+            evaluator = SimpleEval(
                 operators=self.eval_instance.operators,
+                functions=self.eval_instance.functions,
+                names=eval_globals,
             )
+            result = evaluator.eval(condition, previously_parsed=parsed_condition)
             return bool(result)
         except Exception as e:
             raise ValueError(
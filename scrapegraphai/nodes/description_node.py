@@ -9,6 +9,7 @@ from langchain_core.runnables import RunnableParallel
 from tqdm import tqdm
 
 from ..prompts.description_node_prompts import DESCRIPTION_NODE_PROMPT
+from ..utils.crawl_store import content_hash
 from .base_node import BaseNode
 
 
@@ -22,6 +23,8 @@ class DescriptionNode(BaseNode):
     Attributes:
         llm_model: An instance of a language model client, configured for generating answers.
         verbose (bool): A flag indicating whether to show print statements during execution.
+        crawl_store (CrawlStore): The record of the previous crawls of the site; the pages
+            whose content did not change keep their summary instead of being summarized again.
 
     Args:
         input (str): Boolean expression defining the input keys needed from the state.
@@ -43,17 +46,45 @@ class DescriptionNode(BaseNode):
             False if node_config is None else node_config.get("verbose", False)
         )
         self.cache_path = node_config.get("cache_path", False)
+        self.crawl_store = node_config.get("crawl_store", None)
+
+    def _summary_key(self) -> str:
+        """Identifies the model and prompt the summaries are written with."""
+        model = next(
+            (
+                getattr(self.llm_model, attr)
+                for attr in ("model_name", "model", "model_id")
+                if isinstance(getattr(self.llm_model, attr, None), str)
+            ),
+            None,
+        )
+        return content_hash(
+            f"{type(self.llm_model).__qualname__}:{model}:{DESCRIPTION_NODE_PROMPT}"
+        )
 
     def execute(self, state: dict) -> dict:
         self.logger.info(f"--- Executing {self.node_name} Node ---")
 
         docs = list(state.get("docs"))
 
+        summary_key = self._summary_key() if self.crawl_store is not None else None
         chains_dict = {}
 
         for i, chunk in enumerate(
             tqdm(docs, desc="Processing chunks", disable=not self.verbose)
         ):
+            if self.crawl_store is not None:
+                chunk["content_hash"] = content_hash(chunk.get("document"))
+                chunk["changed"] = self.crawl_store.record_fetch(
+                    chunk["source"], chunk["content_hash"], chunk.get("fetched_at")
+                )
+                summary = self.crawl_store.summary(
+                    chunk["source"], chunk["content_hash"], summary_key
+                )
+                if summary is not None:
+                    chunk["summary"] = summary
+                    continue
+
             prompt = PromptTemplate(
                 template=DESCRIPTION_NODE_PROMPT,
                 partial_variables={"content": chunk.get("document")},
@@ -61,11 +92,27 @@ class DescriptionNode(BaseNode):
             chain_name = f"chunk{i + 1}"
             chains_dict[chain_name] = prompt | self.llm_model
 
-        async_runner = RunnableParallel(**chains_dict)
-        batch_results = async_runner.invoke({})
+        if chains_dict:
+            async_runner = RunnableParallel(**chains_dict)
+            batch_results = async_runner.invoke({})
+        else:
+            batch_results = {}
 
         for i in range(1, len(docs) + 1):
-            docs[i - 1]["summary"] = batch_results.get(f"chunk{i}").content
+            if f"chunk{i}" not in batch_results:
+                continue
+            doc = docs[i - 1]
+            doc["summary"] = batch_results.get(f"chunk{i}").content
+            if self.crawl_store is not None:
+                self.crawl_store.save_summary(
+                    doc["source"], doc["content_hash"], summary_key, doc["summary"]
+                )
+
+        if self.crawl_store is not None:
+            self.logger.info(
+                f"Summarized {len(batch_results)} new or changed pages, "
+                f"reused the summaries of {len(docs) - len(batch_results)} pages"
+            )
 
         state.update({self.output[0]: docs})
 
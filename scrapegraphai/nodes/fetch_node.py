@@ -2,18 +2,23 @@
 FetchNode Module
 """
 
+import asyncio
 import json
 from typing import List, Optional
 import concurrent.futures
+from contextlib import nullcontext
 
-import requests
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_core.documents import Document
-from langchain_openai import AzureChatOpenAI, ChatOpenAI
 
 from ..docloaders import ChromiumLoader
+from ..docloaders.document_size import get_document_size_limits, truncate_html
+from ..docloaders.http_cache import get_http_cache
+from ..docloaders.http_fetcher import get_http_fetcher
 from ..utils.cleanup_html import cleanup_html
 from ..utils.convert_to_md import convert_to_md
+from ..utils.model_types import is_model_instance
+from ..utils.proxy_rotation import get_proxy_pool
 from .base_node import BaseNode
 
 
@@ -37,6 +42,8 @@ class FetchNode(BaseNode):
         node_name (str): The unique identifier name for the node, defaulting to "Fetch".
     """
 
+    cacheable = True
+
     def __init__(
         self,
         input: str,
@@ -122,6 +129,20 @@ class FetchNode(BaseNode):
         else:
             raise ValueError(f"Invalid input type: {input_type}")
 
+    async def aexecute(self, state):
+        """
+        Asynchronously fetches the content of the source. Web sources are
+        loaded by awaiting ChromiumLoader directly; local sources are handled
+        in a worker thread.
+        """
+        input_keys = self.get_input_keys(state)
+
+        if input_keys[0] != "url":
+            return await super().aexecute(state)
+
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+        return await self.ahandle_web_source(state, state[input_keys[0]])
+
     def handle_directory(self, state, input_type, source):
         """
         Handles the directory by compressing the source document and updating the state.
@@ -239,10 +260,7 @@ class FetchNode(BaseNode):
         parsed_content = source
 
         if (
-            (
-                isinstance(self.llm_model, ChatOpenAI)
-                or isinstance(self.llm_model, AzureChatOpenAI)
-            )
+            is_model_instance(self.llm_model, "ChatOpenAI", "AzureChatOpenAI")
             and not self.script_creator
             or self.force
             and not self.script_creator
@@ -278,41 +296,55 @@ class FetchNode(BaseNode):
         self.logger.info(f"--- (Fetching HTML from: {source}) ---")
         if self.use_soup:
             # Apply configured timeout to blocking HTTP requests. If timeout is None,
-            # don't pass the timeout argument (requests will block until completion).
-            if self.timeout is None:
-                response = requests.get(source)
-            else:
-                response = requests.get(source, timeout=self.timeout)
+            # the request blocks until completion. Connections are pooled and kept
+            # alive across fetches by the shared HTTP fetcher, which stops downloading
+            # pages past the document size limit.
+            size_limits = get_document_size_limits(
+                self.loader_kwargs.get("max_document_size")
+            )
+            max_bytes = size_limits["max_download_bytes"] if size_limits else None
+            proxy_pool = get_proxy_pool(self.loader_kwargs.get("proxy_pool"))
+            with proxy_pool.rotate() if proxy_pool else nullcontext() as proxy:
+                response = get_http_fetcher().fetch(
+                    source,
+                    timeout=self.timeout,
+                    proxy=proxy,
+                    cache=get_http_cache(self.loader_kwargs.get("http_cache")),
+                    max_bytes=max_bytes,
+                )
             if response.status_code == 200:
                 if not response.text.strip():
                     raise ValueError("No HTML body content found in the response.")
 
+                parsed_content, truncated = response.text, False
+                if size_limits:
+                    parsed_content, truncated = truncate_html(
+                        parsed_content,
+                        size_limits,
+                        partial=response.extensions.get("truncated", False),
+                    )
+
                 if not self.cut:
-                    parsed_content = cleanup_html(response, source)
+                    parsed_content = cleanup_html(parsed_content, source)
 
                 if (
-                    isinstance(self.llm_model, (ChatOpenAI, AzureChatOpenAI))
+                    is_model_instance(self.llm_model, "ChatOpenAI", "AzureChatOpenAI")
                     and not self.script_creator
                     or (self.force and not self.script_creator)
                 ):
                     parsed_content = convert_to_md(source, parsed_content)
 
-                compressed_document = [Document(page_content=parsed_content)]
+                document = compressed_document = [
+                    Document(
+                        page_content=parsed_content,
+                        metadata={"truncated": True} if truncated else {},
+                    )
+                ]
             else:
                 self.logger.warning(
                     f"Failed to retrieve contents from the webpage at url: {source}"
                 )
         else:
-            loader_kwargs = {}
-
-            if self.node_config:
-                loader_kwargs = self.node_config.get("loader_kwargs", {})
-
-            # If a global timeout is configured on the node and no loader-specific timeout
-            # was provided, propagate it to ChromiumLoader so it can apply the same limit.
-            if "timeout" not in loader_kwargs and self.timeout is not None:
-                loader_kwargs["timeout"] = self.timeout
-
             if self.browser_base:
                 try:
                     from ..docloaders.browser_base import browser_base_fetch
@@ -335,12 +367,15 @@ class FetchNode(BaseNode):
             elif self.scrape_do:
                 from ..docloaders.scrape_do import scrape_do_fetch
 
+                proxy_pool = get_proxy_pool(self.loader_kwargs.get("proxy_pool"))
                 if (
                     (self.scrape_do.get("use_proxy") is None)
                     or self.scrape_do.get("geoCode") is None
                     or self.scrape_do.get("super_proxy") is None
                 ):
-                    data = scrape_do_fetch(self.scrape_do.get("api_key"), source)
+                    data = scrape_do_fetch(
+                        self.scrape_do.get("api_key"), source, proxy_pool=proxy_pool
+                    )
                 else:
                     data = scrape_do_fetch(
                         self.scrape_do.get("api_key"),
@@ -348,41 +383,45 @@ class FetchNode(BaseNode):
                         self.scrape_do.get("use_proxy"),
                         self.scrape_do.get("geoCode"),
                         self.scrape_do.get("super_proxy"),
+                        proxy_pool=proxy_pool,
                     )
 
                 document = [Document(page_content=data, metadata={"source": source})]
             else:
-                loader = ChromiumLoader(
-                    [source],
-                    headless=self.headless,
-                    storage_state=self.storage_state,
-                    **loader_kwargs,
-                )
+                loader = self._get_chromium_loader(source)
                 document = loader.load()
 
-            if not document or not document[0].page_content.strip():
-                raise ValueError(
-                    """No HTML body content found in
-                                 the document fetched by ChromiumLoader."""
-                )
+            compressed_document = self._compress_web_document(document)
+        state["doc"] = document
+        state.update(
+            {
+                self.output[0]: compressed_document,
+            }
+        )
+        return state
 
-            parsed_content = document[0].page_content
+    async def ahandle_web_source(self, state, source):
+        """
+        Asynchronously handles the web source, awaiting ChromiumLoader on the
+        running event loop instead of starting a new one for every URL.
+        The `use_soup`, BrowserBase and Scrape.do paths run in a worker thread.
 
-            if (
-                (
-                    isinstance(self.llm_model, ChatOpenAI)
-                    or isinstance(self.llm_model, AzureChatOpenAI)
-                )
-                and not self.script_creator
-                or self.force
-                and not self.script_creator
-                and not self.openai_md_enabled
-            ):
-                parsed_content = convert_to_md(document[0].page_content, parsed_content)
-
-            compressed_document = [
-                Document(page_content=parsed_content, metadata={"source": "html file"})
-            ]
+        Parameters:
+        state (dict): The current state of the graph.
+        source (str): The URL of the web source to fetch HTML content from.
+
+        Returns:
+        dict: The updated state with the processed content.
+        """
+
+        if self.use_soup or self.browser_base or self.scrape_do:
+            return await asyncio.to_thread(self.handle_web_source, state, source)
+
+        self.logger.info(f"--- (Fetching HTML from: {source}) ---")
+        loader = self._get_chromium_loader(source)
+        document = [doc async for doc in loader.alazy_load()]
+
+        compressed_document = self._compress_web_document(document)
         state["doc"] = document
         state.update(
             {
@@ -390,3 +429,69 @@ class FetchNode(BaseNode):
             }
         )
         return state
+
+    def _get_chromium_loader(self, source: str) -> ChromiumLoader:
+        """
+        Builds the ChromiumLoader used to fetch a web source.
+
+        Parameters:
+        source (str): The URL of the web source to fetch.
+
+        Returns:
+        ChromiumLoader: The configured loader.
+        """
+
+        loader_kwargs = {}
+
+        if self.node_config:
+            loader_kwargs = self.node_config.get("loader_kwargs", {})
+
+        # If a global timeout is configured on the node and no loader-specific timeout
+        # was provided, propagate it to ChromiumLoader so it can apply the same limit.
+        if "timeout" not in loader_kwargs and self.timeout is not None:
+            loader_kwargs["timeout"] = self.timeout
+
+        return ChromiumLoader(
+            [source],
+            headless=self.headless,
+            storage_state=self.storage_state,
+            **loader_kwargs,
+        )
+
+    def _compress_web_document(self, document: List[Document]) -> List[Document]:
+        """
+        Validates the fetched web document and optionally converts it to Markdown.
+        The increments yielded by an incremental infinite scroll are joined into
+        a single document, flagged as `truncated` if any of them was.
+
+        Parameters:
+        document (List[Document]): The documents returned by the loader.
+
+        Returns:
+        List[Document]: The processed document.
+
+        Raises:
+        ValueError: If the fetched HTML content is empty or contains only whitespace.
+        """
+
+        if not document or not document[0].page_content.strip():
+            raise ValueError(
+                """No HTML body content found in
+                             the document fetched by ChromiumLoader."""
+            )
+
+        parsed_content = "\n".join(doc.page_content for doc in document)
+
+        if (
+            is_model_instance(self.llm_model, "ChatOpenAI", "AzureChatOpenAI")
+            and not self.script_creator
+            or self.force
+            and not self.script_creator
+            and not self.openai_md_enabled
+        ):
+            parsed_content = convert_to_md(parsed_content, parsed_content)
+
+        metadata = {"source": "html file"}
+        if any(doc.metadata.get("truncated") for doc in document):
+            metadata["truncated"] = True
+        return [Document(page_content=parsed_content, metadata=metadata)]
@@ -2,15 +2,52 @@
 fetch_node_level_k module
 """
 
-from typing import List, Optional
-from urllib.parse import urljoin
+import asyncio
+import itertools
+import time
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
 
 from bs4 import BeautifulSoup
 from langchain_core.documents import Document
 
 from ..docloaders import ChromiumLoader
+from ..utils.proxy_rotation import get_proxy_pool
 from .base_node import BaseNode
 
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalizes a URL so that the spellings of the same page compare equal: the
+    scheme and host are lowercased, the default port and the fragment dropped
+    and an empty path replaced by "/".
+
+    Args:
+        url (str): The URL to normalize.
+
+    Returns:
+        str: The normalized URL.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.hostname or ""
+    if ":" in netloc:
+        netloc = f"[{netloc}]"
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port is not None and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{netloc}:{port}"
+    if parts.username is not None:
+        userinfo = parts.username
+        if parts.password is not None:
+            userinfo = f"{userinfo}:{parts.password}"
+        netloc = f"{userinfo}@{netloc}"
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
 
 class FetchNodeLevelK(BaseNode):
     """
@@ -19,6 +56,12 @@ class FetchNodeLevelK(BaseNode):
     the graph's state. It uses ChromiumLoader to fetch the content from a web page asynchronously
     (with proxy protection).
 
+    The pages are crawled from a frontier queue by `max_concurrency` concurrent workers, each
+    page being fetched once whatever the spellings of its URL, until the frontier is empty or
+    the `max_pages` or `max_time` budget is exhausted. An optional second output key receives
+    whether the crawl completed, that is reached every page without a budget stopping it or a
+    page failing to be fetched.
+
     Attributes:
         embedder_model: An optional model for embedding the fetched content.
         verbose (bool): A flag indicating whether to show print statements during execution.
@@ -28,6 +71,9 @@ class FetchNodeLevelK(BaseNode):
         browser_base (dict): Optional configuration for the browser base API.
         depth (int): Maximum depth of hyperlink graph traversal.
         only_inside_links (bool): Whether to fetch only internal links.
+        max_concurrency (int): Maximum number of pages fetched at the same time.
+        max_pages (Optional[int]): Maximum number of pages fetched by the crawl.
+        max_time (Optional[float]): Maximum duration of the crawl in seconds.
         min_input_len (int): Minimum required length of input data.
 
     Args:
@@ -67,6 +113,11 @@ class FetchNodeLevelK(BaseNode):
         self.only_inside_links = (
             node_config.get("only_inside_links", False) if node_config else False
         )
+        self.max_concurrency = node_config.get("max_concurrency", 5)
+        self.max_pages = node_config.get("max_pages", None)
+        self.max_time = node_config.get("max_time", None)
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
         self.min_input_len = 1
 
     def execute(self, state: dict) -> dict:
@@ -89,18 +140,154 @@ class FetchNodeLevelK(BaseNode):
         input_data = [state[key] for key in input_keys]
         source = input_data[0]
 
-        documents = [{"source": source}]
-        loader_kwargs = (
-            self.node_config.get("loader_kwargs", {}) if self.node_config else {}
-        )
+        documents, complete = asyncio.run(self.acrawl(source, self.loader_kwargs))
+        state.update({self.output[0]: documents})
+        if len(self.output) > 1:
+            state.update({self.output[1]: complete})
+        return state
+
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Asynchronously crawls the source URL and its sub-links on the running event loop.
 
-        for _ in range(self.depth):
-            documents = self.obtain_content(documents, loader_kwargs)
+        Args:
+            state (dict): The current state of the graph.
+
+        Returns:
+            dict: The updated state with a new output key containing the fetched HTML content.
+        """
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
 
-        filtered_documents = [doc for doc in documents if "document" in doc]
-        state.update({self.output[0]: filtered_documents})
+        input_keys = self.get_input_keys(state)
+        documents, complete = await self.acrawl(
+            state[input_keys[0]], self.loader_kwargs
+        )
+        state.update({self.output[0]: documents})
+        if len(self.output) > 1:
+            state.update({self.output[1]: complete})
         return state
 
+    async def acrawl(self, source: str, loader_kwargs: dict) -> Tuple[List[dict], bool]:
+        """
+        Crawls the source URL and the pages it links to, breadth first, down to
+        `depth` levels of hyperlinks.
+
+        Workers take the URLs from a frontier queue and push the links of the
+        pages they fetch back to it. A link is queued only once, whatever the
+        spelling of its URL, and not beyond `depth`. The crawl stops once the
+        frontier is empty, `max_pages` pages were fetched or `max_time` seconds
+        elapsed, keeping the pages fetched so far.
+
+        Args:
+            source (str): The URL to start from.
+            loader_kwargs (dict): Additional arguments for the content loader.
+
+        Returns:
+            Tuple[List[dict], bool]: The fetched pages, with their `source` URL, their
+            `document`, their `depth` and their `fetched_at` time, in the order they were
+            discovered, and whether the crawl completed, without a budget stopping it or
+            a page failing to be fetched.
+        """
+        loader = None
+        if self.browser_base is None and not self.scrape_do:
+            # A single loader for the whole crawl, its proxy is resolved only once
+            loader = ChromiumLoader(
+                [source],
+                headless=self.headless,
+                storage_state=self.storage_state,
+                **loader_kwargs,
+            )
+
+        discovery = itertools.count()
+        frontier = asyncio.Queue()
+        frontier.put_nowait((next(discovery), source, 0))
+        visited = {normalize_url(source)}
+        pages = []
+        reserved = 0
+        complete = True
+
+        async def crawl():
+            nonlocal reserved, complete
+            while True:
+                index, url, depth = await frontier.get()
+                try:
+                    if self.max_pages is not None and reserved >= self.max_pages:
+                        complete = False
+                        continue
+                    reserved += 1
+
+                    try:
+                        document = await self.afetch_content(url, loader, loader_kwargs)
+                    except Exception as e:
+                        self.logger.warning(f"Failed to fetch content for {url}: {e}")
+                        document = None
+                    if not document or not document[0].page_content.strip():
+                        self.logger.warning(f"Failed to fetch content for {url}")
+                        reserved -= 1
+                        complete = False
+                        continue
+
+                    pages.append(
+                        (
+                            index,
+                            {
+                                "source": url,
+                                "document": document,
+                                "depth": depth,
+                                "fetched_at": time.time(),
+                            },
+                        )
+                    )
+                    if depth + 1 >= self.depth:
+                        continue
+
+                    links = self.extract_links(document[0].page_content)
+                    for link in self.get_full_links(url, links):
+                        normalized = normalize_url(link)
+                        if normalized not in visited:
+                            visited.add(normalized)
+                            frontier.put_nowait((next(discovery), link, depth + 1))
+                finally:
+                    frontier.task_done()
+
+        workers = [asyncio.ensure_future(crawl()) for _ in range(self.max_concurrency)]
+        try:
+            await asyncio.wait_for(frontier.join(), self.max_time)
+        except asyncio.TimeoutError:
+            complete = False
+            self.logger.warning(
+                f"Crawl of {source} stopped after {self.max_time}s "
+                f"with {len(pages)} pages fetched"
+            )
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        self.logger.info(f"Crawled {len(pages)} pages from {source}")
+        return [page for _, page in sorted(pages, key=lambda item: item[0])], complete
+
+    async def afetch_content(
+        self, source: str, loader: Optional[ChromiumLoader], loader_kwargs: dict
+    ) -> Optional[List[Document]]:
+        """
+        Asynchronously fetches the HTML content of a given source URL.
+
+        Args:
+            source (str): The URL to fetch content from.
+            loader (Optional[ChromiumLoader]): The loader shared by the crawl, None
+                                               when fetching through an external API.
+            loader_kwargs (dict): Additional arguments for the content loader.
+
+        Returns:
+            Optional[List[Document]]: The fetched documents.
+        """
+        if loader is None:
+            return await asyncio.to_thread(self.fetch_content, source, loader_kwargs)
+
+        self.logger.info(f"--- (Fetching HTML from: {source}) ---")
+        return await loader.aload_urls([source])
+
     def fetch_content(self, source: str, loader_kwargs) -> Optional[str]:
         """
         Fetches the HTML content of a given source URL.
@@ -135,7 +322,11 @@ class FetchNodeLevelK(BaseNode):
         elif self.scrape_do:
             from ..docloaders.scrape_do import scrape_do_fetch
 
-            data = scrape_do_fetch(self.scrape_do.get("api_key"), source)
+            data = scrape_do_fetch(
+                self.scrape_do.get("api_key"),
+                source,
+                proxy_pool=get_proxy_pool(loader_kwargs.get("proxy_pool")),
+            )
             document = [Document(page_content=data, metadata={"source": source})]
         else:
             loader = ChromiumLoader(
@@ -231,47 +422,6 @@ class FetchNodeLevelK(BaseNode):
 
         return full_links
 
-    def obtain_content(self, documents: List, loader_kwargs) -> List:
-        """
-        Iterates through documents, fetching and updating content recursively.
-
-        Args:
-            documents (List): A list of documents containing the source URLs.
-            loader_kwargs (dict): Additional arguments for the content loader.
-
-        Returns:
-            List: The updated list of documents with fetched content.
-        """
-        new_documents = []
-        for doc in documents:
-            source = doc["source"]
-            if "document" not in doc:
-                try:
-                    document = self.fetch_content(source, loader_kwargs)
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to fetch content for {source}: {str(e)}"
-                    )
-                    continue
-
-                if not document or not document[0].page_content.strip():
-                    self.logger.warning(f"Failed to fetch content for {source}")
-                    documents.remove(doc)
-                    continue
-
-                doc["document"] = document
-                links = self.extract_links(doc["document"][0].page_content)
-                full_links = self.get_full_links(source, links)
-
-                for link in full_links:
-                    if not any(
-                        d.get("source", "") == link for d in documents
-                    ) and not any(d.get("source", "") == link for d in new_documents):
-                        new_documents.append({"source": link})
-
-        documents.extend(new_documents)
-        return documents
-
     def process_links(
         self,
         base_url: str,
@@ -2,16 +2,23 @@
 fetch_screen_node module
 """
 
+from functools import partial
 from typing import List, Optional
 
 from playwright.sync_api import sync_playwright
 
+from ..docloaders.browser_pool import get_browser_pool
 from .base_node import BaseNode
 
 
 class FetchScreenNode(BaseNode):
     """
     FetchScreenNode captures screenshots from a given URL and stores the image data as bytes.
+
+    The URL is read from the `url` key of the state, or from the `link` of the
+    node config when the state has none.
+
+    The browser is taken from the shared pool when `loader_kwargs` sets `browser_pool`.
     """
 
     def __init__(
@@ -23,6 +30,7 @@ class FetchScreenNode(BaseNode):
     ):
         super().__init__(node_name, "node", input, output, 2, node_config)
         self.url = node_config.get("link")
+        self.loader_kwargs = node_config.get("loader_kwargs", {})
 
     def execute(self, state: dict) -> dict:
         """
@@ -30,10 +38,22 @@ class FetchScreenNode(BaseNode):
         """
         self.logger.info(f"--- Executing {self.node_name} Node ---")
 
+        url = state.get("url") or self.url
+
+        browser_pool = get_browser_pool(self.loader_kwargs.get("browser_pool"))
+        if browser_pool is not None:
+            screenshot_data_list = browser_pool.run_sync(
+                partial(self._acapture_screenshots, url=url),
+                launch_options={"headless": True},
+            )
+            state["link"] = url
+            state["screenshots"] = screenshot_data_list
+            return state
+
         with sync_playwright() as p:
             browser = p.chromium.launch()
             page = browser.new_page()
-            page.goto(self.url)
+            page.goto(url)
 
             viewport_height = page.viewport_size["height"]
 
@@ -52,7 +72,21 @@ class FetchScreenNode(BaseNode):
 
             browser.close()
 
-        state["link"] = self.url
+        state["link"] = url
         state["screenshots"] = screenshot_data_list
 
         return state
+
+    async def _acapture_screenshots(self, page, url: str) -> List[bytes]:
+        """
+        Captures the first two viewports of the URL on a page of the browser pool.
+        """
+        await page.goto(url)
+        viewport_height = page.viewport_size["height"]
+
+        screenshot_data_list = []
+        for scroll_position in (0, viewport_height):
+            await page.evaluate(f"window.scrollTo(0, {scroll_position});")
+            screenshot_data_list.append(await page.screenshot())
+
+        return screenshot_data_list
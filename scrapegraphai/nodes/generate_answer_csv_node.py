@@ -4,14 +4,13 @@ Module for generating the answer node
 
 from typing import List, Optional
 
-from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnableParallel
-from langchain_mistralai import ChatMistralAI
-from langchain_openai import ChatOpenAI
 from tqdm import tqdm
 
 from ..prompts import TEMPLATE_CHUKS_CSV, TEMPLATE_MERGE_CSV, TEMPLATE_NO_CHUKS_CSV
+from ..utils.model_types import is_model_instance
 from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
@@ -95,9 +94,12 @@ class GenerateAnswerCSVNode(BaseNode):
         user_prompt = input_data[0]
         doc = input_data[1]
 
+        # Keep the structured model local so that the node can be executed again
+        llm_model = self.llm_model
+
         if self.node_config.get("schema", None) is not None:
-            if isinstance(self.llm_model, (ChatOpenAI, ChatMistralAI)):
-                self.llm_model = self.llm_model.with_structured_output(
+            if is_model_instance(llm_model, "ChatOpenAI", "ChatMistralAI"):
+                llm_model = llm_model.with_structured_output(
                     schema=self.node_config["schema"]
                 )  # json schema works only on specific models
 
@@ -132,7 +134,7 @@ class GenerateAnswerCSVNode(BaseNode):
                 },
             )
 
-            chain = prompt | self.llm_model | output_parser
+            chain = prompt | llm_model | output_parser
             answer = chain.invoke({"question": user_prompt})
             state.update({self.output[0]: answer})
             return state
@@ -151,7 +153,7 @@ class GenerateAnswerCSVNode(BaseNode):
             )
 
             chain_name = f"chunk{i + 1}"
-            chains_dict[chain_name] = prompt | self.llm_model | output_parser
+            chains_dict[chain_name] = prompt | llm_model | output_parser
 
         async_runner = RunnableParallel(**chains_dict)
 
@@ -163,7 +165,7 @@ class GenerateAnswerCSVNode(BaseNode):
             partial_variables={"format_instructions": format_instructions},
         )
 
-        merge_chain = merge_prompt | self.llm_model | output_parser
+        merge_chain = merge_prompt | llm_model | output_parser
         answer = merge_chain.invoke({"context": batch_results, "question": user_prompt})
 
         state.update({self.output[0]: answer})
@@ -2,16 +2,14 @@
 GenerateAnswerNode Module
 """
 
+import asyncio
 import json
 import time
 from typing import List, Optional
 
-from langchain_core.prompts import PromptTemplate
-from langchain_aws import ChatBedrock
-from langchain_community.chat_models import ChatOllama
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnableParallel
-from langchain_openai import ChatOpenAI
 from requests.exceptions import Timeout
 from tqdm import tqdm
 
@@ -23,7 +21,9 @@ from ..prompts import (
     TEMPLATE_NO_CHUNKS,
     TEMPLATE_NO_CHUNKS_MD,
 )
+from ..utils.model_types import is_model_instance
 from ..utils.output_parser import get_pydantic_output_parser
+from ..utils.tracing import traced_runnable
 from .base_node import BaseNode
 
 
@@ -49,6 +49,8 @@ class GenerateAnswerNode(BaseNode):
         included in the prompt templates.
     """
 
+    cacheable = True
+
     def __init__(
         self,
         input: str,
@@ -59,7 +61,7 @@ class GenerateAnswerNode(BaseNode):
         super().__init__(node_name, "node", input, output, 2, node_config)
         self.llm_model = node_config["llm_model"]
 
-        if isinstance(node_config["llm_model"], ChatOllama):
+        if is_model_instance(node_config["llm_model"], "ChatOllama"):
             if node_config.get("schema", None) is None:
                 self.llm_model.format = "json"
             else:
@@ -115,30 +117,26 @@ class GenerateAnswerNode(BaseNode):
             self.logger.error(f"Error in GenerateAnswerNode: {str(e)}")
             raise
 
-    def execute(self, state: dict) -> dict:
-        """
-        Executes the GenerateAnswerNode.
-
-        Args:
-            state (dict): The current state of the graph. The input keys will be used
-                          to fetch the correct data from the state.
-
-        Returns:
-            dict: The updated state with the output key containing the generated answer.
-        """
-        self.logger.info(f"--- Executing {self.node_name} Node ---")
-
-        input_keys = self.get_input_keys(state)
-        input_data = [state[key] for key in input_keys]
-        user_prompt = input_data[0]
-        doc = input_data[1]
+    async def ainvoke_with_timeout(self, chain, inputs, timeout):
+        """Helper method to asynchronously invoke chain with timeout"""
+        try:
+            return await asyncio.wait_for(chain.ainvoke(inputs), timeout)
+        except asyncio.TimeoutError as e:
+            message = f"Response took longer than {timeout} seconds"
+            self.logger.error(f"Timeout error: {message}")
+            raise Timeout(message) from e
+        except Exception as e:
+            self.logger.error(f"Error during chain execution: {str(e)}")
+            raise
 
+    def _get_output_parser(self):
+        """Returns the output parser and format instructions for the configured LLM."""
         if self.node_config.get("schema", None) is not None:
-            if isinstance(self.llm_model, ChatOpenAI):
+            if is_model_instance(self.llm_model, "ChatOpenAI"):
                 output_parser = get_pydantic_output_parser(self.node_config["schema"])
                 format_instructions = output_parser.get_format_instructions()
             else:
-                if not isinstance(self.llm_model, ChatBedrock):
+                if not is_model_instance(self.llm_model, "ChatBedrock"):
                     output_parser = get_pydantic_output_parser(
                         self.node_config["schema"]
                     )
@@ -147,7 +145,7 @@ class GenerateAnswerNode(BaseNode):
                     output_parser = None
                     format_instructions = ""
         else:
-            if not isinstance(self.llm_model, ChatBedrock):
+            if not is_model_instance(self.llm_model, "ChatBedrock"):
                 output_parser = JsonOutputParser()
                 format_instructions = (
                     "You must respond with a JSON object. Your response should be formatted as a valid JSON "
@@ -158,6 +156,10 @@ class GenerateAnswerNode(BaseNode):
                 output_parser = None
                 format_instructions = ""
 
+        return output_parser, format_instructions
+
+    def _get_templates(self):
+        """Returns the no-chunks, chunks and merge prompt templates."""
         if (
             not self.script_creator
             or self.force
@@ -177,6 +179,23 @@ class GenerateAnswerNode(BaseNode):
             template_chunks_prompt = self.additional_info + template_chunks_prompt
             template_merge_prompt = self.additional_info + template_merge_prompt
 
+        return template_no_chunks_prompt, template_chunks_prompt, template_merge_prompt
+
+    def _build_chains(self, doc):
+        """
+        Builds the chains needed to answer the prompt over the document.
+
+        Returns:
+            tuple: The single-chunk chain (or None), the parallel chunk runner
+            (or None) and the merge chain (or None).
+        """
+        output_parser, format_instructions = self._get_output_parser()
+        (
+            template_no_chunks_prompt,
+            template_chunks_prompt,
+            template_merge_prompt,
+        ) = self._get_templates()
+
         if len(doc) == 1:
             prompt = PromptTemplate(
                 template=template_no_chunks_prompt,
@@ -188,24 +207,7 @@ class GenerateAnswerNode(BaseNode):
             chain = prompt | self.llm_model
             if output_parser:
                 chain = chain | output_parser
-
-            try:
-                answer = self.invoke_with_timeout(
-                    chain, {"content": doc, "question": user_prompt}, self.timeout
-                )
-            except (Timeout, json.JSONDecodeError) as e:
-                error_msg = (
-                    "Response timeout exceeded"
-                    if isinstance(e, Timeout)
-                    else "Invalid JSON response format"
-                )
-                state.update(
-                    {self.output[0]: {"error": error_msg, "raw_response": str(e)}}
-                )
-                return state
-
-            state.update({self.output[0]: answer})
-            return state
+            return traced_runnable(chain, "generate_answer"), None, None
 
         chains_dict = {}
         for i, chunk in enumerate(
@@ -224,8 +226,66 @@ class GenerateAnswerNode(BaseNode):
             chains_dict[chain_name] = prompt | self.llm_model
             if output_parser:
                 chains_dict[chain_name] = chains_dict[chain_name] | output_parser
+            chains_dict[chain_name] = traced_runnable(
+                chains_dict[chain_name],
+                chain_name,
+                chunk_id=i + 1,
+                chunk_size=len(chunk),
+            )
 
         async_runner = RunnableParallel(**chains_dict)
+
+        merge_prompt = PromptTemplate(
+            template=template_merge_prompt,
+            input_variables=["content", "question"],
+            partial_variables={"format_instructions": format_instructions},
+        )
+
+        merge_chain = merge_prompt | self.llm_model
+        if output_parser:
+            merge_chain = merge_chain | output_parser
+
+        return None, async_runner, traced_runnable(merge_chain, "merge_answers")
+
+    def execute(self, state: dict) -> dict:
+        """
+        Executes the GenerateAnswerNode.
+
+        Args:
+            state (dict): The current state of the graph. The input keys will be used
+                          to fetch the correct data from the state.
+
+        Returns:
+            dict: The updated state with the output key containing the generated answer.
+        """
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+
+        input_keys = self.get_input_keys(state)
+        input_data = [state[key] for key in input_keys]
+        user_prompt = input_data[0]
+        doc = input_data[1]
+
+        chain, async_runner, merge_chain = self._build_chains(doc)
+
+        if chain is not None:
+            try:
+                answer = self.invoke_with_timeout(
+                    chain, {"content": doc, "question": user_prompt}, self.timeout
+                )
+            except (Timeout, json.JSONDecodeError) as e:
+                error_msg = (
+                    "Response timeout exceeded"
+                    if isinstance(e, Timeout)
+                    else "Invalid JSON response format"
+                )
+                state.update(
+                    {self.output[0]: {"error": error_msg, "raw_response": str(e)}}
+                )
+                return state
+
+            state.update({self.output[0]: answer})
+            return state
+
         try:
             batch_results = self.invoke_with_timeout(
                 async_runner, {"question": user_prompt}, self.timeout
@@ -239,15 +299,6 @@ class GenerateAnswerNode(BaseNode):
             state.update({self.output[0]: {"error": error_msg, "raw_response": str(e)}})
             return state
 
-        merge_prompt = PromptTemplate(
-            template=template_merge_prompt,
-            input_variables=["content", "question"],
-            partial_variables={"format_instructions": format_instructions},
-        )
-
-        merge_chain = merge_prompt | self.llm_model
-        if output_parser:
-            merge_chain = merge_chain | output_parser
         try:
             answer = self.invoke_with_timeout(
                 merge_chain,
@@ -265,3 +316,74 @@ class GenerateAnswerNode(BaseNode):
 
         state.update({self.output[0]: answer})
         return state
+
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Asynchronously executes the GenerateAnswerNode, awaiting the LLM with
+        `ainvoke` so chunk chains run concurrently on the event loop.
+
+        Args:
+            state (dict): The current state of the graph. The input keys will be used
+                          to fetch the correct data from the state.
+
+        Returns:
+            dict: The updated state with the output key containing the generated answer.
+        """
+        self.logger.info(f"--- Executing {self.node_name} Node ---")
+
+        input_keys = self.get_input_keys(state)
+        input_data = [state[key] for key in input_keys]
+        user_prompt = input_data[0]
+        doc = input_data[1]
+
+        chain, async_runner, merge_chain = self._build_chains(doc)
+
+        if chain is not None:
+            try:
+                answer = await self.ainvoke_with_timeout(
+                    chain, {"content": doc, "question": user_prompt}, self.timeout
+                )
+            except (Timeout, json.JSONDecodeError) as e:
+                error_msg = (
+                    "Response timeout exceeded"
+                    if isinstance(e, Timeout)
+                    else "Invalid JSON response format"
+                )
+                state.update(
+                    {self.output[0]: {"error": error_msg, "raw_response": str(e)}}
+                )
+                return state
+
+            state.update({self.output[0]: answer})
+            return state
+
+        try:
+            batch_results = await self.ainvoke_with_timeout(
+                async_runner, {"question": user_prompt}, self.timeout
+            )
+        except (Timeout, json.JSONDecodeError) as e:
+            error_msg = (
+                "Response timeout exceeded during chunk processing"
+                if isinstance(e, Timeout)
+                else "Invalid JSON response format in chunk processing"
+            )
+            state.update({self.output[0]: {"error": error_msg, "raw_response": str(e)}})
+            return state
+
+        try:
+            answer = await self.ainvoke_with_timeout(
+                merge_chain,
+                {"content": batch_results, "question": user_prompt},
+                self.timeout,
+            )
+        except (Timeout, json.JSONDecodeError) as e:
+            error_msg = (
+                "Response timeout exceeded during merge"
+                if isinstance(e, Timeout)
+                else "Invalid JSON response format during merge"
+            )
+            state.update({self.output[0]: {"error": error_msg, "raw_response": str(e)}})
+            return state
+
+        state.update({self.output[0]: answer})
+        return state
@@ -4,13 +4,9 @@ GenerateAnswerNodeKLevel Module
 
 from typing import List, Optional
 
-from langchain_aws import ChatBedrock
-from langchain_community.chat_models import ChatOllama
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnableParallel
-from langchain_mistralai import ChatMistralAI
-from langchain_openai import ChatOpenAI
 from tqdm import tqdm
 
 from ..prompts import (
@@ -21,6 +17,7 @@ from ..prompts import (
     TEMPLATE_NO_CHUNKS,
     TEMPLATE_NO_CHUNKS_MD,
 )
+from ..utils.model_types import is_model_instance
 from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
@@ -57,7 +54,7 @@ class GenerateAnswerNodeKLevel(BaseNode):
 
         self.llm_model = node_config["llm_model"]
 
-        if isinstance(node_config["llm_model"], ChatOllama):
+        if is_model_instance(node_config["llm_model"], "ChatOllama"):
             if node_config.get("schema", None) is None:
                 self.llm_model.format = "json"
             else:
@@ -76,14 +73,14 @@ class GenerateAnswerNodeKLevel(BaseNode):
         user_prompt = state.get("user_prompt")
 
         if self.node_config.get("schema", None) is not None:
-            if isinstance(self.llm_model, (ChatOpenAI, ChatMistralAI)):
+            if is_model_instance(self.llm_model, "ChatOpenAI", "ChatMistralAI"):
                 self.llm_model = self.llm_model.with_structured_output(
                     schema=self.node_config["schema"]
                 )
                 output_parser = get_structured_output_parser(self.node_config["schema"])
                 format_instructions = "NA"
             else:
-                if not isinstance(self.llm_model, ChatBedrock):
+                if not is_model_instance(self.llm_model, "ChatBedrock"):
                     output_parser = get_pydantic_output_parser(
                         self.node_config["schema"]
                     )
@@ -92,7 +89,7 @@ class GenerateAnswerNodeKLevel(BaseNode):
                     output_parser = None
                     format_instructions = ""
         else:
-            if not isinstance(self.llm_model, ChatBedrock):
+            if not is_model_instance(self.llm_model, "ChatBedrock"):
                 output_parser = JsonOutputParser()
                 format_instructions = output_parser.get_format_instructions()
             else:
@@ -140,9 +137,7 @@ class GenerateAnswerNodeKLevel(BaseNode):
             )
 
         chains_dict = {}
-        elems = [
-            state.get("docs")[elem.id - 1] for elem in answer_db if elem.score > 0.5
-        ]
+        elems = self._matching_docs(answer_db, state.get("docs"))
 
         for i, chunk in enumerate(
             tqdm(elems, desc="Processing chunks", disable=not self.verbose)
@@ -175,3 +170,29 @@ class GenerateAnswerNodeKLevel(BaseNode):
         state["answer"] = answer
 
         return state
+
+    def _matching_docs(self, answer_db: list, docs: List[dict]) -> List[dict]:
+        """
+        Returns the pages of the relevant hits of the vector database. Hits of
+        the on-disk collections of `RAGNode` carry the `source` of their page,
+        which may belong to an earlier crawl; the other hits are numbered
+        after the position of their page.
+
+        Args:
+            answer_db (list): The hits of the query.
+            docs (List[dict]): The pages of the crawl.
+
+        Returns:
+            List[dict]: The pages of the hits scoring above 0.5.
+        """
+        by_source = {doc.get("source"): doc for doc in docs}
+        matching = []
+        for elem in answer_db:
+            if elem.score <= 0.5:
+                continue
+            source = (getattr(elem, "metadata", None) or {}).get("source")
+            if source is None:
+                matching.append(docs[elem.id - 1])
+            elif source in by_source:
+                matching.append(by_source[source])
+        return matching
@@ -4,12 +4,9 @@ GenerateAnswerNode Module
 
 from typing import List, Optional
 
-from langchain_core.prompts import PromptTemplate
-from langchain_community.chat_models import ChatOllama
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.prompts import PromptTemplate
 from langchain_core.runnables import RunnableParallel
-from langchain_mistralai import ChatMistralAI
-from langchain_openai import ChatOpenAI
 from tqdm import tqdm
 
 from ..prompts.generate_answer_node_omni_prompts import (
@@ -17,6 +14,7 @@ from ..prompts.generate_answer_node_omni_prompts import (
     TEMPLATE_MERGE_OMNI,
     TEMPLATE_NO_CHUNKS_OMNI,
 )
+from ..utils.model_types import is_model_instance
 from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
@@ -52,7 +50,7 @@ class GenerateAnswerOmniNode(BaseNode):
         super().__init__(node_name, "node", input, output, 3, node_config)
 
         self.llm_model = node_config["llm_model"]
-        if isinstance(node_config["llm_model"], ChatOllama):
+        if is_model_instance(node_config["llm_model"], "ChatOllama"):
             self.llm_model.format = "json"
 
         self.verbose = (
@@ -88,9 +86,12 @@ class GenerateAnswerOmniNode(BaseNode):
         doc = input_data[1]
         imag_desc = input_data[2]
 
+        # Keep the structured model local so that the node can be executed again
+        llm_model = self.llm_model
+
         if self.node_config.get("schema", None) is not None:
-            if isinstance(self.llm_model, (ChatOpenAI, ChatMistralAI)):
-                self.llm_model = self.llm_model.with_structured_output(
+            if is_model_instance(llm_model, "ChatOpenAI", "ChatMistralAI"):
+                llm_model = llm_model.with_structured_output(
                     schema=self.node_config["schema"]
                 )
 
@@ -131,7 +132,7 @@ class GenerateAnswerOmniNode(BaseNode):
                 },
             )
 
-            chain = prompt | self.llm_model | output_parser
+            chain = prompt | llm_model | output_parser
             answer = chain.invoke({"question": user_prompt})
 
             state.update({self.output[0]: answer})
@@ -151,7 +152,7 @@ class GenerateAnswerOmniNode(BaseNode):
             )
 
             chain_name = f"chunk{i + 1}"
-            chains_dict[chain_name] = prompt | self.llm_model | output_parser
+            chains_dict[chain_name] = prompt | llm_model | output_parser
 
         async_runner = RunnableParallel(**chains_dict)
 
@@ -163,7 +164,7 @@ class GenerateAnswerOmniNode(BaseNode):
             partial_variables={"format_instructions": format_instructions},
         )
 
-        merge_chain = merge_prompt | self.llm_model | output_parser
+        merge_chain = merge_prompt | llm_model | output_parser
         answer = merge_chain.invoke({"context": batch_results, "question": user_prompt})
 
         state.update({self.output[0]: answer})
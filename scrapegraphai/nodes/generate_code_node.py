@@ -13,7 +13,6 @@ from bs4 import BeautifulSoup
 from jsonschema import ValidationError as JSONSchemaValidationError
 from jsonschema import validate
 from langchain_classic.output_parsers import ResponseSchema, StructuredOutputParser
-from langchain_community.chat_models import ChatOllama
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import PromptTemplate
 
@@ -31,6 +30,7 @@ from ..utils import (
     validation_focused_analysis,
     validation_focused_code_generation,
 )
+from ..utils.model_types import is_model_instance
 from .base_node import BaseNode
 
 
@@ -61,7 +61,7 @@ class GenerateCodeNode(BaseNode):
 
         self.llm_model = node_config["llm_model"]
 
-        if isinstance(node_config["llm_model"], ChatOllama):
+        if is_model_instance(node_config["llm_model"], "ChatOllama"):
             self.llm_model.format = "json"
 
         self.verbose = (
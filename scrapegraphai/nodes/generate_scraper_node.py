@@ -19,7 +19,8 @@ class GenerateScraperNode(BaseNode):
     Attributes:
         llm_model: An instance of a language model client, configured for generating answers.
         library (str): The python library to use for scraping the website.
-        source (str): The website to scrape.
+        source (str): The website to scrape, unless a third input key of the state
+            holds the source of the run.
 
     Args:
         input (str): Boolean expression defining the input keys needed from the state.
@@ -76,6 +77,8 @@ class GenerateScraperNode(BaseNode):
 
         user_prompt = input_data[0]
         doc = input_data[1]
+        # The source of the run, when the input expression includes it
+        source = input_data[2] if len(input_data) > 2 else self.source
 
         if self.node_config.get("schema", None) is not None:
             output_schema = JsonOutputParser(pydantic_object=self.node_config["schema"])
@@ -130,7 +133,7 @@ class GenerateScraperNode(BaseNode):
             partial_variables={
                 "context": doc[0],
                 "library": self.library,
-                "source": self.source,
+                "source": source,
                 "schema_instructions": format_instructions,
             },
         )
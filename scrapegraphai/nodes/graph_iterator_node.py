@@ -8,6 +8,7 @@ from typing import List, Optional, Type
 from pydantic import BaseModel
 from tqdm.asyncio import tqdm
 
+from ..utils.tracing import span
 from .base_node import BaseNode
 
 DEFAULT_BATCHSIZE = 16
@@ -15,8 +16,10 @@ DEFAULT_BATCHSIZE = 16
 
 class GraphIteratorNode(BaseNode):
     """
-    A node responsible for instantiating and running multiple graph instances in parallel.
-    It creates as many graph instances as the number of elements in the input list.
+    A node responsible for running a graph over multiple sources in parallel.
+    It builds a single graph instance as a template and runs a lightweight copy
+    of it per element of the input list, so that the LLM client, the compiled
+    graph and its nodes are shared, awaiting them natively on a single event loop.
 
     Attributes:
         verbose (bool): A flag indicating whether to show print statements during execution.
@@ -78,6 +81,25 @@ class GraphIteratorNode(BaseNode):
 
         return state
 
+    async def aexecute(self, state: dict) -> dict:
+        """
+        Asynchronously executes the graph instances on the running event loop.
+
+        Args:
+            state (dict): The current state of the graph.
+
+        Returns:
+            dict: The updated state with the output key containing the results
+            of the graph instances.
+        """
+        batchsize = self.node_config.get("batchsize", DEFAULT_BATCHSIZE)
+
+        self.logger.info(
+            f"--- Executing {self.node_name} Node with batchsize {batchsize} ---"
+        )
+
+        return await self._async_execute(state, batchsize)
+
     async def _async_execute(self, state: dict, batchsize: int) -> dict:
         """asynchronously executes the node's logic with multiple graph instances
         running in parallel, using a semaphore of some size for concurrency regulation
@@ -107,36 +129,33 @@ class GraphIteratorNode(BaseNode):
         if graph_instance is None:
             raise ValueError("graph instance is required for concurrent execution")
 
-        graph_instance = [
-            graph_instance(
-                prompt="", source="", config=scraper_config, schema=self.schema
-            )
-            for _ in range(len(urls))
-        ]
-
-        for graph in graph_instance:
-            if "graph_depth" in graph.config:
-                graph.config["graph_depth"] += 1
-            else:
-                graph.config["graph_depth"] = 1
-
-            graph.prompt = user_prompt
-
-        participants = []
+        template = graph_instance(
+            prompt="", source="", config=scraper_config, schema=self.schema
+        )
+        template.config["graph_depth"] = template.config.get("graph_depth", 0) + 1
 
         semaphore = asyncio.Semaphore(batchsize)
 
-        async def _async_run(graph):
-            async with semaphore:
-                return await asyncio.to_thread(graph.run)
+        async def _async_run(index, graph):
+            with span(
+                "subgraph", category="subgraph", index=index, source=graph.source
+            ):
+                async with semaphore:
+                    answer = await graph.arun()
+            self.emit_event(
+                {
+                    "type": "subgraph",
+                    "index": index,
+                    "source": graph.source,
+                    "result": answer,
+                    "exec_info": graph.get_execution_info(),
+                }
+            )
+            return answer
 
-        for url, graph in zip(urls, graph_instance):
-            graph.source = url
-            if url.startswith("http"):
-                graph.input_key = "url"
-            participants.append(graph)
+        participants = [template._clone_for_item(user_prompt, url) for url in urls]
 
-        futures = [_async_run(graph) for graph in participants]
+        futures = [_async_run(index, graph) for index, graph in enumerate(participants)]
 
         answers = await tqdm.gather(
             *futures, desc="processing graph instances", disable=not self.verbose
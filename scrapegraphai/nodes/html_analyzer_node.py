@@ -4,12 +4,12 @@ HtmlAnalyzerNode Module
 
 from typing import List, Optional
 
-from langchain_core.prompts import PromptTemplate
-from langchain_community.chat_models import ChatOllama
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
 
 from ..prompts import TEMPLATE_HTML_ANALYSIS, TEMPLATE_HTML_ANALYSIS_WITH_CONTEXT
 from ..utils import reduce_html
+from ..utils.model_types import is_model_instance
 from .base_node import BaseNode
 
 
@@ -39,7 +39,7 @@ class HtmlAnalyzerNode(BaseNode):
 
         self.llm_model = node_config["llm_model"]
 
-        if isinstance(node_config["llm_model"], ChatOllama):
+        if is_model_instance(node_config["llm_model"], "ChatOllama"):
             self.llm_model.format = "json"
 
         self.verbose = (
@@ -4,13 +4,11 @@ MergeAnswersNode Module
 
 from typing import List, Optional
 
-from langchain_core.prompts import PromptTemplate
-from langchain_community.chat_models import ChatOllama
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_mistralai import ChatMistralAI
-from langchain_openai import ChatOpenAI
+from langchain_core.prompts import PromptTemplate
 
 from ..prompts import TEMPLATE_COMBINED
+from ..utils.model_types import is_model_instance
 from ..utils.output_parser import (
     get_pydantic_output_parser,
     get_structured_output_parser,
@@ -44,7 +42,7 @@ class MergeAnswersNode(BaseNode):
 
         self.llm_model = node_config["llm_model"]
 
-        if isinstance(self.llm_model, ChatOllama):
+        if is_model_instance(self.llm_model, "ChatOllama"):
             if self.node_config.get("schema", None) is None:
                 self.llm_model.format = "json"
             else:
@@ -85,7 +83,7 @@ class MergeAnswersNode(BaseNode):
             answers_str += f"CONTENT WEBSITE {i + 1}: {answer}\n"
 
         if self.node_config.get("schema", None) is not None:
-            if isinstance(self.llm_model, (ChatOpenAI, ChatMistralAI)):
+            if is_model_instance(self.llm_model, "ChatOpenAI", "ChatMistralAI"):
                 self.llm_model = self.llm_model.with_structured_output(
                     schema=self.node_config["schema"]
                 )  # json schema works only on specific models
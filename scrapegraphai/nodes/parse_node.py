@@ -37,6 +37,8 @@ class ParseNode(BaseNode):
     )
     relative_url_pattern = re.compile(r"[\(](/[^\(\)\s]*)")
 
+    cacheable = True
+
     def __init__(
         self,
         input: str,
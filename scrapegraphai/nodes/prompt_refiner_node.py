@@ -4,12 +4,12 @@ PromptRefinerNode Module
 
 from typing import List, Optional
 
-from langchain_core.prompts import PromptTemplate
-from langchain_community.chat_models import ChatOllama
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
 
 from ..prompts import TEMPLATE_REFINER, TEMPLATE_REFINER_WITH_CONTEXT
 from ..utils import transform_schema
+from ..utils.model_types import is_model_instance
 from .base_node import BaseNode
 
 
@@ -41,7 +41,7 @@ class PromptRefinerNode(BaseNode):
 
         self.llm_model = node_config["llm_model"]
 
-        if isinstance(node_config["llm_model"], ChatOllama):
+        if is_model_instance(node_config["llm_model"], "ChatOllama"):
             self.llm_model.format = "json"
 
         self.verbose = (
@@ -2,10 +2,17 @@
 RAGNode Module
 """
 
+import uuid
 from typing import List, Optional
 
+from ..utils.crawl_store import content_hash
 from .base_node import BaseNode
 
+COLLECTION_NAME = "vectorial_collection"
+
+# On-disk Qdrant clients by path, a local collection can only be opened once per process
+_site_clients = {}
+
 
 class RAGNode(BaseNode):
     """
@@ -17,6 +24,9 @@ class RAGNode(BaseNode):
     Attributes:
         llm_model: An instance of a language model client, configured for generating answers.
         verbose (bool): A flag indicating whether to show print statements during execution.
+        crawl_store (CrawlStore): The record of the previous crawls of the site. The summaries
+            are then indexed in an on-disk collection of the site, where only the pages whose
+            summary changed are embedded again.
 
     Args:
         input (str): Boolean expression defining the input keys needed from the state.
@@ -39,6 +49,7 @@ class RAGNode(BaseNode):
         self.verbose = (
             False if node_config is None else node_config.get("verbose", False)
         )
+        self.crawl_store = node_config.get("crawl_store", None)
 
     def execute(self, state: dict) -> dict:
         self.logger.info(f"--- Executing {self.node_name} Node ---")
@@ -51,6 +62,9 @@ class RAGNode(BaseNode):
                 "qdrant_client is not installed. Please install it using 'pip install qdrant-client'."
             )
 
+        if self.crawl_store is not None and not state.get("embeddings"):
+            return self._index_incrementally(state, QdrantClient)
+
         if self.node_config.get("client_type") in ["memory", None]:
             client = QdrantClient(":memory:")
         elif self.node_config.get("client_type") == "local_db":
@@ -100,7 +114,85 @@ class RAGNode(BaseNode):
             state["vectorial_db"] = client
             return state
 
-        client.add(collection_name="vectorial_collection", documents=docs, ids=ids)
+        client.add(collection_name=COLLECTION_NAME, documents=docs, ids=ids)
 
         state["vectorial_db"] = client
         return state
+
+    def _index_incrementally(self, state: dict, client_class) -> dict:
+        """
+        Indexes the summaries of the pages in the on-disk collection of their
+        site, embedding only the pages whose summary changed since the last
+        crawl. The pages the crawl no longer reached are removed only when
+        `crawl_complete` is set in the state, since a crawl stopped by a budget
+        or a failed fetch misses pages that still exist.
+
+        Args:
+            state (dict): The current state of the graph.
+            client_class: The QdrantClient class.
+
+        Returns:
+            dict: The updated state with the vector database.
+
+        Raises:
+            ValueError: If the crawl fetched no pages.
+        """
+        from qdrant_client.models import PointIdsList
+
+        pages = state.get("docs")
+        if not pages:
+            raise ValueError("The crawl fetched no pages, there is nothing to index.")
+
+        site = pages[0]["source"]
+        path = self.crawl_store.site_path(site)
+        client = _site_clients.get(path)
+        if client is None:
+            client = _site_clients[path] = client_class(path=path)
+
+        removed = []
+        if state.get("crawl_complete", False):
+            crawled = {page["source"] for page in pages}
+            removed = [
+                url
+                for url, page in self.crawl_store.pages(site).items()
+                if page["indexed"] and url not in crawled
+            ]
+        if removed and client.collection_exists(COLLECTION_NAME):
+            client.delete(
+                COLLECTION_NAME,
+                points_selector=PointIdsList(points=[_point_id(u) for u in removed]),
+            )
+            for url in removed:
+                self.crawl_store.mark_indexed(url, None)
+
+        changed = []
+        for page in pages:
+            page_hash = content_hash(page["document"])
+            summary_key = content_hash(page["summary"])
+            if not self.crawl_store.is_indexed(page["source"], page_hash, summary_key):
+                changed.append((page, summary_key))
+
+        if changed:
+            # Points are keyed by URL, so a changed page replaces its previous version.
+            # The collection outlives the crawls, hits are mapped to pages by source.
+            client.add(
+                collection_name=COLLECTION_NAME,
+                documents=[page["summary"] for page, _ in changed],
+                metadata=[{"source": page["source"]} for page, _ in changed],
+                ids=[_point_id(page["source"]) for page, _ in changed],
+            )
+            for page, summary_key in changed:
+                self.crawl_store.mark_indexed(page["source"], summary_key)
+
+        self.logger.info(
+            f"Indexed {len(changed)} new or changed pages, kept "
+            f"{len(pages) - len(changed)} and removed {len(removed)}"
+        )
+
+        state["vectorial_db"] = client
+        return state
+
+
+def _point_id(url: str) -> str:
+    """Returns the stable identifier of the point of a page."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, url))
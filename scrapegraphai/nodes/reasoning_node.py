@@ -4,12 +4,12 @@ PromptRefinerNode Module
 
 from typing import List, Optional
 
-from langchain_core.prompts import PromptTemplate
-from langchain_community.chat_models import ChatOllama
 from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import PromptTemplate
 
 from ..prompts import TEMPLATE_REASONING, TEMPLATE_REASONING_WITH_CONTEXT
 from ..utils import transform_schema
+from ..utils.model_types import is_model_instance
 from .base_node import BaseNode
 
 
@@ -30,6 +30,8 @@ class ReasoningNode(BaseNode):
         node_name (str): The unique identifier name for the node, defaulting to "GenerateAnswer".
     """
 
+    cacheable = True
+
     def __init__(
         self,
         input: str,
@@ -41,7 +43,7 @@ class ReasoningNode(BaseNode):
 
         self.llm_model = node_config["llm_model"]
 
-        if isinstance(node_config["llm_model"], ChatOllama):
+        if is_model_instance(node_config["llm_model"], "ChatOllama"):
             self.llm_model.format = "json"
 
         self.verbose = (
@@ -3,12 +3,11 @@ RobotsNode Module
 """
 
 from typing import List, Optional
-from urllib.parse import urlparse
 
 from langchain_core.output_parsers import CommaSeparatedListOutputParser
 from langchain_core.prompts import PromptTemplate
-from langchain_community.document_loaders import AsyncChromiumLoader
 
+from ..docloaders.robots_txt import get_robots_cache
 from ..helpers import robots_dictionary
 from ..prompts import TEMPLATE_ROBOT
 from .base_node import BaseNode
@@ -17,15 +16,18 @@ from .base_node import BaseNode
 class RobotsNode(BaseNode):
     """
     A node responsible for checking if a website is scrapeable or not based on the robots.txt file.
-    It uses a language model to determine if the website allows scraping of the provided path.
+    The rules of the file are evaluated as specified by RFC 9309 for the user agents of the
+    language model, listed in `robots_dictionary`, and cached per host for the whole process.
 
     This node acts as a starting point in many scraping workflows, preparing the state
     with the necessary HTML content for further processing by subsequent nodes in the graph.
 
     Attributes:
-        llm_model: An instance of the language model client used for checking scrapeability.
+        llm_model: An instance of the language model client, whose user agents are checked.
         force_scraping (bool): A flag indicating whether scraping should be enforced even
                                if disallowed by robots.txt.
+        llm_fallback (bool): Whether the language model reads the robots.txt file when it
+                             contains no robots.txt rule, such as an HTML error page.
         verbose (bool): A flag indicating whether to show print statements during execution.
 
     Args:
@@ -46,20 +48,60 @@ class RobotsNode(BaseNode):
     ):
         super().__init__(node_name, "node", input, output, 1)
 
-        self.llm_model = node_config["llm_model"]
+        self.llm_model = None if node_config is None else node_config.get("llm_model")
 
         self.force_scraping = (
             False if node_config is None else node_config.get("force_scraping", False)
         )
+        self.llm_fallback = (
+            False if node_config is None else node_config.get("llm_fallback", False)
+        )
         self.verbose = (
             True if node_config is None else node_config.get("verbose", False)
         )
 
+    def user_agents(self) -> List[str]:
+        """
+        Returns the user agents of the language model, from `robots_dictionary`.
+
+        The model name is looked up without its provider prefix, then by the
+        longest family name it starts with, e.g. "claude" for "claude-3-haiku".
+        Unknown models are checked under their own name, which robots.txt files
+        match with their `*` group.
+
+        Returns:
+            List[str]: The user agents whose rules apply.
+        """
+        model = getattr(self.llm_model, "model", None) or getattr(
+            self.llm_model, "model_name", None
+        )
+        if not isinstance(model, str):
+            return ["*"]
+
+        model = model.split("/")[-1]
+        agents = robots_dictionary.get(model)
+        if agents is None:
+            families = [name for name in robots_dictionary if model.startswith(name)]
+            if not families:
+                return [model]
+            agents = robots_dictionary[max(families, key=len)]
+        return [agents] if isinstance(agents, str) else list(agents)
+
+    def _ask_llm(self, source: str, robots_txt: str, agents: List[str]) -> str:
+        """Asks the language model whether the robots.txt file allows the path."""
+        prompt = PromptTemplate(
+            template=TEMPLATE_ROBOT,
+            input_variables=["path"],
+            partial_variables={"context": robots_txt, "agent": agents},
+        )
+        chain = prompt | self.llm_model | CommaSeparatedListOutputParser()
+        return chain.invoke({"path": source})[0]
+
     def execute(self, state: dict) -> dict:
         """
         Checks if a website is scrapeable based on the robots.txt file and updates the state
-        with the scrapeability status. The method constructs a prompt for the language model,
-        submits it, and parses the output to determine if scraping is allowed.
+        with the scrapeability status, "yes" or "no". The robots.txt file of each host is
+        fetched once and its rules are cached by the process.
 
         Args:
             state (dict): The current state of the graph. The input keys will be used to fetch the
@@ -70,7 +112,6 @@ class RobotsNode(BaseNode):
         Raises:
             KeyError: If the input keys are not found in the state, indicating that the
                         necessary information for checking scrapeability is missing.
-            KeyError: If the large language model is not found in the robots_dictionary.
             ValueError: If the website is not scrapeable based on the robots.txt file and
                         scraping is not enforced.
         """
@@ -82,50 +123,35 @@ class RobotsNode(BaseNode):
         input_data = [state[key] for key in input_keys]
 
         source = input_data[0]
-        output_parser = CommaSeparatedListOutputParser()
 
         if not source.startswith("http"):
             raise ValueError("Operation not allowed")
 
-        else:
-            parsed_url = urlparse(source)
-            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-            loader = AsyncChromiumLoader(f"{base_url}/robots.txt")
-            document = loader.load()
-            if "ollama" in self.llm_model.model:
-                self.llm_model.model = self.llm_model.model.split("/")[-1]
-                model = self.llm_model.model.split("/")[-1]
-            else:
-                model = self.llm_model.model
-            try:
-                agent = robots_dictionary[model]
+        robots = get_robots_cache().get(source)
+        agents = self.user_agents()
 
-            except KeyError:
-                agent = model
-
-            prompt = PromptTemplate(
-                template=TEMPLATE_ROBOT,
-                input_variables=["path"],
-                partial_variables={"context": document, "agent": agent},
-            )
+        if (
+            robots.unrecognized is not None
+            and self.llm_fallback
+            and self.llm_model is not None
+        ):
+            self.logger.info("robots.txt has no rule, asking the language model")
+            is_scrapable = self._ask_llm(source, robots.unrecognized, agents)
+        else:
+            is_scrapable = "yes" if robots.allowed(source, agents) else "no"
 
-            chain = prompt | self.llm_model | output_parser
-            is_scrapable = chain.invoke({"path": source})[0]
+        if "no" in is_scrapable:
+            self.logger.warning("\033[31m(Scraping this website is not allowed)\033[0m")
 
-            if "no" in is_scrapable:
+            if not self.force_scraping:
+                raise ValueError("The website you selected is not scrapable")
+            else:
                 self.logger.warning(
-                    "\033[31m(Scraping this website is not allowed)\033[0m"
+                    """\033[33m(WARNING: Scraping this website is
+                    not allowed but you decided to force it)\033[0m"""
                 )
-
-                if not self.force_scraping:
-                    raise ValueError("The website you selected is not scrapable")
-                else:
-                    self.logger.warning(
-                        """\033[33m(WARNING: Scraping this website is
-                        not allowed but you decided to force it)\033[0m"""
-                    )
-            else:
-                self.logger.warning("\033[32m(Scraping this website is allowed)\033[0m")
+        else:
+            self.logger.warning("\033[32m(Scraping this website is allowed)\033[0m")
 
         state.update({self.output[0]: is_scrapable})
         return state
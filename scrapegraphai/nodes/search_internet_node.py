@@ -6,9 +6,9 @@ from typing import List, Optional
 
 from langchain_core.output_parsers import CommaSeparatedListOutputParser
 from langchain_core.prompts import PromptTemplate
-from langchain_community.chat_models import ChatOllama
 
 from ..prompts import TEMPLATE_SEARCH_INTERNET
+from ..utils.model_types import is_model_instance
 from ..utils.research_web import search_on_web
 from .base_node import BaseNode
 
@@ -93,7 +93,10 @@ class SearchInternetNode(BaseNode):
 
         search_answer = search_prompt | self.llm_model | output_parser
 
-        if isinstance(self.llm_model, ChatOllama) and self.llm_model.format == "json":
+        if (
+            is_model_instance(self.llm_model, "ChatOllama")
+            and self.llm_model.format == "json"
+        ):
             self.llm_model.format = None
             search_query = search_answer.invoke({"user_prompt": user_prompt})[0]
             self.llm_model.format = "json"
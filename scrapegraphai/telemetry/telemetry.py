@@ -1,3 +1,4 @@
+import atexit
 import configparser
 import functools
 import importlib.metadata
@@ -5,7 +6,9 @@ import json
 import logging
 import os
 import platform
+import queue
 import threading
+import time
 import uuid
 from typing import Callable, Dict
 from urllib import request
@@ -63,21 +66,54 @@ def _check_config_and_environ_for_telemetry_flag(default_value: bool, config_obj
     return telemetry_enabled
 
 
-config = _load_config(DEFAULT_CONFIG_LOCATION)
-g_telemetry_enabled = _check_config_and_environ_for_telemetry_flag(True, config)
-g_anonymous_id = config["DEFAULT"]["anonymous_id"]
+# The config file is read on first use rather than at import time
+config = None
+g_telemetry_enabled = None
+g_anonymous_id = None
 CALL_COUNTER = 0
 MAX_COUNT_SESSION = 1000
 
+BASE_PROPERTIES = {}
+_init_lock = threading.Lock()
 
-BASE_PROPERTIES = {
-    "os_type": os.name,
-    "os_version": platform.platform(),
-    "python_version": f"{platform.python_version()}/{platform.python_implementation()}",
-    "distinct_id": g_anonymous_id,
-    "scrapegraphai_version": VERSION,
-    "telemetry_version": "0.0.4-proxy",
-}
+# Events are sent one by one by a single background worker
+MAX_QUEUE_SIZE = 1000
+MAX_FIELD_CHARS = 4096
+# Pending events only delay the exit of the interpreter by this much
+EXIT_FLUSH_TIMEOUT = 0.5
+DROPPED_EVENTS = 0
+
+_queue = queue.Queue(maxsize=MAX_QUEUE_SIZE)
+_FLUSH = object()
+_flushed = threading.Event()
+_worker_thread = None
+_worker_lock = threading.Lock()
+
+
+def _init_telemetry():
+    """Loads the telemetry config file and the base properties of the events."""
+    global config, g_telemetry_enabled, g_anonymous_id
+
+    with _init_lock:
+        if g_anonymous_id is not None:
+            return
+
+        config = _load_config(DEFAULT_CONFIG_LOCATION)
+        if g_telemetry_enabled is None:
+            g_telemetry_enabled = _check_config_and_environ_for_telemetry_flag(
+                True, config
+            )
+        BASE_PROPERTIES.update(
+            {
+                "os_type": os.name,
+                "os_version": platform.platform(),
+                "python_version": f"{platform.python_version()}/{platform.python_implementation()}",
+                "distinct_id": config["DEFAULT"]["anonymous_id"],
+                "scrapegraphai_version": VERSION,
+                "telemetry_version": "0.0.4-proxy",
+            }
+        )
+        g_anonymous_id = config["DEFAULT"]["anonymous_id"]
 
 
 def disable_telemetry():
@@ -86,6 +122,8 @@ def disable_telemetry():
 
 
 def is_telemetry_enabled() -> bool:
+    if g_telemetry_enabled is None:
+        _init_telemetry()
     if g_telemetry_enabled:
         global CALL_COUNTER
         CALL_COUNTER += 1
@@ -96,43 +134,139 @@ def is_telemetry_enabled() -> bool:
 
 
 # ⭐ UPDATED FOR PROXY — send without API key
-def _send_event_json(event_json: dict):
+def _post_json(url: str, body) -> bytes:
     headers = {
         "Content-Type": "application/json",
         "User-Agent": f"scrapegraphai/{STR_VERSION}",
     }
-    try:
-        data = json.dumps(event_json).encode()
-        req = request.Request(PROXY_URL, data=data, headers=headers)
+    data = json.dumps(body, default=str).encode()
+    req = request.Request(url, data=data, headers=headers)
+
+    with request.urlopen(req, timeout=TIMEOUT) as f:
+        response_body = f.read()
+        if f.code != 200:
+            raise RuntimeError(response_body)
+    return data
+
 
-        with request.urlopen(req, timeout=TIMEOUT) as f:
-            response_body = f.read()
-            if f.code != 200:
-                raise RuntimeError(response_body)
+def _send_event_json(event_json: dict):
+    try:
+        data = _post_json(PROXY_URL, event_json)
     except Exception as e:
         logger.debug(f"Failed to send telemetry data to proxy: {e}")
     else:
         logger.debug(f"Telemetry payload forwarded to proxy: {data}")
 
 
+def _cap_value(value):
+    """Truncates large values so that a single event stays small."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if not isinstance(value, str):
+        try:
+            value_json = json.dumps(value, default=str)
+        except (TypeError, ValueError):
+            value_json = str(value)
+        if len(value_json) <= MAX_FIELD_CHARS:
+            return value
+        value = value_json
+    if len(value) > MAX_FIELD_CHARS:
+        return value[:MAX_FIELD_CHARS] + "...[truncated]"
+    return value
+
+
+def _cap_payload(event_json: dict) -> dict:
+    properties = event_json.get("properties")
+    if not isinstance(properties, dict):
+        return event_json
+    return {
+        **event_json,
+        "properties": {key: _cap_value(value) for key, value in properties.items()},
+    }
+
+
+def _worker():
+    """Sends the queued events until the process exits."""
+    while True:
+        event = _queue.get()
+        if event is _FLUSH:
+            _flushed.set()
+            continue
+
+        try:
+            _send_event_json(event)
+        except Exception as e:
+            logger.debug(f"Telemetry worker failed: {e}")
+
+
+def _start_worker():
+    global _worker_thread
+
+    with _worker_lock:
+        if _worker_thread is None or not _worker_thread.is_alive():
+            _worker_thread = threading.Thread(
+                target=_worker, name="scrapegraphai-telemetry", daemon=True
+            )
+            _worker_thread.start()
+            atexit.register(_flush_at_exit)
+
+
+def flush_telemetry(timeout: float = TIMEOUT) -> bool:
+    """
+    Waits until the events queued so far have been sent.
+
+    Args:
+        timeout (float): Maximum time to wait in seconds.
+
+    Returns:
+        bool: Whether the queue was flushed before the timeout.
+    """
+    if _worker_thread is None or not _worker_thread.is_alive():
+        return True
+    deadline = time.monotonic() + timeout
+    _flushed.clear()
+    try:
+        _queue.put(_FLUSH, timeout=timeout)
+    except queue.Full:
+        return False
+    return _flushed.wait(max(deadline - time.monotonic(), 0))
+
+
+def _flush_at_exit():
+    """Sends the pending events at exit, without waiting when there are none."""
+    if not _queue.empty():
+        flush_telemetry(EXIT_FLUSH_TIMEOUT)
+
+
 def send_event_json(event_json: dict):
+    if g_telemetry_enabled is None:
+        _init_telemetry()
     if not g_telemetry_enabled:
         raise RuntimeError("Telemetry tracking is disabled!")
+    _start_worker()
     try:
-        th = threading.Thread(target=_send_event_json, args=(event_json,))
-        th.start()
-    except Exception as e:
-        logger.debug(f"Telemetry dispatch thread failed: {e}")
+        # Large fields are cut before queueing, so pending events stay small
+        _queue.put_nowait(_cap_payload(event_json))
+    except queue.Full:
+        # Drop rather than slow down the caller when the endpoint cannot keep up
+        global DROPPED_EVENTS
+        DROPPED_EVENTS += 1
+        logger.debug("Telemetry queue is full, dropping event")
+
+
+def _queue_event(event: str, properties: Dict[str, any]):
+    _init_telemetry()
+    payload = {
+        "event": event,
+        "distinct_id": g_anonymous_id,
+        "properties": {**BASE_PROPERTIES, **properties},
+    }
+    send_event_json(payload)
 
 
 def log_event(event: str, properties: Dict[str, any]):
     if is_telemetry_enabled():
-        payload = {
-            "event": event,
-            "distinct_id": g_anonymous_id,
-            "properties": {**BASE_PROPERTIES, **properties},
-        }
-        send_event_json(payload)
+        _queue_event(event, properties)
 
 
 def log_graph_execution(
@@ -150,6 +284,10 @@ def log_graph_execution(
     exception: str = None,
     total_tokens: int = None,
 ):
+    # Nothing is built when telemetry is disabled
+    if not is_telemetry_enabled():
+        return
+
     props = {
         "graph_name": graph_name,
         "source": source,
@@ -166,7 +304,7 @@ def log_graph_execution(
         "total_tokens": total_tokens,
         "type": "community-library",
     }
-    log_event("graph_execution", props)
+    _queue_event("graph_execution", props)
 
 
 def capture_function_usage(call_fn: Callable) -> Callable:
@@ -176,5 +314,5 @@ def capture_function_usage(call_fn: Callable) -> Callable:
             return call_fn(*args, **kwargs)
         finally:
             if is_telemetry_enabled():
-                log_event("function_usage", {"function_name": call_fn.__name__})
-    return wrapped_fn
\ No newline at end of file
+                _queue_event("function_usage", {"function_name": call_fn.__name__})
+    return wrapped_fn
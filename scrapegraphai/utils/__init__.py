@@ -1,25 +1,15 @@
 """
 __init__.py file for utils folder
+
+Submodules are imported lazily on first attribute access, so that importing
+the package does not pull in heavy third party dependencies.
 """
 
-from .cleanup_code import extract_code
-from .cleanup_html import cleanup_html, reduce_html
-from .code_error_analysis import (
-    execution_focused_analysis,
-    semantic_focused_analysis,
-    syntax_focused_analysis,
-    validation_focused_analysis,
-)
-from .code_error_correction import (
-    execution_focused_code_generation,
-    semantic_focused_code_generation,
-    syntax_focused_code_generation,
-    validation_focused_code_generation,
-)
-from .convert_to_md import convert_to_md
-from .data_export import export_to_csv, export_to_json, export_to_xml
-from .dict_content_compare import are_content_equal
-from .llm_callback_manager import CustomLLMCallbackManager
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
 from .logging import (
     get_logger,
     get_verbosity,
@@ -39,21 +29,135 @@ from .logging import (
     unsetDEFAULT_HANDLER,
     warning_once,
 )
-from .prettify_exec_info import prettify_exec_info
-from .proxy_rotation import Proxy, parse_or_search_proxy, search_proxy_servers
-from .save_audio_from_bytes import save_audio_from_bytes
-from .save_code_to_file import save_code_to_file
-from .schema_trasform import transform_schema  # Note: filename has typo but kept for compatibility
-from .screenshot_scraping.screenshot_preparation import (
-    crop_image,
-    select_area_with_ipywidget,
-    select_area_with_opencv,
-    take_screenshot,
-)
-from .screenshot_scraping.text_detection import detect_text
-from .split_text_into_chunks import split_text_into_chunks
-from .sys_dynamic_import import dynamic_import, srcfile_import
-from .tokenizer import num_tokens_calculus
+
+if TYPE_CHECKING:
+    from .checkpoint import CheckpointStore
+    from .cleanup_code import extract_code
+    from .cleanup_html import cleanup_html, reduce_html
+    from .code_error_analysis import (
+        execution_focused_analysis,
+        semantic_focused_analysis,
+        syntax_focused_analysis,
+        validation_focused_analysis,
+    )
+    from .code_error_correction import (
+        execution_focused_code_generation,
+        semantic_focused_code_generation,
+        syntax_focused_code_generation,
+        validation_focused_code_generation,
+    )
+    from .convert_to_md import convert_to_md
+    from .crawl_store import CrawlStore
+    from .data_export import export_to_csv, export_to_json, export_to_xml
+    from .dict_content_compare import are_content_equal
+    from .llm_callback_manager import CustomLLMCallbackManager
+    from .model_types import is_model_instance
+    from .node_cache import NodeCache
+    from .prettify_exec_info import prettify_exec_info
+    from .profiler import NodeProfiler
+    from .proxy_rotation import (
+        Proxy,
+        ProxyPool,
+        get_proxy_pool,
+        parse_or_search_proxy,
+        search_proxy_servers,
+    )
+    from .save_audio_from_bytes import save_audio_from_bytes
+    from .save_code_to_file import save_code_to_file
+    from .schema_trasform import transform_schema
+    from .screenshot_scraping.screenshot_preparation import (
+        crop_image,
+        select_area_with_ipywidget,
+        select_area_with_opencv,
+        take_screenshot,
+    )
+    from .screenshot_scraping.text_detection import detect_text
+    from .split_text_into_chunks import split_text_into_chunks
+    from .sys_dynamic_import import dynamic_import, srcfile_import
+    from .tokenizer import num_tokens_calculus
+    from .tracing import Tracer
+
+# Maps each public name to the submodule defining it
+_LAZY_IMPORTS = {
+    "CheckpointStore": ".checkpoint",
+    "extract_code": ".cleanup_code",
+    "cleanup_html": ".cleanup_html",
+    "reduce_html": ".cleanup_html",
+    "execution_focused_analysis": ".code_error_analysis",
+    "semantic_focused_analysis": ".code_error_analysis",
+    "syntax_focused_analysis": ".code_error_analysis",
+    "validation_focused_analysis": ".code_error_analysis",
+    "execution_focused_code_generation": ".code_error_correction",
+    "semantic_focused_code_generation": ".code_error_correction",
+    "syntax_focused_code_generation": ".code_error_correction",
+    "validation_focused_code_generation": ".code_error_correction",
+    "convert_to_md": ".convert_to_md",
+    "CrawlStore": ".crawl_store",
+    "export_to_csv": ".data_export",
+    "export_to_json": ".data_export",
+    "export_to_xml": ".data_export",
+    "are_content_equal": ".dict_content_compare",
+    "CustomLLMCallbackManager": ".llm_callback_manager",
+    "is_model_instance": ".model_types",
+    "NodeCache": ".node_cache",
+    "prettify_exec_info": ".prettify_exec_info",
+    "NodeProfiler": ".profiler",
+    "Proxy": ".proxy_rotation",
+    "ProxyPool": ".proxy_rotation",
+    "get_proxy_pool": ".proxy_rotation",
+    "parse_or_search_proxy": ".proxy_rotation",
+    "search_proxy_servers": ".proxy_rotation",
+    "save_audio_from_bytes": ".save_audio_from_bytes",
+    "save_code_to_file": ".save_code_to_file",
+    # Note: filename has typo but kept for compatibility
+    "transform_schema": ".schema_trasform",
+    "crop_image": ".screenshot_scraping.screenshot_preparation",
+    "select_area_with_ipywidget": ".screenshot_scraping.screenshot_preparation",
+    "select_area_with_opencv": ".screenshot_scraping.screenshot_preparation",
+    "take_screenshot": ".screenshot_scraping.screenshot_preparation",
+    "detect_text": ".screenshot_scraping.text_detection",
+    "split_text_into_chunks": ".split_text_into_chunks",
+    "dynamic_import": ".sys_dynamic_import",
+    "srcfile_import": ".sys_dynamic_import",
+    "num_tokens_calculus": ".tokenizer",
+    "Tracer": ".tracing",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+class _UtilsModule(types.ModuleType):
+    """
+    Some functions share the name of their submodule (e.g. `convert_to_md`).
+    Importing such a submodule binds it to the package, which would shadow the
+    lazily exported function, so the function is bound instead, as the eager
+    imports used to do.
+    """
+
+    def __setattr__(self, name, value):
+        if (
+            isinstance(value, types.ModuleType)
+            and _LAZY_IMPORTS.get(name) == f".{name}"
+            and hasattr(value, name)
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _UtilsModule
+
 
 __all__ = [
     # Code cleanup and analysis
@@ -79,15 +183,23 @@ __all__ = [
     "save_code_to_file",
     # Utility functions
     "are_content_equal",
+    "CheckpointStore",
+    "CrawlStore",
     "CustomLLMCallbackManager",
+    "is_model_instance",
+    "NodeCache",
+    "NodeProfiler",
     "prettify_exec_info",
     "transform_schema",
     "split_text_into_chunks",
     "dynamic_import",
     "srcfile_import",
     "num_tokens_calculus",
+    "Tracer",
     # Proxy handling
     "Proxy",
+    "ProxyPool",
+    "get_proxy_pool",
     "parse_or_search_proxy",
     "search_proxy_servers",
     # Screenshot and image processing
@@ -0,0 +1,216 @@
+"""
+SQLite checkpoint store for resumable graph executions
+"""
+
+import os
+import pickle
+import sqlite3
+import time
+from contextlib import closing
+from typing import List, Optional
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+CHECKPOINT_DB = "checkpoints.db"
+
+
+class CheckpointStore:
+    """
+    Persists the state of a graph execution after each node in a local SQLite
+    database, keyed by run id, so that a failed run can be resumed from the
+    node that failed instead of starting over.
+
+    Attributes:
+        db_path (str): Path of the SQLite database file.
+
+    Args:
+        checkpoint_path (str): Directory holding the checkpoint database.
+
+    Example:
+        >>> store = CheckpointStore("./checkpoints")
+        >>> store.save("run-1", "SmartScraperGraph", "ParseNode", state, run_info)
+        >>> store.load("run-1")["next_node"]
+        'ParseNode'
+    """
+
+    def __init__(self, checkpoint_path: str):
+        checkpoint_path = os.fspath(checkpoint_path)
+        os.makedirs(checkpoint_path, exist_ok=True)
+        self.db_path = os.path.join(checkpoint_path, CHECKPOINT_DB)
+        self._unpicklable_runs = set()
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS checkpoints (
+                    run_id TEXT PRIMARY KEY,
+                    graph_name TEXT,
+                    next_node TEXT,
+                    status TEXT,
+                    error TEXT,
+                    state BLOB,
+                    run_info BLOB,
+                    updated_at REAL
+                )
+                """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def save(
+        self,
+        run_id: str,
+        graph_name: str,
+        next_node: Optional[str],
+        state: dict,
+        run_info: dict,
+        status: str = "running",
+    ) -> bool:
+        """
+        Saves the state of a run before executing `next_node`.
+
+        Args:
+            run_id (str): The identifier of the run.
+            graph_name (str): The name of the graph being executed.
+            next_node (Optional[str]): The node to execute next, None once the run is over.
+            state (dict): The current state of the graph.
+            run_info (dict): The execution bookkeeping (exec info, token totals).
+            status (str): One of "running", "failed" or "completed".
+
+        Returns:
+            bool: Whether the checkpoint was written; states that cannot be
+            pickled, such as states holding a vector store client, are skipped
+            instead of failing the run, so that the last saved checkpoint is
+            kept. A warning naming the offending keys is logged once per run.
+        """
+        try:
+            state_blob = pickle.dumps(state)
+            run_info_blob = pickle.dumps(run_info)
+        except Exception as e:
+            if run_id not in self._unpicklable_runs:
+                self._unpicklable_runs.add(run_id)
+                keys = _unpicklable_keys(state)
+                what = f"state keys {', '.join(keys)}" if keys else "run info"
+                logger.warning(
+                    f"Skipping the checkpoints of run {run_id} from {next_node} "
+                    f"on, its {what} cannot be pickled ({e}); resuming the run "
+                    "restarts from its last saved checkpoint."
+                )
+            return False
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO checkpoints
+                (run_id, graph_name, next_node, status, error, state, run_info, updated_at)
+                VALUES (?, ?, ?, ?, NULL, ?, ?, ?)
+                """,
+                (
+                    run_id,
+                    graph_name,
+                    next_node,
+                    status,
+                    state_blob,
+                    run_info_blob,
+                    time.time(),
+                ),
+            )
+        return True
+
+    def set_status(self, run_id: str, status: str, error: Optional[str] = None):
+        """
+        Updates the status of a run, keeping the last saved state.
+
+        Args:
+            run_id (str): The identifier of the run.
+            status (str): One of "running", "failed" or "completed".
+            error (Optional[str]): The error that stopped the run, if any.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE checkpoints SET status = ?, error = ?, updated_at = ? "
+                "WHERE run_id = ?",
+                (status, error, time.time(), run_id),
+            )
+
+    def load(self, run_id: str) -> Optional[dict]:
+        """
+        Loads the last checkpoint of a run.
+
+        Args:
+            run_id (str): The identifier of the run.
+
+        Returns:
+            Optional[dict]: The checkpoint with the keys run_id, graph_name,
+            next_node, status, error, state, run_info and updated_at, or None
+            if the run is unknown.
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT run_id, graph_name, next_node, status, error, state, "
+                "run_info, updated_at FROM checkpoints WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            "run_id": row[0],
+            "graph_name": row[1],
+            "next_node": row[2],
+            "status": row[3],
+            "error": row[4],
+            "state": pickle.loads(row[5]),
+            "run_info": pickle.loads(row[6]),
+            "updated_at": row[7],
+        }
+
+    def list_runs(self, status: Optional[str] = None) -> List[dict]:
+        """
+        Lists the checkpointed runs, most recent first.
+
+        Args:
+            status (Optional[str]): Only return runs with this status.
+
+        Returns:
+            List[dict]: The run_id, graph_name, next_node, status, error and
+            updated_at of each run.
+        """
+        query = (
+            "SELECT run_id, graph_name, next_node, status, error, updated_at "
+            "FROM checkpoints"
+        )
+        params = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY updated_at DESC"
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        keys = ("run_id", "graph_name", "next_node", "status", "error", "updated_at")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def delete(self, run_id: str):
+        """
+        Removes the checkpoint of a run.
+
+        Args:
+            run_id (str): The identifier of the run.
+        """
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM checkpoints WHERE run_id = ?", (run_id,))
+
+
+def _unpicklable_keys(state: dict) -> List[str]:
+    """Returns the keys of the state whose values cannot be pickled."""
+    keys = []
+    for key, value in state.items():
+        try:
+            pickle.dumps(value)
+        except Exception:
+            keys.append(key)
+    return keys
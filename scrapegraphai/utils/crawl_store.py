@@ -0,0 +1,186 @@
+"""
+SQLite store of the pages crawled from each site, for incremental recrawls
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+CRAWL_STORE_DB = "crawl_store.db"
+
+
+def content_hash(content: str) -> str:
+    """Returns the SHA-256 fingerprint of the content of a page."""
+    return hashlib.sha256(content.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def site_of(url: str) -> str:
+    """Returns the site of a URL, its lowercased scheme and host."""
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+class CrawlStore:
+    """
+    Records, for every page crawled from a site, the fingerprint of its
+    content, when it was fetched and what was derived from it: the summary
+    written by DescriptionNode and whether RAGNode indexed it. On the next
+    crawl of the site, only the pages whose fingerprint changed have to be
+    processed again.
+
+    Derived data is keyed by the fingerprint it was computed from, along with
+    a `key` identifying how it was computed (model, prompt), so that a summary
+    is never reused for a changed page or by another model.
+
+    Attributes:
+        db_path (str): Path of the SQLite database file.
+
+    Args:
+        path (str): Directory holding the crawl store database.
+
+    Example:
+        >>> store = CrawlStore("./crawls")
+        >>> store.summary(url, content_hash(page), key) is None
+        True
+        >>> store.save_summary(url, content_hash(page), key, summary)
+        >>> store.summary(url, content_hash(page), key) == summary
+        True
+    """
+
+    def __init__(self, path: str):
+        path = os.fspath(path)
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.db_path = os.path.join(path, CRAWL_STORE_DB)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS pages (
+                    site TEXT,
+                    url TEXT,
+                    content_hash TEXT,
+                    fetched_at REAL,
+                    summary_key TEXT,
+                    summary TEXT,
+                    indexed_key TEXT,
+                    PRIMARY KEY (site, url)
+                )
+                """)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def record_fetch(
+        self, url: str, content_hash: str, fetched_at: Optional[float] = None
+    ) -> bool:
+        """
+        Records the fingerprint of a freshly fetched page.
+
+        Args:
+            url (str): The URL of the page.
+            content_hash (str): The fingerprint of its content.
+            fetched_at (Optional[float]): When it was fetched, defaults to now.
+
+        Returns:
+            bool: Whether the page is new or its content changed since the
+            previous crawl, in which case what was derived from it is dropped.
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        site = site_of(url)
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT content_hash FROM pages WHERE site = ? AND url = ?",
+                (site, url),
+            ).fetchone()
+            if row is not None and row[0] == content_hash:
+                conn.execute(
+                    "UPDATE pages SET fetched_at = ? WHERE site = ? AND url = ?",
+                    (fetched_at, site, url),
+                )
+                return False
+
+            conn.execute(
+                "INSERT OR REPLACE INTO pages (site, url, content_hash, fetched_at) "
+                "VALUES (?, ?, ?, ?)",
+                (site, url, content_hash, fetched_at),
+            )
+            return True
+
+    def summary(self, url: str, content_hash: str, key: str) -> Optional[str]:
+        """
+        Returns the summary of a page, if it was written for the same content
+        with the same key.
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT summary FROM pages WHERE site = ? AND url = ? "
+                "AND content_hash = ? AND summary_key = ?",
+                (site_of(url), url, content_hash, key),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def save_summary(self, url: str, content_hash: str, key: str, summary: str):
+        """Saves the summary written for the given content of a page."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE pages SET summary_key = ?, summary = ? "
+                "WHERE site = ? AND url = ? AND content_hash = ?",
+                (key, summary, site_of(url), url, content_hash),
+            )
+
+    def is_indexed(self, url: str, content_hash: str, key: str) -> bool:
+        """Tells whether the given content of a page was indexed with the same key."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT 1 FROM pages WHERE site = ? AND url = ? "
+                "AND content_hash = ? AND indexed_key = ?",
+                (site_of(url), url, content_hash, key),
+            ).fetchone()
+        return row is not None
+
+    def mark_indexed(self, url: str, key: Optional[str]):
+        """Records that the current content of a page was indexed, or not with None."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "UPDATE pages SET indexed_key = ? WHERE site = ? AND url = ?",
+                (key, site_of(url), url),
+            )
+
+    def pages(self, site: str) -> Dict[str, dict]:
+        """
+        Returns the pages recorded for a site.
+
+        Args:
+            site (str): The site, or any URL of it.
+
+        Returns:
+            Dict[str, dict]: The `content_hash`, `fetched_at`, `summary` and
+            `indexed` status of each page, by URL.
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT url, content_hash, fetched_at, summary, indexed_key "
+                "FROM pages WHERE site = ?",
+                (site_of(site),),
+            ).fetchall()
+        return {
+            url: {
+                "content_hash": page_hash,
+                "fetched_at": fetched_at,
+                "summary": summary,
+                "indexed": indexed_key is not None,
+            }
+            for url, page_hash, fetched_at, summary, indexed_key in rows
+        }
+
+    def site_path(self, site: str) -> str:
+        """Returns a directory dedicated to the derived data of a site."""
+        parts = urlsplit(site_of(site))
+        name = f"{parts.scheme}_{parts.netloc}".replace(":", "_")
+        path = os.path.join(self.path, "sites", name)
+        os.makedirs(path, exist_ok=True)
+        return path
@@ -152,6 +152,8 @@ def get_custom_callback(llm_model_name: str):
     Function to get custom callback for LLM token usage statistics.
     """
     cb = CustomCallbackHandler(llm_model_name)
-    custom_callback.set(cb)
-    yield cb
-    custom_callback.set(None)
+    token = custom_callback.set(cb)
+    try:
+        yield cb
+    finally:
+        custom_callback.reset(token)
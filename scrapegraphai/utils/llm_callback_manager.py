@@ -2,67 +2,176 @@
 This module provides a custom callback manager for LLM models.
 
 Classes:
-- CustomLLMCallbackManager: Manages exclusive access to callbacks for different types of LLM models.
+- UsageScopeHandler: Accumulates the token usage of the LLM calls made inside a scope.
+- CustomLLMCallbackManager: Provides the usage scope of a node execution for different
+  types of LLM models.
 """
 
 import threading
 from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Optional
 
-from langchain_aws import ChatBedrock
-from langchain_community.callbacks.manager import (
-    get_bedrock_anthropic_callback,
-    get_openai_callback,
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.tracers.context import register_configure_hook
+
+from .custom_callback import CustomCallbackHandler
+from .model_types import is_model_instance
+
+USAGE_FIELDS = (
+    "total_tokens",
+    "prompt_tokens",
+    "completion_tokens",
+    "successful_requests",
+    "total_cost",
 )
-from langchain_openai import AzureChatOpenAI, ChatOpenAI
 
-from .custom_callback import get_custom_callback
+
+class UsageScopeHandler(BaseCallbackHandler):
+    """
+    Callback handler accumulating the token usage of the LLM calls made while
+    its scope is active. The tokens and cost of each call are computed by a
+    provider specific handler, then added to this scope and to every enclosing
+    scope, so that the usage of a sub-graph also counts towards the node that
+    ran it.
+
+    Attributes:
+        handler (BaseCallbackHandler): The provider specific handler computing the usage.
+        parent (Optional[UsageScopeHandler]): The enclosing scope, if any.
+        total_tokens (int): Tokens used in the scope.
+        prompt_tokens (int): Prompt tokens used in the scope.
+        completion_tokens (int): Completion tokens used in the scope.
+        successful_requests (int): LLM requests completed in the scope.
+        total_cost (float): Cost of the scope in USD.
+    """
+
+    total_tokens: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    successful_requests: int = 0
+    total_cost: float = 0.0
+
+    def __init__(
+        self,
+        handler: BaseCallbackHandler,
+        parent: Optional["UsageScopeHandler"] = None,
+    ) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self.handler = handler
+        self.parent = parent
+
+    def __repr__(self) -> str:
+        return (
+            f"Tokens Used: {self.total_tokens}\n"
+            f"\tPrompt Tokens: {self.prompt_tokens}\n"
+            f"\tCompletion Tokens: {self.completion_tokens}\n"
+            f"Successful Requests: {self.successful_requests}\n"
+            f"Total Cost (USD): ${self.total_cost}"
+        )
+
+    @property
+    def always_verbose(self) -> bool:
+        """Whether to call verbose callbacks even if verbose is False."""
+        return True
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        """Collect token usage."""
+        with self._lock:
+            before = [getattr(self.handler, field) for field in USAGE_FIELDS]
+            self.handler.on_llm_end(response, **kwargs)
+            usage = {
+                field: getattr(self.handler, field) - previous
+                for field, previous in zip(USAGE_FIELDS, before)
+            }
+
+        self.add_usage(usage)
+
+    def add_usage(self, usage: dict) -> None:
+        """
+        Adds token usage to this scope and to its enclosing scopes.
+
+        Args:
+            usage (dict): The increment of each field of `USAGE_FIELDS`.
+        """
+        scope = self
+        while scope is not None:
+            with scope._lock:
+                for field in USAGE_FIELDS:
+                    setattr(scope, field, getattr(scope, field) + usage[field])
+            scope = scope.parent
+
+    def __copy__(self) -> "UsageScopeHandler":
+        """Return a copy of the callback handler."""
+        return self
+
+    def __deepcopy__(self, memo: Any) -> "UsageScopeHandler":
+        """Return a deep copy of the callback handler."""
+        return self
+
+
+usage_scope: ContextVar[Optional[UsageScopeHandler]] = ContextVar(
+    "usage_scope", default=None
+)
+register_configure_hook(usage_scope, True)
 
 
 class CustomLLMCallbackManager:
     """
-    CustomLLMCallbackManager class provides a mechanism to acquire a callback for LLM models
-    in an exclusive, thread-safe manner.
+    CustomLLMCallbackManager class provides the callback tracking the token usage
+    of a node execution for LLM models.
 
-    Attributes:
-    _lock (threading.Lock): Ensures that only one callback can be acquired at a time.
+    The active callback is stored in a context variable, which asyncio tasks and
+    worker threads started with a copied context inherit, so concurrent graph
+    executions each account for their own LLM calls without any locking.
 
     Methods:
-    exclusive_get_callback: A context manager that yields the appropriate callback based on
-    the LLM model and its name, ensuring exclusive access to the callback.
+    get_callback: A context manager that yields the usage scope of the LLM calls made
+    inside it, computed with the callback matching the LLM model and its name.
     """
 
-    _lock = threading.Lock()
+    @staticmethod
+    def _create_handler(llm_model, llm_model_name) -> BaseCallbackHandler:
+        if is_model_instance(llm_model, "ChatOpenAI", "AzureChatOpenAI"):
+            from langchain_community.callbacks.manager import OpenAICallbackHandler
+
+            return OpenAICallbackHandler()
+
+        if (
+            is_model_instance(llm_model, "ChatBedrock")
+            and llm_model_name is not None
+            and "claude" in llm_model_name
+        ):
+            from langchain_community.callbacks.manager import (
+                BedrockAnthropicTokenUsageCallbackHandler,
+            )
+
+            return BedrockAnthropicTokenUsageCallbackHandler()
+
+        return CustomCallbackHandler(llm_model_name)
 
     @contextmanager
-    def exclusive_get_callback(self, llm_model, llm_model_name):
+    def get_callback(self, llm_model, llm_model_name):
         """
-        Provides an exclusive callback for the LLM model in a thread-safe manner.
+        Provides the callback of the LLM model, scoped to the current context.
 
         Args:
             llm_model: The LLM model instance (e.g., ChatOpenAI, AzureChatOpenAI, ChatBedrock).
             llm_model_name (str): The name of the LLM model, used for model-specific callbacks.
 
         Yields:
-            The appropriate callback for the LLM model, or None if the lock is unavailable.
+            UsageScopeHandler: The token usage of the LLM calls made inside the context,
+            including those of nested scopes.
         """
-        if CustomLLMCallbackManager._lock.acquire(blocking=False):
-            try:
-                if isinstance(llm_model, ChatOpenAI) or isinstance(
-                    llm_model, AzureChatOpenAI
-                ):
-                    with get_openai_callback() as cb:
-                        yield cb
-                elif (
-                    isinstance(llm_model, ChatBedrock)
-                    and llm_model_name is not None
-                    and "claude" in llm_model_name
-                ):
-                    with get_bedrock_anthropic_callback() as cb:
-                        yield cb
-                else:
-                    with get_custom_callback(llm_model_name) as cb:
-                        yield cb
-            finally:
-                CustomLLMCallbackManager._lock.release()
-        else:
-            yield None
+        cb = UsageScopeHandler(
+            self._create_handler(llm_model, llm_model_name), parent=usage_scope.get()
+        )
+        token = usage_scope.set(cb)
+        try:
+            yield cb
+        finally:
+            usage_scope.reset(token)
+
+    # Kept for backward compatibility, callbacks are no longer exclusive
+    exclusive_get_callback = get_callback
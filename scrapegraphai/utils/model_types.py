@@ -0,0 +1,50 @@
+"""
+Import-free type checks for provider specific chat models
+"""
+
+from typing import Any
+
+# Provider chat model classes and the package defining them
+PROVIDER_CLASSES = {
+    "ChatOpenAI": "langchain_openai",
+    "AzureChatOpenAI": "langchain_openai",
+    "ChatMistralAI": "langchain_mistralai",
+    "ChatBedrock": "langchain_aws",
+    "ChatOllama": "langchain_community",
+}
+
+
+def is_model_instance(llm_model: Any, *class_names: str) -> bool:
+    """
+    Checks whether a model is an instance of one of the given provider chat
+    model classes, like `isinstance`, but by looking up the class hierarchy of
+    the model instead of importing the provider packages.
+
+    Args:
+        llm_model: The model instance to check.
+        *class_names (str): Names of the classes in `PROVIDER_CLASSES`.
+
+    Returns:
+        bool: True if the model is an instance of one of the classes.
+
+    Raises:
+        ValueError: If a class name is not a known provider class.
+
+    Example:
+        >>> is_model_instance(llm_model, "ChatOpenAI", "ChatMistralAI")
+        True
+    """
+    targets = set()
+    for class_name in class_names:
+        if class_name not in PROVIDER_CLASSES:
+            raise ValueError(f"Unknown provider model class: {class_name}")
+        targets.add((class_name, PROVIDER_CLASSES[class_name]))
+
+    classes = {type(llm_model), getattr(llm_model, "__class__", type(llm_model))}
+    for cls in classes:
+        for base in getattr(cls, "__mro__", ()):
+            package = base.__module__.split(".", 1)[0]
+            if (base.__name__, package) in targets:
+                return True
+
+    return False
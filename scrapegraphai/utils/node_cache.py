@@ -0,0 +1,245 @@
+"""
+Content-addressed on-disk cache for node results
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import struct
+import tempfile
+import threading
+import time
+from typing import Any, Optional
+
+from langchain_core.documents import Document
+from pydantic import BaseModel
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_SIZE = 512 * 1024 * 1024
+
+# Node attributes and config entries that do not influence a node's output
+IGNORED_CONFIG_KEYS = {"verbose", "cache_path", "timeout", "headless"}
+
+# Entries start with their creation time, read without unpickling them
+_CREATED = struct.Struct("<d")
+
+
+def _serialize(obj: Any) -> Any:
+    """
+    JSON fallback used to hash state and node config values.
+
+    Raises:
+        TypeError: If the object has no stable representation, which disables
+                   caching for that execution instead of risking a false hit.
+    """
+    if isinstance(obj, Document):
+        return {"page_content": obj.page_content, "metadata": obj.metadata}
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, type) and hasattr(obj, "model_json_schema"):
+        return obj.model_json_schema()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    for attr in ("model_name", "model", "model_id"):
+        model_name = getattr(obj, attr, None)
+        if isinstance(model_name, str):
+            return {
+                "class": f"{type(obj).__module__}.{type(obj).__qualname__}",
+                "model": model_name,
+                "temperature": getattr(obj, "temperature", None),
+            }
+    raise TypeError(f"Object of type {type(obj).__name__} is not cacheable")
+
+
+class NodeCache:
+    """
+    Stores the state updates produced by deterministic nodes on disk, keyed by
+    a hash of the node type, its configuration and the input state slice it reads.
+    Entries expire `ttl` seconds after they were stored and the least recently
+    used ones are evicted once the cache grows beyond `max_size` bytes. The
+    modification time of an entry file is its last use.
+
+    Attributes:
+        cache_dir (str): Directory holding the cache entries.
+        max_size (int): Maximum total size of the cache in bytes.
+        ttl (Optional[float]): Time to live of an entry in seconds; None disables expiry.
+
+    Args:
+        cache_path (str): Base cache directory; entries are stored in its `nodes` folder.
+        max_size (int, optional): Maximum total size of the cache in bytes.
+        ttl (Optional[float], optional): Time to live of an entry in seconds.
+
+    Example:
+        >>> cache = NodeCache("./cache", ttl=3600)
+        >>> key = cache.make_key(fetch_node, state)
+        >>> cache.store(key, {"doc": document})
+        >>> cache.load(key)
+        {'doc': document}
+    """
+
+    def __init__(
+        self,
+        cache_path: str,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: Optional[float] = None,
+    ):
+        self.cache_dir = os.path.join(os.fspath(cache_path), "nodes")
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def make_key(self, node, state: dict) -> Optional[str]:
+        """
+        Computes the cache key of a node execution.
+
+        Args:
+            node (BaseNode): The node about to be executed.
+            state (dict): The current state of the graph.
+
+        Returns:
+            Optional[str]: The hex digest of the execution, or None if the node
+            is not cacheable or its inputs cannot be hashed reliably.
+        """
+        if not getattr(node, "cacheable", False):
+            return None
+
+        try:
+            input_keys = node.get_input_keys(state)
+        except ValueError:
+            return None
+
+        config = {
+            key: value
+            for key, value in (node.node_config or {}).items()
+            if key not in IGNORED_CONFIG_KEYS
+        }
+        payload = {
+            "node": f"{type(node).__module__}.{type(node).__qualname__}",
+            "node_name": node.node_name,
+            "input": node.input,
+            "output": node.output,
+            "llm_model": getattr(node, "llm_model", None),
+            "config": config,
+            "state": {key: state[key] for key in input_keys},
+        }
+
+        try:
+            serialized = json.dumps(payload, sort_keys=True, default=_serialize)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Skipping cache for {node.node_name}: {e}")
+            return None
+
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def load(self, key: str) -> Optional[dict]:
+        """
+        Returns the cached state updates for a key, or None on a miss.
+
+        Args:
+            key (str): The cache key returned by `make_key`.
+
+        Returns:
+            Optional[dict]: The cached state updates.
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                (created,) = _CREATED.unpack(f.read(_CREATED.size))
+                if self._expired(created):
+                    self._remove(path)
+                    return None
+                updates = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Discarding unreadable cache entry {key}: {e}")
+            self._remove(path)
+            return None
+
+        # Touch the entry so that eviction follows least recently used order
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return updates
+
+    def store(self, key: str, updates: dict):
+        """
+        Stores the state updates of a node execution and evicts old entries
+        if the cache exceeds its maximum size.
+
+        Args:
+            key (str): The cache key returned by `make_key`.
+            updates (dict): The state keys added or replaced by the node.
+        """
+        try:
+            data = _CREATED.pack(time.time()) + pickle.dumps(updates)
+        except Exception as e:
+            logger.debug(f"Skipping cache store for {key}: {e}")
+            return
+
+        if len(data) > self.max_size:
+            return
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._entry_path(key))
+        except OSError as e:
+            logger.debug(f"Failed to write cache entry {key}: {e}")
+            self._remove(tmp_path)
+            return
+
+        self._evict()
+
+    def clear(self):
+        """Removes every entry from the cache."""
+        for name in os.listdir(self.cache_dir):
+            self._remove(os.path.join(self.cache_dir, name))
+
+    def _expired(self, created: float) -> bool:
+        return self.ttl is not None and time.time() - created > self.ttl
+
+    def _evict(self):
+        """Removes expired entries, then the least recently used ones above max_size."""
+        with self._lock:
+            entries = []
+            for name in os.listdir(self.cache_dir):
+                if not name.endswith(".pkl"):
+                    continue
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                    if self.ttl is not None:
+                        with open(path, "rb") as f:
+                            (created,) = _CREATED.unpack(f.read(_CREATED.size))
+                        if self._expired(created):
+                            self._remove(path)
+                            continue
+                except (OSError, struct.error):
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_size <= self.max_size:
+                    break
+                self._remove(path)
+                total_size -= size
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
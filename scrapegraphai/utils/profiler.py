@@ -0,0 +1,298 @@
+"""
+CPU and memory profiling of node executions
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TOP_N = 15
+
+_tracemalloc_lock = threading.Lock()
+_tracemalloc_users = 0
+
+# The profile of an asynchronously executed node, taken over by the worker
+# thread running its synchronous `execute`
+_worker_profile: ContextVar[Optional[tuple]] = ContextVar(
+    "worker_profile", default=None
+)
+
+
+def _start_tracemalloc() -> bool:
+    """Starts tracemalloc for a profiled node, returns False if it was started elsewhere."""
+    global _tracemalloc_users
+
+    with _tracemalloc_lock:
+        if _tracemalloc_users == 0 and tracemalloc.is_tracing():
+            return False
+        if _tracemalloc_users == 0:
+            tracemalloc.start()
+        _tracemalloc_users += 1
+        tracemalloc.reset_peak()
+        return True
+
+
+def _stop_tracemalloc():
+    global _tracemalloc_users
+
+    with _tracemalloc_lock:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0:
+            tracemalloc.stop()
+
+
+def deep_sizeof(obj: Any, max_objects: int = 100_000) -> int:
+    """
+    Approximates the memory held by an object and the objects it references.
+
+    Args:
+        obj (Any): The object to measure, usually the graph state.
+        max_objects (int): Stops counting after this many objects, so that huge
+                           states do not make profiling itself slow.
+
+    Returns:
+        int: The approximate size in bytes.
+    """
+    seen = set()
+    stack = [obj]
+    size = 0
+
+    while stack and len(seen) < max_objects:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+
+        try:
+            size += sys.getsizeof(current)
+        except TypeError:
+            continue
+
+        if isinstance(current, (str, bytes, bytearray, int, float, bool)):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__"):
+            stack.append(vars(current))
+
+    return size
+
+
+class NodeProfiler:
+    """
+    Profiles the execution of graph nodes with cProfile and tracemalloc, to
+    find out whether a slow run is spent parsing, chunking or waiting on the LLM.
+
+    The CPU profile only covers the thread running the node: nodes executed
+    concurrently by the parallel executor are profiled separately, but their
+    memory peaks overlap since tracemalloc traces the whole process. Nodes of
+    nested graphs are reported as part of the node running them. In async runs,
+    `profile_async` hands the profile over to the worker thread of nodes whose
+    `execute` runs in `asyncio.to_thread`, instead of measuring the event loop.
+
+    Attributes:
+        top_n (int): Number of functions reported per node.
+        output_dir (Optional[str]): Directory where the `.prof` and `.json`
+                                    files of each node are written, if any.
+
+    Args:
+        top_n (int, optional): Number of functions reported per node.
+        output_dir (Optional[str], optional): Directory for the profile dumps.
+
+    Example:
+        >>> profiler = NodeProfiler(top_n=5)
+        >>> with profiler.profile(node, state) as report:
+        ...     node.execute(state)
+        >>> report["peak_memory_bytes"]
+        1843200
+    """
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N, output_dir: Optional[str] = None):
+        self.top_n = top_n
+        self.output_dir = os.fspath(output_dir) if output_dir else None
+        if self.output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+
+    @classmethod
+    def from_config(cls, profile) -> Optional["NodeProfiler"]:
+        """
+        Creates a profiler from the `profile` option of a graph config.
+
+        Args:
+            profile: False to disable profiling, True for the defaults or a dict
+                     with the `top_n` and `output_dir` keys.
+
+        Returns:
+            Optional[NodeProfiler]: The profiler, or None if profiling is disabled.
+        """
+        if not profile:
+            return None
+        if profile is True:
+            return cls()
+        if isinstance(profile, dict):
+            return cls(
+                top_n=profile.get("top_n", DEFAULT_TOP_N),
+                output_dir=profile.get("output_dir"),
+            )
+        raise ValueError("The profile option must be a boolean or a dictionary.")
+
+    @contextmanager
+    def profile(self, node, state: dict):
+        """
+        Profiles the code executed inside the context.
+
+        Args:
+            node (BaseNode): The node being executed.
+            state (dict): The state of the graph, measured once the node completes.
+
+        Yields:
+            dict: The report of the node, filled in when the context exits, with
+            the keys cpu_time, peak_memory_bytes, state_size_bytes, top_functions
+            and the paths of the dump files.
+        """
+        report = {}
+        profiler = cProfile.Profile()
+        tracing = _start_tracemalloc()
+        # A node of a nested graph may run while its parent node is profiled
+        cpu_profiled = sys.getprofile() is None
+        if cpu_profiled:
+            try:
+                profiler.enable()
+            except ValueError:
+                cpu_profiled = False
+
+        start = time.thread_time()
+        try:
+            yield report
+        finally:
+            cpu_time = time.thread_time() - start
+            if cpu_profiled:
+                profiler.disable()
+            peak = None
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1]
+                _stop_tracemalloc()
+
+            report.update(
+                {
+                    "cpu_time": cpu_time,
+                    "peak_memory_bytes": peak,
+                    "state_size_bytes": deep_sizeof(state),
+                    "top_functions": (
+                        self._top_functions(profiler) if cpu_profiled else []
+                    ),
+                }
+            )
+            if self.output_dir:
+                self._dump(node, profiler if cpu_profiled else None, report)
+
+    @contextmanager
+    def profile_async(self, node, state: dict):
+        """
+        Profiles a node executed by `await node.aexecute(state)`.
+
+        Nodes running their synchronous `execute` in a worker thread through
+        `run_profiled` are profiled in that thread; natively asynchronous
+        nodes are profiled on the event loop thread.
+
+        Args:
+            node (BaseNode): The node being executed.
+            state (dict): The state of the graph, measured once the node completes.
+
+        Yields:
+            dict: The report of the node, as for `profile`.
+        """
+        report = {}
+        token = _worker_profile.set((self, node, state, report))
+        try:
+            with self.profile(node, state) as loop_report:
+                yield report
+        finally:
+            _worker_profile.reset(token)
+        if not report:
+            report.update(loop_report)
+
+    def _top_functions(self, profiler: cProfile.Profile) -> list:
+        """Returns the functions with the highest cumulative time."""
+        stats = pstats.Stats(profiler).stats
+        entries = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)
+
+        top_functions = []
+        for (filename, line, name), (_, calls, total, cumulative, _) in entries:
+            if "_lsprof" in name:
+                continue
+            location = name if filename == "~" else f"{filename}:{line}({name})"
+            top_functions.append(
+                {
+                    "function": location,
+                    "calls": calls,
+                    "total_time": total,
+                    "cumulative_time": cumulative,
+                }
+            )
+            if len(top_functions) == self.top_n:
+                break
+
+        return top_functions
+
+    def _dump(self, node, profiler: Optional[cProfile.Profile], report: dict):
+        """Writes the profile of a node to `.prof` and `.json` files."""
+        name = re.sub(r"[^\w.-]", "_", node.node_name)
+        base_path = os.path.join(
+            self.output_dir, f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{id(report):x}"
+        )
+
+        try:
+            if profiler is not None:
+                profiler.dump_stats(f"{base_path}.prof")
+                report["prof_path"] = f"{base_path}.prof"
+            report["json_path"] = f"{base_path}.json"
+            with open(report["json_path"], "w", encoding="utf-8") as f:
+                json.dump({"node_name": node.node_name, **report}, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not write the profile of {node.node_name}: {e}")
+
+
+def run_profiled(func: Callable, *args) -> Any:
+    """
+    Runs a function in the current thread, within the profile of the node
+    executing it asynchronously, if any. Nodes call it from their worker thread,
+    as in `asyncio.to_thread(run_profiled, self.execute, state)`.
+
+    Args:
+        func (Callable): The function, usually the `execute` method of a node.
+        *args: Its arguments.
+
+    Returns:
+        Any: The result of the function.
+    """
+    pending = _worker_profile.get()
+    if pending is None:
+        return func(*args)
+
+    profiler, node, state, report = pending
+    # Nodes nested in the function are profiled as part of it
+    token = _worker_profile.set(None)
+    try:
+        with profiler.profile(node, state) as worker_report:
+            result = func(*args)
+    finally:
+        _worker_profile.reset(token)
+    report.update(worker_report)
+    return result
@@ -2,16 +2,30 @@
 Module for rotating proxies
 """
 
+import asyncio
+import concurrent.futures
 import ipaddress
+import json
 import random
 import re
-from typing import List, Optional, Set, TypedDict
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Set, TypedDict, Union
 from urllib.parse import urlparse
 
+import httpx
 import requests
 from fp.errors import FreeProxyException
 from fp.fp import FreeProxy
 
+from .logging import get_logger
+
+logger = get_logger("proxy-pool")
+
+# Lightweight page fetched through each candidate to check it works
+DEFAULT_PROBE_URL = "https://www.gstatic.com/generate_204"
+
 
 class ProxyBrokerCriteria(TypedDict, total=False):
     """
@@ -209,3 +223,348 @@ def parse_or_search_proxy(proxy: Proxy) -> ProxySettings:
     assert proxy["server"] == "broker", f"Unknown proxy server type: {proxy['server']}"
 
     return _search_proxy(proxy)
+
+
+class _ProxyStats:
+    """The health record of a proxy of a pool."""
+
+    __slots__ = ("settings", "successes", "failures", "consecutive_failures", "latency")
+
+    def __init__(self, settings: ProxySettings):
+        self.settings = settings
+        self.successes = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.latency: Optional[float] = None
+
+    @property
+    def success_rate(self) -> float:
+        # Laplace smoothing keeps new proxies from scoring 0 or 1 outright
+        return (self.successes + 1) / (self.successes + self.failures + 2)
+
+
+class ProxyPool:
+    """
+    A pool of proxies checked concurrently, scored by their success rate and
+    latency, and rotated on every request.
+
+    Candidates come from the given proxies or, without any, from the FreeProxy
+    broker. They are all probed at the same time on first use; the working ones
+    join the pool and each request picks one of them at random, weighted by
+    its success rate and the inverse of its latency. The fetchers report the
+    outcome of every request, and proxies failing too often are evicted, so
+    that bad proxies stop costing retries. When no proxy is left, the
+    candidates are searched and probed again.
+
+    Attributes:
+        probe_url (str): The URL fetched through the candidates to check them.
+        probe_timeout (float): Timeout of a probe in seconds.
+        max_consecutive_failures (int): Failures in a row evicting a proxy.
+        min_success_rate (float): Success rate below which a proxy is evicted,
+            once it served `min_requests` requests.
+        min_requests (int): Requests served before the success rate is trusted.
+        latency_smoothing (float): Weight of the last latency in the moving
+            average of a proxy.
+
+    Args:
+        proxies (Optional[List[Union[str, ProxySettings]]]): The candidate proxy
+            servers or their Playwright style settings; None searches the broker.
+        criteria (Optional[dict]): The `ProxyBrokerCriteria` of the broker
+            search, with `max_candidates` (20) to probe.
+
+    Example:
+        >>> pool = ProxyPool(["http://10.0.0.1:3128", "http://10.0.0.2:3128"])
+        >>> proxy = pool.get()
+        >>> pool.report(proxy, success=True, latency=0.4)
+    """
+
+    def __init__(
+        self,
+        proxies: Optional[List[Union[str, ProxySettings]]] = None,
+        criteria: Optional[dict] = None,
+        probe_url: str = DEFAULT_PROBE_URL,
+        probe_timeout: float = 5.0,
+        max_consecutive_failures: int = 3,
+        min_success_rate: float = 0.5,
+        min_requests: int = 5,
+        latency_smoothing: float = 0.3,
+    ):
+        if max_consecutive_failures < 1 or min_requests < 1:
+            raise ValueError("Proxy failure and request thresholds must be at least 1.")
+        if not 0 < latency_smoothing <= 1:
+            raise ValueError("latency_smoothing must be in (0, 1].")
+
+        self._candidates = [
+            {"server": proxy} if isinstance(proxy, str) else _parse_proxy(proxy)
+            for proxy in proxies or []
+        ]
+        self.criteria = dict(criteria or {})
+        self.probe_url = probe_url
+        self.probe_timeout = probe_timeout
+        self.max_consecutive_failures = max_consecutive_failures
+        self.min_success_rate = min_success_rate
+        self.min_requests = min_requests
+        self.latency_smoothing = latency_smoothing
+        self._proxies: Dict[str, _ProxyStats] = {}
+        self._lock = threading.Lock()
+        # Held while probing, so that concurrent requests wait for a single probe
+        self._probe_lock = threading.Lock()
+
+    def _search_candidates(self) -> List[ProxySettings]:
+        """Lists the candidates of the broker, without checking them one by one."""
+        criteria = dict(self.criteria)
+        max_candidates = criteria.pop("max_candidates", 20)
+        search_outside = criteria.pop("search_outside_if_empty", True)
+        broker = FreeProxy(
+            anonym=criteria.get("anonymous", True),
+            country_id=criteria.get("countryset"),
+            elite=True,
+            https=criteria.get("secure", False),
+            timeout=criteria.get("timeout", self.probe_timeout),
+        )
+        addresses = broker.get_proxy_list(search_outside)
+        random.shuffle(addresses)
+        return [
+            {"server": f"http://{address}"} for address in addresses[:max_candidates]
+        ]
+
+    def _probe_one(self, settings: ProxySettings) -> _ProxyStats:
+        # Imported here, the fetch layer itself depends on the utils
+        from ..docloaders.http_fetcher import get_http_fetcher
+
+        stats = _ProxyStats(settings)
+        start = time.monotonic()
+        try:
+            response = get_http_fetcher().fetch(
+                self.probe_url, timeout=self.probe_timeout, proxy=settings
+            )
+            success = response.status_code < 400
+        except httpx.HTTPError:
+            success = False
+        if success:
+            stats.successes = 1
+            stats.latency = time.monotonic() - start
+        else:
+            stats.failures = 1
+        return stats
+
+    def probe(self, proxies: Optional[List[Union[str, ProxySettings]]] = None) -> int:
+        """
+        Probes candidate proxies concurrently and adds the working ones to the pool.
+
+        Args:
+            proxies (Optional[List[Union[str, ProxySettings]]]): The candidates
+                to probe; by default the proxies given to the pool, or those
+                found by the broker.
+
+        Returns:
+            int: The number of working proxies in the pool.
+        """
+        if proxies is not None:
+            candidates = [
+                {"server": proxy} if isinstance(proxy, str) else _parse_proxy(proxy)
+                for proxy in proxies
+            ]
+        else:
+            candidates = self._candidates or self._search_candidates()
+
+        with self._lock:
+            candidates = [c for c in candidates if c["server"] not in self._proxies]
+        if candidates:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(32, len(candidates)), thread_name_prefix="proxy-probe"
+            ) as executor:
+                probed = list(executor.map(self._probe_one, candidates))
+        else:
+            probed = []
+
+        with self._lock:
+            for stats in probed:
+                if stats.successes:
+                    self._proxies[stats.settings["server"]] = stats
+            working = len(self._proxies)
+        _release([stats.settings for stats in probed if not stats.successes])
+        logger.info(f"{working} working proxies after probing {len(probed)} candidates")
+        return working
+
+    async def aprobe(
+        self, proxies: Optional[List[Union[str, ProxySettings]]] = None
+    ) -> int:
+        """Asynchronous version of `probe`."""
+        return await asyncio.to_thread(self.probe, proxies)
+
+    def get(self) -> ProxySettings:
+        """
+        Picks the proxy of a request, weighted by success rate and latency.
+
+        Returns:
+            ProxySettings: The Playwright style settings of the proxy.
+
+        Raises:
+            ValueError: If no candidate proxy works.
+        """
+        with self._lock:
+            proxies = list(self._proxies.values())
+        if not proxies:
+            with self._probe_lock:
+                with self._lock:
+                    empty = not self._proxies
+                if empty:
+                    self.probe()
+            with self._lock:
+                proxies = list(self._proxies.values())
+            if not proxies:
+                raise ValueError("No working proxy found for the proxy pool.")
+
+        weights = [
+            stats.success_rate**2 / max(stats.latency or self.probe_timeout, 0.05)
+            for stats in proxies
+        ]
+        return dict(random.choices(proxies, weights)[0].settings)
+
+    async def aget(self) -> ProxySettings:
+        """Asynchronous version of `get`, probing the candidates off the event loop."""
+        with self._lock:
+            probed = bool(self._proxies)
+        return self.get() if probed else await asyncio.to_thread(self.get)
+
+    def report(
+        self,
+        proxy: Union[str, ProxySettings],
+        success: bool,
+        latency: Optional[float] = None,
+    ):
+        """
+        Records the outcome of a request sent through a proxy, evicting the
+        proxy if it fails too often.
+
+        Args:
+            proxy (Union[str, ProxySettings]): The proxy, or its server.
+            success (bool): Whether the proxy delivered a response.
+            latency (Optional[float]): The duration of the request in seconds.
+        """
+        server = proxy if isinstance(proxy, str) else proxy["server"]
+        evicted = None
+        with self._lock:
+            stats = self._proxies.get(server)
+            if stats is None:
+                return
+            if success:
+                stats.successes += 1
+                stats.consecutive_failures = 0
+                if latency is not None:
+                    stats.latency = (
+                        latency
+                        if stats.latency is None
+                        else self.latency_smoothing * latency
+                        + (1 - self.latency_smoothing) * stats.latency
+                    )
+                return
+
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            requests_served = stats.successes + stats.failures
+            if stats.consecutive_failures >= self.max_consecutive_failures or (
+                requests_served >= self.min_requests
+                and stats.success_rate < self.min_success_rate
+            ):
+                evicted = self._proxies.pop(server)
+                logger.info(
+                    f"Evicted proxy {server} after {stats.failures} failures "
+                    f"in {requests_served} requests"
+                )
+        if evicted is not None:
+            _release([evicted.settings])
+
+    @contextmanager
+    def rotate(self) -> Iterator[ProxySettings]:
+        """
+        Picks the proxy of a request and reports its outcome: a failure if the
+        block raises, its latency otherwise.
+
+        Yields:
+            ProxySettings: The Playwright style settings of the proxy.
+        """
+        proxy = self.get()
+        start = time.monotonic()
+        try:
+            yield proxy
+        except Exception:
+            self.report(proxy, success=False)
+            raise
+        self.report(proxy, success=True, latency=time.monotonic() - start)
+
+    @asynccontextmanager
+    async def arotate(self) -> AsyncIterator[ProxySettings]:
+        """Asynchronous version of `rotate`."""
+        proxy = await self.aget()
+        start = time.monotonic()
+        try:
+            yield proxy
+        except Exception:
+            self.report(proxy, success=False)
+            raise
+        self.report(proxy, success=True, latency=time.monotonic() - start)
+
+    def stats(self) -> List[dict]:
+        """Returns the success counts and latency of the proxies of the pool."""
+        with self._lock:
+            return [
+                {
+                    "server": server,
+                    "successes": stats.successes,
+                    "failures": stats.failures,
+                    "success_rate": stats.success_rate,
+                    "latency": stats.latency,
+                }
+                for server, stats in self._proxies.items()
+            ]
+
+
+def _release(proxies: List[ProxySettings]):
+    """Closes the HTTP connections of proxies rejected or evicted by a pool."""
+    if not proxies:
+        return
+
+    from ..docloaders.http_fetcher import get_http_fetcher
+
+    fetcher = get_http_fetcher()
+    for proxy in proxies:
+        fetcher.release_proxy(proxy)
+
+
+# Pools shared by the process, keyed by their settings
+_shared_pools: Dict[str, ProxyPool] = {}
+_shared_pool_lock = threading.Lock()
+
+
+def get_proxy_pool(option: Union[bool, dict, ProxyPool, None]) -> Optional[ProxyPool]:
+    """
+    Resolves the `proxy_pool` option of the loaders.
+
+    Args:
+        option: None or False to disable the pool, True to use the pool shared by
+                the process, a dict with the settings of a pool shared by the
+                loaders passing the same settings, or a ProxyPool.
+
+    Returns:
+        Optional[ProxyPool]: The pool to use, if any.
+
+    Raises:
+        ValueError: If the option has an unsupported type.
+    """
+    if not option:
+        return None
+    if isinstance(option, ProxyPool):
+        return option
+    if option is not True and not isinstance(option, dict):
+        raise ValueError(
+            "The proxy_pool option must be a boolean, a dictionary or a ProxyPool."
+        )
+
+    settings = option if isinstance(option, dict) else {}
+    key = json.dumps(settings, sort_keys=True, default=str)
+    with _shared_pool_lock:
+        if key not in _shared_pools:
+            _shared_pools[key] = ProxyPool(**settings)
+        return _shared_pools[key]
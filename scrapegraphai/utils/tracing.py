@@ -0,0 +1,348 @@
+"""
+Span tracing of graph executions, exportable as Chrome trace or OTLP-JSON files
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+TRACE_FORMATS = ("chrome", "otlp")
+
+
+class Span:
+    """
+    A timed operation of a traced execution, such as a node or an LLM call.
+
+    Attributes:
+        name (str): The name of the operation.
+        category (str): The kind of operation (graph, node, llm, fetch, ...).
+        span_id (str): The 16 hex digits identifier of the span.
+        parent_id (Optional[str]): The identifier of the enclosing span.
+        start_ns (int): Start time in nanoseconds since the epoch.
+        end_ns (Optional[int]): End time in nanoseconds since the epoch.
+        attributes (dict): Additional information about the operation.
+        error (Optional[str]): The exception that ended the span, if any.
+        lane (int): The thread or asyncio task the span ran in.
+    """
+
+    __slots__ = (
+        "name",
+        "category",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "error",
+        "lane",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        category: str,
+        parent_id: Optional[str],
+        attributes: dict,
+        lane: int,
+    ):
+        self.name = name
+        self.category = category
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = attributes
+        self.error = None
+        self.lane = lane
+
+    def set_attribute(self, key: str, value: Any):
+        """Adds an attribute to the span."""
+        self.attributes[key] = value
+
+
+class Tracer:
+    """
+    Collects the spans of an execution so that its timeline can be inspected,
+    e.g. to spot chunks serialised behind a rate limiter.
+
+    The spans opened with `span` while the tracer is active (see `use_tracer`)
+    are recorded, including those of asyncio tasks and of worker threads started
+    with a copy of the current context.
+
+    Attributes:
+        trace_id (str): The 32 hex digits identifier of the trace.
+        spans (List[Span]): The completed spans, in completion order.
+
+    Example:
+        >>> tracer = Tracer()
+        >>> with use_tracer(tracer), span("fetch", category="fetch", url=url):
+        ...     html = fetch(url)
+        >>> tracer.export("trace.json", "chrome")
+    """
+
+    def __init__(self):
+        self.trace_id = os.urandom(16).hex()
+        self.spans: List[Span] = []
+        self._lanes = {}
+        self._lock = threading.Lock()
+
+    def _get_lane(self) -> int:
+        """Returns the lane of the current thread or asyncio task."""
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+
+        thread = threading.current_thread()
+        key = (thread.ident, id(task) if task is not None else None)
+        with self._lock:
+            if key not in self._lanes:
+                label = (
+                    thread.name if task is None else f"{thread.name}/{task.get_name()}"
+                )
+                self._lanes[key] = (len(self._lanes) + 1, label)
+            return self._lanes[key][0]
+
+    def _add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def to_chrome(self) -> dict:
+        """
+        Returns the trace in the Chrome trace event format, viewable in Perfetto
+        or chrome://tracing. Every thread and asyncio task gets its own track.
+        """
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+            lanes = list(self._lanes.values())
+
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": lane,
+                "args": {"name": label},
+            }
+            for lane, label in lanes
+        ]
+        for span in sorted(spans, key=lambda span: span.start_ns):
+            args = {key: _to_json(value) for key, value in span.attributes.items()}
+            if span.error is not None:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_ns / 1000,
+                    "dur": (span.end_ns - span.start_ns) / 1000,
+                    "pid": pid,
+                    "tid": span.lane,
+                    "args": args,
+                }
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_otlp(self) -> dict:
+        """
+        Returns the trace in the OTLP-JSON format, accepted by the OpenTelemetry
+        collector file receiver and by tracing backends such as Jaeger.
+        """
+        with self._lock:
+            spans = list(self.spans)
+
+        otlp_spans = []
+        for span in spans:
+            otlp_span = {
+                "traceId": self.trace_id,
+                "spanId": span.span_id,
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(span.start_ns),
+                "endTimeUnixNano": str(span.end_ns),
+                "attributes": [
+                    {"key": key, "value": _to_otlp_value(value)}
+                    for key, value in {
+                        "category": span.category,
+                        **span.attributes,
+                    }.items()
+                ],
+                "status": (
+                    {"code": 2, "message": span.error}
+                    if span.error is not None
+                    else {"code": 1}
+                ),
+            }
+            if span.parent_id is not None:
+                otlp_span["parentSpanId"] = span.parent_id
+            otlp_spans.append(otlp_span)
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {
+                                "key": "service.name",
+                                "value": {"stringValue": "scrapegraphai"},
+                            }
+                        ]
+                    },
+                    "scopeSpans": [
+                        {"scope": {"name": "scrapegraphai"}, "spans": otlp_spans}
+                    ],
+                }
+            ]
+        }
+
+    def export(self, path: str, trace_format: str = "chrome"):
+        """
+        Writes the trace to a JSON file.
+
+        Args:
+            path (str): The path of the file.
+            trace_format (str): Either "chrome" or "otlp".
+
+        Raises:
+            ValueError: If the format is not supported.
+        """
+        if trace_format not in TRACE_FORMATS:
+            raise ValueError(
+                f"Unsupported trace format '{trace_format}', "
+                f"expected one of {', '.join(TRACE_FORMATS)}."
+            )
+
+        trace = self.to_chrome() if trace_format == "chrome" else self.to_otlp()
+        directory = os.path.dirname(os.fspath(path))
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f)
+        logger.info(f"Trace written to {path}")
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
+
+
+def _to_otlp_value(value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+_active_tracer: ContextVar[Optional[Tracer]] = ContextVar("tracer", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("span", default=None)
+
+
+def get_tracer() -> Optional[Tracer]:
+    """Returns the tracer active in the current context, if any."""
+    return _active_tracer.get()
+
+
+@contextmanager
+def use_tracer(tracer: Optional[Tracer]) -> Iterator[Optional[Tracer]]:
+    """
+    Activates a tracer in the current context; does nothing if it is None.
+
+    Args:
+        tracer (Optional[Tracer]): The tracer recording the spans.
+    """
+    if tracer is None:
+        yield None
+        return
+
+    token = _active_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _active_tracer.reset(token)
+
+
+@contextmanager
+def span(
+    name: str, category: str = "scrapegraphai", **attributes
+) -> Iterator[Optional[Span]]:
+    """
+    Records the code executed inside the context as a span of the active
+    tracer, nested in the current span. Does nothing when no tracer is active.
+
+    Args:
+        name (str): The name of the span.
+        category (str): The kind of operation.
+        **attributes: Additional information about the operation.
+
+    Yields:
+        Optional[Span]: The span, or None if tracing is disabled.
+    """
+    tracer = _active_tracer.get()
+    if tracer is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = Span(
+        name,
+        category,
+        parent.span_id if parent is not None else None,
+        attributes,
+        tracer._get_lane(),
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current_span.reset(token)
+        tracer._add(current)
+
+
+def traced_runnable(runnable, name: str, category: str = "llm", **attributes):
+    """
+    Wraps a langchain runnable so that each of its invocations is recorded as
+    a span. Returns the runnable unchanged when no tracer is active.
+
+    Args:
+        runnable (Runnable): The runnable to trace, e.g. a chunk chain.
+        name (str): The name of the spans.
+        category (str): The kind of operation.
+        **attributes: Additional information about the operation.
+
+    Returns:
+        Runnable: The traced runnable.
+    """
+    if _active_tracer.get() is None:
+        return runnable
+
+    from langchain_core.runnables import RunnableLambda
+
+    def _invoke(inputs, config):
+        with span(name, category, **attributes):
+            return runnable.invoke(inputs, config)
+
+    async def _ainvoke(inputs, config):
+        with span(name, category, **attributes):
+            return await runnable.ainvoke(inputs, config)
+
+    return RunnableLambda(_invoke, afunc=_ainvoke, name=name)
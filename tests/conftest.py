@@ -336,6 +336,17 @@ def mock_server_url(mock_server):
     return mock_server.get_url()
 
 
+@pytest.fixture
+def route_server():
+    """Start an HTTP server on a free port answering the routes set by the test."""
+    from tests.fixtures.mock_server.server import RouteServer
+
+    server = RouteServer()
+    server.start()
+    yield server
+    server.stop()
+
+
 @pytest.fixture
 def mock_website_url():
     """URL for the mock test website."""
@@ -11,7 +11,7 @@ This server provides:
 
 import json
 import time
-from http.server import BaseHTTPRequestHandler, HTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
 from pathlib import Path
 from threading import Thread
 from typing import Dict, Optional
@@ -345,3 +345,68 @@ class MockHTTPServer:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.stop()
+
+
+class RouteRequestHandler(BaseHTTPRequestHandler):
+    """Request handler serving the routes of a RouteServer."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        """Suppress default logging."""
+        pass
+
+    def do_GET(self):
+        """Answer with the route registered for the path, or a 404."""
+        server = self.server.route_server
+        path = urlparse(self.path).path
+        server.requests.append((path, dict(self.headers)))
+
+        route = server.routes.get(path, (404, {}, "Not Found"))
+        if callable(route):
+            route = route(self)
+        status, headers, body = route
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+
+        self.send_response(status)
+        headers = {"Content-Type": "text/html; charset=utf-8", **headers}
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class RouteServer:
+    """
+    HTTP server answering each path with a `(status, headers, body)` route,
+    or with a callable taking the request handler and returning one.
+    Every request is recorded as a `(path, headers)` tuple.
+    """
+
+    def __init__(self, host: str = "127.0.0.1"):
+        self.routes = {}
+        self.requests = []
+        self.server = ThreadingHTTPServer((host, 0), RouteRequestHandler)
+        self.server.route_server = self
+        self.host, self.port = self.server.server_address[:2]
+        self.thread = Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self):
+        """Start the server in a background thread."""
+        self.thread.start()
+
+    def stop(self):
+        """Stop the server."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join(timeout=1)
+
+    def get_url(self, path: str = "") -> str:
+        """Get full URL for a given path."""
+        return f"http://{self.host}:{self.port}{path}"
+
+    def paths(self):
+        """Returns the paths requested so far."""
+        return [path for path, _ in self.requests]
@@ -1,13 +1,20 @@
+import asyncio
+import importlib
 from unittest.mock import Mock, patch
 
 import pytest
 from langchain_aws import ChatBedrock
+from langchain_core.runnables import RunnableLambda
 from langchain_ollama import ChatOllama
 from langchain_openai import AzureChatOpenAI, ChatOpenAI
 
-from scrapegraphai.graphs import AbstractGraph, BaseGraph
+from scrapegraphai.docloaders import http_fetcher
+from scrapegraphai.docloaders.http_fetcher import HttpFetcher
+from scrapegraphai.graphs import AbstractGraph, BaseGraph, ScriptCreatorGraph
 from scrapegraphai.models import DeepSeek, OneApi
 from scrapegraphai.nodes import FetchNode, ParseNode
+from scrapegraphai.nodes.base_node import BaseNode
+from scrapegraphai.utils import CheckpointStore
 
 """
 Tests for the AbstractGraph.
@@ -314,3 +321,154 @@ class TestAbstractGraph:
         graph.execution_info = dummy_info
         info = graph.get_execution_info()
         assert info == dummy_info
+
+
+class ManyGraph(TestGraph):
+    running = 0
+    max_running = 0
+
+    async def arun(self) -> str:
+        ManyGraph.running += 1
+        ManyGraph.max_running = max(ManyGraph.max_running, ManyGraph.running)
+        await asyncio.sleep(0.01 if self.source.endswith("slow") else 0)
+        ManyGraph.running -= 1
+        if "fail" in self.source:
+            raise RuntimeError("fetch failed")
+        self.execution_info = [{"node_name": "TOTAL RESULT", "source": self.source}]
+        return f"{self.prompt}: {self.source}"
+
+
+def test_run_many_returns_results_in_order():
+    """Test that run_many runs every item with bounded concurrency and keeps the item order."""
+    graph = ManyGraph(
+        "title",
+        {"llm": {"model": "openai/gpt-3.5-turbo", "openai_api_key": "sk-test"}},
+    )
+    graph.input_key = "url"
+    ManyGraph.max_running = 0
+    items = [
+        "https://example.com/slow",
+        ("price", "https://example.com/b"),
+        {"source": "https://example.com/fail"},
+        "./local",
+    ]
+
+    results = graph.run_many(items, concurrency=2)
+
+    assert [result["index"] for result in results] == [0, 1, 2, 3]
+    assert results[0]["answer"] == "title: https://example.com/slow"
+    assert results[1]["answer"] == "price: https://example.com/b"
+    assert results[2]["error"] == "fetch failed"
+    assert results[2]["answer"] is None
+    assert results[3]["exec_info"][0]["source"] == "./local"
+    assert ManyGraph.max_running == 2
+    assert graph.source is None
+
+
+async def test_aiter_many_yields_in_completion_order():
+    """Test that aiter_many yields the fastest items first."""
+    graph = ManyGraph(
+        "title",
+        {"llm": {"model": "openai/gpt-3.5-turbo", "openai_api_key": "sk-test"}},
+    )
+
+    sources = [
+        result["source"]
+        async for result in graph.aiter_many(
+            ["https://example.com/slow", "https://example.com/fast"]
+        )
+    ]
+
+    assert sources == ["https://example.com/fast", "https://example.com/slow"]
+
+
+class ParsedDocGraph(TestGraph):
+    def _result(self) -> str:
+        return self.final_state.get("parsed_doc", "No document found.")
+
+
+async def test_resume_returns_the_result_of_the_graph():
+    """Test that resume and aresume extract the result like run does."""
+    graph = ParsedDocGraph(
+        "dummy",
+        {"llm": {"model": "openai/gpt-3.5-turbo", "openai_api_key": "sk-test"}},
+    )
+    graph.graph = Mock()
+    graph.graph.resume.return_value = ({"parsed_doc": "parsed"}, [])
+
+    assert graph.resume("run") == "parsed"
+
+    async def aresume(run_id):
+        return {"parsed_doc": "parsed async"}, []
+
+    graph.graph.aresume = aresume
+    assert await graph.aresume("run") == "parsed async"
+
+
+class AnswerNode(BaseNode):
+    failing = True
+
+    def __init__(self):
+        super().__init__("Answer", "node", "url", ["parsed_doc"], 1, {})
+
+    def execute(self, state):
+        if self.failing and "fail" in state["url"]:
+            raise RuntimeError("fetch failed")
+        state["parsed_doc"] = state["url"]
+        return state
+
+
+def test_run_many_items_are_resumed_by_run_id(tmp_path):
+    """Test that each run_many item has its own run id, used to resume it."""
+    graph = ParsedDocGraph(
+        "title",
+        {"llm": {"model": "openai/gpt-3.5-turbo", "openai_api_key": "sk-test"}},
+    )
+    graph.input_key = "url"
+    node = AnswerNode()
+    graph.graph = BaseGraph(nodes=[node], edges=[], entry_point=node)
+    graph.graph.checkpoint_store = CheckpointStore(tmp_path)
+
+    with patch("scrapegraphai.graphs.base_graph.log_graph_execution"):
+        results = graph.run_many(
+            ["https://example.com/a", "https://example.com/fail"], concurrency=2
+        )
+        run_ids = [result["run_id"] for result in results]
+        assert None not in run_ids and len(set(run_ids)) == 2
+        assert graph.graph.run_id is None
+        with pytest.raises(ValueError, match="already completed"):
+            graph.resume(run_ids[0])
+
+        node.failing = False
+        assert graph.resume(run_ids[1]) == "https://example.com/fail"
+
+
+def test_run_many_items_use_their_own_source(route_server, monkeypatch):
+    """Test that nodes built with the graph source get the source of each item."""
+    fetcher = HttpFetcher(timeout=5)
+    monkeypatch.setattr(http_fetcher, "_shared_fetcher", fetcher)
+    # The tiktoken encodings are downloaded, words are counted instead
+    chunking = importlib.import_module("scrapegraphai.utils.split_text_into_chunks")
+    monkeypatch.setattr(chunking, "num_tokens_calculus", lambda text: len(text.split()))
+    text = "<p>A server-rendered catalog page of the shop.</p>" * 10
+    for path in ("/a", "/b"):
+        route_server.routes[path] = (200, {}, f"<html><body>{text}</body></html>")
+    graph = ScriptCreatorGraph(
+        "List the products",
+        route_server.get_url("/a"),
+        {
+            "llm": {"model": "openai/gpt-3.5-turbo", "openai_api_key": "sk-test"},
+            "library": "beautifulsoup",
+            "loader_kwargs": {"http_first": True},
+        },
+    )
+    # The script is the prompt, which names the source website
+    graph.graph.nodes[-1].llm_model = RunnableLambda(lambda prompt: prompt.to_string())
+
+    with patch("scrapegraphai.graphs.base_graph.log_graph_execution"):
+        results = graph.run_many([route_server.get_url(p) for p in ("/a", "/b")])
+    fetcher.close()
+
+    for result, path in zip(results, ("/a", "/b")):
+        assert result["error"] is None
+        assert f"SOURCE: {route_server.get_url(path)}" in result["answer"]
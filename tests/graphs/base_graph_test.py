@@ -0,0 +1,585 @@
+"""
+Tests for the BaseGraph execution modes.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from scrapegraphai.docloaders.http_cache import (
+    CACHE_HIT,
+    CACHE_MISS,
+    CachedResponse,
+    record_cache_result,
+)
+from scrapegraphai.graphs import BaseGraph
+from scrapegraphai.nodes.base_node import BaseNode
+from scrapegraphai.utils.profiler import NodeProfiler
+
+
+class SleepNode(BaseNode):
+    def __init__(self, node_name, input, output, delay=0.0, events=None):
+        super().__init__(node_name, "node", input, output, 1, {})
+        self.delay = delay
+        self.events = events if events is not None else []
+
+    def execute(self, state):
+        self.events.append(("start", self.node_name))
+        time.sleep(self.delay)
+        input_keys = self.get_input_keys(state)
+        value = "+".join(str(state[key]) for key in input_keys)
+        state.update(dict.fromkeys(self.output, f"{self.node_name}({value})"))
+        self.events.append(("end", self.node_name))
+        return state
+
+
+@pytest.fixture(autouse=True)
+def no_telemetry():
+    with patch("scrapegraphai.graphs.base_graph.log_graph_execution"):
+        yield
+
+
+def _build_graph(events, parallel):
+    fetch = SleepNode("Fetch", "url", ["doc"], 0.2, events)
+    parse = SleepNode("Parse", "doc", ["parsed_doc"], 0.0, events)
+    refine = SleepNode("Refine", "user_prompt", ["refined_prompt"], 0.2, events)
+    generate = SleepNode(
+        "Generate", "refined_prompt & parsed_doc", ["answer"], 0.0, events
+    )
+    return BaseGraph(
+        nodes=[fetch, parse, refine, generate],
+        edges=[(fetch, parse), (parse, refine), (refine, generate)],
+        entry_point=fetch,
+        parallel=parallel,
+    )
+
+
+def test_parallel_dependencies():
+    graph = _build_graph([], parallel=True)
+    order = graph._get_execution_order()
+    deps = graph._build_dependencies(order)
+    assert deps["Fetch"] == set()
+    assert deps["Parse"] == {"Fetch"}
+    assert deps["Refine"] == set()
+    assert deps["Generate"] == {"Parse", "Refine"}
+
+
+def test_parallel_matches_standard_state():
+    initial = {"user_prompt": "q", "url": "u"}
+    standard_state, _ = _build_graph([], parallel=False)._execute_standard(
+        dict(initial)
+    )
+    parallel_state, exec_info = _build_graph([], parallel=True)._execute_parallel(
+        dict(initial)
+    )
+    assert parallel_state == standard_state
+    assert exec_info[-1]["node_name"] == "TOTAL RESULT"
+
+
+def test_parallel_overlaps_independent_nodes():
+    events = []
+    graph = _build_graph(events, parallel=True)
+    graph._execute_parallel({"user_prompt": "q", "url": "u"})
+    starts = [name for kind, name in events[:2] if kind == "start"]
+    assert set(starts) == {"Fetch", "Refine"}
+
+
+def test_parallel_propagates_errors():
+    class FailingNode(SleepNode):
+        def execute(self, state):
+            raise RuntimeError("boom")
+
+    fetch = SleepNode("Fetch", "url", ["doc"])
+    failing = FailingNode("Fail", "doc", ["answer"])
+    graph = BaseGraph(
+        nodes=[fetch, failing],
+        edges=[(fetch, failing)],
+        entry_point=fetch,
+        parallel=True,
+    )
+    with pytest.raises(RuntimeError, match="boom"):
+        graph._execute_parallel({"url": "u"})
+
+
+async def test_aexecute_standard_matches_execute():
+    initial = {"user_prompt": "q", "url": "u"}
+    standard_state, _ = _build_graph([], parallel=False)._execute_standard(
+        dict(initial)
+    )
+    async_state, exec_info = await _build_graph([], parallel=False)._aexecute_standard(
+        dict(initial)
+    )
+    assert async_state == standard_state
+    assert exec_info[-1]["node_name"] == "TOTAL RESULT"
+
+
+async def test_aexecute_parallel_matches_execute():
+    initial = {"user_prompt": "q", "url": "u"}
+    standard_state, _ = _build_graph([], parallel=False)._execute_standard(
+        dict(initial)
+    )
+    async_state, _ = await _build_graph([], parallel=True)._aexecute_parallel(
+        dict(initial)
+    )
+    assert async_state == standard_state
+
+
+async def test_aexecute_uses_node_aexecute():
+    class AsyncNode(SleepNode):
+        def execute(self, state):
+            raise AssertionError("execute should not be called")
+
+        async def aexecute(self, state):
+            state.update({"answer": "async"})
+            return state
+
+    node = AsyncNode("Async", "user_prompt", ["answer"])
+    graph = BaseGraph(nodes=[node], edges=[], entry_point=node)
+    state, _ = await graph.aexecute({"user_prompt": "q"})
+    assert state["answer"] == "async"
+
+
+def test_compile_rejects_duplicate_node_names():
+    first = SleepNode("Fetch", "url", ["doc"])
+    second = SleepNode("Fetch", "doc", ["parsed_doc"])
+    with pytest.raises(ValueError, match="already exists"):
+        BaseGraph(nodes=[first, second], edges=[(first, second)], entry_point=first)
+
+
+def test_compile_rejects_edges_to_unknown_nodes():
+    fetch = SleepNode("Fetch", "url", ["doc"])
+    orphan = SleepNode("Orphan", "doc", ["parsed_doc"])
+    with pytest.raises(ValueError, match="not part of the graph"):
+        BaseGraph(nodes=[fetch], edges=[(fetch, orphan)], entry_point=fetch)
+
+
+def test_compile_rejects_invalid_input_expression():
+    fetch = SleepNode("Fetch", "url & | doc", ["doc"])
+    with pytest.raises(ValueError, match="Invalid input expression"):
+        BaseGraph(nodes=[fetch], edges=[], entry_point=fetch)
+
+
+def test_compiled_input_keys_are_memoised_by_key_presence():
+    node = SleepNode("Generate", "user_prompt & (relevant_chunks | doc)", ["answer"])
+    node.compile_input_expression()
+    assert node.get_input_keys({"user_prompt": 1, "doc": 2}) == ["user_prompt", "doc"]
+    assert node.get_input_keys({"user_prompt": 3, "doc": 4, "x": 5}) == [
+        "user_prompt",
+        "doc",
+    ]
+    assert len(node._compiled_input[3]) == 1
+    with pytest.raises(ValueError):
+        node.get_input_keys({"doc": 2})
+
+
+def test_node_cache_skips_cached_nodes(tmp_path):
+    from scrapegraphai.utils import NodeCache
+
+    events = []
+    graph = _build_graph(events, parallel=False)
+    for node in graph.nodes:
+        node.cacheable = node.node_name in ("Fetch", "Parse")
+        node.delay = 0.0
+    graph.cache = NodeCache(tmp_path)
+
+    first, _ = graph.execute({"url": "https://example.com", "user_prompt": "a"})
+    events.clear()
+    second, exec_info = graph.execute(
+        {"url": "https://example.com", "user_prompt": "b"}
+    )
+
+    started = [name for kind, name in events if kind == "start"]
+    assert started == ["Refine", "Generate"]
+    assert second["parsed_doc"] == first["parsed_doc"]
+    assert second["answer"] != first["answer"]
+    assert exec_info[0]["node_name"] == "Fetch"
+
+
+class FlakyNode(SleepNode):
+    def __init__(self, *args, failures=1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failures = failures
+
+    def execute(self, state):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("transient failure")
+        return super().execute(state)
+
+
+def test_resume_restarts_from_failed_node(tmp_path):
+    from scrapegraphai.utils import CheckpointStore
+
+    events = []
+    graph = _build_graph(events, parallel=False)
+    generate = FlakyNode(
+        "Generate", "refined_prompt & parsed_doc", ["answer"], events=events
+    )
+    graph.nodes[-1] = generate
+    graph._node_index["Generate"] = generate
+    for node in graph.nodes:
+        node.delay = 0.0
+    graph.checkpoint_store = CheckpointStore(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        graph.execute({"url": "https://example.com", "user_prompt": "a"})
+    run_id = graph.run_id
+    assert graph.checkpoint_store.load(run_id)["status"] == "failed"
+
+    events.clear()
+    state, exec_info = graph.resume(run_id)
+
+    started = [name for kind, name in events if kind == "start"]
+    assert started == ["Generate"]
+    assert state["answer"] == "Generate(Refine(a)+Parse(Fetch(https://example.com)))"
+    assert graph.checkpoint_store.load(run_id)["status"] == "completed"
+    with pytest.raises(ValueError, match="already completed"):
+        graph.resume(run_id)
+
+
+async def test_aresume_restarts_from_failed_node(tmp_path):
+    from scrapegraphai.utils import CheckpointStore
+
+    events = []
+    fetch = FlakyNode("Fetch", "url", ["doc"], events=events)
+    parse = SleepNode("Parse", "doc", ["parsed_doc"], events=events)
+    graph = BaseGraph(nodes=[fetch, parse], edges=[(fetch, parse)], entry_point=fetch)
+    graph.checkpoint_store = CheckpointStore(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        await graph.aexecute({"url": "u"})
+
+    state, _ = await graph.aresume()
+    assert state["parsed_doc"] == "Parse(Fetch(u))"
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+async def test_parallel_resume_skips_completed_nodes(tmp_path, asynchronous):
+    from scrapegraphai.utils import CheckpointStore
+
+    events = []
+    graph = _build_graph(events, parallel=True)
+    parse = FlakyNode("Parse", "doc", ["parsed_doc"], events=events)
+    graph.nodes[1] = parse
+    graph._node_index["Parse"] = parse
+    graph._parallel_plan = None
+    graph.nodes[0].delay = 0.1
+    graph.nodes[2].delay = 0.0
+    graph.checkpoint_store = CheckpointStore(tmp_path)
+    inputs = {"url": "https://example.com", "user_prompt": "a"}
+
+    with pytest.raises(RuntimeError):
+        if asynchronous:
+            await graph.aexecute(inputs)
+        else:
+            graph.execute(inputs)
+    checkpoint = graph.checkpoint_store.load(graph.run_id)
+    assert checkpoint["status"] == "failed"
+    assert checkpoint["run_info"]["completed_nodes"] == ["Fetch", "Refine"]
+
+    events.clear()
+    if asynchronous:
+        state, _ = await graph.aresume()
+    else:
+        state, _ = graph.resume()
+
+    started = [name for kind, name in events if kind == "start"]
+    assert started == ["Parse", "Generate"]
+    assert state["answer"] == "Generate(Refine(a)+Parse(Fetch(https://example.com)))"
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_nested_graph_runs_are_keyed_under_the_parent_run(tmp_path, parallel):
+    from scrapegraphai.utils import CheckpointStore
+
+    store = CheckpointStore(tmp_path)
+
+    class SubgraphNode(SleepNode):
+        def execute(self, state):
+            inner = SleepNode("Inner", "url", ["inner"])
+            graph = BaseGraph(nodes=[inner], edges=[], entry_point=inner)
+            graph.checkpoint_store = store
+            graph.execute({"url": "u"})
+            self.inner_run_id = graph.run_id
+            return super().execute(state)
+
+    outer = SubgraphNode("Outer", "url", ["doc"])
+    graph = BaseGraph(nodes=[outer], edges=[], entry_point=outer, parallel=parallel)
+    graph.checkpoint_store = store
+    graph.execute({"url": "u"})
+
+    assert outer.inner_run_id.startswith(f"{graph.run_id}/")
+    assert {run["run_id"] for run in store.list_runs()} == {
+        graph.run_id,
+        outer.inner_run_id,
+    }
+
+
+def test_resume_requires_checkpointing():
+    graph = _build_graph([], parallel=False)
+    with pytest.raises(ValueError, match="checkpoint_path"):
+        graph.resume("missing")
+
+
+def test_stream_yields_node_events_then_end():
+    graph = _build_graph([], parallel=False)
+    for node in graph.nodes:
+        node.delay = 0.0
+
+    events = list(graph.stream({"url": "u", "user_prompt": "p"}))
+
+    assert [event["type"] for event in events] == ["node"] * 4 + ["end"]
+    assert [event["node_name"] for event in events[:4]] == [
+        "Fetch",
+        "Parse",
+        "Refine",
+        "Generate",
+    ]
+    assert events[0]["changed_keys"] == ["doc"]
+    assert events[0]["updates"] == {"doc": "Fetch(u)"}
+    assert events[-1]["state"]["answer"] == "Generate(Refine(p)+Parse(Fetch(u)))"
+    assert events[-1]["exec_info"][-1]["node_name"] == "TOTAL RESULT"
+
+
+def test_stream_parallel_yields_in_completion_order():
+    graph = _build_graph([], parallel=True)
+
+    names = [
+        event["node_name"]
+        for event in graph.stream({"url": "u", "user_prompt": "p"})
+        if event["type"] == "node"
+    ]
+
+    assert names[-1] == "Generate"
+    assert names.index("Fetch") < names.index("Parse")
+    assert sorted(names) == ["Fetch", "Generate", "Parse", "Refine"]
+
+
+def test_stream_propagates_errors():
+    events = []
+    fetch = FlakyNode("Fetch", "url", ["doc"], events=events)
+    graph = BaseGraph(nodes=[fetch], edges=[], entry_point=fetch)
+
+    with pytest.raises(RuntimeError):
+        list(graph.stream({"url": "u"}))
+
+
+async def test_astream_yields_node_and_emitted_events():
+    class EmittingNode(SleepNode):
+        def execute(self, state):
+            self.emit_event({"type": "subgraph", "index": 0, "result": "partial"})
+            return super().execute(state)
+
+    fetch = EmittingNode("Fetch", "url", ["doc"])
+    parse = SleepNode("Parse", "doc", ["parsed_doc"])
+    graph = BaseGraph(nodes=[fetch, parse], edges=[(fetch, parse)], entry_point=fetch)
+
+    events = [event async for event in graph.astream({"url": "u"})]
+
+    assert [(event["type"], event.get("node_name")) for event in events] == [
+        ("subgraph", "Fetch"),
+        ("node", "Fetch"),
+        ("node", "Parse"),
+        ("end", None),
+    ]
+    assert events[-1]["state"]["parsed_doc"] == "Parse(Fetch(u))"
+    # Outside of a stream, emitted events are dropped
+    fetch.execute({"url": "u"})
+
+
+def test_concurrent_streams_of_a_graph_keep_their_events_apart():
+    class EmittingNode(SleepNode):
+        def execute(self, state):
+            self.emit_event({"type": "subgraph", "url": state["url"]})
+            return super().execute(state)
+
+    fetch = EmittingNode("Fetch", "url", ["doc"], 0.2)
+    graph = BaseGraph(nodes=[fetch], edges=[], entry_point=fetch)
+
+    def stream(url):
+        return [event["url"] for event in graph.stream({"url": url}) if "url" in event]
+
+    with ThreadPoolExecutor(2) as pool:
+        first, second = pool.map(stream, ["a", "b"])
+
+    assert (first, second) == (["a"], ["b"])
+
+
+def test_closing_a_stream_stops_its_execution():
+    events = []
+    graph = _build_graph(events, parallel=False)
+
+    stream = graph.stream({"url": "u", "user_prompt": "p"})
+    assert next(stream)["node_name"] == "Fetch"
+    stream.close()
+    time.sleep(0.3)
+
+    assert ("start", "Refine") not in events
+
+
+class LLMNode(SleepNode):
+    def __init__(self, node_name, input, output, llm_model, calls):
+        super().__init__(node_name, input, output)
+        self.llm_model = llm_model
+        self.calls = calls
+
+    def execute(self, state):
+        for _ in range(self.calls):
+            self.llm_model.invoke("prompt")
+        return super().execute(state)
+
+
+def _fake_llm(tokens):
+    message = AIMessage(
+        content="answer",
+        usage_metadata={
+            "input_tokens": tokens,
+            "output_tokens": 0,
+            "total_tokens": tokens,
+        },
+    )
+    return GenericFakeChatModel(messages=repeat(message))
+
+
+def test_concurrent_runs_account_tokens_separately():
+    def run(calls):
+        llm = _fake_llm(tokens=calls)
+        fetch = LLMNode("Fetch", "url", ["doc"], llm, calls)
+        parse = LLMNode("Parse", "doc", ["parsed_doc"], llm, calls)
+        graph = BaseGraph(
+            nodes=[fetch, parse], edges=[(fetch, parse)], entry_point=fetch
+        )
+        _, exec_info = graph.execute({"url": "u"})
+        return exec_info[-1]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        totals = list(executor.map(run, range(1, 9)))
+
+    for calls, total in zip(range(1, 9), totals):
+        assert total["total_tokens"] == 2 * calls * calls
+        assert total["successful_requests"] == 2 * calls
+
+
+def test_nested_graph_tokens_count_towards_parent_node():
+    llm = _fake_llm(tokens=3)
+
+    class SubgraphNode(LLMNode):
+        def execute(self, state):
+            inner = LLMNode("Inner", "url", ["inner"], llm, 2)
+            graph = BaseGraph(nodes=[inner], edges=[], entry_point=inner)
+            _, self.inner_info = graph.execute({"url": "u"})
+            return super().execute(state)
+
+    outer = SubgraphNode("Outer", "url", ["doc"], llm, 1)
+    graph = BaseGraph(nodes=[outer], edges=[], entry_point=outer, parallel=True)
+    _, exec_info = graph.execute({"url": "u"})
+
+    assert outer.inner_info[-1]["total_tokens"] == 6
+    assert exec_info[0]["total_tokens"] == 9
+    assert exec_info[-1]["total_tokens"] == 9
+
+
+def test_profiler_attaches_report_to_exec_info():
+    graph = _build_graph([], parallel=False)
+    graph.profiler = NodeProfiler(top_n=3)
+
+    _, exec_info = graph.execute({"user_prompt": "q", "url": "u"})
+
+    profiles = [entry["profile"] for entry in exec_info[:-1]]
+    assert len(profiles) == 4
+    assert all(len(profile["top_functions"]) == 3 for profile in profiles)
+    assert all(profile["peak_memory_bytes"] is not None for profile in profiles)
+    assert "profile" not in exec_info[-1]
+
+
+async def test_async_profiles_measure_the_worker_thread():
+    class BusyNode(SleepNode):
+        def execute(self, state):
+            deadline = time.thread_time() + 0.3
+            while time.thread_time() < deadline:
+                pass
+            return super().execute(state)
+
+    busy = BusyNode("Busy", "url", ["doc"])
+    graph = BaseGraph(nodes=[busy], edges=[], entry_point=busy)
+    graph.profiler = NodeProfiler(top_n=5)
+
+    _, exec_info = await graph.aexecute({"url": "u"})
+
+    profile = exec_info[0]["profile"]
+    assert profile["cpu_time"] >= 0.3
+    functions = [entry["function"] for entry in profile["top_functions"]]
+    assert any("execute" in function for function in functions)
+    assert not any("_run_once" in function for function in functions)
+
+
+def test_http_cache_results_are_reported_in_exec_info():
+    class CachedFetchNode(SleepNode):
+        def execute(self, state):
+            entry = CachedResponse("http://a.com/", 200, {}, b"page", 0, 0.5)
+            record_cache_result(CACHE_HIT, entry)
+            record_cache_result(CACHE_MISS)
+            return super().execute(state)
+
+    fetch = CachedFetchNode("Fetch", "url", ["doc"])
+    parse = SleepNode("Parse", "doc", ["parsed_doc"])
+    graph = BaseGraph(nodes=[fetch, parse], edges=[(fetch, parse)], entry_point=fetch)
+
+    _, exec_info = graph.execute({"url": "u"})
+
+    assert exec_info[0]["http_cache"]["hits"] == 1
+    assert exec_info[0]["http_cache"]["misses"] == 1
+    assert "http_cache" not in exec_info[1]
+    assert exec_info[-1]["http_cache"]["bytes_saved"] == 4
+    assert exec_info[-1]["http_cache"]["time_saved"] == 0.5
+
+
+def test_trace_path_exports_graph_and_node_spans(tmp_path):
+    trace_path = tmp_path / "trace.json"
+    graph = _build_graph([], parallel=True)
+    graph.trace_path = str(trace_path)
+
+    graph.execute({"user_prompt": "q", "url": "u"})
+
+    events = json.loads(trace_path.read_text())["traceEvents"]
+    spans = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert spans["Custom"]["cat"] == "graph"
+    assert {"Fetch", "Parse", "Refine", "Generate"} <= set(spans)
+    # Independent nodes run in separate worker threads
+    assert spans["Fetch"]["tid"] != spans["Refine"]["tid"]
+
+
+async def test_nested_graph_spans_join_the_parent_trace(tmp_path):
+    trace_path = tmp_path / "trace.json"
+
+    class SubgraphNode(SleepNode):
+        def execute(self, state):
+            inner = SleepNode("Inner", "url", ["inner"])
+            graph = BaseGraph(
+                nodes=[inner], edges=[], entry_point=inner, graph_name="Inner"
+            )
+            graph.trace_path = str(tmp_path / "inner.json")
+            graph.execute({"url": "u"})
+            return super().execute(state)
+
+    outer = SubgraphNode("Outer", "url", ["doc"])
+    graph = BaseGraph(nodes=[outer], edges=[], entry_point=outer)
+    graph.trace_path = str(trace_path)
+    graph.trace_format = "otlp"
+
+    await graph.aexecute({"url": "u"})
+
+    otlp = json.loads(trace_path.read_text())
+    spans = {
+        span["name"]: span
+        for span in otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    }
+    assert spans["Inner"]["parentSpanId"] == spans["Outer"]["spanId"]
+    assert spans["Outer"]["parentSpanId"] == spans["Custom"]["spanId"]
+    assert not (tmp_path / "inner.json").exists()
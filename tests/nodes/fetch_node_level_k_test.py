@@ -0,0 +1,127 @@
+import time
+
+import pytest
+
+from scrapegraphai.docloaders import http_fetcher
+from scrapegraphai.docloaders.chromium import ChromiumLoader
+from scrapegraphai.docloaders.http_fetcher import HttpFetcher
+from scrapegraphai.nodes.fetch_node_level_k import FetchNodeLevelK, normalize_url
+
+TEXT = "<p>A server-rendered page of the site, long enough to be read.</p>" * 10
+
+
+def page(*links):
+    anchors = "".join(f'<a href="{link}">link</a>' for link in links)
+    return f"<html><body>{TEXT}{anchors}</body></html>"
+
+
+@pytest.fixture
+def site(route_server, monkeypatch):
+    fetcher = HttpFetcher(timeout=5)
+    monkeypatch.setattr(http_fetcher, "_shared_fetcher", fetcher)
+    home = route_server.get_url("/")
+    route_server.routes.update(
+        {
+            "/": (200, {}, page("/a", "/a#top", f"{home}a", "/b", "mailto:x@y.z")),
+            "/a": (200, {}, page("/", "/b", "/c")),
+            "/b": (200, {}, page("/a", "/d")),
+            "/c": (200, {}, page("/e")),
+            "/d": (200, {}, page()),
+        }
+    )
+    yield route_server
+    fetcher.close()
+
+
+def crawl(source, **config):
+    node = FetchNodeLevelK(
+        input="url",
+        output=["docs"],
+        node_config={"loader_kwargs": {"http_first": True}, **config},
+    )
+    return node.execute({"url": source})["docs"]
+
+
+def test_normalize_url():
+    assert normalize_url("HTTP://Example.COM:80") == "http://example.com/"
+    assert normalize_url("https://example.com:443/a?b=1#top") == (
+        "https://example.com/a?b=1"
+    )
+    assert normalize_url("http://example.com:8080/A") == "http://example.com:8080/A"
+
+
+def test_pages_are_fetched_once_down_to_the_depth(site):
+    docs = crawl(site.get_url("/"), depth=2)
+
+    assert sorted(site.paths()) == ["/", "/a", "/b"]
+    assert [doc["depth"] for doc in docs] == [0, 1, 1]
+    assert docs[0]["source"] == site.get_url("/")
+    assert "server-rendered" in docs[1]["document"][0].page_content
+
+    docs = crawl(site.get_url("/"), depth=3)
+    assert {normalize_url(doc["source"]) for doc in docs} == {
+        site.get_url(path) for path in ("/", "/a", "/b", "/c", "/d")
+    }
+
+
+def test_budgets_stop_the_crawl(site):
+    assert len(crawl(site.get_url("/"), depth=3, max_pages=2)) == 2
+
+    def slow(handler):
+        time.sleep(1)
+        return 200, {}, page()
+
+    site.routes["/a"] = site.routes["/b"] = slow
+    start = time.monotonic()
+    docs = crawl(site.get_url("/"), depth=2, max_time=0.5)
+
+    assert time.monotonic() - start < 0.9
+    assert [doc["depth"] for doc in docs] == [0]
+
+
+def test_pages_are_fetched_concurrently(site):
+    def slow(handler):
+        time.sleep(0.3)
+        return 200, {}, page()
+
+    for path in ("/a", "/b"):
+        site.routes[path] = slow
+    site.routes["/"] = (200, {}, page("/a", "/b"))
+
+    start = time.monotonic()
+    docs = crawl(site.get_url("/"), depth=2, max_concurrency=2)
+
+    assert len(docs) == 3
+    assert time.monotonic() - start < 0.55
+
+
+def test_failed_pages_are_skipped(site, monkeypatch):
+    async def render(self, url, browser_name="chromium"):
+        return "   " if url.endswith("/a") else page()
+
+    # The empty page falls back to the browser, which finds nothing either
+    monkeypatch.setattr(ChromiumLoader, "ascrape_playwright", render)
+    site.routes["/a"] = (200, {}, "   ")
+    docs = crawl(site.get_url("/"), depth=2, max_concurrency=1)
+
+    assert [doc["source"] for doc in docs] == [site.get_url(p) for p in ("/", "/b")]
+
+
+def test_the_crawl_tells_whether_it_completed(site, monkeypatch):
+    def completed(**config):
+        node = FetchNodeLevelK(
+            input="url",
+            output=["docs", "crawl_complete"],
+            node_config={"loader_kwargs": {"http_first": True}, **config},
+        )
+        return node.execute({"url": site.get_url("/")})["crawl_complete"]
+
+    assert completed(depth=2) is True
+    assert completed(depth=3, max_pages=2) is False
+
+    async def render(self, url, browser_name="chromium"):
+        return "   "
+
+    monkeypatch.setattr(ChromiumLoader, "ascrape_playwright", render)
+    site.routes["/a"] = (200, {}, "   ")
+    assert completed(depth=2) is False
@@ -0,0 +1,54 @@
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from scrapegraphai.graphs import AbstractGraph, BaseGraph
+from scrapegraphai.nodes import GraphIteratorNode
+from scrapegraphai.nodes.base_node import BaseNode
+
+
+class EchoNode(BaseNode):
+    def __init__(self):
+        super().__init__("Echo", "node", "url | local_dir", ["answer"], 1, {})
+
+    def execute(self, state):
+        source = state.get("url") or state.get("local_dir")
+        state.update({"answer": f"{state['user_prompt']}: {source}"})
+        return state
+
+
+class EchoGraph(AbstractGraph):
+    instances = 0
+
+    def __init__(self, prompt, source, config, schema=None):
+        EchoGraph.instances += 1
+        super().__init__(prompt, config, source, schema)
+        self.input_key = "url" if source.startswith("http") else "local_dir"
+
+    def _create_graph(self):
+        node = EchoNode()
+        return BaseGraph(nodes=[node], edges=[], entry_point=node)
+
+    def run(self):
+        return super().run()
+
+
+def test_graph_iterator_reuses_one_graph_instance(mocker):
+    mocker.patch("scrapegraphai.graphs.base_graph.log_graph_execution")
+    EchoGraph.instances = 0
+    config = {
+        "llm": {
+            "model_instance": FakeListChatModel(responses=["unused"]),
+            "model_tokens": 1000,
+        }
+    }
+    node = GraphIteratorNode(
+        input="user_prompt & urls",
+        output=["results"],
+        node_config={"graph_instance": EchoGraph, "scraper_config": config},
+    )
+    urls = [f"https://example.com/{i}" for i in range(5)] + ["./local"]
+
+    state = node.execute({"user_prompt": "title", "urls": urls})
+
+    assert EchoGraph.instances == 1
+    assert state["results"] == [f"title: {url}" for url in urls]
+    assert config["graph_depth"] == 1
@@ -1,15 +1,18 @@
 from unittest.mock import MagicMock
 
 import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
 
+from scrapegraphai.docloaders import http_fetcher
+from scrapegraphai.docloaders.http_fetcher import HttpFetcher
 from scrapegraphai.nodes import RobotsNode
 
 
 @pytest.fixture
 def mock_llm_model():
     mock_model = MagicMock()
-    mock_model.model = "ollama/llama3"
-    mock_model.__call__ = MagicMock(return_value=["yes"])
+    mock_model.model = "openai/gpt-4o"
     return mock_model
 
 
@@ -22,63 +25,69 @@ def robots_node(mock_llm_model):
     )
 
 
-def test_robots_node_scrapable(robots_node):
-    state = {"url": "https://perinim.github.io/robots.txt"}
-
-    # Mocking AsyncChromiumLoader to return a fake robots.txt content
-    robots_node.AsyncChromiumLoader = MagicMock(
-        return_value=MagicMock(load=MagicMock(return_value="User-agent: *\nAllow: /"))
-    )
+@pytest.fixture
+def site(route_server, monkeypatch):
+    fetcher = HttpFetcher(timeout=5)
+    monkeypatch.setattr(http_fetcher, "_shared_fetcher", fetcher)
+    yield route_server
+    fetcher.close()
 
-    # Execute the node
-    result_state, result = robots_node.execute(state)
 
-    # Check the updated state
-    assert result_state["is_scrapable"] == "yes"
-    assert result == ("is_scrapable", "yes")
+def test_robots_node_scrapable(robots_node, site):
+    site.routes["/robots.txt"] = (200, {}, "User-agent: *\nAllow: /")
+    state = {"url": site.get_url("/home")}
 
+    result_state = robots_node.execute(state)
 
-def test_robots_node_not_scrapable(robots_node):
-    state = {"url": "https://twitter.com/home"}
+    assert result_state["is_scrapable"] == "yes"
+    robots_node.llm_model.assert_not_called()
 
-    # Mocking AsyncChromiumLoader to return a fake robots.txt content
-    robots_node.AsyncChromiumLoader = MagicMock(
-        return_value=MagicMock(
-            load=MagicMock(return_value="User-agent: *\nDisallow: /")
-        )
-    )
 
-    # Mock the LLM response to return "no"
-    robots_node.llm_model.__call__.return_value = ["no"]
+def test_robots_node_not_scrapable(robots_node, site):
+    site.routes["/robots.txt"] = (200, {}, "User-agent: GPTBot\nDisallow: /home")
 
     # Execute the node and expect a ValueError because force_scraping is False by default
     with pytest.raises(ValueError):
-        robots_node.execute(state)
+        robots_node.execute({"url": site.get_url("/home")})
 
 
-def test_robots_node_force_scrapable(robots_node):
-    state = {"url": "https://twitter.com/home"}
+def test_robots_node_force_scrapable(robots_node, site):
+    site.routes["/robots.txt"] = (200, {}, "User-agent: *\nDisallow: /")
+    robots_node.force_scraping = True
 
-    # Mocking AsyncChromiumLoader to return a fake robots.txt content
-    robots_node.AsyncChromiumLoader = MagicMock(
-        return_value=MagicMock(
-            load=MagicMock(return_value="User-agent: *\nDisallow: /")
-        )
-    )
+    result_state = robots_node.execute({"url": site.get_url("/home")})
 
-    # Mock the LLM response to return "no"
-    robots_node.llm_model.__call__.return_value = ["no"]
+    assert result_state["is_scrapable"] == "no"
+    # The robots.txt of the host is fetched once
+    robots_node.execute({"url": site.get_url("/other")})
+    assert site.paths() == ["/robots.txt"]
 
-    # Set force_scraping to True
-    robots_node.force_scraping = True
 
-    # Execute the node
-    result_state, result = robots_node.execute(state)
+def test_user_agents_come_from_the_robots_dictionary(robots_node):
+    assert robots_node.user_agents() == ["GPTBot", "ChatGPT-user"]
+    robots_node.llm_model.model = "claude-3-haiku"
+    assert robots_node.user_agents() == ["Claude-Web", "ClaudeBot"]
+    robots_node.llm_model.model = "ollama/llama3"
+    assert robots_node.user_agents() == ["llama3"]
 
-    # Check the updated state
-    assert result_state["is_scrapable"] == "no"
-    assert result == ("is_scrapable", "no")
 
+def test_llm_reads_unrecognized_robots_files(site):
+    site.routes["/robots.txt"] = (200, {}, "<html><body>Nothing here</body></html>")
+    prompts = []
+
+    def answer(prompt):
+        prompts.append(prompt.to_string())
+        return AIMessage(content="no")
+
+    node = RobotsNode(
+        input="url",
+        output=["is_scrapable"],
+        node_config={
+            "llm_model": RunnableLambda(answer),
+            "llm_fallback": True,
+            "force_scraping": True,
+        },
+    )
 
-if __name__ == "__main__":
-    pytest.main()
+    assert node.execute({"url": site.get_url("/")})["is_scrapable"] == "no"
+    assert "Nothing here" in prompts[0]
@@ -0,0 +1,223 @@
+"""
+Tests for the pool of warm browsers shared by the loaders.
+"""
+
+import asyncio
+
+import pytest
+
+from scrapegraphai.docloaders.browser_pool import BrowserPool, get_browser_pool
+from scrapegraphai.docloaders.chromium import ChromiumLoader
+
+
+class FakePage:
+    def __init__(self, browser):
+        self.browser = browser
+        self.url = None
+
+    async def goto(self, url, wait_until=None):
+        self.url = url
+        await asyncio.sleep(self.browser.playwright.page_delay)
+
+    async def wait_for_load_state(self, state):
+        return
+
+    async def content(self):
+        return f"<html>{self.url} from browser {self.browser.index}</html>"
+
+
+class FakeContext:
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.closed = False
+
+    async def add_init_script(self, script):
+        return
+
+    async def new_page(self):
+        return FakePage(self.browser)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, playwright, options):
+        self.playwright = playwright
+        self.options = options
+        self.index = len(playwright.browsers)
+        self.connected = True
+        self.closed = False
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected and not self.closed
+
+    async def new_context(self, **options):
+        context = FakeContext(self, options)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowserType:
+    def __init__(self, playwright):
+        self.playwright = playwright
+
+    async def launch(self, **options):
+        await asyncio.sleep(self.playwright.launch_delay)
+        browser = FakeBrowser(self.playwright, options)
+        self.playwright.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.page_delay = 0
+        self.launch_delay = 0
+        self.chromium = FakeBrowserType(self)
+        self.firefox = FakeBrowserType(self)
+        self.stopped = False
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        self.stopped = True
+
+    def running_browsers(self):
+        return [browser for browser in self.browsers if not browser.closed]
+
+
+@pytest.fixture
+def playwright(monkeypatch):
+    fake = FakePlaywright()
+    monkeypatch.setattr("playwright.async_api.async_playwright", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def pool():
+    pool = BrowserPool(max_browsers=2, max_pages_per_browser=3)
+    yield pool
+    pool.close()
+
+
+def test_pooled_browser_is_reused_across_event_loops(playwright, pool):
+    urls = ["http://example.com/1", "http://example.com/2", "http://example.com/3"]
+
+    # Every load runs in its own event loop
+    docs = [
+        doc
+        for url in urls
+        for doc in ChromiumLoader(
+            [url], browser_pool=pool, storage_state="state.json"
+        ).load()
+    ]
+
+    assert [doc.page_content for doc in docs] == [
+        f"<html>{url} from browser 0</html>" for url in urls
+    ]
+    assert pool.launches == 1
+    browser = playwright.browsers[0]
+    assert browser.options["headless"] is True
+    assert all(context.closed for context in browser.contexts)
+    assert browser.contexts[0].options["storage_state"] == "state.json"
+
+
+def test_browser_is_recycled_after_max_pages(playwright, pool):
+    for _ in range(7):
+        pool.run_sync(lambda page: page.content())
+
+    assert pool.launches == 3
+    assert [browser.closed for browser in playwright.browsers] == [True, True, False]
+
+
+def test_disconnected_browser_is_replaced(playwright, pool):
+    pool.run_sync(lambda page: page.content())
+    playwright.browsers[0].connected = False
+
+    content = pool.run_sync(lambda page: page.content())
+
+    assert "from browser 1" in content
+    assert playwright.browsers[0].closed
+
+
+def test_browsers_are_keyed_by_launch_options(playwright, pool):
+    pool.run_sync(lambda page: page.content(), launch_options={"headless": True})
+    pool.run_sync(lambda page: page.content(), launch_options={"headless": False})
+    pool.run_sync(lambda page: page.content(), launch_options={"headless": True})
+
+    assert pool.launches == 2
+    assert len(playwright.browsers[0].contexts) == 2
+
+
+async def test_concurrent_fetches_share_a_bounded_number_of_browsers(playwright):
+    pool = BrowserPool(max_browsers=2)
+    playwright.page_delay = 0.05
+    urls = [f"http://example.com/{i}" for i in range(6)]
+    loader = ChromiumLoader(urls, browser_pool=pool)
+
+    docs = [doc async for doc in loader.alazy_load()]
+
+    assert len(docs) == 6
+    assert pool.launches == 2
+    # Other loaders can still fetch once the browsers are released
+    playwright.page_delay = 0
+    other = ChromiumLoader(["http://other.com"], browser_pool=pool, headless=False)
+    assert [doc async for doc in other.alazy_load()]
+    assert len(playwright.running_browsers()) == 2
+    await asyncio.to_thread(pool.close)
+
+
+async def test_browsers_are_launched_concurrently(playwright):
+    pool = BrowserPool(max_browsers=2)
+    playwright.launch_delay = 0.3
+    loop = asyncio.get_running_loop()
+
+    start = loop.time()
+    await asyncio.gather(
+        pool.run(lambda page: page.content(), launch_options={"headless": True}),
+        pool.run(lambda page: page.content(), launch_options={"headless": False}),
+    )
+
+    assert loop.time() - start < 0.5
+    assert pool.launches == 2
+    await asyncio.to_thread(pool.close)
+
+
+def test_close_stops_browsers_and_playwright(playwright, pool):
+    pool.run_sync(lambda page: page.content())
+
+    pool.close()
+
+    assert playwright.browsers[0].closed
+    assert playwright.stopped
+    # The pool starts again when used after being closed
+    assert pool.run_sync(lambda page: page.content())
+
+
+def test_invalid_browser_name_raises(playwright, pool):
+    with pytest.raises(ValueError, match="Invalid browser name"):
+        pool.run_sync(lambda page: page.content(), browser_name="opera")
+
+
+def test_get_browser_pool_resolves_option():
+    pool = BrowserPool()
+
+    assert get_browser_pool(None) is None
+    assert get_browser_pool(False) is None
+    assert get_browser_pool(pool) is pool
+    assert get_browser_pool(True) is get_browser_pool(True)
+    shared = get_browser_pool({"max_browsers": 4})
+    assert shared is get_browser_pool({"max_browsers": 4})
+    assert shared.max_browsers == 4
+    assert shared is not get_browser_pool(True)
+    with pytest.raises(ValueError):
+        get_browser_pool("yes")
+    with pytest.raises(ValueError):
+        BrowserPool(max_browsers=0)
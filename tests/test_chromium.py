@@ -943,7 +943,7 @@ async def test_ascrape_playwright_scroll_retry_failure(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_alazy_load_order(monkeypatch):
-    """Test that alazy_load returns documents in the same order as the input URLs even if scraping tasks complete out of order."""
+    """Test that alazy_load yields documents as soon as they are scraped, in completion order."""
     urls = [
         "http://example.com/first",
         "http://example.com/second",
@@ -962,10 +962,11 @@ async def test_alazy_load_order(monkeypatch):
     monkeypatch.setattr(loader, "ascrape_playwright", delayed_scraper)
 
     docs = [doc async for doc in loader.alazy_load()]
-    # Ensure that the order of documents matches the order of input URLs
-    for doc, url in zip(docs, urls):
-        assert doc.metadata["source"] == url
-        assert f"Content for {url}" in doc.page_content
+    # Ensure that the documents are yielded in the order the scraping tasks completed
+    completion_order = sorted(urls, key=lambda url: 0.3 - 0.1 * (len(url) % 3))
+    assert [doc.metadata["source"] for doc in docs] == completion_order
+    for doc in docs:
+        assert f"Content for {doc.metadata['source']}" in doc.page_content
 
 
 @pytest.mark.asyncio
@@ -2160,9 +2161,11 @@ async def test_lazy_load_with_none_urls(monkeypatch):
 
 @pytest.mark.asyncio
 def test_lazy_load_sequential_timing(monkeypatch):
-    """Test that lazy_load runs scraping sequentially rather than concurrently."""
+    """Test that lazy_load runs scraping sequentially when max_concurrency is 1."""
     urls = ["http://example.com/1", "http://example.com/2", "http://example.com/3"]
-    loader = ChromiumLoader(urls, backend="playwright", requires_js_support=False)
+    loader = ChromiumLoader(
+        urls, backend="playwright", requires_js_support=False, max_concurrency=1
+    )
 
     async def dummy_scraper_with_delay(url, browser_name="chromium"):
         await asyncio.sleep(0.5)
@@ -2196,3 +2199,99 @@ def test_lazy_load_with_tuple_urls(monkeypatch):
     for doc, url in zip(docs, urls):
         assert f"Tuple content for {url}" in doc.page_content
         assert doc.metadata["source"] == url
+
+
+def make_tracking_scraper(delay=0.05):
+    """Returns a dummy scraper recording the peak number of concurrent fetches, overall and per host."""
+    stats = {"active": 0, "peak": 0, "hosts": {}, "host_peaks": {}, "loops": set()}
+
+    async def scraper(url, browser_name="chromium"):
+        host = url.split("/")[2]
+        stats["loops"].add(id(asyncio.get_running_loop()))
+        stats["active"] += 1
+        stats["hosts"][host] = stats["hosts"].get(host, 0) + 1
+        stats["peak"] = max(stats["peak"], stats["active"])
+        stats["host_peaks"][host] = max(
+            stats["host_peaks"].get(host, 0), stats["hosts"][host]
+        )
+        await asyncio.sleep(delay)
+        stats["active"] -= 1
+        stats["hosts"][host] -= 1
+        return f"<html>{url}</html>"
+
+    return scraper, stats
+
+
+@pytest.mark.asyncio
+async def test_alazy_load_respects_concurrency_limits(monkeypatch):
+    """Test that alazy_load never exceeds the global and per-host concurrency limits."""
+    urls = [f"http://a.com/{i}" for i in range(10)] + [
+        f"http://b.com/{i}" for i in range(10)
+    ]
+    loader = ChromiumLoader(urls, max_concurrency=4, max_concurrency_per_host=2)
+    scraper, stats = make_tracking_scraper()
+    monkeypatch.setattr(loader, "ascrape_playwright", scraper)
+
+    docs = [doc async for doc in loader.alazy_load()]
+
+    assert sorted(doc.metadata["source"] for doc in docs) == sorted(urls)
+    assert stats["peak"] == 4
+    assert stats["host_peaks"] == {"a.com": 2, "b.com": 2}
+
+
+@pytest.mark.asyncio
+async def test_aload_urls_calls_share_the_concurrency_limits(monkeypatch):
+    """Test that concurrent aload_urls calls, as made by a crawler, share the limits."""
+    urls = [f"http://a.com/{i}" for i in range(6)] + [
+        f"http://b.com/{i}" for i in range(6)
+    ]
+    loader = ChromiumLoader([], max_concurrency=3, max_concurrency_per_host=2)
+    scraper, stats = make_tracking_scraper()
+    monkeypatch.setattr(loader, "ascrape_playwright", scraper)
+
+    await asyncio.gather(*(loader.aload_urls([url]) for url in urls))
+
+    assert stats["peak"] == 3
+    assert max(stats["host_peaks"].values()) == 2
+
+
+def test_lazy_load_uses_a_single_event_loop(monkeypatch):
+    """Test that lazy_load fetches the whole batch concurrently on one event loop."""
+    urls = [f"http://example.com/{i}" for i in range(6)]
+    loader = ChromiumLoader(urls, max_concurrency=3)
+    scraper, stats = make_tracking_scraper()
+    monkeypatch.setattr(loader, "ascrape_playwright", scraper)
+
+    docs = list(loader.lazy_load())
+
+    assert len(docs) == 6
+    assert len(stats["loops"]) == 1
+    assert stats["peak"] == 3
+
+
+@pytest.mark.asyncio
+async def test_alazy_load_failure_cancels_pending_fetches(monkeypatch):
+    """Test that a failed fetch cancels the fetches still waiting for a slot."""
+    urls = ["http://fail.com"] + [f"http://example.com/{i}" for i in range(5)]
+    loader = ChromiumLoader(urls, max_concurrency=2)
+    started = []
+
+    async def scraper(url, browser_name="chromium"):
+        started.append(url)
+        if "fail" in url:
+            raise RuntimeError("Failed to scrape")
+        await asyncio.sleep(0.2)
+        return "<html></html>"
+
+    monkeypatch.setattr(loader, "ascrape_playwright", scraper)
+
+    with pytest.raises(RuntimeError, match="Failed to scrape"):
+        [doc async for doc in loader.alazy_load()]
+    await asyncio.sleep(0.3)
+    assert len(started) < len(urls)
+
+
+def test_invalid_concurrency_limit_raises():
+    """Test that a concurrency limit lower than 1 is rejected."""
+    with pytest.raises(ValueError, match="Concurrency limits"):
+        ChromiumLoader(["http://example.com"], max_concurrency=0)
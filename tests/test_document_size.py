@@ -0,0 +1,173 @@
+"""
+Tests for the document size limits, the streamed HTTP downloads and the
+truncation strategies.
+"""
+
+import pytest
+
+from scrapegraphai.docloaders import http_fetcher
+from scrapegraphai.docloaders.chromium import ChromiumLoader
+from scrapegraphai.docloaders.document_size import (
+    get_document_size_limits,
+    truncate_html,
+)
+from scrapegraphai.docloaders.http_fetcher import HttpFetcher
+from scrapegraphai.nodes import FetchNode
+
+PARAGRAPHS = "".join(f"<p>Paragraph {i} of the article.</p>" for i in range(2000))
+PAGE = (
+    "<html><head><title>Report</title>"
+    f"<script>{'var data = 1;' * 2000}</script></head>"
+    f"<body><nav>{'<a href=/x>Menu</a>' * 500}</nav>"
+    f'<img src="data:image/png;base64,{"A" * 20000}">'
+    f"<main>{PARAGRAPHS}</main></body></html>"
+)
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    fetcher = HttpFetcher(timeout=5)
+    monkeypatch.setattr(http_fetcher, "_shared_fetcher", fetcher)
+    yield fetcher
+    fetcher.close()
+
+
+def test_limits_are_resolved_from_the_option():
+    assert get_document_size_limits(None) is None
+    assert get_document_size_limits(1000) == {
+        "max_bytes": 1000,
+        "strategy": "head",
+        "max_download_bytes": 1000,
+    }
+    limits = get_document_size_limits({"max_bytes": 1000, "strategy": "byte_budget"})
+    assert limits["max_download_bytes"] == 4000
+
+    for option in (True, "1 MB", {"max_bytes": 0}, {"size": 1000}):
+        with pytest.raises(ValueError):
+            get_document_size_limits(option)
+    with pytest.raises(ValueError):
+        get_document_size_limits({"max_bytes": 1000, "strategy": "tail"})
+
+
+@pytest.mark.parametrize("strategy", ["head", "main_content", "byte_budget"])
+def test_strategies_fit_the_budget(strategy):
+    limits = get_document_size_limits({"max_bytes": 30_000, "strategy": strategy})
+
+    html, truncated = truncate_html(PAGE, limits)
+
+    assert truncated
+    assert len(html.encode("utf-8")) <= 30_000
+    assert not html.rstrip().endswith("<")
+    if strategy == "head":
+        assert html.startswith("<html><head><title>Report")
+    else:
+        assert "var data" not in html and "base64" not in html
+        assert "<title>Report</title>" in html
+        assert "Paragraph 0 " in html
+    if strategy == "main_content":
+        assert "Menu" not in html
+
+
+def test_documents_within_the_limit_are_kept():
+    limits = get_document_size_limits(len(PAGE.encode("utf-8")))
+
+    assert truncate_html(PAGE, limits) == (PAGE, False)
+    # A cut download never ends in the middle of a tag
+    html, truncated = truncate_html("<html><body><p>Hello</p><di", limits, True)
+    assert truncated and html == "<html><body><p>Hello</p>"
+
+
+def test_http_downloads_stop_at_the_limit(route_server, fetcher):
+    route_server.routes["/report"] = (200, {"Content-Type": "text/html"}, PAGE)
+    url = route_server.get_url("/report")
+
+    response = fetcher.fetch(url, max_bytes=10_000)
+
+    assert response.extensions["truncated"]
+    assert response.content == PAGE.encode("utf-8")[:10_000]
+    assert not fetcher.fetch(url, max_bytes=10**7).extensions["truncated"]
+
+
+def test_http_tier_flags_truncated_documents(route_server, fetcher):
+    route_server.routes["/report"] = (200, {"Content-Type": "text/html"}, PAGE)
+    route_server.routes["/small"] = (200, {"Content-Type": "text/html"}, PARAGRAPHS)
+    loader = ChromiumLoader(
+        [route_server.get_url("/report"), route_server.get_url("/small")],
+        http_first=True,
+        max_document_size={"max_bytes": 120_000, "strategy": "main_content"},
+    )
+
+    documents = {doc.metadata["source"]: doc for doc in loader.load()}
+
+    report = documents[route_server.get_url("/report")]
+    assert report.metadata["truncated"] is True
+    assert len(report.page_content.encode("utf-8")) <= 120_000
+    assert report.page_content.startswith("<html><head><title>Report</title>")
+    assert "truncated" not in documents[route_server.get_url("/small")].metadata
+
+
+def test_soup_fetch_truncates_and_flags_documents(route_server, fetcher):
+    route_server.routes["/report"] = (200, {"Content-Type": "text/html"}, PAGE)
+    node = FetchNode(
+        input="url",
+        output=["doc"],
+        node_config={
+            "use_soup": True,
+            "loader_kwargs": {"max_document_size": 10_000},
+        },
+    )
+
+    document = node.execute({"url": route_server.get_url("/report")})["doc"][0]
+
+    assert document.metadata == {"truncated": True}
+    assert len(document.page_content.encode("utf-8")) <= 10_000
+    assert not document.page_content.rstrip().endswith("<")
+
+
+def test_browser_tier_flags_survive_the_fetch_node(route_server, fetcher):
+    route_server.routes["/report"] = (200, {"Content-Type": "text/html"}, PAGE)
+    node = FetchNode(
+        input="url",
+        output=["doc"],
+        node_config={
+            "loader_kwargs": {"http_first": True, "max_document_size": 10_000},
+        },
+    )
+
+    document = node.execute({"url": route_server.get_url("/report")})["doc"][0]
+
+    assert document.metadata == {"source": "html file", "truncated": True}
+    assert len(document.page_content.encode("utf-8")) <= 10_000
+
+
+class FakePage:
+    def __init__(self, html):
+        self.html = html
+        self.serialized = False
+
+    async def evaluate(self, script, args):
+        max_chars, main_content = args
+        if len(self.html) <= max_chars:
+            return None
+        return self.html[:max_chars]
+
+    async def content(self):
+        self.serialized = True
+        return self.html
+
+
+async def test_browser_dom_is_cut_before_serialization():
+    loader = ChromiumLoader(["https://example.com"], max_document_size=5000)
+    page = FakePage(PAGE)
+
+    content = await loader._page_content(page, "https://example.com")
+    document = loader._document("https://example.com", content)
+
+    assert not page.serialized
+    assert document.metadata == {"source": "https://example.com", "truncated": True}
+    assert len(document.page_content) <= 5000
+
+    small = FakePage("<html><body>Small</body></html>")
+    content = await loader._page_content(small, "https://example.com/small")
+    assert small.serialized
+    assert "truncated" not in loader._document("https://example.com", content).metadata
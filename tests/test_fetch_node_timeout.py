@@ -24,6 +24,15 @@ class TestFetchNodeTimeout(unittest.TestCase):
         """Set up test fixtures."""
         # Mock all the heavy external dependencies at import time
         self.mock_modules = {}
+        self.saved_modules = sys.modules.copy()
+        self.saved_attributes = [
+            (sys.modules[module], name, getattr(sys.modules[module], name))
+            for module, name in [
+                ('langchain_core.documents', 'Document'),
+                ('langchain_community.document_loaders', 'PyPDFLoader'),
+            ]
+            if module in sys.modules
+        ]
         for module in ['langchain_core', 'langchain_core.documents', 
                        'langchain_community', 'langchain_community.document_loaders',
                        'langchain_openai', 'minify_html', 'pydantic', 
@@ -56,11 +65,11 @@ class TestFetchNodeTimeout(unittest.TestCase):
 
     def tearDown(self):
         """Clean up after tests."""
-        # Remove mocked modules
-        for module in list(sys.modules.keys()):
-            if 'langchain' in module or module in ['minify_html', 'pydantic']:
-                if module in self.mock_modules or module.startswith('langchain'):
-                    sys.modules.pop(module, None)
+        # Restore the modules and attributes replaced by the mocks
+        sys.modules.clear()
+        sys.modules.update(self.saved_modules)
+        for module, name, value in self.saved_attributes:
+            setattr(module, name, value)
 
     def test_timeout_default_value(self):
         """Test that default timeout is set to 30 seconds."""
@@ -98,13 +107,14 @@ class TestFetchNodeTimeout(unittest.TestCase):
         )
         self.assertEqual(node.timeout, 30)
 
-    @patch('scrapegraphai.nodes.fetch_node.requests')
-    def test_requests_get_with_timeout(self, mock_requests):
-        """Test that requests.get is called with timeout when use_soup=True."""
+    @patch('scrapegraphai.nodes.fetch_node.get_http_fetcher')
+    def test_requests_get_with_timeout(self, mock_get_http_fetcher):
+        """Test that the HTTP fetch is called with timeout when use_soup=True."""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.text = "<html><body>Test content</body></html>"
-        mock_requests.get.return_value = mock_response
+        mock_fetch = mock_get_http_fetcher.return_value.fetch
+        mock_fetch.return_value = mock_response
         
         node = self.FetchNode(
             input="url",
@@ -116,18 +126,19 @@ class TestFetchNodeTimeout(unittest.TestCase):
         state = {"url": "https://example.com"}
         node.execute(state)
         
-        # Verify requests.get was called with timeout
-        mock_requests.get.assert_called_once()
-        call_args = mock_requests.get.call_args
+        # Verify the fetch was called with timeout
+        mock_fetch.assert_called_once()
+        call_args = mock_fetch.call_args
         self.assertEqual(call_args[1].get('timeout'), 15)
 
-    @patch('scrapegraphai.nodes.fetch_node.requests')
-    def test_requests_get_without_timeout_when_none(self, mock_requests):
-        """Test that requests.get is called without timeout argument when timeout=None."""
+    @patch('scrapegraphai.nodes.fetch_node.get_http_fetcher')
+    def test_requests_get_without_timeout_when_none(self, mock_get_http_fetcher):
+        """Test that the HTTP fetch is called without a time limit when timeout=None."""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.text = "<html><body>Test content</body></html>"
-        mock_requests.get.return_value = mock_response
+        mock_fetch = mock_get_http_fetcher.return_value.fetch
+        mock_fetch.return_value = mock_response
         
         node = self.FetchNode(
             input="url",
@@ -139,10 +150,10 @@ class TestFetchNodeTimeout(unittest.TestCase):
         state = {"url": "https://example.com"}
         node.execute(state)
         
-        # Verify requests.get was called without timeout
-        mock_requests.get.assert_called_once()
-        call_args = mock_requests.get.call_args
-        self.assertNotIn('timeout', call_args[1])
+        # Verify the fetch was called without a time limit
+        mock_fetch.assert_called_once()
+        call_args = mock_fetch.call_args
+        self.assertIsNone(call_args[1]['timeout'])
 
     def test_pdf_parsing_with_timeout(self):
         """Test that PDF parsing completes within timeout."""
@@ -1,3 +1,4 @@
+import asyncio
 import json
 
 import pytest
@@ -265,3 +266,30 @@ def test_init_chat_ollama_format():
         "dummy_input", ["output"], node_config=node_config_with_schema
     )
     assert node2.llm_model.format == "dummy_schema_json"
+
+
+async def test_aexecute_single_chunk(dummy_node_with_pipe):
+    """
+    Test that aexecute() awaits the chain through ainvoke_with_timeout.
+    """
+    state = {"dummy_input": "What is the answer?", "doc": ["Only one chunk text"]}
+
+    async def fake_ainvoke_with_timeout(chain, inputs, timeout):
+        return {"content": "async single-chunk answer"}
+
+    dummy_node_with_pipe.ainvoke_with_timeout = fake_ainvoke_with_timeout
+    output_state = await dummy_node_with_pipe.aexecute(state)
+    assert output_state["output"] == {"content": "async single-chunk answer"}
+
+
+async def test_ainvoke_with_timeout_raises_timeout(dummy_node):
+    """
+    Test that ainvoke_with_timeout() converts an asyncio timeout into a Timeout.
+    """
+
+    class SlowChain:
+        async def ainvoke(self, inputs):
+            await asyncio.sleep(1)
+
+    with pytest.raises(Timeout):
+        await dummy_node.ainvoke_with_timeout(SlowChain(), {}, 0.01)
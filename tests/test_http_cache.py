@@ -0,0 +1,239 @@
+"""
+Tests for the on-disk HTTP cache of the fetch layer.
+"""
+
+import time
+from email.utils import formatdate
+
+import pytest
+
+from scrapegraphai.docloaders import http_fetcher
+from scrapegraphai.docloaders.chromium import ChromiumLoader
+from scrapegraphai.docloaders.http_cache import (
+    HttpCache,
+    freshness_lifetime,
+    get_http_cache,
+    http_cache_scope,
+    record_cache_result,
+)
+from scrapegraphai.docloaders.http_fetcher import HttpFetcher
+
+PAGE = "<html><body>" + "<p>A server-rendered catalog page.</p>" * 20 + "</body></html>"
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    fetcher = HttpFetcher(timeout=5)
+    monkeypatch.setattr(http_fetcher, "_shared_fetcher", fetcher)
+    yield fetcher
+    fetcher.close()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return HttpCache(tmp_path)
+
+
+def etag_route(etag, body=PAGE):
+    """Answers with a 304 when the request carries the current ETag."""
+
+    def route(handler):
+        if handler.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, ""
+        return 200, {"ETag": etag, "Cache-Control": "no-cache"}, body
+
+    return route
+
+
+def test_freshness_lifetime_follows_cache_headers():
+    now = time.time()
+
+    assert freshness_lifetime({"cache-control": "max-age=60"}, now) == 60
+    assert freshness_lifetime({"cache-control": "max-age=60", "age": "20"}, now) == 40
+    assert freshness_lifetime({"cache-control": "no-cache, max-age=60"}, now) == 0
+    assert freshness_lifetime({"cache-control": "private, no-store"}, now) is None
+    assert freshness_lifetime({"vary": "*"}, now) is None
+    assert freshness_lifetime({"expires": formatdate(now + 120)}, now) == pytest.approx(
+        120, abs=1
+    )
+    assert freshness_lifetime({"expires": "0"}, now) == 0
+    # Heuristic freshness: a tenth of the time since the last modification
+    assert freshness_lifetime(
+        {"last-modified": formatdate(now - 1000)}, now
+    ) == pytest.approx(100, abs=1)
+    assert freshness_lifetime({}, now) == 0
+
+
+def test_fresh_responses_are_served_without_a_request(route_server, fetcher, cache):
+    route_server.routes["/page"] = (200, {"Cache-Control": "max-age=3600"}, PAGE)
+    url = route_server.get_url("/page")
+
+    with http_cache_scope() as stats:
+        first = fetcher.fetch(url, cache=cache)
+        second = fetcher.fetch(url, cache=cache)
+
+    assert first.text == second.text == PAGE
+    assert route_server.paths() == ["/page"]
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["bytes_saved"] == len(PAGE)
+
+
+def test_stale_responses_are_revalidated(route_server, fetcher, cache):
+    route_server.routes["/page"] = etag_route('"v1"')
+    url = route_server.get_url("/page")
+
+    with http_cache_scope() as stats:
+        fetcher.fetch(url, cache=cache)
+        revalidated = fetcher.fetch(url, cache=cache)
+
+    assert revalidated.status_code == 200
+    assert revalidated.text == PAGE
+    assert route_server.requests[1][1]["If-None-Match"] == '"v1"'
+    assert stats["revalidated"] == 1
+
+    # A changed page replaces the stored one
+    route_server.routes["/page"] = etag_route('"v2"', body=PAGE + "<p>new</p>")
+    assert fetcher.fetch(url, cache=cache).text.endswith("<p>new</p>")
+    assert cache.lookup(url).headers["etag"] == '"v2"'
+
+
+def test_uncacheable_responses_are_not_stored(route_server, fetcher, cache):
+    route_server.routes["/private"] = (200, {"Cache-Control": "no-store"}, PAGE)
+    route_server.routes["/plain"] = (200, {}, PAGE)
+    route_server.routes["/missing"] = (404, {"Cache-Control": "max-age=60"}, "")
+
+    for path in ("/private", "/plain", "/missing"):
+        fetcher.fetch(route_server.get_url(path), cache=cache)
+
+    assert cache.size() == 0
+
+
+def test_least_recently_used_responses_are_evicted(tmp_path):
+    cache = HttpCache(tmp_path, max_size=2500)
+    headers = {"cache-control": "max-age=60"}
+
+    cache.store("http://a.com/", 200, headers, b"a" * 1000)
+    cache.store("http://b.com/", 200, headers, b"b" * 1000)
+    cache.lookup("http://a.com/")
+    cache.store("http://c.com/", 200, headers, b"c" * 1000)
+
+    assert cache.lookup("http://b.com/") is None
+    assert cache.lookup("http://a.com/").body == b"a" * 1000
+    assert cache.size() <= 2500
+    # Responses larger than the whole cache are never stored
+    assert cache.store("http://d.com/", 200, headers, b"d" * 5000) is None
+
+
+def test_loader_serves_http_tier_from_the_cache(route_server, fetcher, tmp_path):
+    route_server.routes["/page"] = (200, {"Cache-Control": "max-age=3600"}, PAGE)
+    url = route_server.get_url("/page")
+    options = {"path": str(tmp_path), "max_size": 1024 * 1024}
+
+    with http_cache_scope() as stats:
+        for _ in range(2):
+            loader = ChromiumLoader([url], http_first=True, http_cache=options)
+            assert list(loader.lazy_load())[0].page_content == PAGE
+
+    assert route_server.paths() == ["/page"]
+    assert stats["requests"] == 2
+    assert stats["hits"] == 1
+
+
+class FakeRequest:
+    def __init__(self, url):
+        self.url = url
+        self.headers = {"user-agent": "browser"}
+
+
+class FakeAPIResponse:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, url, server):
+        self.request = FakeRequest(url)
+        self.server = server
+        self.fulfilled = None
+
+    async def fetch(self, headers=None):
+        self.server.requests.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeAPIResponse(304, {"etag": '"v1"'}, b"")
+        return FakeAPIResponse(
+            200,
+            {"etag": '"v1"', "content-encoding": "gzip", "set-cookie": "a=1"},
+            PAGE.encode(),
+        )
+
+    async def fulfill(self, status=None, headers=None, body=None):
+        self.fulfilled = (status, headers, body)
+
+
+class FakeServer:
+    def __init__(self):
+        self.requests = []
+
+
+class FakeCachedPage:
+    def __init__(self, server):
+        self.server = server
+        self.routes = []
+
+    async def route(self, matcher, handler, times=None):
+        self.routes.append((matcher, handler))
+
+    async def load(self, url):
+        matcher, handler = self.routes[-1]
+        assert matcher(url)
+        route = FakeRoute(url, self.server)
+        await handler(route)
+        return route.fulfilled
+
+
+async def test_browser_main_document_is_revalidated(tmp_path):
+    loader = ChromiumLoader(["http://example.com"], http_cache=str(tmp_path))
+    server = FakeServer()
+    results = []
+
+    for _ in range(2):
+        page = FakeCachedPage(server)
+        await loader._route_through_cache(page, "http://example.com", results)
+        status, headers, body = await page.load("http://example.com/")
+        assert (status, body) == (200, PAGE.encode())
+        assert "content-encoding" not in headers
+
+    assert [result[0] for result in results] == ["miss", "revalidated"]
+    assert server.requests[1]["If-None-Match"] == '"v1"'
+    assert "set-cookie" not in loader.http_cache.lookup("http://example.com").headers
+
+
+def test_get_http_cache_resolves_option(tmp_path):
+    cache = HttpCache(tmp_path / "own")
+
+    assert get_http_cache(None) is None
+    assert get_http_cache(cache) is cache
+    assert get_http_cache(str(tmp_path)) is get_http_cache({"path": tmp_path})
+    with pytest.raises(ValueError):
+        get_http_cache({"max_size": 10})
+    with pytest.raises(ValueError):
+        get_http_cache(42)
+
+
+def test_scopes_report_to_their_parent(cache):
+    entry = cache.store("http://a.com/", 200, {"cache-control": "max-age=60"}, b"x")
+
+    with http_cache_scope() as outer:
+        with http_cache_scope() as inner:
+            record_cache_result("hit", entry)
+        record_cache_result("miss")
+
+    assert inner["requests"] == 1
+    assert outer["requests"] == 2
+    assert outer["bytes_saved"] == 1
@@ -0,0 +1,148 @@
+"""
+Tests for the HTTP tier of the fetch layer and its browser fallback.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from scrapegraphai.docloaders import http_fetcher
+from scrapegraphai.docloaders.chromium import ChromiumLoader
+from scrapegraphai.docloaders.http_fetcher import (
+    BROWSER_TIER,
+    HTTP_TIER,
+    HttpFetcher,
+    needs_browser,
+    proxy_url,
+)
+
+ARTICLE = (
+    "<html><head><title>Catalog</title><script>var tracking = 1;</script></head>"
+    "<body><main>"
+    + "".join(f"<p>Product {i} is a server-rendered item.</p>" for i in range(20))
+    + "</main></body></html>"
+)
+SPA = (
+    '<html><head><script src="/bundle.js"></script></head>'
+    '<body><div id="root"></div></body></html>'
+)
+NOSCRIPT = (
+    "<html><body><noscript>You need to enable JavaScript to run this app."
+    "</noscript><div id='app'>Loading...</div></body></html>"
+)
+
+
+def make_response(body, status=200):
+    return httpx.Response(status, text=body)
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    fetcher = HttpFetcher(timeout=5)
+    monkeypatch.setattr(http_fetcher, "_shared_fetcher", fetcher)
+    yield fetcher
+    fetcher.close()
+
+
+@pytest.fixture
+def browser_calls(monkeypatch):
+    calls = []
+
+    async def fake_browser(self, url, browser_name="chromium"):
+        calls.append(url)
+        return f"<html>rendered {url}</html>"
+
+    monkeypatch.setattr(ChromiumLoader, "ascrape_playwright", fake_browser)
+    return calls
+
+
+def test_needs_browser_heuristics():
+    assert needs_browser(make_response(ARTICLE)) is None
+    assert needs_browser(make_response("  ")) == "empty body"
+    assert needs_browser(make_response(SPA)) == "empty single-page application root"
+    assert "noscript" in needs_browser(make_response(NOSCRIPT))
+    assert needs_browser(make_response(ARTICLE, status=403)) == "HTTP status 403"
+    assert "little visible text" in needs_browser(
+        make_response("<html><body><p>Hi</p></body></html>")
+    )
+
+
+def test_proxy_url_includes_credentials():
+    assert proxy_url(None) is None
+    assert proxy_url({"server": "1.2.3.4:8080"}) == "http://1.2.3.4:8080"
+    assert (
+        proxy_url({"server": "http://proxy:3128", "username": "u", "password": "p"})
+        == "http://u:p@proxy:3128"
+    )
+
+
+def test_server_rendered_pages_skip_the_browser(route_server, fetcher, browser_calls):
+    route_server.routes["/article"] = (200, {}, ARTICLE)
+    url = route_server.get_url("/article")
+
+    docs = list(ChromiumLoader([url], http_first=True).lazy_load())
+
+    assert docs[0].page_content == ARTICLE
+    assert browser_calls == []
+    assert fetcher.preferred_tier(url) == HTTP_TIER
+
+
+def test_client_rendered_pages_fall_back_to_the_browser(
+    route_server, fetcher, browser_calls
+):
+    route_server.routes["/spa"] = (200, {}, SPA)
+    route_server.routes["/article"] = (200, {}, ARTICLE)
+    spa_url = route_server.get_url("/spa")
+    article_url = route_server.get_url("/article")
+
+    docs = list(ChromiumLoader([spa_url], http_first=True).lazy_load())
+
+    assert docs[0].page_content == f"<html>rendered {spa_url}</html>"
+    assert browser_calls == [spa_url]
+    assert fetcher.preferred_tier(spa_url) == BROWSER_TIER
+
+    # The host is remembered as needing a browser, plain HTTP is not tried again
+    list(ChromiumLoader([article_url], http_first=True).lazy_load())
+    assert browser_calls == [spa_url, article_url]
+    assert route_server.paths() == ["/spa"]
+
+
+def test_server_errors_are_not_remembered(route_server, fetcher, browser_calls):
+    route_server.routes["/busy"] = (503, {}, "Service Unavailable")
+    url = route_server.get_url("/busy")
+
+    list(ChromiumLoader([url], http_first=True).lazy_load())
+
+    assert browser_calls == [url]
+    assert fetcher.preferred_tier(url) is None
+
+
+def test_unreachable_host_falls_back_to_the_browser(fetcher, browser_calls):
+    url = "http://127.0.0.1:9/unreachable"
+
+    docs = list(ChromiumLoader([url], http_first=True).lazy_load())
+
+    assert docs[0].page_content == f"<html>rendered {url}</html>"
+
+
+async def test_connections_are_shared_across_event_loops(route_server, fetcher):
+    route_server.routes["/article"] = (200, {}, ARTICLE)
+    url = route_server.get_url("/article")
+
+    sync_response = await asyncio.to_thread(fetcher.fetch, url)
+    async_response = await fetcher.afetch(url)
+
+    assert sync_response.text == async_response.text == ARTICLE
+    assert len(fetcher._clients) == 1
+    assert route_server.requests[0][1]["User-Agent"].startswith("Mozilla/5.0")
+
+
+def test_remembered_hosts_are_bounded():
+    fetcher = HttpFetcher(max_remembered_hosts=2)
+
+    for host in ("a.com", "b.com", "c.com"):
+        fetcher.remember_tier(f"http://{host}/", HTTP_TIER)
+
+    assert fetcher.preferred_tier("http://a.com/page") is None
+    assert fetcher.preferred_tier("http://c.com/page") == HTTP_TIER
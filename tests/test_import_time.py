@@ -0,0 +1,86 @@
+"""
+Tests that importing the packages stays cheap and free of side effects.
+"""
+
+import json
+import subprocess
+import sys
+
+from scrapegraphai.utils.model_types import is_model_instance
+
+# Generous budget: the lazy packages import in a few milliseconds, the eager
+# ones used to take several seconds
+IMPORT_TIME_BUDGET = 1.0
+
+PROVIDER_MODULES = [
+    "langchain_openai",
+    "langchain_aws",
+    "langchain_mistralai",
+    "langchain_community.chat_models",
+    "langchain_community.callbacks",
+]
+
+IMPORT_SCRIPT = """
+import json, logging, sys, time
+start = time.perf_counter()
+import scrapegraphai, scrapegraphai.graphs, scrapegraphai.nodes, scrapegraphai.utils
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "modules": [m for m in %r if m in sys.modules],
+    "level": logging.getLogger("scrapegraphai").level,
+}))
+"""
+
+
+def run_import(tmp_path):
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT % (PROVIDER_MODULES,)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"HOME": str(tmp_path), "PATH": ""},
+    )
+    return json.loads(result.stdout)
+
+
+def test_package_import_is_lazy(tmp_path):
+    report = run_import(tmp_path)
+
+    assert report["modules"] == []
+    assert report["elapsed"] < IMPORT_TIME_BUDGET
+
+
+def test_package_import_has_no_side_effects(tmp_path):
+    report = run_import(tmp_path)
+
+    # Neither the telemetry config file nor the verbosity are touched
+    assert list(tmp_path.iterdir()) == []
+    assert report["level"] != 20
+
+
+def test_lazy_attributes_resolve():
+    import scrapegraphai.graphs as graphs
+    import scrapegraphai.nodes as nodes
+    import scrapegraphai.utils as utils
+
+    for package in (graphs, nodes, utils):
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+            assert name in dir(package)
+
+    # Submodules sharing the name of a function do not shadow it
+    import scrapegraphai.utils.convert_to_md  # noqa: F401
+
+    assert callable(utils.convert_to_md)
+
+
+def test_is_model_instance_checks_class_hierarchy():
+    ChatOpenAI = type("ChatOpenAI", (), {"__module__": "langchain_openai.chat_models"})
+    Subclass = type("AzureModel", (ChatOpenAI,), {"__module__": "my_project"})
+    Impostor = type("ChatOpenAI", (), {"__module__": "my_project"})
+
+    assert is_model_instance(ChatOpenAI(), "ChatOpenAI")
+    assert is_model_instance(Subclass(), "ChatMistralAI", "ChatOpenAI")
+    assert not is_model_instance(Impostor(), "ChatOpenAI")
+    assert not is_model_instance(ChatOpenAI(), "ChatBedrock")
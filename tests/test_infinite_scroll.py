@@ -0,0 +1,231 @@
+"""
+Tests for the non-blocking infinite scroll mode of ChromiumLoader.
+"""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.documents import Document
+
+from scrapegraphai.docloaders import chromium
+from scrapegraphai.docloaders.browser_pool import BrowserPool
+from scrapegraphai.docloaders.chromium import ChromiumLoader
+from scrapegraphai.nodes import FetchNode
+
+
+class FakeFeedPage:
+    """A feed loading a batch of items after each scroll, until none is left."""
+
+    def __init__(self, batches, load_delay=0.01):
+        self.batches = list(batches)
+        self.load_delay = load_delay
+        self.items = ["<li>item 0</li>"]
+        self.added = []
+        self.scrolls = 0
+        self.observing = None
+        self.url = None
+        self.mouse = self
+
+    async def route(self, pattern, handler, times=None):
+        return
+
+    async def goto(self, url, wait_until=None):
+        self.url = url
+
+    async def wait_for_load_state(self, state):
+        return
+
+    async def content(self):
+        return f"<html><ul>{''.join(self.items)}</ul></html>"
+
+    async def evaluate(self, script, arg=None):
+        if script == chromium._OBSERVE_MUTATIONS_JS:
+            self.observing = arg
+            return None
+        if script == chromium._SCROLL_AND_WAIT_JS:
+            self.scrolls += 1
+            await asyncio.sleep(self.load_delay)
+            batch = self.batches.pop(0) if self.batches else []
+            self.items += batch
+            self.added += batch
+            return len(batch)
+        if script == chromium._TAKE_ADDED_HTML_JS:
+            added, self.added = self.added, []
+            return "\n".join(added)
+        # Page height queried by the legacy scroll mode
+        return 1000
+
+    async def wheel(self, x, y):
+        return
+
+
+class FakeContext:
+    def __init__(self, page):
+        self.page = page
+        self.closed = False
+
+    async def add_init_script(self, script):
+        return
+
+    async def new_page(self):
+        return self.page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, page):
+        self.page = page
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **options):
+        return FakeContext(self.page)
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self, page):
+        self.page = page
+        self.chromium = self
+        self.launches = 0
+
+    async def launch(self, **options):
+        self.launches += 1
+        return FakeBrowser(self.page)
+
+    async def start(self):
+        return self
+
+    async def stop(self):
+        return
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def batch(start, count):
+    return [f"<li>item {i}</li>" for i in range(start, start + count)]
+
+
+@pytest.fixture
+def feed(monkeypatch):
+    page = FakeFeedPage([batch(1, 2), batch(3, 2), batch(5, 1)])
+    monkeypatch.setattr(
+        "playwright.async_api.async_playwright", lambda: FakePlaywright(page)
+    )
+    return page
+
+
+def test_scrolls_until_no_new_content(feed):
+    loader = ChromiumLoader(
+        ["https://feed.com/"], infinite_scroll={"max_idle_scrolls": 2}
+    )
+
+    docs = list(loader.lazy_load())
+
+    assert len(docs) == 1
+    assert all(f"<li>item {i}</li>" in docs[0].page_content for i in range(6))
+    # Three scrolls loaded items, the next two found nothing new
+    assert feed.scrolls == 5
+    assert feed.observing is False
+
+
+def test_max_scrolls_bounds_scrolling(feed):
+    loader = ChromiumLoader(["https://feed.com/"], infinite_scroll={"max_scrolls": 1})
+
+    docs = list(loader.lazy_load())
+
+    assert feed.scrolls == 1
+    assert "item 3" not in docs[0].page_content
+
+
+async def test_incremental_mode_yields_html_deltas(feed):
+    loader = ChromiumLoader(
+        ["https://feed.com/"], infinite_scroll={"incremental": True}
+    )
+
+    docs = [doc async for doc in loader.alazy_load()]
+
+    assert [doc.metadata["chunk"] for doc in docs] == [0, 1, 2, 3]
+    assert docs[0].page_content == "<html><ul><li>item 0</li></ul></html>"
+    assert docs[1].page_content == "<li>item 1</li>\n<li>item 2</li>"
+    assert docs[3].page_content == "<li>item 5</li>"
+    assert feed.observing is True
+
+
+async def test_incremental_mode_runs_on_the_browser_pool(feed):
+    pool = BrowserPool(max_browsers=1)
+    loader = ChromiumLoader(
+        ["https://feed.com/"],
+        browser_pool=pool,
+        infinite_scroll={"incremental": True},
+    )
+
+    chunks = [chunk async for chunk in loader.astream_infinite_scroll(loader.urls[0])]
+
+    assert len(chunks) == 4
+    assert chunks[2] == "<li>item 3</li>\n<li>item 4</li>"
+    assert pool.launches == 1
+    await asyncio.to_thread(pool.close)
+
+
+async def test_scrolling_does_not_block_the_event_loop(feed):
+    feed.load_delay = 0.1
+    loader = ChromiumLoader(["https://feed.com/"], infinite_scroll=True)
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.02)
+
+    ticking = asyncio.ensure_future(ticker())
+    await loader.ascrape_infinite_scroll("https://feed.com/")
+    await loader.ascrape_playwright_scroll(
+        "https://feed.com/", timeout=0.3, scroll=5000, sleep=0.1
+    )
+    ticking.cancel()
+
+    assert max(b - a for a, b in zip(ticks, ticks[1:])) < 0.09
+
+
+def test_fetch_node_joins_incremental_documents(mocker):
+    loader = mocker.patch("scrapegraphai.nodes.fetch_node.ChromiumLoader")
+    loader.return_value.load.return_value = [
+        Document(page_content="<ul><li>item 0</li></ul>", metadata={"chunk": 0}),
+        Document(page_content="<li>item 1</li>", metadata={"chunk": 1}),
+    ]
+    node = FetchNode(
+        input="url",
+        output=["doc"],
+        node_config={"loader_kwargs": {"infinite_scroll": {"incremental": True}}},
+    )
+
+    state = node.execute({"url": "https://feed.com/"})
+
+    assert "infinite_scroll" in loader.call_args.kwargs
+    assert "item 0" in state["doc"][0].page_content
+    assert "item 1" in state["doc"][0].page_content
+
+
+def test_invalid_infinite_scroll_options_raise():
+    with pytest.raises(ValueError, match="Unknown infinite_scroll keys"):
+        ChromiumLoader(["https://feed.com/"], infinite_scroll={"pixels": 100})
+    with pytest.raises(ValueError, match="at least 1"):
+        ChromiumLoader(["https://feed.com/"], infinite_scroll={"max_scrolls": 0})
+    with pytest.raises(ValueError, match="JavaScript disabled"):
+        ChromiumLoader(
+            ["https://feed.com/"], infinite_scroll=True, javascript_enabled=False
+        )
+    with pytest.raises(ValueError, match="not set"):
+        asyncio.run(ChromiumLoader(["https://feed.com/"]).ascrape_infinite_scroll("x"))
@@ -0,0 +1,163 @@
+"""
+Tests for the per-host politeness scheduler.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from scrapegraphai.docloaders import http_fetcher
+from scrapegraphai.docloaders.chromium import ChromiumLoader
+from scrapegraphai.docloaders.http_fetcher import HttpFetcher
+from scrapegraphai.docloaders.politeness import (
+    PolitenessScheduler,
+    get_politeness_scheduler,
+)
+from scrapegraphai.docloaders.robots_txt import RobotsTxt
+
+PAGE = "<html><body>" + "<p>A server-rendered catalog page.</p>" * 20 + "</body></html>"
+
+ROBOTS = """
+User-agent: GPTBot
+Disallow: /
+
+User-agent: ScrapeGraphAI
+User-agent: OtherBot
+Crawl-delay: 0.25
+
+User-agent: *
+Crawl-delay: 10
+"""
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    fetcher = HttpFetcher(timeout=5)
+    monkeypatch.setattr(http_fetcher, "_shared_fetcher", fetcher)
+    yield fetcher
+    fetcher.close()
+
+
+async def start_times(scheduler, urls, hold=0.0):
+    starts = []
+
+    async def fetch(url):
+        async with scheduler.slot(url):
+            starts.append(time.monotonic())
+            await asyncio.sleep(hold)
+
+    await asyncio.gather(*(fetch(url) for url in urls))
+    return sorted(starts)
+
+
+def test_crawl_delay_follows_the_user_agent_groups():
+    robots = RobotsTxt(ROBOTS)
+
+    assert robots.crawl_delay("ScrapeGraphAI") == 0.25
+    assert robots.crawl_delay("SomeBot") == 10
+    assert robots.crawl_delay("GPTBot") is None
+    assert RobotsTxt("User-agent: *\nDisallow:").crawl_delay("SomeBot") is None
+
+
+async def test_token_bucket_spaces_requests_per_host():
+    scheduler = PolitenessScheduler(
+        requests_per_second=10, burst=2, respect_crawl_delay=False
+    )
+
+    starts = await start_times(scheduler, ["http://a.com/1"] * 5 + ["http://b.com/"])
+
+    # The burst and the other host start at once, then one request every 0.1s
+    assert starts[2] - starts[0] < 0.05
+    assert starts[-1] - starts[0] == pytest.approx(0.3, abs=0.05)
+
+
+async def test_host_concurrency_is_shared_across_event_loops():
+    scheduler = PolitenessScheduler(
+        max_concurrency_per_host=1,
+        requests_per_second=1000,
+        burst=10,
+        respect_crawl_delay=False,
+    )
+    in_flight, peak = [0], [0]
+    lock = threading.Lock()
+
+    async def fetch():
+        async with scheduler.slot("http://a.com/"):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+
+    async def batch():
+        await asyncio.gather(*(fetch() for _ in range(3)))
+
+    threads = [threading.Thread(target=asyncio.run, args=(batch(),)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    await asyncio.to_thread(lambda: [thread.join(5) for thread in threads])
+
+    assert peak[0] == 1
+    assert not scheduler._hosts["a.com"].waiters
+
+
+async def test_crawl_delay_is_fetched_once_and_honoured(route_server, fetcher):
+    route_server.routes["/robots.txt"] = (200, {}, ROBOTS)
+    scheduler = PolitenessScheduler(requests_per_second=100, burst=10)
+    url = route_server.get_url("/page")
+
+    starts = await start_times(scheduler, [url] * 3)
+
+    assert route_server.paths() == ["/robots.txt"]
+    assert starts[2] - starts[0] == pytest.approx(0.5, abs=0.1)
+
+
+async def test_throttled_hosts_are_backed_off(monkeypatch):
+    scheduler = PolitenessScheduler(
+        requests_per_second=100, burst=10, respect_crawl_delay=False
+    )
+    url = "http://a.com/"
+
+    scheduler.report(url, 429)
+    scheduler.report(url, 503)
+    assert scheduler.backoff(url) == pytest.approx(0.02)
+    scheduler.report(url, 429, retry_after="0")
+    starts = await start_times(scheduler, [url] * 3)
+    assert starts[2] - starts[0] == pytest.approx(0.08, abs=0.03)
+
+    for _ in range(3):
+        scheduler.report(url, 200)
+    assert scheduler.backoff(url) == 0
+
+
+def test_loader_reports_throttling_to_the_scheduler(route_server, fetcher):
+    route_server.routes["/slow"] = (503, {"Retry-After": "0"}, "busy")
+    route_server.routes["/page"] = (200, {}, PAGE)
+    scheduler = PolitenessScheduler(requests_per_second=100, burst=10)
+    loader = ChromiumLoader(
+        [route_server.get_url("/page")], http_first=True, politeness=scheduler
+    )
+
+    assert [doc.page_content for doc in loader.lazy_load()] == [PAGE]
+    assert route_server.paths() == ["/robots.txt", "/page"]
+
+    asyncio.run(loader.ascrape_http(route_server.get_url("/slow")))
+    assert scheduler.backoff(route_server.get_url("/")) > 0
+
+
+def test_get_politeness_scheduler_resolves_option():
+    scheduler = PolitenessScheduler()
+
+    assert get_politeness_scheduler(None) is None
+    assert get_politeness_scheduler(scheduler) is scheduler
+    assert get_politeness_scheduler(True) is get_politeness_scheduler(True)
+    shared = get_politeness_scheduler({"burst": 4})
+    assert shared is get_politeness_scheduler({"burst": 4})
+    assert shared is not get_politeness_scheduler(True)
+    with pytest.raises(ValueError):
+        get_politeness_scheduler("fast")
+    with pytest.raises(ValueError):
+        PolitenessScheduler(max_concurrency_per_host=0)
@@ -0,0 +1,186 @@
+"""
+Tests for the blocking of the page resources not needed to read the HTML.
+"""
+
+import pytest
+
+from scrapegraphai.docloaders.chromium import ChromiumLoader
+from scrapegraphai.docloaders.resource_blocking import (
+    ResourceBlocker,
+    get_resource_blocker,
+)
+
+SUBRESOURCES = [
+    ("image", "https://shop.com/logo.png"),
+    ("font", "https://fonts.shop.com/inter.woff2"),
+    ("script", "https://www.googletagmanager.com/gtm.js"),
+    ("script", "https://shop.com/app.js"),
+    ("xhr", "https://shop.com/ads/slot?id=1"),
+]
+
+
+class FakeRequest:
+    def __init__(self, resource_type, url, navigation=False):
+        self.resource_type = resource_type
+        self.url = url
+        self.navigation = navigation
+
+    def is_navigation_request(self):
+        return self.navigation
+
+
+class FakeRoute:
+    def __init__(self, request):
+        self.request = request
+        self.outcome = None
+
+    async def abort(self, error_code=None):
+        self.outcome = "aborted"
+
+    async def fallback(self):
+        self.outcome = "fallback"
+
+
+class FakePage:
+    """Sends the requests of a page through its routes, like Playwright."""
+
+    def __init__(self):
+        self.routes = []
+        self.loaded = []
+
+    async def route(self, pattern, handler, times=None):
+        self.routes.append(handler)
+
+    async def goto(self, url, wait_until=None):
+        requests = [FakeRequest("document", url, navigation=True)] + [
+            FakeRequest(resource_type, subresource_url)
+            for resource_type, subresource_url in SUBRESOURCES
+        ]
+        for request in requests:
+            outcome = "fallback"
+            for handler in reversed(self.routes):
+                route = FakeRoute(request)
+                await handler(route)
+                outcome = route.outcome
+                if outcome != "fallback":
+                    break
+            if outcome == "fallback":
+                self.loaded.append(request.url)
+
+    async def wait_for_load_state(self, state):
+        return
+
+    async def content(self):
+        return "<html>catalog</html>"
+
+
+class FakeContext:
+    def __init__(self, options):
+        self.options = options
+        self.page = FakePage()
+
+    async def add_init_script(self, script=None, path=None):
+        return
+
+    async def new_page(self):
+        return self.page
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    async def new_context(self, **options):
+        self.contexts.append(FakeContext(options))
+        return self.contexts[-1]
+
+    async def close(self):
+        return
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browser = FakeBrowser()
+        self.chromium = self
+
+    async def launch(self, **options):
+        return self.browser
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture
+def playwright(monkeypatch):
+    fake = FakePlaywright()
+    monkeypatch.setattr("playwright.async_api.async_playwright", lambda: fake)
+    return fake
+
+
+def test_blocker_matches_types_domains_and_patterns():
+    blocker = ResourceBlocker(
+        resource_types=["image"], domains=["ads.com"], url_patterns=["*/track/*"]
+    )
+
+    assert blocker.blocks("image", "https://shop.com/logo.png")
+    assert blocker.blocks("script", "https://cdn.ads.com/tag.js")
+    assert blocker.blocks("xhr", "https://shop.com/track/view")
+    assert not blocker.blocks("script", "https://notads.com/app.js")
+    assert not blocker.blocks("document", "https://shop.com/")
+
+
+async def test_navigations_are_never_blocked():
+    blocker = ResourceBlocker(resource_types=["document"], domains=["shop.com"])
+    route = FakeRoute(FakeRequest("document", "https://shop.com/", navigation=True))
+
+    await blocker._handle(route)
+
+    assert route.outcome == "fallback"
+
+
+async def test_default_blocking_keeps_only_needed_resources(playwright):
+    loader = ChromiumLoader(["https://shop.com/"], block_resources=True)
+
+    content = await loader.ascrape_playwright("https://shop.com/")
+
+    assert content == "<html>catalog</html>"
+    assert playwright.browser.contexts[0].page.loaded == [
+        "https://shop.com/",
+        "https://shop.com/app.js",
+        "https://shop.com/ads/slot?id=1",
+    ]
+
+
+async def test_custom_patterns_and_disabled_javascript(playwright):
+    loader = ChromiumLoader(
+        ["https://shop.com/"],
+        block_resources={"resource_types": ["script"], "url_patterns": ["*/ads/*"]},
+        javascript_enabled=False,
+    )
+
+    await loader.ascrape_playwright("https://shop.com/")
+
+    context = playwright.browser.contexts[0]
+    assert context.options["java_script_enabled"] is False
+    assert context.page.loaded == [
+        "https://shop.com/",
+        "https://shop.com/logo.png",
+        "https://fonts.shop.com/inter.woff2",
+    ]
+
+
+def test_invalid_options_raise():
+    assert get_resource_blocker(None) is None
+    with pytest.raises(ValueError, match="Unknown resource types"):
+        get_resource_blocker({"resource_types": ["images"]})
+    with pytest.raises(ValueError, match="Unknown block_resources keys"):
+        get_resource_blocker({"hosts": ["ads.com"]})
+    with pytest.raises(ValueError):
+        get_resource_blocker(["image"])
+    with pytest.raises(ValueError, match="JavaScript"):
+        ChromiumLoader(
+            ["https://shop.com/"], requires_js_support=True, javascript_enabled=False
+        )
@@ -0,0 +1,115 @@
+"""
+Tests for the deterministic robots.txt evaluation and its per-host cache.
+"""
+
+import asyncio
+
+import pytest
+
+from scrapegraphai.docloaders import http_fetcher
+from scrapegraphai.docloaders.http_fetcher import HttpFetcher
+from scrapegraphai.docloaders.robots_txt import RobotsCache, RobotsTxt
+
+ROBOTS = """
+# Rules before any group apply to no crawler
+Disallow: /
+
+User-agent: GPTBot
+User-agent: ChatGPT-User
+Disallow: /
+
+User-agent: PerplexityBot/1.0
+Allow: /public
+Disallow: /*.pdf$
+Disallow: /private
+Allow: /private/open
+Crawl-delay: 2
+
+User-agent: *
+Disallow: /search?
+Disallow: /caf%C3%A9
+Allow: /search?page=
+"""
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    fetcher = HttpFetcher(timeout=5)
+    monkeypatch.setattr(http_fetcher, "_shared_fetcher", fetcher)
+    yield fetcher
+    fetcher.close()
+
+
+@pytest.mark.parametrize(
+    "path, user_agents, allowed",
+    [
+        ("/", "GPTBot", False),
+        ("/", ["ClaudeBot", "chatgpt-user"], False),
+        ("/robots.txt", "GPTBot", True),
+        ("/docs/report.pdf", "PerplexityBot", False),
+        ("/docs/report.pdf?download=1", "PerplexityBot", True),
+        # Rules of the same length: allow wins
+        ("/public/report.pdf", "PerplexityBot", True),
+        ("/private/page", "PerplexityBot", False),
+        ("/private/open/page", "PerplexityBot", True),
+        # The PerplexityBot group replaces the * group
+        ("/search?q=robots", "PerplexityBot", True),
+        ("/search?q=robots", "ClaudeBot", False),
+        ("/search?page=2", "ClaudeBot", True),
+        ("/café", "ClaudeBot", False),
+        ("/cafe", "ClaudeBot", True),
+    ],
+)
+def test_rules_follow_rfc_9309(path, user_agents, allowed):
+    robots = RobotsTxt(ROBOTS)
+
+    assert robots.allowed(f"https://example.com{path}", user_agents) is allowed
+
+
+def test_crawl_delay_and_special_statuses():
+    robots = RobotsTxt(ROBOTS)
+
+    assert robots.crawl_delay("PerplexityBot") == 2
+    assert robots.crawl_delay("GPTBot") is None
+    assert RobotsTxt(status="unavailable").allowed("/private", "GPTBot")
+    assert not RobotsTxt(status="unreachable").allowed("/", "GPTBot")
+    assert RobotsTxt("<html><body>Not found</body></html>").unrecognized
+    assert RobotsTxt(ROBOTS).unrecognized is None
+
+
+def test_rules_are_fetched_once_per_host(route_server, fetcher):
+    route_server.routes["/robots.txt"] = (200, {}, ROBOTS)
+    cache = RobotsCache()
+
+    for path in ("/", "/private", "/search?q=1"):
+        cache.get(route_server.get_url(path))
+
+    assert route_server.paths() == ["/robots.txt"]
+    assert not cache.get(route_server.get_url("/")).allowed("/", "GPTBot")
+
+
+async def test_concurrent_lookups_share_one_request(route_server, fetcher):
+    route_server.routes["/robots.txt"] = (200, {}, ROBOTS)
+    cache = RobotsCache()
+
+    results = await asyncio.gather(
+        *(cache.aget(route_server.get_url(f"/{i}")) for i in range(5))
+    )
+
+    assert route_server.paths() == ["/robots.txt"]
+    assert all(result is results[0] for result in results)
+
+
+def test_expired_rules_are_refetched_and_kept_if_unreachable(route_server, fetcher):
+    route_server.routes["/robots.txt"] = (200, {}, ROBOTS)
+    cache = RobotsCache(ttl=0)
+    url = route_server.get_url("/")
+
+    assert not cache.get(url).allowed(url, "GPTBot")
+    route_server.routes["/robots.txt"] = (503, {}, "")
+    assert cache.get(url).status == "ok"
+    assert len(route_server.paths()) == 2
+
+    route_server.routes["/robots.txt"] = (404, {}, "")
+    cache.clear()
+    assert cache.get(url).allowed(url, "GPTBot")
@@ -0,0 +1,125 @@
+"""
+Tests for the background telemetry sender.
+"""
+
+import queue
+from unittest.mock import patch
+
+import pytest
+
+from scrapegraphai.telemetry import telemetry
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Enables telemetry and records the requests instead of sending them."""
+    requests = []
+
+    def fake_post(url, body):
+        requests.append((url, body))
+        return b""
+
+    monkeypatch.setattr(telemetry, "g_telemetry_enabled", True)
+    monkeypatch.setattr(telemetry, "g_anonymous_id", "test-id")
+    monkeypatch.setattr(telemetry, "CALL_COUNTER", 0)
+    monkeypatch.setattr(telemetry, "_post_json", fake_post)
+    yield requests
+    telemetry.flush_telemetry()
+
+
+def test_disabled_telemetry_builds_nothing(monkeypatch):
+    monkeypatch.setattr(telemetry, "g_telemetry_enabled", False)
+
+    with patch.object(telemetry, "_queue_event") as queue_event:
+        telemetry.log_graph_execution(
+            graph_name="SmartScraperGraph",
+            source=["https://example.com"],
+            prompt="q",
+            schema=None,
+            llm_model="gpt",
+            embedder_model=None,
+            source_type="url",
+            execution_time=1.0,
+            content="x" * 10_000,
+        )
+        telemetry.log_event("function_usage", {})
+
+    queue_event.assert_not_called()
+
+
+def test_events_are_sent_by_the_worker(sent):
+    for index in range(10):
+        telemetry.log_event("function_usage", {"index": index})
+
+    assert telemetry.flush_telemetry()
+
+    assert {url for url, _ in sent} == {telemetry.PROXY_URL}
+    assert [body["properties"]["index"] for _, body in sent] == list(range(10))
+
+
+def test_full_queue_drops_events(sent, monkeypatch):
+    monkeypatch.setattr(telemetry, "_queue", queue.Queue(maxsize=2))
+    monkeypatch.setattr(telemetry, "_start_worker", lambda: None)
+    monkeypatch.setattr(telemetry, "DROPPED_EVENTS", 0)
+
+    for index in range(5):
+        telemetry.log_event("function_usage", {"index": index})
+
+    assert telemetry._queue.qsize() == 2
+    assert telemetry.DROPPED_EVENTS == 3
+
+
+def test_large_fields_are_truncated():
+    event = {
+        "event": "graph_execution",
+        "properties": {
+            "content": "x" * 100_000,
+            "response": {"items": ["y" * 100] * 1000},
+            "total_tokens": 12,
+            "prompt": "short",
+        },
+    }
+
+    properties = telemetry._cap_payload(event)["properties"]
+
+    assert len(properties["content"]) < telemetry.MAX_FIELD_CHARS + 20
+    assert isinstance(properties["response"], str)
+    assert properties["response"].endswith("[truncated]")
+    assert properties["total_tokens"] == 12
+    assert properties["prompt"] == "short"
+    assert len(event["properties"]["content"]) == 100_000
+
+
+def test_events_are_truncated_when_queued(monkeypatch):
+    monkeypatch.setattr(telemetry, "g_telemetry_enabled", True)
+    monkeypatch.setattr(telemetry, "CALL_COUNTER", 0)
+    monkeypatch.setattr(telemetry, "_queue", queue.Queue())
+    monkeypatch.setattr(telemetry, "_start_worker", lambda: None)
+
+    telemetry.log_graph_execution(
+        graph_name="SmartScraperGraph",
+        source=["https://example.com"],
+        prompt="q",
+        schema=None,
+        llm_model="gpt",
+        embedder_model=None,
+        source_type="url",
+        execution_time=1.0,
+        content="x" * 100_000,
+    )
+
+    event = telemetry._queue.get_nowait()
+    assert len(event["properties"]["content"]) < telemetry.MAX_FIELD_CHARS + 20
+
+
+def test_exit_flush_skips_an_empty_queue(monkeypatch):
+    monkeypatch.setattr(telemetry, "_queue", queue.Queue())
+
+    with patch.object(telemetry, "flush_telemetry") as flush:
+        telemetry._flush_at_exit()
+        flush.assert_not_called()
+
+        telemetry._queue.put_nowait({"event": "function_usage"})
+        telemetry._flush_at_exit()
+        flush.assert_called_once_with(telemetry.EXIT_FLUSH_TIMEOUT)
+
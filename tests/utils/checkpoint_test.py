@@ -0,0 +1,47 @@
+"""
+Tests for the SQLite checkpoint store.
+"""
+
+from unittest.mock import patch
+
+from scrapegraphai.utils.checkpoint import CheckpointStore
+
+
+def test_save_load_and_status(tmp_path):
+    store = CheckpointStore(tmp_path)
+    state = {"url": "https://example.com", "doc": ["content"]}
+
+    assert store.save("run-1", "Custom", "ParseNode", state, {"exec_info": []})
+    checkpoint = store.load("run-1")
+    assert checkpoint["state"] == state
+    assert checkpoint["next_node"] == "ParseNode"
+    assert checkpoint["status"] == "running"
+
+    store.set_status("run-1", "failed", "boom")
+    checkpoint = store.load("run-1")
+    assert checkpoint["status"] == "failed"
+    assert checkpoint["error"] == "boom"
+    assert checkpoint["state"] == state
+    assert [run["run_id"] for run in store.list_runs(status="failed")] == ["run-1"]
+
+
+def test_unpicklable_state_is_skipped(tmp_path):
+    store = CheckpointStore(tmp_path)
+    state = {"url": "https://example.com", "vectorial_db": lambda: None}
+
+    with patch("scrapegraphai.utils.checkpoint.logger") as logger:
+        assert store.save("run-1", "Custom", "RAGNode", {"url": "u"}, {})
+        assert not store.save("run-1", "Custom", "GenerateNode", state, {})
+        assert not store.save("run-1", "Custom", None, state, {})
+
+    assert store.load("run-1")["next_node"] == "RAGNode"
+    logger.warning.assert_called_once()
+    assert "vectorial_db" in logger.warning.call_args[0][0]
+
+
+def test_delete(tmp_path):
+    store = CheckpointStore(tmp_path)
+    store.save("run-1", "Custom", "Node", {}, {})
+    store.delete("run-1")
+    assert store.load("run-1") is None
+    assert store.list_runs() == []
@@ -0,0 +1,157 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from scrapegraphai.graphs import BaseGraph
+from scrapegraphai.nodes import DescriptionNode, GenerateAnswerNodeKLevel, RAGNode
+from scrapegraphai.utils.crawl_store import CrawlStore, content_hash, site_of
+
+URL = "https://shop.com/catalog"
+
+
+def test_record_fetch_detects_changed_content(tmp_path):
+    store = CrawlStore(tmp_path)
+
+    assert store.record_fetch(URL, content_hash("v1"), fetched_at=1.0)
+    assert not store.record_fetch(URL, content_hash("v1"), fetched_at=2.0)
+    assert store.pages("https://shop.com")[URL]["fetched_at"] == 2.0
+    assert store.record_fetch(URL, content_hash("v2"))
+    assert site_of("HTTPS://Shop.com:8443/a") == "https://shop.com:8443"
+
+
+def test_derived_data_is_keyed_by_content(tmp_path):
+    store = CrawlStore(tmp_path)
+    v1, v2 = content_hash("v1"), content_hash("v2")
+    store.record_fetch(URL, v1)
+    store.save_summary(URL, v1, "model-a", "A catalog")
+    store.mark_indexed(URL, "summary-a")
+
+    # The store is persistent
+    store = CrawlStore(tmp_path)
+    assert store.summary(URL, v1, "model-a") == "A catalog"
+    assert store.summary(URL, v1, "model-b") is None
+    assert store.is_indexed(URL, v1, "summary-a")
+
+    store.record_fetch(URL, v2)
+    assert store.summary(URL, v2, "model-a") is None
+    assert not store.is_indexed(URL, v2, "summary-a")
+    assert store.pages(URL)[URL] == {
+        "content_hash": v2,
+        "fetched_at": store.pages(URL)[URL]["fetched_at"],
+        "summary": None,
+        "indexed": False,
+    }
+
+
+def test_description_node_summarizes_only_changed_pages(tmp_path):
+    calls = []
+
+    def summarize(prompt):
+        calls.append(prompt.to_string())
+        return AIMessage(content=f"summary {len(calls)}")
+
+    node = DescriptionNode(
+        input="docs",
+        output=["docs"],
+        node_config={
+            "llm_model": RunnableLambda(summarize),
+            "crawl_store": CrawlStore(tmp_path),
+        },
+    )
+    pages = {f"https://shop.com/{i}": f"page {i}" for i in range(3)}
+
+    def run():
+        docs = [{"source": url, "document": text} for url, text in pages.items()]
+        return node.execute({"docs": docs})["docs"]
+
+    first = run()
+    assert len(calls) == 3
+    assert all(doc["changed"] for doc in first)
+
+    pages["https://shop.com/1"] = "page 1, updated"
+    second = run()
+
+    assert len(calls) == 4
+    assert "page 1, updated" in calls[-1]
+    assert [doc["changed"] for doc in second] == [False, True, False]
+    assert second[0]["summary"] == first[0]["summary"]
+    assert second[1]["summary"] == "summary 4"
+
+
+class FakeQdrantClient:
+    """An on-disk Qdrant collection matching the documents by keyword."""
+
+    def __init__(self, path):
+        self.points = {}
+
+    def add(self, collection_name, documents, metadata, ids):
+        for point_id, document, meta in zip(ids, documents, metadata):
+            self.points[point_id] = (document, meta)
+
+    def query(self, collection_name, query_text):
+        return [
+            SimpleNamespace(id=point_id, document=document, metadata=meta, score=1.0)
+            for point_id, (document, meta) in self.points.items()
+            if any(word in document for word in query_text.split())
+        ]
+
+    def collection_exists(self, collection_name):
+        return bool(self.points)
+
+    def delete(self, collection_name, points_selector):
+        for point_id in points_selector.points:
+            self.points.pop(point_id, None)
+
+
+def test_answers_use_the_pages_of_the_collection_hits(tmp_path, monkeypatch):
+    qdrant_client = pytest.importorskip("qdrant_client")
+    monkeypatch.setattr(qdrant_client, "QdrantClient", FakeQdrantClient)
+    store = CrawlStore(tmp_path)
+    chunks = []
+
+    def summarize(prompt):
+        return AIMessage(content=f"summary of {prompt.to_string()}")
+
+    def answer(prompt):
+        chunks.append(prompt.to_string())
+        return AIMessage(content=json.dumps({"answer": len(chunks)}))
+
+    description = DescriptionNode(
+        input="docs",
+        output=["docs"],
+        node_config={"llm_model": RunnableLambda(summarize), "crawl_store": store},
+    )
+    rag = RAGNode(
+        input="docs",
+        output=["vectorial_db"],
+        node_config={"llm_model": None, "crawl_store": store},
+    )
+    generate = GenerateAnswerNodeKLevel(
+        input="vectorial_db",
+        output=["answer"],
+        node_config={"llm_model": RunnableLambda(answer)},
+    )
+    graph = BaseGraph(
+        nodes=[description, rag, generate],
+        edges=[(description, rag), (rag, generate)],
+        entry_point=description,
+    )
+
+    def run(pages, complete):
+        chunks.clear()
+        docs = [{"source": url, "document": text} for url, text in pages.items()]
+        state, _ = graph.execute(
+            {"docs": docs, "crawl_complete": complete, "user_prompt": "shoes hats"}
+        )
+        return state
+
+    run({URL + "/shoes": "Red shoes", URL + "/hats": "Blue hats"}, complete=True)
+    # The crawl stopped early, the shoes page stays in the collection
+    state = run({URL + "/about": "About us", URL + "/hats": "Blue hats"}, False)
+
+    assert state["answer"] == {"answer": 2}
+    assert "Blue hats" in chunks[0]
+    assert not any("Red shoes" in chunk for chunk in chunks)
@@ -0,0 +1,91 @@
+"""
+Tests for the per-context token accounting of the LLM callback manager.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from scrapegraphai.utils.llm_callback_manager import CustomLLMCallbackManager
+
+
+def make_model(tokens=5):
+    message = AIMessage(
+        content="answer",
+        usage_metadata={
+            "input_tokens": tokens - 2,
+            "output_tokens": 2,
+            "total_tokens": tokens,
+        },
+    )
+    return GenericFakeChatModel(messages=repeat(message))
+
+
+def test_callback_counts_calls_in_scope():
+    manager = CustomLLMCallbackManager()
+    model = make_model()
+
+    model.invoke("before")
+    with manager.get_callback(model, "fake-model") as cb:
+        model.invoke("first")
+        model.invoke("second")
+    model.invoke("after")
+
+    assert cb.total_tokens == 10
+    assert cb.prompt_tokens == 6
+    assert cb.completion_tokens == 4
+    assert cb.successful_requests == 2
+
+
+def test_nested_scopes_add_up_to_the_enclosing_scope():
+    manager = CustomLLMCallbackManager()
+    model = make_model()
+
+    with manager.get_callback(model, "fake-model") as outer:
+        model.invoke("outer")
+        with manager.get_callback(model, "fake-model") as inner:
+            model.invoke("inner")
+        model.invoke("outer again")
+
+    assert inner.total_tokens == 5
+    assert outer.total_tokens == 15
+    assert outer.successful_requests == 3
+
+
+async def test_concurrent_tasks_are_accounted_separately():
+    manager = CustomLLMCallbackManager()
+
+    async def run(calls):
+        model = make_model(tokens=calls)
+        with manager.get_callback(model, "fake-model") as cb:
+            for _ in range(calls):
+                await model.ainvoke("prompt")
+                await asyncio.sleep(0)
+        return cb
+
+    with manager.get_callback(make_model(), "fake-model") as parent:
+        callbacks = await asyncio.gather(*(run(calls) for calls in range(3, 9)))
+
+    for calls, cb in zip(range(3, 9), callbacks):
+        assert cb.successful_requests == calls
+        assert cb.total_tokens == calls * calls
+    assert parent.total_tokens == sum(calls * calls for calls in range(3, 9))
+
+
+def test_concurrent_threads_are_accounted_separately():
+    manager = CustomLLMCallbackManager()
+
+    def run(calls):
+        model = make_model(tokens=calls)
+        with manager.get_callback(model, "fake-model") as cb:
+            for _ in range(calls):
+                model.invoke("prompt")
+        return cb.total_tokens, cb.successful_requests
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run, range(3, 9)))
+
+    assert results == [(calls * calls, calls) for calls in range(3, 9)]
@@ -0,0 +1,101 @@
+"""
+Tests for the content-addressed node result cache.
+"""
+
+import os
+import time
+
+from langchain_core.documents import Document
+
+from scrapegraphai.nodes.base_node import BaseNode
+from scrapegraphai.utils.node_cache import NodeCache
+
+
+class DummyNode(BaseNode):
+    cacheable = True
+
+    def __init__(self, node_config=None):
+        super().__init__("Fetch", "node", "url", ["doc"], 1, node_config or {})
+
+    def execute(self, state):
+        return state
+
+
+def test_store_and_load_roundtrip(tmp_path):
+    cache = NodeCache(tmp_path)
+    key = cache.make_key(DummyNode(), {"url": "https://example.com"})
+    updates = {"doc": [{"page_content": "hello", "metadata": {"source": "url"}}]}
+
+    assert cache.load(key) is None
+    cache.store(key, updates)
+    assert cache.load(key) == updates
+
+
+def test_key_hashes_documents_by_content(tmp_path):
+    cache = NodeCache(tmp_path)
+    node = DummyNode()
+    key = cache.make_key(node, {"url": [Document(page_content="a")]})
+
+    assert key is not None
+    assert key == cache.make_key(node, {"url": [Document(page_content="a")]})
+    assert key != cache.make_key(node, {"url": [Document(page_content="b")]})
+
+
+def test_key_depends_on_input_slice_and_config(tmp_path):
+    cache = NodeCache(tmp_path)
+    node = DummyNode({"verbose": False})
+    key = cache.make_key(node, {"url": "https://a.com", "user_prompt": "x"})
+
+    assert key == cache.make_key(node, {"url": "https://a.com", "user_prompt": "y"})
+    assert key == cache.make_key(DummyNode({"verbose": True}), {"url": "https://a.com"})
+    assert key != cache.make_key(node, {"url": "https://b.com"})
+    assert key != cache.make_key(DummyNode({"force": True}), {"url": "https://a.com"})
+
+
+def test_non_cacheable_and_unhashable_inputs(tmp_path):
+    cache = NodeCache(tmp_path)
+    node = DummyNode()
+    node.cacheable = False
+    assert cache.make_key(node, {"url": "https://a.com"}) is None
+    assert cache.make_key(DummyNode(), {"url": object()}) is None
+
+
+def test_ttl_expiry(tmp_path):
+    cache = NodeCache(tmp_path, ttl=0.05)
+    cache.store("key", {"doc": "content"})
+    assert cache.load("key") == {"doc": "content"}
+
+    time.sleep(0.1)
+    assert cache.load("key") is None
+    assert not os.listdir(cache.cache_dir)
+
+
+def test_entries_read_often_still_expire(tmp_path):
+    cache = NodeCache(tmp_path, ttl=0.2)
+    cache.store("old", {"doc": "content"})
+    time.sleep(0.1)
+    assert cache.load("old") == {"doc": "content"}
+    time.sleep(0.15)
+
+    # The read refreshed the last use of the entry, not its creation time
+    cache.store("new", {"doc": "content"})
+    assert sorted(os.listdir(cache.cache_dir)) == ["new.pkl"]
+
+
+def test_lru_eviction(tmp_path):
+    cache = NodeCache(tmp_path)
+    for key in ("a", "b", "c"):
+        cache.store(key, {"doc": "x" * 1000})
+    entry_size = os.path.getsize(os.path.join(cache.cache_dir, "a.pkl"))
+
+    now = time.time()
+    for age, key in enumerate(("b", "a", "c")):
+        os.utime(os.path.join(cache.cache_dir, f"{key}.pkl"), (now, now - age))
+
+    cache.max_size = entry_size * 3
+    cache.store("d", {"doc": "x" * 1000})
+
+    assert cache.load("c") is None
+    assert cache.load("a") is not None
+    assert cache.load("b") is not None
+    assert cache.load("d") is not None
@@ -0,0 +1,84 @@
+"""
+Tests for the node profiler.
+"""
+
+import json
+import os
+import pstats
+
+import pytest
+
+from scrapegraphai.nodes.base_node import BaseNode
+from scrapegraphai.utils.profiler import NodeProfiler, deep_sizeof
+
+
+class AllocatingNode(BaseNode):
+    def __init__(self):
+        super().__init__("Allocate/Node", "node", "url", ["doc"], 1, {})
+
+    def execute(self, state):
+        state["doc"] = [build_chunk(index) for index in range(2000)]
+        return state
+
+
+def build_chunk(index):
+    return "x" * 500 + str(index)
+
+
+def test_profile_reports_cpu_memory_and_functions():
+    profiler = NodeProfiler(top_n=5)
+    node = AllocatingNode()
+    state = {"url": "u"}
+
+    with profiler.profile(node, state) as report:
+        node.execute(state)
+
+    assert report["cpu_time"] >= 0
+    assert report["peak_memory_bytes"] > 1_000_000
+    assert report["state_size_bytes"] > 1_000_000
+    assert len(report["top_functions"]) == 5
+    functions = [entry["function"] for entry in report["top_functions"]]
+    assert any("build_chunk" in function for function in functions)
+    assert not any("_lsprof" in function for function in functions)
+
+
+def test_profile_dumps_prof_and_json(tmp_path):
+    profiler = NodeProfiler(output_dir=tmp_path)
+    node = AllocatingNode()
+    state = {"url": "u"}
+
+    with profiler.profile(node, state) as report:
+        node.execute(state)
+
+    assert pstats.Stats(report["prof_path"]).total_calls > 0
+    with open(report["json_path"], encoding="utf-8") as f:
+        dumped = json.load(f)
+    assert dumped["node_name"] == "Allocate/Node"
+    assert dumped["top_functions"] == report["top_functions"]
+    assert os.path.basename(report["json_path"]).startswith("Allocate_Node-")
+
+
+def test_nested_profiles_skip_inner_cpu_profile():
+    profiler = NodeProfiler()
+    node = AllocatingNode()
+
+    with profiler.profile(node, {}) as outer:
+        with profiler.profile(node, {}) as inner:
+            node.execute({})
+
+    assert inner["top_functions"] == []
+    assert outer["top_functions"]
+
+
+def test_from_config():
+    assert NodeProfiler.from_config(False) is None
+    assert NodeProfiler.from_config(True).top_n == 15
+    assert NodeProfiler.from_config({"top_n": 3}).top_n == 3
+    with pytest.raises(ValueError):
+        NodeProfiler.from_config("yes")
+
+
+def test_deep_sizeof_counts_nested_objects():
+    payload = "y" * 10_000
+    assert deep_sizeof({"a": [payload]}) > 10_000
+    assert deep_sizeof({"a": [payload, payload]}) < 20_000
@@ -0,0 +1,167 @@
+"""
+Tests for the health-checked proxy pool, with local servers acting as proxies.
+"""
+
+import random
+import time
+from unittest.mock import patch
+
+import pytest
+
+from scrapegraphai.docloaders import http_fetcher
+from scrapegraphai.docloaders.chromium import ChromiumLoader
+from scrapegraphai.docloaders.http_fetcher import HttpFetcher, proxy_url
+from scrapegraphai.docloaders.scrape_do import scrape_do_fetch
+from scrapegraphai.utils.proxy_rotation import ProxyPool, get_proxy_pool
+from tests.fixtures.mock_server.server import RouteServer
+
+PROBE_URL = "http://probe.test/generate_204"
+DEAD_PROXY = "http://127.0.0.1:1"
+ARTICLE = (
+    "<html><body><main>"
+    + "".join(f"<p>Product {i} is a server-rendered item.</p>" for i in range(20))
+    + "</main></body></html>"
+)
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    fetcher = HttpFetcher(timeout=5)
+    monkeypatch.setattr(http_fetcher, "_shared_fetcher", fetcher)
+    yield fetcher
+    fetcher.close()
+
+
+@pytest.fixture
+def proxies(fetcher):
+    """Two local servers answering the requests proxied through them."""
+    servers = [RouteServer(), RouteServer()]
+    for server in servers:
+        server.routes["/generate_204"] = (204, {}, "")
+        server.start()
+    yield servers
+    for server in servers:
+        server.stop()
+
+
+def test_probe_keeps_the_working_proxies(proxies):
+    pool = ProxyPool(
+        [proxies[0].get_url(), DEAD_PROXY, {"server": proxies[1].get_url()}],
+        probe_url=PROBE_URL,
+    )
+
+    assert pool.probe() == 2
+    assert {stats["server"] for stats in pool.stats()} == {
+        proxies[0].get_url(),
+        proxies[1].get_url(),
+    }
+    # The probes went through the proxies
+    assert proxies[0].requests[0][1]["Host"] == "probe.test"
+
+
+def test_fast_reliable_proxies_are_picked_more_often(proxies):
+    fast, slow = (server.get_url() for server in proxies)
+    pool = ProxyPool([fast, slow], probe_url=PROBE_URL)
+    pool.probe()
+    for _ in range(5):
+        pool.report(fast, success=True, latency=0.1)
+        pool.report(slow, success=True, latency=2.0)
+    pool.report(slow, success=False)
+
+    random.seed(0)
+    picks = [pool.get()["server"] for _ in range(1000)]
+
+    assert picks.count(fast) > 900
+    assert picks.count(slow) > 0
+
+
+def test_failing_proxies_are_evicted_and_replaced(proxies):
+    first, second = (server.get_url() for server in proxies)
+    pool = ProxyPool([first, second], probe_url=PROBE_URL, max_consecutive_failures=2)
+    pool.probe()
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError), pool.rotate() as proxy:
+            assert proxy["server"] in (first, second)
+            pool.report(first, success=False)
+            raise ConnectionError
+    assert len(pool.stats()) < 2
+    pool.report(second, success=False)
+    pool.report(second, success=False)
+    assert pool.stats() == []
+
+    # An empty pool probes its candidates again
+    assert pool.get()["server"] in (first, second)
+    assert ProxyPool([DEAD_PROXY], probe_url=PROBE_URL).stats() == []
+    with pytest.raises(ValueError):
+        ProxyPool([DEAD_PROXY], probe_url=PROBE_URL).get()
+
+
+def test_rejected_and_evicted_proxies_close_their_connections(proxies, fetcher):
+    working = proxies[0].get_url()
+    pool = ProxyPool(
+        [working, DEAD_PROXY], probe_url=PROBE_URL, max_consecutive_failures=1
+    )
+
+    def released(server):
+        deadline = time.monotonic() + 2
+        while proxy_url({"server": server}) in fetcher._clients:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    pool.probe()
+    assert released(DEAD_PROXY)
+    assert proxy_url({"server": working}) in fetcher._clients
+
+    pool.report(working, success=False)
+    assert released(working)
+
+
+def test_proxy_pool_option():
+    pool = ProxyPool(["http://10.0.0.1:3128"])
+
+    assert get_proxy_pool(None) is None
+    assert get_proxy_pool(False) is None
+    assert get_proxy_pool(pool) is pool
+    assert get_proxy_pool(True) is get_proxy_pool(True)
+    shared = get_proxy_pool({"proxies": ["http://10.0.0.1:3128"]})
+    assert shared is get_proxy_pool({"proxies": ["http://10.0.0.1:3128"]})
+    assert shared is not get_proxy_pool({"proxies": ["http://10.0.0.2:3128"]})
+    with pytest.raises(ValueError):
+        get_proxy_pool("http://10.0.0.1:3128")
+    with pytest.raises(ValueError):
+        ChromiumLoader(
+            ["https://example.com"],
+            proxy={"server": "http://10.0.0.2:3128"},
+            proxy_pool=pool,
+        )
+
+
+def test_loader_and_scrape_do_rotate_through_the_pool(proxies, monkeypatch):
+    for server in proxies:
+        server.routes["/page"] = (200, {}, ARTICLE)
+    pool = ProxyPool([server.get_url() for server in proxies], probe_url=PROBE_URL)
+    loader = ChromiumLoader(
+        [f"http://site{i}.test/page" for i in range(6)],
+        http_first=True,
+        proxy_pool=pool,
+    )
+
+    documents = loader.load()
+
+    assert all(doc.page_content == ARTICLE for doc in documents)
+    assert sum(stats["successes"] for stats in pool.stats()) == 2 + 6
+
+    # The API token only travels through the proxies encrypted
+    monkeypatch.delenv("API_SCRAPE_DO_URL", raising=False)
+    with patch("requests.get") as get:
+        get.return_value.text = "scrape.do answer"
+        assert scrape_do_fetch("token", "https://example.com", proxy_pool=pool) == (
+            "scrape.do answer"
+        )
+    url, proxy = get.call_args.args[0], get.call_args.kwargs["proxies"]["https"]
+    assert url.startswith("https://api.scrape.do?token=token&")
+    assert proxy in {server.get_url() for server in proxies}
+    assert sum(stats["successes"] for stats in pool.stats()) == 2 + 7
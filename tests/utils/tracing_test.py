@@ -0,0 +1,108 @@
+"""
+Tests for the span tracer and its exports.
+"""
+
+import asyncio
+import json
+
+import pytest
+from langchain_core.runnables import RunnableLambda, RunnableParallel
+
+from scrapegraphai.utils.tracing import Tracer, span, traced_runnable, use_tracer
+
+
+def test_span_is_noop_without_tracer():
+    with span("idle") as current:
+        assert current is None
+
+
+def test_spans_nest_and_record_errors():
+    tracer = Tracer()
+
+    with use_tracer(tracer), span("graph", category="graph") as graph:
+        with span("node", category="node", url="u") as node:
+            pass
+        with pytest.raises(RuntimeError):
+            with span("failing"):
+                raise RuntimeError("boom")
+
+    spans = {span.name: span for span in tracer.spans}
+    assert spans["node"].parent_id == graph.span_id
+    assert spans["node"].attributes == {"url": "u"}
+    assert spans["failing"].error == "RuntimeError: boom"
+    assert spans["graph"].parent_id is None
+    assert node.end_ns >= node.start_ns
+
+
+async def test_async_tasks_get_their_own_lane():
+    tracer = Tracer()
+
+    async def chunk(index):
+        with span(f"chunk{index}"):
+            await asyncio.sleep(0.01)
+
+    with use_tracer(tracer):
+        with span("node"):
+            await asyncio.gather(*(chunk(index) for index in range(3)))
+
+    spans = {span.name: span for span in tracer.spans}
+    lanes = {spans[f"chunk{index}"].lane for index in range(3)}
+    assert len(lanes) == 3
+    assert all(spans[f"chunk{i}"].parent_id == spans["node"].span_id for i in range(3))
+
+
+def test_chrome_export(tmp_path):
+    tracer = Tracer()
+    with use_tracer(tracer), span("graph", category="graph", source=object()):
+        pass
+
+    path = tmp_path / "traces" / "run.json"
+    tracer.export(path, "chrome")
+    events = json.loads(path.read_text())["traceEvents"]
+
+    assert events[0]["ph"] == "M"
+    complete = [event for event in events if event["ph"] == "X"]
+    assert complete[0]["name"] == "graph"
+    assert complete[0]["cat"] == "graph"
+    assert complete[0]["dur"] >= 0
+    assert isinstance(complete[0]["args"]["source"], str)
+
+
+def test_otlp_export(tmp_path):
+    tracer = Tracer()
+    with use_tracer(tracer), span("graph"):
+        with span("node", attempt=2):
+            pass
+
+    path = tmp_path / "run.json"
+    tracer.export(path, "otlp")
+    spans = json.loads(path.read_text())["resourceSpans"][0]["scopeSpans"][0]["spans"]
+
+    node, graph = spans
+    assert node["parentSpanId"] == graph["spanId"]
+    assert node["traceId"] == graph["traceId"] == tracer.trace_id
+    assert {"key": "attempt", "value": {"intValue": "2"}} in node["attributes"]
+    assert "parentSpanId" not in graph
+
+
+def test_export_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        Tracer().export(tmp_path / "run.json", "zipkin")
+
+
+def test_traced_runnable_records_parallel_branches():
+    tracer = Tracer()
+    double = RunnableLambda(lambda x: x * 2)
+
+    assert traced_runnable(double, "chunk1") is double
+
+    with use_tracer(tracer), span("node"):
+        runner = RunnableParallel(
+            chunk1=traced_runnable(double, "chunk1", chunk_id=1),
+            chunk2=traced_runnable(double, "chunk2", chunk_id=2),
+        )
+        assert runner.invoke(3) == {"chunk1": 6, "chunk2": 6}
+
+    spans = {span.name: span for span in tracer.spans}
+    assert spans["chunk1"].parent_id == spans["node"].span_id
+    assert spans["chunk2"].attributes == {"chunk_id": 2}